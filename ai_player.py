@@ -0,0 +1,425 @@
+'''
+Module: ai_player.py
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Inputs: Responses to the attacks of the computer
+Outputs: Attacks and ship placements of a computer player
+
+Description: This module implements a computer opponent. It attacks the cell
+             that is covered by the most placements of the opponent's ships
+             that are still possible, using the same placement rules as the
+             engine. The placements are never listed. Every placement is the
+             bow of a ship and a direction, and the amount of placements that
+             cover every cell is counted once at the start. After a miss only
+             the placements through that cell are removed, and once a ship is
+             hit, which the response of the attack tells the size of, only the
+             few placements of that ship through its hits are searched until
+             it sinks. The densities only ever shrink, so the cell with the
+             highest density is kept in a heap that is fixed up lazily
+
+             The strategy plugs into the simulator, and the view lets the
+             computer play the interactive game with --view ai
+'''
+################################################################################
+# Imports
+################################################################################
+import fleet_generator as FG
+import game_view as GV
+
+from interfaces import interface_headers as IH
+
+import heapq
+import random
+
+################################################################################
+# Global Variables
+################################################################################
+
+# Directions of a placement. A ship that goes along a row has its
+# bow at its last column, one that goes along a column has its
+# bow at its last row, the same as the placements of the engine
+PLACEMENT_HORIZONTAL = 0
+PLACEMENT_VERTICAL = 1
+
+################################################################################
+# Types
+################################################################################
+class DensityStrategy:
+    """
+    Description: This strategy attacks the cell that the most placements of
+                 the remaining ships cover. Cells are numbered in row major
+                 order, and placement n of a ship is the direction n % 2 with
+                 its bow at cell n // 2
+    """
+    def __init__( self, rng : random.Random, number_of_ships : int = IH.MAX_NUM_OF_SHIPS ):
+        """
+        Function: Initialization
+
+        Inputs: Random number generator of the game, the number of ships of the opponent
+        Outputs: None
+
+        Description: The opponent is expected to have the ships of sizes
+                     MIN_NUM_OF_SHIPS to number_of_ships, and the size of
+                     a ship is its id
+        """
+        self._rows = IH.NUMBER_OF_ROWS
+        self._cols = IH.NUMBER_OF_COLS
+        cells = self._rows * self._cols
+
+        self._attacked = bytearray( cells )
+
+        # Placements that are still possible for every ship that has
+        # not sunk, along with the density that every ship adds to
+        # the cells while it has not been found
+        self._valid : dict[ int, bytearray ] = dict()
+        self._ship_density : dict[ int, list[ int ] ] = dict()
+        self._density = [ 0 ] * cells
+
+        for size in range( IH.MIN_NUM_OF_SHIPS, number_of_ships + 1 ):
+            self._valid[ size ] = self._get_initial_placements( size )
+            self._ship_density[ size ] = self._get_initial_density( size )
+            self._density = list( map( int.__add__, self._density, self._ship_density[ size ] ) )
+
+        # Cells that were hit on every ship that has been found but
+        # has not sunk yet
+        self._hits : dict[ int, list[ int ] ] = dict()
+
+        # Ties are broken in a random order that is fixed for the game
+        self._tie_breaks = [ rng.random() for _ in range( cells ) ]
+        self._heap = [ ( -density, tie_break, cell ) for cell, ( density, tie_break ) in enumerate( zip( self._density, self._tie_breaks ) ) ]
+        heapq.heapify( self._heap )
+
+    def _get_initial_placements( self, size : int ) -> bytearray:
+        """
+        Function: Get Initial Placements
+
+        Inputs: The size of a ship
+        Outputs: A flag for every placement that fits on the board
+
+        Description: A ship of size one is the same in both directions, so
+                     only its horizontal placements are counted
+        """
+        valid = bytearray( 2 * self._rows * self._cols )
+
+        for row in range( self._rows ):
+            for col in range( self._cols ):
+                cell = row * self._cols + col
+                valid[ 2 * cell + PLACEMENT_HORIZONTAL ] = col >= size - 1
+                valid[ 2 * cell + PLACEMENT_VERTICAL ] = row >= size - 1 and size > 1
+
+        return valid
+
+    def _get_initial_density( self, size : int ) -> list[ int ]:
+        """
+        Function: Get Initial Density
+
+        Inputs: The size of a ship
+        Outputs: The amount of placements of the ship that cover every cell
+
+        Description: The bows of the horizontal placements that cover a cell
+                     are the columns from the cell to size - 1 columns after
+                     it that fit on the board, and the same goes for the rows
+                     of the vertical placements
+        """
+        def count_bows( index : int, length : int ) -> int:
+            return max( 0, min( index + size - 1, length - 1 ) - max( index, size - 1 ) + 1 )
+
+        col_counts = [ count_bows( col, self._cols ) for col in range( self._cols ) ]
+        row_counts = [ count_bows( row, self._rows ) if size > 1 else 0 for row in range( self._rows ) ]
+
+        return [ row_count + col_count for row_count in row_counts for col_count in col_counts ]
+
+    def _get_placement_cells( self, size : int, placement : int ) -> range:
+        """
+        Function: Get Placement Cells
+
+        Inputs: The size of a ship, a placement of the ship
+        Outputs: The cells that the placement covers
+        """
+        bow = placement // 2
+        step = 1 if placement % 2 == PLACEMENT_HORIZONTAL else self._cols
+
+        return range( bow, bow - size * step, -step )
+
+    def _get_covering_placements( self, size : int, cell : int ) -> list[ int ]:
+        """
+        Function: Get Covering Placements
+
+        Inputs: The size of a ship, a cell
+        Outputs: Every placement of the ship that covers the cell and is still possible
+        """
+        valid = self._valid[ size ]
+        row, col = divmod( cell, self._cols )
+        placements = list()
+
+        for bow_col in range( col, min( col + size, self._cols ) ):
+            placement = 2 * ( row * self._cols + bow_col ) + PLACEMENT_HORIZONTAL
+            if valid[ placement ]:
+                placements.append( placement )
+
+        for bow_row in range( row, min( row + size, self._rows ) ):
+            placement = 2 * ( bow_row * self._cols + col ) + PLACEMENT_VERTICAL
+            if valid[ placement ]:
+                placements.append( placement )
+
+        return placements
+
+    def _remove_placements( self, size : int, cell : int ) -> None:
+        """
+        Function: Remove Placements
+
+        Inputs: The size of a ship, a cell that the ship can not cover
+        Outputs: None
+
+        Description: The density of a ship that has been found is no longer
+                     part of the density of the board
+        """
+        valid = self._valid[ size ]
+        ship_density = self._ship_density.get( size )
+        density = self._density
+
+        for placement in self._get_covering_placements( size, cell ):
+            valid[ placement ] = 0
+
+            if ship_density is not None:
+                for covered_cell in self._get_placement_cells( size, placement ):
+                    ship_density[ covered_cell ] -= 1
+                    density[ covered_cell ] -= 1
+
+    def _find_ship( self, size : int ) -> None:
+        """
+        Function: Find Ship
+
+        Inputs: The size of the ship that was hit for the first time
+        Outputs: None
+        """
+        self._density = list( map( int.__sub__, self._density, self._ship_density.pop( size ) ) )
+        self._hits[ size ] = list()
+
+    def _choose_target( self ) -> int:
+        """
+        Function: Choose Target
+
+        Inputs: None
+        Outputs: The cell to attack to sink a ship that has been found, None if there is no such cell
+
+        Description: Only the placements through the first hit of a ship can
+                     hold it, and of those only the ones that cover every
+                     other hit
+        """
+        counts : dict[ int, int ] = dict()
+
+        for size, hits in self._hits.items():
+            for placement in self._get_covering_placements( size, hits[ 0 ] ):
+                cells = self._get_placement_cells( size, placement )
+
+                if all( hit in cells for hit in hits ):
+                    for cell in cells:
+                        if not self._attacked[ cell ]:
+                            counts[ cell ] = counts.get( cell, 0 ) + 1
+
+        if not counts:
+            return None
+
+        return max( counts, key=lambda cell: ( counts[ cell ], self._tie_breaks[ cell ] ) )
+
+    def _choose_hunt( self ) -> int:
+        """
+        Function: Choose Hunt
+
+        Inputs: None
+        Outputs: The cell with the highest density that was not attacked
+
+        Description: Entries of the heap are fixed up when they reach the top,
+                     which is correct because a density never grows
+        """
+        heap = self._heap
+
+        while True:
+            negative_density, tie_break, cell = heap[ 0 ]
+
+            if self._attacked[ cell ]:
+                heapq.heappop( heap )
+
+            elif -negative_density != self._density[ cell ]:
+                heapq.heapreplace( heap, ( -self._density[ cell ], tie_break, cell ) )
+
+            else:
+                return cell
+
+    def choose_attack( self ) -> IH.SystemCoordType:
+        """
+        Function: Choose Attack
+
+        Inputs: None
+        Outputs: The coordinate to attack
+        """
+        cell = self._choose_target() if self._hits else None
+
+        if cell is None:
+            cell = self._choose_hunt()
+
+        return divmod( cell, self._cols )
+
+    def record_result( self, coord : IH.SystemCoordType, response : dict ) -> None:
+        """
+        Function: Record Result
+
+        Inputs: The coordinate that was attacked, the response to the attack
+        Outputs: None
+
+        Description: No other ship can cover a cell that was hit, and no
+                     ship at all can cover a cell that was missed
+        """
+        cell = coord[ IH.ROW_INDEX ] * self._cols + coord[ IH.COLUMN_INDEX ]
+        self._attacked[ cell ] = 1
+
+        hit_size = None
+        if IH.CoordStateType( response[ IH.GAME_COORD_TYPE_STATE_INDEX ] ) == IH.CoordStateType.COORD_STATE_HIT:
+            hit_size = response[ IH.VIEW_PARAM_SIZE ]
+
+        for size in self._valid:
+            if size != hit_size:
+                self._remove_placements( size, cell )
+
+        # A ship that the opponent does not have is ignored
+        if hit_size not in self._valid:
+            return
+
+        if hit_size not in self._hits:
+            self._find_ship( hit_size )
+
+        self._hits[ hit_size ].append( cell )
+
+        if response[ IH.VIEW_PARAM_SHIP_SUNK ]:
+            del self._hits[ hit_size ]
+            del self._valid[ hit_size ]
+
+    def skip( self, coord : IH.SystemCoordType ) -> None:
+        """
+        Function: Skip
+
+        Inputs: A coordinate that was attacked without the strategy knowing the result
+        Outputs: None
+        """
+        self._attacked[ coord[ IH.ROW_INDEX ] * self._cols + coord[ IH.COLUMN_INDEX ] ] = 1
+
+class AIGameView( GV.GameView ):
+    def __init__( self ):
+        """
+        Function: Initialization
+
+        Inputs: None
+        Outputs: None
+
+        Description: The player still selects if the computer hosts or joins a
+                     game and the number of ships on the start page. The ships
+                     are placed at random and the attacks are chosen by the
+                     density strategy, and every page is still shown
+        """
+        super().__init__()
+        self._rng = random.Random()
+        self._number_of_ships = IH.MAX_NUM_OF_SHIPS
+        self._strategy : DensityStrategy = None
+        self._last_attack : IH.SystemCoordType = None
+        self._fleet : dict[ int, tuple[ IH.SystemCoordType, str, int ] ] = dict()
+
+    def draw_start_page( self, params : dict ) -> dict:
+        """
+        Function: Draw Start Page
+
+        Inputs: Configuration Inputs
+        Outputs: Dictionary with configuration state
+
+        Description: The opponent is expected to play with the same number of
+                     ships as the computer
+        """
+        config_dict = super().draw_start_page( params )
+        self._number_of_ships = config_dict[ IH.VIEW_PARAM_NUM_OF_SHIPS ]
+
+        return config_dict
+
+    def prompt_ship_init( self, params : dict ) -> dict:
+        """
+        Function: Prompt Ship Initialization
+
+        Inputs: Configuration Inputs
+        Outputs: Configuration Outputs
+
+        Description: A random layout of the whole fleet is drawn for the first
+                     ship, and every ship is answered from it. A new layout is
+                     drawn if the engine did not accept a placement
+        """
+        self._renderer.render( [ "Initialization:", "", *self._get_grid_lines( params ) ] )
+
+        size = params[ IH.VIEW_PARAM_SIZE ]
+
+        if size == IH.MIN_NUM_OF_SHIPS or size not in self._fleet or params[ IH.VIEW_PARAM_IS_ERROR_STATE ]:
+            layout = FG.FleetGenerator( self._rng, max( size, self._number_of_ships ) ).generate()
+            self._fleet = { ship_size : placement for *placement, ship_size in layout }
+
+        bow, direction = self._fleet[ size ]
+
+        return { IH.VIEW_PARAM_ROW : IH.SYS_ROW_TO_PLACMENT_ROW[ bow[ IH.ROW_INDEX ] ],
+                 IH.VIEW_PARAM_COL : IH.SYS_COL_TO_PLACMENT_COL[ bow[ IH.COLUMN_INDEX ] ],
+                 IH.VIEW_PARAM_DIRECTION : direction }
+
+    def _create_strategy( self, opponent_board : IH.VisualBoardType ) -> DensityStrategy:
+        """
+        Function: Create Strategy
+
+        Inputs: The opponent's board
+        Outputs: The strategy
+
+        Description: A resumed game already has attacks on the opponent's
+                     board. The misses are used, and the hits are skipped
+                     since the ships they belong to are not known
+        """
+        strategy = DensityStrategy( self._rng, self._number_of_ships )
+        miss = { IH.GAME_COORD_TYPE_STATE_INDEX : IH.CoordStateType.COORD_STATE_MISS.value }
+
+        for row, cells in enumerate( opponent_board ):
+            for col, cell in enumerate( cells ):
+                if cell == IH.MISSED_CELL:
+                    strategy.record_result( ( row, col ), miss )
+
+                elif cell == IH.HIT_CELL:
+                    strategy.skip( ( row, col ) )
+
+        return strategy
+
+    def prompt_user_attack( self, params : dict ) -> dict:
+        """
+        Function: Prompt User Attack
+
+        Inputs: Configuration Inputs
+        Outputs: Configuration Outputs
+
+        Description: The response to the last attack of the computer is read
+                     from the parameters before the next attack is chosen
+        """
+        if self._strategy is None:
+            self._strategy = self._create_strategy( params[ IH.VIEW_PARAM_OPPONENT_BOARD ] )
+
+        elif self._last_attack is not None:
+            response = params.get( IH.VIEW_PARAM_RESPONSE )
+
+            if response is not None and not params[ IH.VIEW_PARAM_IS_ERROR_STATE ]:
+                self._strategy.record_result( self._last_attack, response )
+
+            else:
+                self._strategy.skip( self._last_attack )
+
+        frame = [ "Attack Plan:", "", *self._get_grid_lines( params ) ]
+
+        if params[ IH.VIEW_PARAM_STATE_MESSAGE ] is not None:
+            frame.extend( params[ IH.VIEW_PARAM_STATE_MESSAGE ].splitlines() )
+
+        self._renderer.render( frame )
+
+        self._last_attack = self._strategy.choose_attack()
+
+        return { IH.VIEW_PARAM_ROW : IH.SYS_ROW_TO_PLACMENT_ROW[ self._last_attack[ IH.ROW_INDEX ] ],
+                 IH.VIEW_PARAM_COL : IH.SYS_COL_TO_PLACMENT_COL[ self._last_attack[ IH.COLUMN_INDEX ] ] }
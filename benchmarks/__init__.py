@@ -0,0 +1,10 @@
+'''
+Module: benchmarks
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Description: This package holds the benchmarks of the hot paths of the game.
+             Run every benchmark from the root of the repository with
+             $python executable$ -m benchmarks.run_benchmarks
+'''
@@ -0,0 +1,125 @@
+'''
+Module: bench_harness.py
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Inputs: Benchmarks to run
+Outputs: Timings of the benchmarks
+
+Description: This module holds the pieces that are shared by every benchmark.
+             A benchmark is a name and a setup function. The setup function
+             builds whatever state the benchmark needs and returns the
+             operation to time along with a function that releases the state.
+             Operations are timed with timeit, so every benchmark reports the
+             time of a single call of its operation
+'''
+################################################################################
+# Imports
+################################################################################
+import statistics
+import timeit
+
+from collections.abc import Callable
+
+################################################################################
+# Global Variables
+################################################################################
+
+# Default amount of times every benchmark is timed. The fastest
+# run is the least disturbed by the rest of the system
+DEFAULT_REPEAT = 5
+
+# Default minimum amount of seconds that a single run takes, so
+# that the timer resolution does not affect fast operations
+DEFAULT_MIN_TIME = 0.2
+
+NANOSECONDS_PER_SECOND = 1_000_000_000
+
+################################################################################
+# Types
+################################################################################
+class BenchmarkUnavailable( Exception ):
+    """
+    Description: Raised by the setup of a benchmark that can not run on this
+                 machine, such as a benchmark of an optional dependency that
+                 is not installed
+    """
+    pass
+
+class Benchmark:
+    """
+    Description: This is a single benchmark. The setup function returns the
+                 operation to time and a function to call once the timing is
+                 done, which can be None if there is nothing to release
+    """
+    __slots__ = ( "group", "name", "setup" )
+
+    def __init__( self, group : str, name : str, setup : Callable[ [], tuple[ Callable, Callable ] ] ) -> None:
+        """
+        Function: Initialization
+
+        Inputs: The group of the benchmark, the name of the benchmark, the setup function
+        Outputs: None
+        """
+        self.group = group
+        self.name = name
+        self.setup = setup
+
+    def get_full_name( self ) -> str:
+        """
+        Function: Get Full Name
+
+        Inputs: None
+        Outputs: The name of the benchmark prefixed with its group
+        """
+        return f"{ self.group }.{ self.name }"
+
+################################################################################
+# Procedures
+################################################################################
+def measure( operation : Callable, repeat : int = DEFAULT_REPEAT, min_time : float = DEFAULT_MIN_TIME ) -> dict:
+    """
+    Function: Measure
+
+    Inputs: The operation to time, the amount of runs, the minimum time of a run
+    Outputs: Timings of a single call of the operation in nanoseconds
+
+    Description: The amount of calls per run is calibrated so that a run
+                 takes at least min_time seconds
+    """
+    timer = timeit.Timer( operation )
+    number = 1
+
+    # Double the amount of calls until a run is long enough
+    while timer.timeit( number ) < min_time:
+        number *= 2
+
+    timings = [ run * NANOSECONDS_PER_SECOND / number for run in timer.repeat( repeat, number ) ]
+
+    return { "number" : number,
+             "repeat" : repeat,
+             "best_ns" : min( timings ),
+             "median_ns" : statistics.median( timings ),
+             "mean_ns" : statistics.fmean( timings ),
+             "stdev_ns" : statistics.stdev( timings ) if len( timings ) > 1 else 0.0 }
+
+def run_benchmark( benchmark : Benchmark, repeat : int = DEFAULT_REPEAT, min_time : float = DEFAULT_MIN_TIME ) -> dict:
+    """
+    Function: Run Benchmark
+
+    Inputs: The benchmark, the amount of runs, the minimum time of a run
+    Outputs: The result of the benchmark
+
+    Description: Raises BenchmarkUnavailable if the benchmark can not run
+    """
+    operation, teardown = benchmark.setup()
+
+    try:
+        result = measure( operation, repeat, min_time )
+
+    finally:
+        if teardown is not None:
+            teardown()
+
+    return { "name" : benchmark.get_full_name(), **result }
@@ -0,0 +1,154 @@
+'''
+Module: bench_model.py
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Inputs: None
+Outputs: Benchmarks of the game models
+
+Description: This module benchmarks every method of the model interface for
+             every model implementation. The numpy model is skipped if numpy
+             is not installed
+'''
+################################################################################
+# Imports
+################################################################################
+import fleet_generator as FG
+import game_engine as GE
+import game_snapshot as GS
+import model_factory as MF
+
+from benchmarks import bench_harness as BH
+from interfaces import interface_headers as IH
+
+import os
+import random
+import tempfile
+
+################################################################################
+# Global Variables
+################################################################################
+HOST = IH.PlayerTypeEnum.PLAYER_TYPE_HOST
+JOIN = IH.PlayerTypeEnum.PLAYER_TYPE_JOIN
+
+################################################################################
+# Procedures
+################################################################################
+def create_fleet_model( model_type : str ):
+    """
+    Function: Create Fleet Model
+
+    Inputs: The name of the model
+    Outputs: A model with the largest fleet placed on both boards
+
+    Description: Every ship is placed along the first columns of the board,
+                 one row per ship, so the fleet fits on any board size
+    """
+    try:
+        engine = GE.GameEngine( MF.create_model( model_type ) )
+
+    except ImportError as error:
+        raise BH.BenchmarkUnavailable( str( error ) ) from error
+
+    for player_type in IH.PlayerTypeEnum:
+        for size in range( IH.MIN_NUM_OF_SHIPS, IH.MAX_NUM_OF_SHIPS + 1 ):
+            if not engine.place_ship( player_type, ( size - 1, size - 1 ), GE.DIRECTION_HORIZONTAL, size ):
+                raise RuntimeError( f"The ship of size { size } could not be placed" )
+
+    return engine.get_model()
+
+def _get_model_benchmarks( model_type : str ) -> list[ BH.Benchmark ]:
+    """
+    Function: Get Model Benchmarks
+
+    Inputs: The name of the model
+    Outputs: The benchmarks of the model
+    """
+    group = f"model.{ model_type }"
+    last_coord = ( IH.NUMBER_OF_ROWS - 1, IH.NUMBER_OF_COLS - 1 )
+    base_cell = { IH.GAME_COORD_TYPE_ID_INDEX : IH.BASE_CELL, IH.GAME_COORD_TYPE_STATE_INDEX : IH.CoordStateType.COORD_STATE_BASE }
+
+    def setup_init():
+        # Creating a model raises if its dependencies are missing
+        model_class = type( create_fleet_model( model_type ) )
+        return model_class, None
+
+    def setup_get_coord():
+        model = create_fleet_model( model_type )
+        return lambda: model.get_coord( HOST, ( 0, 0 ) ), None
+
+    def setup_update_coord():
+        model = create_fleet_model( model_type )
+        return lambda: model.update_coord( HOST, last_coord, base_cell ), None
+
+    def setup_is_valid_coord():
+        model = create_fleet_model( model_type )
+        return lambda: model.is_valid_coord( JOIN, last_coord, IH.GameEventType.GAME_EVENT_MAKE_ATTACK ), None
+
+    def setup_can_place_ship():
+        # The fleet is along the first columns, so the last
+        # row is free for the largest ship
+        model = create_fleet_model( model_type )
+        return lambda: model.can_place_ship( HOST, last_coord, GE.DIRECTION_HORIZONTAL, IH.MAX_NUM_OF_SHIPS ), None
+
+    def setup_ships_are_alive():
+        model = create_fleet_model( model_type )
+        return lambda: model.ships_are_alive( HOST ), None
+
+    def setup_ship_is_alive():
+        model = create_fleet_model( model_type )
+        return lambda: model.ship_is_alive( HOST, IH.MAX_NUM_OF_SHIPS ), None
+
+    def setup_get_visual_board():
+        model = create_fleet_model( model_type )
+        return lambda: model.get_visual_board( HOST ), None
+
+    def setup_get_board_masks():
+        model = create_fleet_model( model_type )
+        return lambda: model.get_board_masks( HOST ), None
+
+    def setup_write_snapshot():
+        model = create_fleet_model( model_type )
+        directory = tempfile.mkdtemp()
+        snapshot_file = GS.SnapshotFile( os.path.join( directory, "game.bsnp" ) )
+
+        def teardown():
+            snapshot_file.remove()
+            os.rmdir( directory )
+
+        return lambda: snapshot_file.write( GS.capture_snapshot( model, HOST, HOST, 0, None ) ), teardown
+
+    return [ BH.Benchmark( group, "init", setup_init ),
+             BH.Benchmark( group, "get_coord", setup_get_coord ),
+             BH.Benchmark( group, "update_coord", setup_update_coord ),
+             BH.Benchmark( group, "is_valid_coord", setup_is_valid_coord ),
+             BH.Benchmark( group, "can_place_ship", setup_can_place_ship ),
+             BH.Benchmark( group, "ships_are_alive", setup_ships_are_alive ),
+             BH.Benchmark( group, "ship_is_alive", setup_ship_is_alive ),
+             BH.Benchmark( group, "get_visual_board", setup_get_visual_board ),
+             BH.Benchmark( group, "get_board_masks", setup_get_board_masks ),
+             BH.Benchmark( group, "write_snapshot", setup_write_snapshot ) ]
+
+def _get_fleet_benchmarks() -> list[ BH.Benchmark ]:
+    """
+    Function: Get Fleet Benchmarks
+
+    Inputs: None
+    Outputs: The benchmarks of the fleet generator
+    """
+    def setup_generate():
+        generator = FG.FleetGenerator( random.Random( 0 ) )
+        return generator.generate, None
+
+    return [ BH.Benchmark( "fleet", "generate", setup_generate ) ]
+
+def get_benchmarks() -> list[ BH.Benchmark ]:
+    """
+    Function: Get Benchmarks
+
+    Inputs: None
+    Outputs: The benchmarks of every model and of the fleet generator
+    """
+    return [ *( benchmark for model_type in MF.MODEL_TYPES for benchmark in _get_model_benchmarks( model_type ) ),
+             *_get_fleet_benchmarks() ]
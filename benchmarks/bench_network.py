@@ -0,0 +1,157 @@
+'''
+Module: bench_network.py
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Inputs: None
+Outputs: Benchmarks of the network interaction
+
+Description: This module benchmarks the messages that are exchanged on every
+             turn. The codecs are timed on their own, and a host and a client
+             are connected over the loopback interface to time a full turn:
+             an attack sent by the client and the response sent back by the
+             host. A free port is used so that a running game is not affected.
+             The same turn is also timed over the in-process loopback
+             connections, which do not use a port at all
+'''
+################################################################################
+# Imports
+################################################################################
+import client as GC
+import host as GH
+import loopback_connection as LC
+import message_codec as MC
+import network_config as NC
+import shared_memory_connection as SMC
+
+from benchmarks import bench_harness as BH
+from interfaces import interface_headers as IH
+
+import socket
+import threading
+import time
+
+################################################################################
+# Global Variables
+################################################################################
+ATTACK_MESSAGE = { IH.VIEW_PARAM_ROW : 3, IH.VIEW_PARAM_COL : 7 }
+RESPONSE_MESSAGE = { IH.GAME_COORD_TYPE_STATE_INDEX : IH.CoordStateType.COORD_STATE_HIT.value,
+                     IH.VIEW_PARAM_WIN : False,
+                     IH.VIEW_PARAM_SHIP_SUNK : True,
+                     IH.VIEW_PARAM_SIZE : 3 }
+
+# Amount of seconds to wait for the loopback connection
+CONNECT_TIMEOUT = 10
+
+################################################################################
+# Procedures
+################################################################################
+def _get_free_port( host : str ) -> int:
+    """
+    Function: Get Free Port
+
+    Inputs: The address to bind to
+    Outputs: A port that is not in use
+    """
+    with socket.socket( socket.AF_INET, socket.SOCK_STREAM ) as probe:
+        probe.bind( ( host, 0 ) )
+        return probe.getsockname()[ 1 ]
+
+def _connect_loopback( codec : str, transport : str = NC.TRANSPORT_TCP ) -> tuple[ GH.Host, GC.Client ]:
+    """
+    Function: Connect Loopback
+
+    Inputs: The codec to negotiate, the transport to connect on
+    Outputs: A host and a client that are connected to each other
+
+    Description: The host waits for the client on a separate thread because
+                 opening the connection blocks until the client connects.
+                 The free port also names the socket file of the transports
+                 that meet on a Unix domain socket
+    """
+    if transport != NC.TRANSPORT_TCP and not hasattr( socket, "AF_UNIX" ):
+        raise BH.BenchmarkUnavailable( "Unix domain sockets are not supported on this platform" )
+
+    config = NC.NetworkConfig( transport=transport )
+
+    try:
+        config.port = _get_free_port( config.get_host() )
+
+    except OSError as error:
+        raise BH.BenchmarkUnavailable( str( error ) ) from error
+
+    host = GH.Host( codec, config )
+    client = GC.Client( codec, config=config )
+
+    if transport == NC.TRANSPORT_SHARED_MEMORY:
+        host = SMC.SharedMemoryConnection( host )
+        client = SMC.SharedMemoryConnection( client )
+
+    listener = threading.Thread( target=host.open_connection, daemon=True )
+    listener.start()
+
+    # The client may try to connect before the host is listening
+    for _ in range( CONNECT_TIMEOUT * 100 ):
+        try:
+            client.open_connection()
+            break
+
+        except ConnectionRefusedError:
+            time.sleep( 0.01 )
+
+    else:
+        raise BH.BenchmarkUnavailable( "The loopback connection could not be opened" )
+
+    listener.join( CONNECT_TIMEOUT )
+
+    return host, client
+
+def _get_codec_benchmarks( codec : str ) -> list[ BH.Benchmark ]:
+    """
+    Function: Get Codec Benchmarks
+
+    Inputs: The name of the codec
+    Outputs: The benchmarks of the codec
+    """
+    group = f"network.{ codec }"
+    codec_instance = MC.CODEC_NAME_TO_CLASS[ codec ]()
+    encoded_attack = codec_instance.encode( ATTACK_MESSAGE )
+
+    def setup_encode():
+        return lambda: codec_instance.encode( ATTACK_MESSAGE ), None
+
+    def setup_decode():
+        return lambda: codec_instance.decode( encoded_attack ), None
+
+    def setup_round_trip( connect = _connect_loopback ):
+        host, client = connect( codec )
+
+        def round_trip():
+            client.send_message( ATTACK_MESSAGE )
+            host.wait_for_message()
+            host.send_message( RESPONSE_MESSAGE )
+            client.wait_for_message()
+
+        def teardown():
+            client.close_connection()
+            host.close_connection()
+
+        return round_trip, teardown
+
+    return [ BH.Benchmark( group, "encode_attack", setup_encode ),
+             BH.Benchmark( group, "decode_attack", setup_decode ),
+             BH.Benchmark( group, "turn_round_trip", setup_round_trip ),
+             BH.Benchmark( group, "queue_turn_round_trip", lambda: setup_round_trip( LC.create_queue_pair ) ),
+             BH.Benchmark( group, "socketpair_turn_round_trip", lambda: setup_round_trip( LC.create_socket_pair ) ),
+             BH.Benchmark( group, "unix_turn_round_trip", lambda: setup_round_trip( lambda codec: _connect_loopback( codec, NC.TRANSPORT_UNIX ) ) ),
+             BH.Benchmark( group, "shm_turn_round_trip", lambda: setup_round_trip( lambda codec: _connect_loopback( codec, NC.TRANSPORT_SHARED_MEMORY ) ) ) ]
+
+def get_benchmarks() -> list[ BH.Benchmark ]:
+    """
+    Function: Get Benchmarks
+
+    Inputs: None
+    Outputs: The benchmarks of every codec
+    """
+    return [ benchmark for codec in MC.CODEC_NAME_TO_CLASS for benchmark in _get_codec_benchmarks( codec ) ]
@@ -0,0 +1,87 @@
+'''
+Module: bench_view.py
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Inputs: None
+Outputs: Benchmarks of the console view
+
+Description: This module benchmarks the parts of the console view that run on
+             every screen refresh. The output of the view is written to the
+             null device, so the timings do not include the terminal
+'''
+################################################################################
+# Imports
+################################################################################
+import model_factory as MF
+
+from benchmarks import bench_harness as BH
+from benchmarks import bench_model as BM
+from interfaces import interface_headers as IH
+
+import contextlib
+import os
+
+################################################################################
+# Procedures
+################################################################################
+def _create_view():
+    """
+    Function: Create View
+
+    Inputs: None
+    Outputs: The console view and the parameters to draw both boards with
+
+    Description: The boards are taken from the model that the game uses
+                 by default
+    """
+    try:
+        import game_view as GV
+
+    except ImportError as error:
+        raise BH.BenchmarkUnavailable( str( error ) ) from error
+
+    model = BM.create_fleet_model( MF.DEFAULT_MODEL_TYPE )
+    params = { IH.VIEW_PARAM_BOARD : model.get_visual_board( BM.HOST ),
+               IH.VIEW_PARAM_OPPONENT_BOARD : model.get_visual_board( BM.JOIN ) }
+
+    return GV.GameView(), params
+
+def _setup_convert_to_view_grid():
+    """
+    Function: Setup Convert to View Grid
+
+    Inputs: None
+    Outputs: The operation to time, the teardown function
+    """
+    view, params = _create_view()
+    board = params[ IH.VIEW_PARAM_BOARD ]
+
+    return lambda: view._convert_to_view_grid( board ), None
+
+def _setup_draw_grid():
+    """
+    Function: Setup Draw Grid
+
+    Inputs: None
+    Outputs: The operation to time, the teardown function
+    """
+    view, params = _create_view()
+    null_device = open( os.devnull, "w" )
+
+    def draw_grid():
+        with contextlib.redirect_stdout( null_device ):
+            view.draw_grid( params )
+
+    return draw_grid, null_device.close
+
+def get_benchmarks() -> list[ BH.Benchmark ]:
+    """
+    Function: Get Benchmarks
+
+    Inputs: None
+    Outputs: The benchmarks of the view
+    """
+    return [ BH.Benchmark( "view", "convert_to_view_grid", _setup_convert_to_view_grid ),
+             BH.Benchmark( "view", "draw_grid", _setup_draw_grid ) ]
@@ -0,0 +1,149 @@
+'''
+Module: run_benchmarks.py
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Inputs: Benchmark options
+Outputs: Results of the benchmarks as JSON
+
+Description: This module runs the benchmarks of the models, the view and the
+             network interaction and writes the results as a single JSON
+             document. Benchmarks that can not run on this machine are listed
+             as skipped. Pass the results of an earlier run with --compare to
+             print how much every benchmark changed since then
+
+Run it from the root of the repository with
+$python executable$ -m benchmarks.run_benchmarks --output results.json
+'''
+################################################################################
+# Imports
+################################################################################
+from benchmarks import bench_harness as BH
+from benchmarks import bench_model as BM
+from benchmarks import bench_network as BN
+from benchmarks import bench_view as BV
+from interfaces import interface_headers as IH
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+
+################################################################################
+# Global Variables
+################################################################################
+
+# Modules that provide benchmarks. Every module has a get_benchmarks
+# function that returns its benchmarks
+BENCHMARK_MODULES = [ BM, BV, BN ]
+
+################################################################################
+# Procedures
+################################################################################
+def get_commit() -> str:
+    """
+    Function: Get Commit
+
+    Inputs: None
+    Outputs: The commit that is checked out, None outside of a git checkout
+    """
+    try:
+        return subprocess.run( [ "git", "rev-parse", "HEAD" ], capture_output=True, text=True, check=True ).stdout.strip()
+
+    except ( OSError, subprocess.CalledProcessError ):
+        return None
+
+def run_benchmarks( name_filter : str = None, repeat : int = BH.DEFAULT_REPEAT, min_time : float = BH.DEFAULT_MIN_TIME ) -> dict:
+    """
+    Function: Run Benchmarks
+
+    Inputs: Part of the name of the benchmarks to run, the amount of runs, the minimum time of a run
+    Outputs: The results of every benchmark along with the environment they ran in
+    """
+    results = list()
+    skipped = list()
+
+    for module in BENCHMARK_MODULES:
+        for benchmark in module.get_benchmarks():
+            if name_filter is not None and name_filter not in benchmark.get_full_name():
+                continue
+
+            try:
+                results.append( BH.run_benchmark( benchmark, repeat, min_time ) )
+
+            except BH.BenchmarkUnavailable as error:
+                skipped.append( { "name" : benchmark.get_full_name(), "reason" : str( error ) } )
+
+    return { "commit" : get_commit(),
+             "python" : platform.python_version(),
+             "platform" : platform.platform(),
+             "rows" : IH.NUMBER_OF_ROWS,
+             "cols" : IH.NUMBER_OF_COLS,
+             "results" : results,
+             "skipped" : skipped }
+
+def compare_results( baseline : dict, current : dict ) -> list[ str ]:
+    """
+    Function: Compare Results
+
+    Inputs: The results of an earlier run, the results of this run
+    Outputs: A line per benchmark that ran in both runs
+
+    Description: The best times are compared, since they are the least
+                 affected by noise. A ratio above 1 means this run is slower
+    """
+    baseline_times = { result[ "name" ] : result[ "best_ns" ] for result in baseline[ "results" ] }
+    lines = list()
+
+    for result in current[ "results" ]:
+        if result[ "name" ] in baseline_times:
+            ratio = result[ "best_ns" ] / baseline_times[ result[ "name" ] ]
+            lines.append( f"{ result[ 'name' ] :<40} { baseline_times[ result[ 'name' ] ] :>14.1f} ns "
+                          f"{ result[ 'best_ns' ] :>14.1f} ns { ratio :>7.2f}x" )
+
+    return lines
+
+def parse_arguments( argv : list[ str ] = None ) -> argparse.Namespace:
+    """
+    Function: Parse Arguments
+
+    Inputs: Command line arguments, defaults to the arguments of the process
+    Output: Parsed benchmark options
+    """
+    parser = argparse.ArgumentParser( description="Battleship benchmarks" )
+    parser.add_argument( "--filter", default=None, help="Only run the benchmarks whose name contains this text" )
+    parser.add_argument( "--repeat", type=int, default=BH.DEFAULT_REPEAT, help="Number of timed runs per benchmark" )
+    parser.add_argument( "--min-time", type=float, default=BH.DEFAULT_MIN_TIME, help="Minimum seconds per timed run" )
+    parser.add_argument( "--output", default=None, help="File to write the results to, defaults to standard output" )
+    parser.add_argument( "--compare", default=None, help="Results of an earlier run to compare against" )
+    parser.add_argument( "--rows", type=int, default=IH.NUMBER_OF_ROWS, help="Number of rows on the board" )
+    parser.add_argument( "--cols", type=int, default=IH.NUMBER_OF_COLS, help="Number of columns on the board" )
+
+    return parser.parse_args( argv )
+
+def main( options : argparse.Namespace ):
+    """
+    Function: Main
+
+    Inputs: Benchmark options
+    Output: The results written as JSON, the comparison printed to standard error
+    """
+    IH.set_board_dimensions( options.rows, options.cols )
+    results = run_benchmarks( options.filter, options.repeat, options.min_time )
+
+    if options.output is None:
+        print( json.dumps( results, indent=2 ) )
+
+    else:
+        with open( options.output, "w" ) as output:
+            json.dump( results, output, indent=2 )
+
+    if options.compare is not None:
+        with open( options.compare ) as baseline:
+            for line in compare_results( json.load( baseline ), results ):
+                print( line, file=sys.stderr )
+
+if __name__ == "__main__":
+    main( parse_arguments() )
@@ -22,59 +22,44 @@ Sources: DigitalOcean
 ################################################################################
 # Imports
 ################################################################################
-import socket
+import message_codec as MC
+import network_config as NC
 import interfaces.interface_headers as IH
-from interfaces.interface_game_interaction import GameInteractionInterface
+from socket_connection import SocketConnection
 
 ################################################################################
 # Types
 ################################################################################
-class Client( GameInteractionInterface ):
+class Client( SocketConnection ):
     
-    def __init__( self ) -> None:
+    def __init__( self, codec : str = MC.DEFAULT_CODEC, lobby : bool = False, config : NC.NetworkConfig = None ) -> None:
         """
-        Definition: Setting up the host address, host port and client socket.
+        Definition: Setting up the address and socket options of the host to connect to, and the client socket.
         """
         
-        # Declare the members of this class. For now, we will be using
-        # networking protocols on the same host. Can easily be modified
-        # to do networking across multiple hosts
-        self.host = socket.gethostname()
-        self.host_port = 5014
-        self.client_socket = None 
+        # Declare the members of this class. Without a configuration
+        # the settings are taken from the environment, and the
+        # client connects to the name of this machine on the default port
+        super().__init__( codec )
+        self.network_config = NC.from_environment() if config is None else config
+
+        # In lobby mode the client connects to a game server, which
+        # decides if this player makes the first move. Otherwise the
+        # host always makes the first move
+        self.lobby = lobby
+        self.first_move = False
     
     def open_connection( self ) -> None:
         """
         Definition: Opening the connection and listening for and connecting to the host.
         """
         
-        # Create a client socket and connect to the host socket
-        self.client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.client_socket.connect((self.host, self.host_port))
-    
-    def close_connection( self ) -> None:
-        """
-        Definition: Closing the port.
-        """
-        
-        # Close the client socket
-        self.client_socket.close()
-        self.client_socket = None 
+        # Create a client socket and connect to the host socket, then
+        # agree with the host on the codec that will be used for the game
+        client_socket = NC.create_connected_socket( self.network_config )
+        self._start_connection( client_socket )
+        self._negotiate_codec_as_client()
 
-    def send_message( self, msg ) -> None:
-        """
-        Definition: Sending a message to the server.
-        """
-        
-        # Send an encoded string to the host
-        self.client_socket.send(msg.encode())
-        
-        
-    def wait_for_message( self ):
-        """
-        Definition: Waiting for a message from the server.
-        """
-        
-        # Decode the encoded string sent by the host
-        data = self.client_socket.recv(1024).decode()
-        return data
\ No newline at end of file
+        # Wait for the game server to pair us with an opponent
+        if self.lobby:
+            self.first_move = self.wait_for_message()[ IH.VIEW_PARAM_FIRST_MOVE ]
@@ -0,0 +1,165 @@
+'''
+Module: event_loop.py
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Inputs: Files to watch and timers to run
+Outputs: Calls to the functions registered for them
+
+Description: This module implements a small event loop on top of selectors.
+             Functions can be registered to run when a file or socket has data
+             to read and when a timer expires. The loop waits on every file
+             and the closest timer at once, so a single thread can react to
+             the network, the keyboard and the clock without blocking on any
+             one of them
+'''
+################################################################################
+# Imports
+################################################################################
+import heapq
+import itertools
+import selectors
+import time
+
+from collections.abc import Callable
+
+################################################################################
+# Types
+################################################################################
+class Timer:
+    """
+    Description: This is a function that is scheduled to run at a point in
+                 time. A timer that is cancelled is skipped once it expires
+    """
+    __slots__ = ( "deadline", "callback", "cancelled" )
+
+    def __init__( self, deadline : float, callback : Callable[ [], None ] ) -> None:
+        """
+        Function: Initialization
+
+        Inputs: The time of the monotonic clock to run at, the function to run
+        Outputs: None
+        """
+        self.deadline = deadline
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel( self ) -> None:
+        """
+        Function: Cancel
+
+        Inputs: None
+        Outputs: None
+        """
+        self.cancelled = True
+
+class EventLoop:
+    def __init__( self ) -> None:
+        """
+        Function: Initialization
+
+        Inputs: None
+        Outputs: None
+        """
+        self._selector = selectors.DefaultSelector()
+
+        # The timers are kept in a heap ordered by their deadline.
+        # The counter keeps timers with the same deadline in the
+        # order they were scheduled
+        self._timers : list[ tuple[ float, int, Timer ] ] = list()
+        self._timer_counter = itertools.count()
+        self._running = False
+
+    def add_reader( self, fileobj, callback : Callable[ [], None ] ) -> None:
+        """
+        Function: Add Reader
+
+        Inputs: A file or socket, or anything with a fileno method, the function to run when it can be read
+        Outputs: None
+        """
+        self._selector.register( fileobj, selectors.EVENT_READ, callback )
+
+    def remove_reader( self, fileobj ) -> None:
+        """
+        Function: Remove Reader
+
+        Inputs: A file or socket that was added before
+        Outputs: None
+        """
+        self._selector.unregister( fileobj )
+
+    def call_at( self, deadline : float, callback : Callable[ [], None ] ) -> Timer:
+        """
+        Function: Call At
+
+        Inputs: The time of the monotonic clock to run at, the function to run
+        Outputs: The timer, which can be cancelled
+        """
+        timer = Timer( deadline, callback )
+        heapq.heappush( self._timers, ( deadline, next( self._timer_counter ), timer ) )
+
+        return timer
+
+    def call_later( self, delay : float, callback : Callable[ [], None ] ) -> Timer:
+        """
+        Function: Call Later
+
+        Inputs: The amount of seconds to wait, the function to run
+        Outputs: The timer, which can be cancelled
+        """
+        return self.call_at( time.monotonic() + delay, callback )
+
+    def stop( self ) -> None:
+        """
+        Function: Stop
+
+        Inputs: None
+        Outputs: None
+
+        Description: The loop returns once the function that called this is done
+        """
+        self._running = False
+
+    def close( self ) -> None:
+        """
+        Function: Close
+
+        Inputs: None
+        Outputs: None
+        """
+        self._selector.close()
+
+    def run( self ) -> None:
+        """
+        Function: Run
+
+        Inputs: None
+        Outputs: None
+
+        Description: Runs the registered functions until stop is called
+        """
+        self._running = True
+
+        while self._running:
+            # Drop the timers that were cancelled, then sleep
+            # until the closest timer or until a file is ready
+            while self._timers and self._timers[ 0 ][ 2 ].cancelled:
+                heapq.heappop( self._timers )
+
+            timeout = None if not self._timers else max( 0.0, self._timers[ 0 ][ 0 ] - time.monotonic() )
+
+            for key, _ in self._selector.select( timeout ):
+                key.data()
+
+                if not self._running:
+                    return
+
+            # Run every timer that expired while waiting
+            now = time.monotonic()
+
+            while self._running and self._timers and self._timers[ 0 ][ 0 ] <= now:
+                _, _, timer = heapq.heappop( self._timers )
+
+                if not timer.cancelled:
+                    timer.callback()
@@ -0,0 +1,230 @@
+'''
+Module: fleet_generator.py
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Inputs: A random number generator, the number of ships
+Outputs: Random legal layouts of a fleet
+
+Description: This module places a whole fleet without a view. Every ship of
+             sizes MIN_NUM_OF_SHIPS to the number of ships is given a bow and
+             a direction, following the same placement rules as the engine.
+             Layouts are uniformly random. Every ship is drawn from the
+             placements of its size that fit on the board, and the whole
+             layout is drawn again if two ships overlap, so no layout is
+             favored over another. Drawing from the placements that fit
+             instead of from random bows keeps the rate of accepted layouts
+             high on large boards, where ships rarely overlap
+'''
+################################################################################
+# Imports
+################################################################################
+import game_engine as GE
+import ship_footprints as SF
+
+from interfaces import interface_headers as IH
+from interfaces import interface_game_model as IGM
+
+import random
+
+################################################################################
+# Global Variables
+################################################################################
+
+# Footprints and placements of every placement index of a ship,
+# by the dimensions of the board and the size of the ship
+_PLACEMENT_TABLES : dict[ tuple[ int, int, int ], tuple[ list[ int ], list[ tuple ] ] ] = dict()
+
+################################################################################
+# Types
+################################################################################
+class FleetGenerator:
+    """
+    Description: This generator draws layouts of a fleet. Placement n of a
+                 ship is one of its horizontal placements in row major order
+                 of their bows, followed by its vertical placements in the
+                 same order. Overlaps are found with the footprint masks on
+                 boards that have a footprint table, and with the cell
+                 numbers of the ships on larger boards, where every mask
+                 would be as wide as the board
+    """
+    __slots__ = ( "_rng", "_cols", "_sizes", "_masks", "_placements" )
+
+    def __init__( self, rng : random.Random, number_of_ships : int = IH.MAX_NUM_OF_SHIPS ):
+        """
+        Function: Initialization
+
+        Inputs: The random number generator, the number of ships
+        Outputs: None
+
+        Description: The generator uses the board dimensions in the interface
+                     headers. The largest ships are drawn first because they
+                     overlap the most, so rejected layouts are found early
+
+        Data members: The random number generator, the number of columns, the
+                      size, the amount of horizontal placements, the width of
+                      the horizontal bows and the amount of placements of every
+                      ship, the footprints and placements of every ship
+        """
+        self._rng = rng
+        self._cols = IH.NUMBER_OF_COLS
+        self._sizes : list[ tuple[ int, int, int, int ] ] = []
+
+        for size in range( number_of_ships, IH.MIN_NUM_OF_SHIPS - 1, -1 ):
+            width = max( IH.NUMBER_OF_COLS - size + 1, 0 )
+            horizontal_count = IH.NUMBER_OF_ROWS * width
+            vertical_count = max( IH.NUMBER_OF_ROWS - size + 1, 0 ) * IH.NUMBER_OF_COLS
+
+            if horizontal_count + vertical_count == 0:
+                raise ValueError( f"A ship of size { size } does not fit on the board" )
+
+            self._sizes.append( ( size, horizontal_count, width, horizontal_count + vertical_count ) )
+
+        self._masks : list[ list[ int ] ] = None
+        self._placements : list[ list[ tuple ] ] = None
+
+        if IH.NUMBER_OF_ROWS * IH.NUMBER_OF_COLS <= SF.MAX_TABLE_CELLS:
+            tables = [ self._get_placement_table( entry ) for entry in self._sizes ]
+            self._masks = [ masks for masks, _ in tables ]
+            self._placements = [ placements for _, placements in tables ]
+
+    def _get_placement( self, size : int, horizontal_count : int, width : int, index : int ) -> tuple[ IH.SystemCoordType, str ]:
+        """
+        Function: Get Placement
+
+        Inputs: The size of a ship, the amount and width of its horizontal placements, the index of a placement
+        Outputs: The bow and direction of the placement
+        """
+        if index < horizontal_count:
+            return ( index // width, index % width + size - 1 ), IH.DIRECTION_HORIZONTAL
+
+        index -= horizontal_count
+        return ( index // self._cols + size - 1, index % self._cols ), IH.DIRECTION_VERTICAL
+
+    def _get_placement_table( self, entry : tuple[ int, int, int, int ] ) -> tuple[ list[ int ], list[ tuple ] ]:
+        """
+        Function: Get Placement Table
+
+        Inputs: The size, the amount and width of the horizontal placements and the amount of placements of a ship
+        Outputs: The footprint and the bow, direction and size of every placement of the ship
+
+        Description: The tables are shared by every generator of the same
+                     board, since they do not depend on the fleet
+        """
+        size, horizontal_count, width, count = entry
+        key = ( IH.NUMBER_OF_ROWS, IH.NUMBER_OF_COLS, size )
+        table = _PLACEMENT_TABLES.get( key )
+
+        if table is None:
+            footprints = SF.get_footprint_table()
+            placements = [ ( *self._get_placement( size, horizontal_count, width, index ), size ) for index in range( count ) ]
+
+            table = ( [ footprints.get_mask( *placement ) for placement in placements ], placements )
+            _PLACEMENT_TABLES[ key ] = table
+
+        return table
+
+    def _draw_with_masks( self ) -> list[ int ]:
+        """
+        Function: Draw With Masks
+
+        Inputs: None
+        Outputs: The placement index of every ship, largest ship first
+
+        Description: Drawing an index with random() avoids the overhead of
+                     randrange, and its bias is far below what a game could show
+        """
+        draw = self._rng.random
+        sizes = self._masks
+
+        while True:
+            occupied = 0
+            indexes = []
+
+            for masks in sizes:
+                index = int( draw() * len( masks ) )
+                mask = masks[ index ]
+
+                if occupied & mask:
+                    break
+
+                occupied |= mask
+                indexes.append( index )
+
+            else:
+                return indexes
+
+    def _draw_with_cells( self ) -> list[ int ]:
+        """
+        Function: Draw With Cells
+
+        Inputs: None
+        Outputs: The placement index of every ship, largest ship first
+
+        Description: A ship is a range of cell numbers, with a step of one
+                     column when it is vertical. The stern of a vertical
+                     placement is the cell of its index
+        """
+        draw = self._rng.random
+        cols = self._cols
+
+        while True:
+            occupied = set()
+            indexes = []
+
+            for size, horizontal_count, width, count in self._sizes:
+                index = int( draw() * count )
+
+                if index < horizontal_count:
+                    stern = index // width * cols + index % width
+                    cells = range( stern, stern + size )
+
+                else:
+                    stern = index - horizontal_count
+                    cells = range( stern, stern + size * cols, cols )
+
+                if not occupied.isdisjoint( cells ):
+                    break
+
+                occupied.update( cells )
+                indexes.append( index )
+
+            else:
+                return indexes
+
+    def generate( self ) -> list[ tuple[ IH.SystemCoordType, str, int ] ]:
+        """
+        Function: Generate
+
+        Inputs: None
+        Outputs: The bow, direction and size of every ship, smallest ship first
+        """
+        if self._masks is not None:
+            layout = [ placements[ index ] for placements, index in zip( self._placements, self._draw_with_masks() ) ]
+
+        else:
+            layout = [ ( *self._get_placement( size, horizontal_count, width, index ), size )
+                       for ( size, horizontal_count, width, _ ), index in zip( self._sizes, self._draw_with_cells() ) ]
+
+        layout.reverse()
+        return layout
+
+    def place_fleet( self, target : IGM.GameModelInterface | GE.GameEngine, player_type : IH.PlayerTypeEnum ) -> list[ tuple[ IH.SystemCoordType, str, int ] ]:
+        """
+        Function: Place Fleet
+
+        Inputs: The model or engine to place the fleet with, the player's board
+        Outputs: The bow, direction and size of every ship that was placed
+
+        Description: Placing through an engine hands the placements to its
+                     move log. The board has to be empty, so that every
+                     layout fits on it
+        """
+        layout = self.generate()
+
+        for bow, direction, size in layout:
+            if not target.place_ship( player_type, bow, direction, size ):
+                raise ValueError( "A fleet can only be placed on an empty board" )
+
+        return layout
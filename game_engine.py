@@ -0,0 +1,264 @@
+'''
+Module: game_engine.py
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Inputs: Ship placements and attacks
+Outputs: Results of the placements and attacks
+
+Description: This module holds the rules of the game. The engine operates
+             on top of any implementation of the model interface and does no
+             input or output of its own, so the same rules can be driven by
+             the interactive game, by simulations, or by bots. Every placement
+             and attack can be handed to a move log
+'''
+################################################################################
+# Imports
+################################################################################
+from interfaces import interface_headers as IH
+from interfaces import interface_game_model as IGM
+
+################################################################################
+# Global Variables
+################################################################################
+
+# Directions that a ship can be placed in from its bow
+DIRECTION_VERTICAL = IH.DIRECTION_VERTICAL
+DIRECTION_HORIZONTAL = IH.DIRECTION_HORIZONTAL
+DIRECTIONS = ( DIRECTION_HORIZONTAL, DIRECTION_VERTICAL )
+
+################################################################################
+# Types
+################################################################################
+class GameEngine:
+    def __init__( self, model : IGM.GameModelInterface, move_log = None ):
+        """
+        Function: Initialization
+
+        Inputs: Instance of a model, the move log writer that the moves are handed to or None
+        Outputs: None
+
+        Description: This is the initialization function of the engine. The
+                     engine applies the rules of the game to the model that
+                     is given to it
+
+        Data members: Instance of the model, the winner of the game, the move log
+        """
+        self._model : IGM.GameModelInterface = model
+        self._winner : IH.PlayerTypeEnum = None
+        self._move_log = move_log
+
+    def get_model( self ) -> IGM.GameModelInterface:
+        """
+        Function: Get Model
+
+        Inputs: None
+        Outputs: The model the engine operates on
+        """
+        return self._model
+
+    def get_winner( self ) -> IH.PlayerTypeEnum:
+        """
+        Function: Get Winner
+
+        Inputs: None
+        Outputs: The player that won the game, None if the game is not over
+        """
+        return self._winner
+
+    def is_over( self ) -> bool:
+        """
+        Function: Is Over
+
+        Inputs: None
+        Outputs: If the game has ended
+        """
+        return self._winner is not None
+
+    def forfeit( self, player_type : IH.PlayerTypeEnum ) -> None:
+        """
+        Function: Forfeit
+
+        Inputs: The player that gives up the game
+        Outputs: None
+
+        Description: Ends the game in favor of the opponent, such as when a
+                     player leaves or runs out of time. A game that is already
+                     over keeps its winner
+        """
+        if self._winner is None:
+            self._winner = get_opponent_type( player_type )
+
+    def place_ship( self, player_type : IH.PlayerTypeEnum, bow : IH.SystemCoordType, direction : str, size : int ) -> bool:
+        """
+        Function: Place Ship
+
+        Inputs: The player's board, the system coordinate of the bow, the direction, the size of the ship
+        Outputs: If the ship was placed
+
+        Description: The ship extends from the bow towards the first row or
+                     column depending on the direction. The ship is only placed
+                     if every coordinate it would take is a valid placement, and
+                     the size of the ship is used as its id. The model checks
+                     and commits the whole placement in one step
+        """
+        if not self._model.place_ship( player_type, bow, direction, size ):
+            return False
+
+        if self._move_log is not None:
+            self._move_log.log_placement( player_type, bow, direction, size )
+
+        return True
+
+    def can_place_ship( self, player_type : IH.PlayerTypeEnum, bow : IH.SystemCoordType, direction : str, size : int ) -> bool:
+        """
+        Function: Can Place Ship
+
+        Inputs: The player's board, the system coordinate of the bow, the direction, the size of the ship
+        Outputs: If the ship can be placed
+        """
+        return self._model.can_place_ship( player_type, bow, direction, size )
+
+    def is_valid_attack( self, player_type : IH.PlayerTypeEnum, coord : IH.SystemCoordType ) -> bool:
+        """
+        Function: Is Valid Attack
+
+        Inputs: The board being attacked, the coordinate of the attack
+        Outputs: If the coordinate can be attacked
+
+        Description: Coordinates that arrive over the network are checked with
+                     this before they are resolved, so a coordinate that is not
+                     on the board is rejected here rather than by the model
+        """
+        return IH.is_on_board( coord ) and self._model.is_valid_coord( player_type, coord, IH.GameEventType.GAME_EVENT_MAKE_ATTACK )
+
+    def resolve_attack( self, player_type : IH.PlayerTypeEnum, coord : IH.SystemCoordType ) -> dict:
+        """
+        Function: Resolve Attack
+
+        Inputs: The board being attacked, the coordinate of the attack
+        Outputs: The response to the attack
+
+        Description: This function is used by the defending player. The attack
+                     is applied to the board and the response that is sent back
+                     to the attacker is returned. The response holds the state
+                     of the cell, if the attack won the game, if the attack sunk
+                     a ship and the size of the ship that was attacked
+        """
+        response = dict()
+        cell = self._model.get_coord( player_type, coord )
+
+        # If the coordinate is a ship coordinate, and it is not hit already,
+        # make sure that it is in the hit state. Otherwise, the the opponent
+        # missed
+        if cell[ IH.GAME_COORD_TYPE_ID_INDEX ] > IH.BASE_CELL and cell[ IH.GAME_COORD_TYPE_STATE_INDEX ] != IH.CoordStateType.COORD_STATE_HIT:
+            response[ IH.GAME_COORD_TYPE_STATE_INDEX ] = IH.CoordStateType.COORD_STATE_HIT.value
+            cell[ IH.GAME_COORD_TYPE_STATE_INDEX ] = IH.CoordStateType.COORD_STATE_HIT
+
+        else:
+            response[ IH.GAME_COORD_TYPE_STATE_INDEX ] = IH.CoordStateType.COORD_STATE_MISS.value
+            cell[ IH.GAME_COORD_TYPE_STATE_INDEX ] = IH.CoordStateType.COORD_STATE_MISS
+
+        self._model.update_coord( player_type, coord, cell )
+
+        # Determine if the result of this attack caused the attacker
+        # to win and if the attack sunk the ship
+        response[ IH.VIEW_PARAM_WIN ] = not self._model.ships_are_alive( player_type )
+        response[ IH.VIEW_PARAM_SHIP_SUNK ] = not self._model.ship_is_alive( player_type, cell[ IH.GAME_COORD_TYPE_ID_INDEX ] )
+        response[ IH.VIEW_PARAM_SIZE ] = cell[ IH.GAME_COORD_TYPE_ID_INDEX ]
+
+        if response[ IH.VIEW_PARAM_WIN ]:
+            self._winner = get_opponent_type( player_type )
+
+        if self._move_log is not None:
+            self._move_log.log_attack( player_type, coord, response )
+
+        return response
+
+    def record_attack_result( self, player_type : IH.PlayerTypeEnum, coord : IH.SystemCoordType, response : dict ) -> None:
+        """
+        Function: Record Attack Result
+
+        Inputs: The board that was attacked, the coordinate of the attack, the response to the attack
+        Outputs: None
+
+        Description: This function is used by the attacking player to record
+                     the response of the defending player on its copy of the
+                     opponent's board
+        """
+        cell = self._model.get_coord( player_type, coord )
+
+        self._model.update_coord( player_type, coord, { IH.GAME_COORD_TYPE_ID_INDEX: cell[ IH.GAME_COORD_TYPE_ID_INDEX ],
+                                                        IH.GAME_COORD_TYPE_STATE_INDEX: IH.CoordStateType( response[ IH.GAME_COORD_TYPE_STATE_INDEX ] ) } )
+
+        if response[ IH.VIEW_PARAM_WIN ]:
+            self._winner = get_opponent_type( player_type )
+
+        if self._move_log is not None:
+            self._move_log.log_attack( player_type, coord, response )
+
+################################################################################
+# Procedures
+################################################################################
+def get_opponent_type( player_type : IH.PlayerTypeEnum ) -> IH.PlayerTypeEnum:
+    """
+    Function: Get Opponent Type
+
+    Inputs: Type of a player
+    Output: Type of the opposing player
+    """
+    if player_type == IH.PlayerTypeEnum.PLAYER_TYPE_HOST:
+        return IH.PlayerTypeEnum.PLAYER_TYPE_JOIN
+
+    return IH.PlayerTypeEnum.PLAYER_TYPE_HOST
+
+def get_attack_coord( message : dict ) -> IH.SystemCoordType:
+    """
+    Function: Get Attack Coordinate
+
+    Inputs: An attack that arrived from the opponent
+    Outputs: The coordinate of the attack, None if the message is not an attack
+    """
+    try:
+        return ( message[ IH.VIEW_PARAM_ROW ], message[ IH.VIEW_PARAM_COL ] )
+
+    except ( KeyError, TypeError ):
+        return None
+
+def get_ending_coordinate( start_coordinate, dir, amount : IH.SystemCoordType ) -> IH.SystemCoordType:
+    """
+    Function: Get Ending Coordinate
+
+    Inputs: Starting coordinate, calulation direction, amount to move
+    Output: Ending Coordinate
+
+    Description: This is a helper function that computes the predicted
+                 ending coordinate given a starting coordinate and
+                 the orientation of ship with the size of the ship
+    """
+
+    # Depending on the direction passed, compute the ending
+    # coordinate by subtracting the amount from the a particular
+    # index in the starting coordinate
+    if dir == DIRECTION_VERTICAL:
+        return ( start_coordinate[ 0 ] - amount + 1, start_coordinate[ 1 ] )
+
+    if dir == DIRECTION_HORIZONTAL:
+        return ( start_coordinate[ 0 ], start_coordinate[ 1 ] - amount + 1 )
+
+def get_ship_coords( bow : IH.SystemCoordType, direction : str, size : int ) -> list[ IH.SystemCoordType ]:
+    """
+    Function: Get Ship Coordinates
+
+    Inputs: The system coordinate of the bow, the direction, the size of the ship
+    Output: Every coordinate that the ship would take
+
+    Description: This is a helper function that lists the coordinates
+                 between the bow and the ending coordinate of a ship
+    """
+    end = get_ending_coordinate( bow, direction, size )
+
+    return [ ( row, col )
+             for row in range( bow[ IH.ROW_INDEX ], end[ IH.ROW_INDEX ] - 1, -1 )
+             for col in range( bow[ IH.COLUMN_INDEX ], end[ IH.COLUMN_INDEX ] - 1, -1 ) ]
@@ -0,0 +1,483 @@
+'''
+Module: game_loop.py
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Inputs: The engine, presenter and connection of a game that is ready to start
+Outputs: The turns of the game played until it ends
+
+Description: This module plays the turns of a networked game on top of an event
+             loop. While the player waits for the opponent, the connection, the
+             keyboard and the clock are watched at the same time: the move of
+             the opponent is handled as soon as it arrives, the waiting page
+             counts down the time the opponent has left, an opponent that
+             leaves or runs out of time ends the game, and the player can leave
+             the game by entering q. The pages of the view are still called
+             the same way as in the blocking loop of main.py, so every view
+             works with both loops
+'''
+################################################################################
+# Imports
+################################################################################
+import event_loop as EL
+import game_engine as GE
+import game_snapshot as GS
+
+from interfaces import interface_headers as IH
+from interfaces import interface_game_presenter as IGP
+from interfaces import interface_game_interaction as IGI
+
+import math
+import os
+import sys
+import time
+
+################################################################################
+# Global Variables
+################################################################################
+
+# Extra seconds given to the opponent before they run out of time,
+# so that a move made right at the end of a turn is not lost on
+# its way over the network
+TURN_TIMEOUT_GRACE = 2.0
+
+# Seconds between the updates of the countdown on the waiting page
+COUNTDOWN_INTERVAL = 1.0
+
+# Input that leaves the game while waiting for the opponent
+QUIT_COMMANDS = { "q", "quit" }
+
+# Maximum amount of bytes read from the keyboard at once
+INPUT_READ_SIZE = 1024
+
+# Reason the game ends with when the opponent sends a message that
+# can not be decoded, or a move that the rules do not allow
+INVALID_MOVE_MESSAGE = "The opponent sent an invalid move"
+
+WINDOWS_OS_NAME = "nt"
+
+################################################################################
+# Procedures
+################################################################################
+def describe_opponent_attack( coord : IH.SystemCoordType, response : dict ) -> str:
+    """
+    Function: Describe Opponent Attack
+
+    Inputs: The system coordinate the opponent attacked, the response to the attack
+    Outputs: The state message that describes the attack
+    """
+    location = f"row={ IH.SYS_ROW_TO_PLACMENT_ROW[ coord[ IH.ROW_INDEX ] ] }, col={ IH.SYS_COL_TO_PLACMENT_COL[ coord[ IH.COLUMN_INDEX ] ] }"
+
+    return _describe_attack( f"The opponent's move at { location }", response )
+
+def describe_player_attack( attack : dict, response : dict ) -> str:
+    """
+    Function: Describe Player Attack
+
+    Inputs: The attack as it was entered in the view, the response to the attack
+    Outputs: The state message that describes the attack
+    """
+    return _describe_attack( f"Your move at row={ attack[ IH.VIEW_PARAM_ROW ] }, col={ attack[ IH.VIEW_PARAM_COL ] }", response )
+
+def _describe_attack( move : str, response : dict ) -> str:
+    """
+    Function: Describe Attack
+
+    Inputs: The description of the move, the response to the attack
+    Outputs: The state message that describes the attack
+    """
+    if IH.CoordStateType( response[ IH.GAME_COORD_TYPE_STATE_INDEX ] ) == IH.CoordStateType.COORD_STATE_HIT:
+        message = f"{ move } hit!"
+
+    else:
+        message = f"{ move } missed!"
+
+    # If Ship was sunk, indictate as a status message that the ship was sunk
+    if response[ IH.VIEW_PARAM_SHIP_SUNK ]:
+        message += f"\nShip of size { response[ IH.VIEW_PARAM_SIZE ] } was sunk!"
+
+    return message
+
+def _add_message_line( message : str, line : str ) -> str:
+    """
+    Function: Add Message Line
+
+    Inputs: A state message that may be None, the line to add
+    Outputs: The state message with the line added at the end
+    """
+    return line if message is None else f"{ message }\n{ line }"
+
+################################################################################
+# Types
+################################################################################
+class EventDrivenGame:
+    def __init__( self, engine : GE.GameEngine, presenter : IGP.GamePresenterInterface, connection : IGI.GameInteractionInterface,
+                  function_parameters : dict, player_type : IH.PlayerTypeEnum, turn : IH.PlayerTypeEnum, turn_timeout : float = None,
+                  recorder : GS.SnapshotRecorder = None ) -> None:
+        """
+        Function: Initialization
+
+        Inputs: The engine with the ships placed, the presenter, the open connection,
+                the parameters of the pages, the player, the player that moves first,
+                the seconds a player has to make a move or None for no limit,
+                the recorder that saves every turn or None
+        Outputs: None
+
+        Description: The connection has to provide fileno, poll_message,
+                     connection_count and poll_interval, so it can be
+                     watched by the event loop
+        """
+        self._engine = engine
+        self._presenter = presenter
+        self._connection = connection
+        self._function_parameters = function_parameters
+        self._player_type = player_type
+        self._opponent_type = GE.get_opponent_type( player_type )
+        self._turn = turn
+        self._turn_timeout = turn_timeout
+        self._recorder = recorder
+
+        self._loop = EL.EventLoop()
+        self._message : dict = None
+        self._turn_deadline : float = None
+
+        # The socket of the connection that is watched, which is
+        # replaced whenever the connection is opened again
+        self._connection_fd : int = None
+        self._connection_count = 0
+
+        # The keyboard can only be watched by a selector if it is
+        # a terminal on a platform that is not Windows
+        self._watch_input = os.name != WINDOWS_OS_NAME and sys.stdin.isatty()
+
+    def run( self ) -> None:
+        """
+        Function: Run
+
+        Inputs: None
+        Outputs: None
+
+        Description: Plays turns until the game is over, then closes the
+                     connection and shows the game over page
+        """
+        self._watch_connection()
+
+        if self._watch_input:
+            self._loop.add_reader( sys.stdin, self._on_input )
+
+        try:
+            while not self._engine.is_over():
+                if self._turn == self._player_type:
+                    self._play_turn()
+
+                else:
+                    self._wait_for_opponent()
+
+        finally:
+            self._loop.close()
+            self._connection.close_connection()
+
+        # A game that is over can not be resumed
+        if self._recorder is not None:
+            self._recorder.remove()
+
+        # Once the Game is over, display the game over page
+        # and indicate if you won the game
+        self._function_parameters[ IH.VIEW_PARAM_WIN ] = self._engine.get_winner() == self._player_type
+        self._presenter.trigger_view_event( IH.GameEventType.GAME_EVENT_GAME_END, self._function_parameters )
+
+    def _watch_connection( self ) -> None:
+        """
+        Function: Watch Connection
+
+        Inputs: None
+        Outputs: None
+
+        Description: A connection that was opened again has a new socket,
+                     which may even reuse the number of the old one, so the
+                     count of openings tells if the watched socket is current
+        """
+        if self._connection_fd is not None and self._connection_count == self._connection.connection_count:
+            return
+
+        if self._connection_fd is not None:
+            self._loop.remove_reader( self._connection_fd )
+
+        self._connection_fd = self._connection.fileno()
+        self._connection_count = self._connection.connection_count
+        self._loop.add_reader( self._connection_fd, self._on_connection_readable )
+
+    def _end_game( self, loser : IH.PlayerTypeEnum, message : str ) -> None:
+        """
+        Function: End Game
+
+        Inputs: The player that gave up the game, the reason the game ended
+        Outputs: None
+        """
+        self._engine.forfeit( loser )
+        self._function_parameters[ IH.VIEW_PARAM_STATE_MESSAGE ] = message
+        self._loop.stop()
+
+    def _start_turn( self, turn : IH.PlayerTypeEnum ) -> None:
+        """
+        Function: Start Turn
+
+        Inputs: The player that moves next
+        Outputs: None
+        """
+        self._turn = turn
+        self._turn_deadline = None
+
+    def _get_deadline( self ) -> float:
+        """
+        Function: Get Deadline
+
+        Inputs: None
+        Outputs: The time of the monotonic clock the current turn ends at, None without a time limit
+
+        Description: The clock of a turn starts the first time it is asked for
+        """
+        if self._turn_timeout is not None and self._turn_deadline is None:
+            self._turn_deadline = time.monotonic() + self._turn_timeout
+
+        return self._turn_deadline
+
+    def _poll( self ) -> dict:
+        """
+        Function: Poll
+
+        Inputs: None
+        Outputs: The next message from the opponent, None if it has not arrived
+        """
+        try:
+            return self._connection.poll_message()
+
+        except OSError:
+            self._end_game( self._opponent_type, "The opponent left the game" )
+            return None
+
+        # A message that can not be decoded
+        except ValueError:
+            self._end_game( self._opponent_type, INVALID_MOVE_MESSAGE )
+            return None
+
+        # A connection that was lost and could not be resumed
+        except GS.SnapshotError as error:
+            self._end_game( self._opponent_type, str( error ) )
+            return None
+
+    def _on_connection_readable( self ) -> None:
+        """
+        Function: On Connection Readable
+
+        Inputs: None
+        Outputs: None
+        """
+        message = self._poll()
+        self._watch_connection()
+
+        if message is not None:
+            self._message = message
+            self._loop.stop()
+
+    def _on_input( self ) -> None:
+        """
+        Function: On Input
+
+        Inputs: None
+        Outputs: None
+
+        Description: Anything typed while waiting is read here, so it does not
+                     end up in the next prompt. Only the quit command is used
+        """
+        data = os.read( sys.stdin.fileno(), INPUT_READ_SIZE )
+
+        # Stop watching a keyboard that was closed
+        if not data:
+            self._loop.remove_reader( sys.stdin )
+            self._watch_input = False
+            return
+
+        if data.decode( errors="ignore" ).strip().lower() in QUIT_COMMANDS:
+            self._end_game( self._player_type, "You left the game" )
+
+    def _wait_for_message( self, deadline : float, on_countdown = None ) -> dict:
+        """
+        Function: Wait for Message
+
+        Inputs: The time the opponent has to answer until, the function that shows the time left
+        Outputs: The message from the opponent, None if the game ended while waiting
+        """
+        self._message = None
+        timers = list()
+
+        if deadline is not None:
+            timers.append( self._loop.call_at( deadline + TURN_TIMEOUT_GRACE,
+                                               lambda: self._end_game( self._opponent_type, "The opponent ran out of time" ) ) )
+
+            if on_countdown is not None:
+                def countdown():
+                    on_countdown( deadline - time.monotonic() )
+                    timers.append( self._loop.call_later( COUNTDOWN_INTERVAL, countdown ) )
+
+                countdown()
+
+        # A connection whose socket may miss a message is also
+        # checked on a timer, so the game never waits forever
+        poll_interval = self._connection.poll_interval
+
+        if poll_interval is not None:
+            def check():
+                if self._message is None:
+                    self._on_connection_readable()
+
+                timers.append( self._loop.call_later( poll_interval, check ) )
+
+            timers.append( self._loop.call_later( poll_interval, check ) )
+
+        # A message may already be waiting in the buffer of the
+        # connection, which the selector would not report
+        self._message = self._poll()
+        self._watch_connection()
+
+        if self._message is None and not self._engine.is_over():
+            self._loop.run()
+
+        for timer in timers:
+            timer.cancel()
+
+        return self._message
+
+    def _wait_for_opponent( self ) -> None:
+        """
+        Function: Wait for Opponent
+
+        Inputs: None
+        Outputs: None
+
+        Description: Waits for the attack of the opponent and sends back the response
+        """
+        # Keep the messages of the last turn for the waiting page, and
+        # reset them for the pages that follow
+        wait_parameters = dict( self._function_parameters )
+        self._function_parameters[ IH.VIEW_PARAM_STATE_MESSAGE ] = None
+        self._function_parameters[ IH.VIEW_PARAM_IS_ERROR_STATE ] = False
+
+        def show_countdown( time_left : float ) -> None:
+            countdown_parameters = dict( wait_parameters )
+            countdown_parameters[ IH.VIEW_PARAM_STATE_MESSAGE ] = _add_message_line(
+                wait_parameters[ IH.VIEW_PARAM_STATE_MESSAGE ], f"The opponent has { max( math.ceil( time_left ), 0 ) } seconds left to move" )
+            self._presenter.trigger_view_event( IH.GameEventType.GAME_EVENT_WAIT_FOR_OPPONENT, countdown_parameters )
+
+        deadline = self._get_deadline()
+
+        if deadline is None:
+            self._presenter.trigger_view_event( IH.GameEventType.GAME_EVENT_WAIT_FOR_OPPONENT, wait_parameters )
+
+        data = self._wait_for_message( deadline, show_countdown )
+        if data is None:
+            return
+
+        # Unpack the data into coordinates and let the engine
+        # apply the attack to the player's board. The engine
+        # gives back the response that is sent to the opponent.
+        # An attack the rules do not allow ends the game
+        coord = GE.get_attack_coord( data )
+
+        if coord is None or not self._engine.is_valid_attack( self._player_type, coord ):
+            self._end_game( self._opponent_type, INVALID_MOVE_MESSAGE )
+            return
+
+        response = self._engine.resolve_attack( self._player_type, coord )
+
+        # The response is saved before it is sent, so the opponent
+        # is never ahead of the snapshot
+        if self._recorder is not None:
+            self._recorder.record_defense( coord, response, self._player_type )
+
+        try:
+            self._connection.send_message( response )
+
+        except OSError:
+            self._end_game( self._opponent_type, "The opponent left the game" )
+            return
+
+        except GS.SnapshotError as error:
+            self._end_game( self._opponent_type, str( error ) )
+            return
+
+        self._function_parameters[ IH.VIEW_PARAM_STATE_MESSAGE ] = describe_opponent_attack( coord, response )
+        self._start_turn( self._player_type )
+
+    def _play_turn( self ) -> None:
+        """
+        Function: Play Turn
+
+        Inputs: None
+        Outputs: None
+
+        Description: Asks the player for an attack, sends it and waits for the
+                     response. The prompt of the view blocks, so running out of
+                     time is noticed once the attack is entered
+        """
+        deadline = self._get_deadline()
+        prompt_parameters = self._function_parameters
+
+        if deadline is not None:
+            prompt_parameters = dict( self._function_parameters )
+            prompt_parameters[ IH.VIEW_PARAM_STATE_MESSAGE ] = _add_message_line(
+                prompt_parameters[ IH.VIEW_PARAM_STATE_MESSAGE ], f"You have { max( math.ceil( deadline - time.monotonic() ), 0 ) } seconds to move" )
+
+        attack = self._presenter.trigger_view_event( IH.GameEventType.GAME_EVENT_MAKE_ATTACK, prompt_parameters )
+
+        # Remove any messages or errors that are currently
+        # displayed on the page
+        self._function_parameters[ IH.VIEW_PARAM_STATE_MESSAGE ] = None
+        self._function_parameters[ IH.VIEW_PARAM_IS_ERROR_STATE ] = False
+
+        if deadline is not None and time.monotonic() > deadline:
+            self._end_game( self._player_type, "You ran out of time" )
+            return
+
+        # Get the system coordinates from the attack
+        attack_sys = ( IH.PLACEMENT_ROW_TO_SYS_ROW[ attack[ IH.VIEW_PARAM_ROW ] ], IH.PLACEMENT_COL_TO_SYS_COL[ attack[ IH.VIEW_PARAM_COL ] ] )
+
+        # We are only in an error state if the user attempted to
+        # attack a coordinate that has already been hit
+        if not self._engine.is_valid_attack( self._opponent_type, attack_sys ):
+            self._function_parameters[ IH.VIEW_PARAM_IS_ERROR_STATE ] = True
+            return
+
+        try:
+            self._connection.send_request( { IH.VIEW_PARAM_ROW : attack_sys[ IH.ROW_INDEX ],
+                                             IH.VIEW_PARAM_COL : attack_sys[ IH.COLUMN_INDEX ] } )
+
+        except OSError:
+            self._end_game( self._opponent_type, "The opponent left the game" )
+            return
+
+        except GS.SnapshotError as error:
+            self._end_game( self._opponent_type, str( error ) )
+            return
+
+        # The opponent answers right away, so the answer gets a
+        # turn of its own to arrive
+        response_deadline = None if self._turn_timeout is None else time.monotonic() + self._turn_timeout
+        response = self._wait_for_message( response_deadline )
+        if response is None:
+            return
+
+        # Record the response on the opponent's board
+        try:
+            self._engine.record_attack_result( self._opponent_type, attack_sys, response )
+
+        except ( KeyError, TypeError, ValueError ):
+            self._end_game( self._opponent_type, INVALID_MOVE_MESSAGE )
+            return
+        self._function_parameters[ IH.VIEW_PARAM_STATE_MESSAGE ] = describe_player_attack( attack, response )
+        self._function_parameters[ IH.VIEW_PARAM_RESPONSE ] = response
+        self._start_turn( self._opponent_type )
+
+        if self._recorder is not None:
+            self._recorder.record_attack( self._opponent_type )
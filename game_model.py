@@ -23,6 +23,9 @@ Outputs:
 from interfaces import interface_headers as IH
 from interfaces import interface_game_model as IGM
 
+import ship_footprints as SF
+import visual_board as VB
+
 ################################################################################
 # Global Variables
 ################################################################################
@@ -30,6 +33,81 @@ from interfaces import interface_game_model as IGM
 ################################################################################
 # Types
 ################################################################################
+class _ShipRegistry:
+    """
+    Description: This is a helper structure that tracks the ships of a single
+                 board. Keeping these counters current as cells change lets
+                 the model answer if ships are alive without scanning the board,
+                 and keeping a mask of the ship cells lets it check a whole
+                 ship placement against its footprint
+    """
+    __slots__ = ( "ship_cells", "cells_alive", "ship_cells_alive", "occupied_mask" )
+
+    def __init__( self ):
+        """
+        Function: Initialization
+
+        Inputs: None
+        Outputs: None
+
+        Description: Creates a registry for a board where every cell
+                     is an empty cell that has not been attacked. Empty
+                     cells are not registered, only the cells of ships
+        """
+        # Mapping of ship id to the cells that the ship occupies,
+        # and ship id to the amount of those cells not yet hit
+        self.ship_cells : dict[ int, set[ IH.SystemCoordType ] ] = dict()
+        self.cells_alive : dict[ int, int ] = dict()
+
+        # Total amount of cells that belong to a ship and are not hit
+        self.ship_cells_alive : int = 0
+
+        # Cells that belong to a ship, in the layout of the footprints
+        self.occupied_mask : int = 0
+
+    def remove_cell( self, coord : IH.SystemCoordType, cell : IH.GameCoordType ) -> None:
+        """
+        Function: Remove Cell
+
+        Inputs: The location of the cell, the value of the cell
+        Outputs: None
+
+        Description: Removes the contribution of a cell from the counters
+        """
+        ship_id = cell[ IH.GAME_COORD_TYPE_ID_INDEX ]
+
+        if ship_id == IH.BASE_CELL:
+            return
+
+        self.ship_cells[ ship_id ].discard( coord )
+        self.occupied_mask &= ~( 1 << ( coord[ IH.ROW_INDEX ] * IH.NUMBER_OF_COLS + coord[ IH.COLUMN_INDEX ] ) )
+
+        if cell[ IH.GAME_COORD_TYPE_STATE_INDEX ] != IH.CoordStateType.COORD_STATE_HIT:
+            self.cells_alive[ ship_id ] -= 1
+            self.ship_cells_alive -= 1
+
+    def add_cell( self, coord : IH.SystemCoordType, cell : IH.GameCoordType ) -> None:
+        """
+        Function: Add Cell
+
+        Inputs: The location of the cell, the value of the cell
+        Outputs: None
+
+        Description: Adds the contribution of a cell to the counters
+        """
+        ship_id = cell[ IH.GAME_COORD_TYPE_ID_INDEX ]
+
+        if ship_id == IH.BASE_CELL:
+            return
+
+        self.ship_cells.setdefault( ship_id, set() ).add( coord )
+        self.cells_alive.setdefault( ship_id, 0 )
+        self.occupied_mask |= 1 << ( coord[ IH.ROW_INDEX ] * IH.NUMBER_OF_COLS + coord[ IH.COLUMN_INDEX ] )
+
+        if cell[ IH.GAME_COORD_TYPE_STATE_INDEX ] != IH.CoordStateType.COORD_STATE_HIT:
+            self.cells_alive[ ship_id ] += 1
+            self.ship_cells_alive += 1
+
 class GameModel( IGM.GameModelInterface ):
     def __init__( self ):
         """
@@ -42,11 +120,17 @@ class GameModel( IGM.GameModelInterface ):
                      create data members to store the state of both the current
                      player and the opponent
 
-        Data members: Instance of a board for the current player and the opponent
+        Data members: Instance of a board, a ship registry and a visual board
+                      for the current player and the opponent
         """
         # Initialize Data Members
         self._host_board : IH.GameBoardType = []
         self._join_board : IH.GameBoardType = []
+        self._host_registry = _ShipRegistry()
+        self._join_registry = _ShipRegistry()
+        self._host_visual_board = VB.VisualBoard()
+        self._join_visual_board = VB.VisualBoard()
+        self._footprints = SF.get_footprint_table()
 
         # Update the both the player and opponent boards.
         # The IDS are defined in the interface because the rest
@@ -79,7 +163,8 @@ class GameModel( IGM.GameModelInterface ):
                      return the same types
         """
         # Extract the row and column from the coordinate 
-        # passed in
+        # passed in. Negative indexes would wrap around the board
+        IH.check_on_board( coord )
         row = coord[ IH.ROW_INDEX ]
         col = coord[ IH.COLUMN_INDEX ]
 
@@ -101,16 +186,27 @@ class GameModel( IGM.GameModelInterface ):
         Description: This function is the data setter of the cell. We only
                      make it so that we update on a coordinate by coordinate
                      basis so that we don't expose everything to the application
-                     that consumes this model
+                     that consumes this model. The ship registry and the visual
+                     board are kept current with every update
         """
         # Extract the row and column from the coordinate 
-        # passed in
+        # passed in. Negative indexes would wrap around the board
+        IH.check_on_board( coord )
         row = coord[ IH.ROW_INDEX ]
         col = coord[ IH.COLUMN_INDEX ]
 
         # Determine the board that we need to update based on the
         # player type that we pass in
         board_to_update = self._host_board if player_type == IH.PlayerTypeEnum.PLAYER_TYPE_HOST else self._join_board
+        registry = self._host_registry if player_type == IH.PlayerTypeEnum.PLAYER_TYPE_HOST else self._join_registry
+        visual_board = self._host_visual_board if player_type == IH.PlayerTypeEnum.PLAYER_TYPE_HOST else self._join_visual_board
+
+        # Move the cell in the registry from the old value to
+        # the new value before replacing it on the board
+        coord = ( row, col )
+        registry.remove_cell( coord, board_to_update[ row ][ col ] )
+        registry.add_cell( coord, new_val )
+        visual_board.set_cell( coord, new_val )
 
         # Set the coordinate in the board to have
         board_to_update[ row ][ col ] = new_val
@@ -136,19 +232,20 @@ class GameModel( IGM.GameModelInterface ):
         # player type that we pass in
         board_to_validate = self._host_board if player_type == IH.PlayerTypeEnum.PLAYER_TYPE_HOST else self._join_board
 
+        # No action can be taken on a coordinate that is not on the
+        # board. This is checked before indexing, because negative
+        # indexes would wrap around the board
+        if not IH.is_on_board( coord ):
+            return False
+
         # Determine the particular cell information of the coordinate
         cell = board_to_validate[ row ][ col ]
 
         if event == IH.GameEventType.GAME_EVENT_PLACE_SHIPS:
             # If we are in the case of trying to validate that
             # we can place a ship at this coordinate, we need to
-            # make sure that the coordinate is a valid position
-            # and the cell is empty
-            condition = row >= 0 and row < IH.NUMBER_OF_ROWS
-            condition = condition and col >= 0 and col < IH.NUMBER_OF_COLS
-            condition = condition and cell[ IH.GAME_COORD_TYPE_ID_INDEX ] is IH.BASE_CELL
-
-            return condition
+            # make sure that the cell is empty
+            return cell[ IH.GAME_COORD_TYPE_ID_INDEX ] is IH.BASE_CELL
         
         elif event == IH.GameEventType.GAME_EVENT_MAKE_ATTACK:
             # In the event that we are trying to make an attack
@@ -161,6 +258,49 @@ class GameModel( IGM.GameModelInterface ):
             # a coordinate with an undefined event
             raise AssertionError( f"There isn't a check for validity given the event { event.name }" )
 
+    def can_place_ship( self, player_type : IH.PlayerTypeEnum, bow : IH.SystemCoordType, direction : str, size : int ) -> bool:
+        """
+        Function: Can a ship be placed
+
+        Inputs: The player's' board, the system coordinate of the bow, the direction, the size of the ship
+        Outputs: Boolean value
+
+        Description: This function checks a whole ship placement at once.
+                     Placements that leave the board have an empty footprint,
+                     every other placement is checked against the ship cells
+                     in the registry
+        """
+        # Get the registry of the board that we need to check
+        registry = self._host_registry if player_type == IH.PlayerTypeEnum.PLAYER_TYPE_HOST else self._join_registry
+
+        mask = self._footprints.get_mask( bow, direction, size )
+        return mask != 0 and not registry.occupied_mask & mask
+
+    def place_ship( self, player_type : IH.PlayerTypeEnum, bow : IH.SystemCoordType, direction : str, size : int ) -> bool:
+        """
+        Function: Place a ship
+
+        Inputs: The player's' board, the system coordinate of the bow, the direction, the size of the ship
+        Outputs: If the ship was placed
+
+        Description: This function checks and commits a whole ship placement.
+                     The cells of the footprint are updated through update_coord
+                     so the registry and the visual board stay current
+        """
+        # Get the registry of the board that we need to check
+        registry = self._host_registry if player_type == IH.PlayerTypeEnum.PLAYER_TYPE_HOST else self._join_registry
+
+        mask = self._footprints.get_mask( bow, direction, size )
+
+        if mask == 0 or registry.occupied_mask & mask:
+            return False
+
+        for coord in self._footprints.get_mask_coords( mask ):
+            new_state = { IH.GAME_COORD_TYPE_ID_INDEX : size, IH.GAME_COORD_TYPE_STATE_INDEX: IH.CoordStateType.COORD_STATE_BASE }
+            self.update_coord( player_type, coord, new_state )
+
+        return True
+
     def ships_are_alive( self, player_type : IH.PlayerTypeEnum ) -> bool:
         """
         Function: Are there ships still alive?
@@ -171,19 +311,12 @@ class GameModel( IGM.GameModelInterface ):
         Description: This function defines the ablity to check if board
                      still has ships that are alive
         """
-        # Get the board that we need to check
-        board_to_validate = self._host_board if player_type == IH.PlayerTypeEnum.PLAYER_TYPE_HOST else self._join_board
-
-        for row in board_to_validate:
-            for cell in row:
-                # If we find that there is a cell that has a ship in it
-                # and the ship is still alive, return True
-                if cell[ IH.GAME_COORD_TYPE_ID_INDEX ] != IH.BASE_CELL and cell[ IH.GAME_COORD_TYPE_STATE_INDEX ] != IH.CoordStateType.COORD_STATE_HIT:
-                    return True
+        # Get the registry of the board that we need to check
+        registry = self._host_registry if player_type == IH.PlayerTypeEnum.PLAYER_TYPE_HOST else self._join_registry
 
-        # Return False if we were not able to find one ship
-        # that was still alive
-        return False
+        # Ships are alive as long as there is a ship cell that
+        # has not been hit
+        return registry.ship_cells_alive > 0
     
     def ship_is_alive( self, player_type : IH.PlayerTypeEnum, ship_id : int ) -> bool:
         """
@@ -195,18 +328,17 @@ class GameModel( IGM.GameModelInterface ):
         Description: This function defines the ablity to check if a unique ship
                      is still alive
         """
-        # Get the board that we need to check
-        board_to_validate = self._host_board if player_type == IH.PlayerTypeEnum.PLAYER_TYPE_HOST else self._join_board
+        # Get the registry of the board that we need to check
+        registry = self._host_registry if player_type == IH.PlayerTypeEnum.PLAYER_TYPE_HOST else self._join_registry
 
-        for row in board_to_validate:
-            for cell in row:
-                # If a particular ship still has an unhit cell, return True
-                if cell[ IH.GAME_COORD_TYPE_ID_INDEX ] == ship_id and cell[ IH.GAME_COORD_TYPE_STATE_INDEX ] != IH.CoordStateType.COORD_STATE_HIT:
-                    return True
+        # Empty cells are not registered. An attack on an empty cell
+        # is a miss, so they are alive as long as there is one
+        if ship_id == IH.BASE_CELL:
+            return registry.occupied_mask != ( 1 << ( IH.NUMBER_OF_ROWS * IH.NUMBER_OF_COLS ) ) - 1
 
-        # Return False if we were not able to find any coordinates
-        # that weren't hit for a particular ship
-        return False
+        # A particular ship is alive as long as one of its
+        # cells has not been hit
+        return registry.cells_alive.get( ship_id, 0 ) > 0
     
     def get_visual_board( self, player_type : IH.PlayerTypeEnum ) -> IH.VisualBoardType:
         """
@@ -217,41 +349,37 @@ class GameModel( IGM.GameModelInterface ):
 
         Description: This function returns a transformed state of the board
                      so that the entire board is represented as a 2D array
-                     of integers
+                     of integers. The returned rows are read-only views that
+                     track the board as it changes
+        """
+        # The visual board is kept current by update_coord, so
+        # the views can be handed out directly
+        visual_board = self._host_visual_board if player_type == IH.PlayerTypeEnum.PLAYER_TYPE_HOST else self._join_visual_board
+
+        return visual_board.get_view()
+
+    def get_board_masks( self, player_type : IH.PlayerTypeEnum ) -> IH.BoardMasksType:
         """
-        # Initialization a list that will store the visual board
-        return_list : IH.VisualBoardType = list()
-
-        # Determine which board that we are wanting to
-        # transform
-        board_to_transform = self._host_board if player_type == IH.PlayerTypeEnum.PLAYER_TYPE_HOST else self._join_board
-
-        for row in board_to_transform:
-            # For every row that is in the board, create
-            # an equivalent row that will hold the corrected
-            # ids
-            row_list = list()
-
-            for cell in row:
-                # Basically, for every cell in the board, we
-                # only want to show the ID of the board if 
-                # the cell has not been attacked. Otherwise,
-                # Display the type of action done on the 
-                # Cell
-                if cell[ IH.GAME_COORD_TYPE_STATE_INDEX ] == IH.CoordStateType.COORD_STATE_HIT:
-                    row_list.append( IH.HIT_CELL )
-
-                elif cell[ IH.GAME_COORD_TYPE_STATE_INDEX ] == IH.CoordStateType.COORD_STATE_MISS:
-                    row_list.append( IH.MISSED_CELL )
-
-                elif cell[ IH.GAME_COORD_TYPE_STATE_INDEX ] == IH.CoordStateType.COORD_STATE_BASE:
-                    row_list.append( cell[ IH.GAME_COORD_TYPE_ID_INDEX ] )
-
-            # Add the transformed row into the return structure
-            return_list.append( row_list )
-
-        # Return the transformed board
-        return return_list
+        Function: Get the board masks
+
+        Inputs: The player's' board
+        Outputs: The masks of the ships, the hit cells and the missed cells
+
+        Description: The ship masks are built from the cells in the registry,
+                     and the move masks from the visual board
+        """
+        registry = self._host_registry if player_type == IH.PlayerTypeEnum.PLAYER_TYPE_HOST else self._join_registry
+        visual_board = self._host_visual_board if player_type == IH.PlayerTypeEnum.PLAYER_TYPE_HOST else self._join_visual_board
+
+        ship_masks = dict()
+
+        for ship_id, cells in registry.ship_cells.items():
+            if cells:
+                ship_masks[ ship_id ] = sum( 1 << ( row * IH.NUMBER_OF_COLS + col ) for row, col in cells )
+
+        hit_mask, miss_mask = visual_board.get_state_masks()
+
+        return ship_masks, hit_mask, miss_mask
 
 
 ################################################################################
@@ -0,0 +1,336 @@
+"""
+Module: game_model_bitboard.py
+Creation Date: October 18, 2026
+Author: Manoj Turaga
+Contributors: Manoj Turaga
+Sources:
+
+Description:
+    This model is an alternative implementation of the model interface.
+    Instead of storing every cell of a board as a dictionary, every board
+    is stored as a handful of integer bitmasks. Bit n of a mask refers to
+    the cell at row n // NUMBER_OF_COLS and column n % NUMBER_OF_COLS.
+    This makes hit tests and sunk checks single bitwise operations and
+    keeps the memory footprint of a board small
+
+Inputs:
+    Actions done to affect the player state
+Outputs:
+    Current state of the player
+"""
+
+################################################################################
+# Imports
+################################################################################
+from interfaces import interface_headers as IH
+from interfaces import interface_game_model as IGM
+
+import ship_footprints as SF
+import visual_board as VB
+
+################################################################################
+# Global Variables
+################################################################################
+
+################################################################################
+# Types
+################################################################################
+class _BitBoard:
+    """
+    Description: This is a helper structure that holds the masks for a single
+                 board. Slots are used so that thousands of boards can be held
+                 in a single process without the overhead of a dictionary
+                 per instance
+    """
+    __slots__ = ( "ship_masks", "occupied_mask", "hit_mask", "miss_mask", "visual_board" )
+
+    def __init__( self ):
+        """
+        Function: Initialization
+
+        Inputs: None
+        Outputs: None
+
+        Description: Creates an empty board with no ships and no moves
+        """
+        # Mapping of ship id to the cells that the ship occupies,
+        # along with the union of all the ship cells
+        self.ship_masks : dict[ int, int ] = dict()
+        self.occupied_mask : int = 0
+
+        # Cells that have been attacked on this board
+        self.hit_mask : int = 0
+        self.miss_mask : int = 0
+
+        # Visual state of the board that is handed out to consumers
+        self.visual_board = VB.VisualBoard()
+
+class BitboardGameModel( IGM.GameModelInterface ):
+    def __init__( self ):
+        """
+        Function: Initialization
+
+        Inputs: None
+        Outputs: None
+
+        Description: This is the initialization function of the model. It will
+                     create an empty bitboard for both the host and the joining
+                     player
+
+        Data members: Instance of a board for the current player and the opponent
+        """
+        # Initialize Data Members. The full mask is used to
+        # find the cells that are not occupied by any ship
+        self._host_board = _BitBoard()
+        self._join_board = _BitBoard()
+        self._full_mask = ( 1 << ( IH.NUMBER_OF_ROWS * IH.NUMBER_OF_COLS ) ) - 1
+        self._footprints = SF.get_footprint_table()
+
+    def _get_board( self, player_type : IH.PlayerTypeEnum ) -> _BitBoard:
+        """
+        Function: Get Board
+
+        Inputs: The player whose board we want
+        Outputs: The bitboard of the player
+
+        Description: This is a helper function to select the board of a player
+        """
+        return self._host_board if player_type == IH.PlayerTypeEnum.PLAYER_TYPE_HOST else self._join_board
+
+    def _get_id_mask( self, board : _BitBoard, ship_id : int ) -> int:
+        """
+        Function: Get ID Mask
+
+        Inputs: The board to check, the id of the cells we want
+        Outputs: Mask of every cell that has the id
+
+        Description: Cells that are not occupied by a ship have the base
+                     cell id, so the mask for the base cell id is the
+                     complement of the occupied cells
+        """
+        if ship_id == IH.BASE_CELL:
+            return self._full_mask & ~board.occupied_mask
+
+        return board.ship_masks.get( ship_id, 0 )
+
+    def get_coord( self, player_type : IH.PlayerTypeEnum, coord: IH.SystemCoordType ) -> IH.GameCoordType:
+        """
+        Function: Get coordinate from board
+
+        Inputs: The Player we want to get the data from, the location of the data
+        Outputs: The data in the cell of the board
+
+        Description: This function rebuilds the cell structure defined in the
+                     interface headers from the masks of the board
+        """
+        # A coordinate that is not on the board would be the bit of
+        # another cell, or a negative shift
+        IH.check_on_board( coord )
+        board = self._get_board( player_type )
+        bit = 1 << ( coord[ IH.ROW_INDEX ] * IH.NUMBER_OF_COLS + coord[ IH.COLUMN_INDEX ] )
+
+        # Find the ship that occupies the cell, if any
+        ship_id = IH.BASE_CELL
+        if board.occupied_mask & bit:
+            for candidate_id, mask in board.ship_masks.items():
+                if mask & bit:
+                    ship_id = candidate_id
+                    break
+
+        # Determine the state of the cell from the move masks
+        if board.hit_mask & bit:
+            state = IH.CoordStateType.COORD_STATE_HIT
+
+        elif board.miss_mask & bit:
+            state = IH.CoordStateType.COORD_STATE_MISS
+
+        else:
+            state = IH.CoordStateType.COORD_STATE_BASE
+
+        return { IH.GAME_COORD_TYPE_ID_INDEX : ship_id, IH.GAME_COORD_TYPE_STATE_INDEX : state }
+
+    def update_coord( self, player_type : IH.PlayerTypeEnum, coord: IH.SystemCoordType, new_val: IH.GameCoordType ) -> None:
+        """
+        Function: Update cell in board
+
+        Inputs: The Player we want to get the data from, the location of the data, the new data
+        Outputs: None
+
+        Description: This function is the data setter of the cell. The bit of
+                     the cell is cleared from every mask and then set in the
+                     masks that describe the new value
+        """
+        IH.check_on_board( coord )
+        board = self._get_board( player_type )
+        bit = 1 << ( coord[ IH.ROW_INDEX ] * IH.NUMBER_OF_COLS + coord[ IH.COLUMN_INDEX ] )
+        ship_id = new_val[ IH.GAME_COORD_TYPE_ID_INDEX ]
+        state = new_val[ IH.GAME_COORD_TYPE_STATE_INDEX ]
+
+        # Remove the cell from the ship that previously occupied it
+        if board.occupied_mask & bit:
+            for old_id, mask in board.ship_masks.items():
+                if mask & bit:
+                    board.ship_masks[ old_id ] = mask & ~bit
+                    break
+
+            board.occupied_mask &= ~bit
+
+        # Add the cell to the new ship if there is one
+        if ship_id != IH.BASE_CELL:
+            board.ship_masks[ ship_id ] = board.ship_masks.get( ship_id, 0 ) | bit
+            board.occupied_mask |= bit
+
+        # Update the state of the cell
+        board.hit_mask &= ~bit
+        board.miss_mask &= ~bit
+
+        if state == IH.CoordStateType.COORD_STATE_HIT:
+            board.hit_mask |= bit
+
+        elif state == IH.CoordStateType.COORD_STATE_MISS:
+            board.miss_mask |= bit
+
+        board.visual_board.set_cell( coord, new_val )
+
+    def is_valid_coord( self, player_type : IH.PlayerTypeEnum, coord: IH.SystemCoordType, event : IH.GameEventType ) -> bool:
+        """
+        Function: Can action be taken on coordinate
+
+        Inputs: The player's' board, the coordinate to check, under what circumstances we are checking
+        Outputs: Boolean value
+
+        Description: This function makes sure that an action can be taken
+                     on a particular coordinate. Depending on the context provided by event,
+                     this function can take different logic to know if a particular coordinate
+                     is valid
+        """
+        # Extract the row and column from the coordinate
+        # passed in
+        row = coord[ IH.ROW_INDEX ]
+        col = coord[ IH.COLUMN_INDEX ]
+
+        board = self._get_board( player_type )
+
+        # No action can be taken on a coordinate that is not on the
+        # board. Its bit would belong to another cell
+        if not IH.is_on_board( coord ):
+            return False
+
+        bit = 1 << ( row * IH.NUMBER_OF_COLS + col )
+
+        if event == IH.GameEventType.GAME_EVENT_PLACE_SHIPS:
+            # A ship can only be placed in a cell that is not
+            # already occupied
+            return not board.occupied_mask & bit
+
+        elif event == IH.GameEventType.GAME_EVENT_MAKE_ATTACK:
+            # It is invalid to attack a coordinate that already
+            # had a move made on it
+            return not ( board.hit_mask | board.miss_mask ) & bit
+
+        else:
+            # We raise an error if we try to validate an action on
+            # a coordinate with an undefined event
+            raise AssertionError( f"There isn't a check for validity given the event { event.name }" )
+
+    def can_place_ship( self, player_type : IH.PlayerTypeEnum, bow : IH.SystemCoordType, direction : str, size : int ) -> bool:
+        """
+        Function: Can a ship be placed
+
+        Inputs: The player's' board, the system coordinate of the bow, the direction, the size of the ship
+        Outputs: Boolean value
+
+        Description: Placements that leave the board have an empty footprint,
+                     every other placement is checked against the occupied cells
+        """
+        mask = self._footprints.get_mask( bow, direction, size )
+        return mask != 0 and not self._get_board( player_type ).occupied_mask & mask
+
+    def place_ship( self, player_type : IH.PlayerTypeEnum, bow : IH.SystemCoordType, direction : str, size : int ) -> bool:
+        """
+        Function: Place a ship
+
+        Inputs: The player's' board, the system coordinate of the bow, the direction, the size of the ship
+        Outputs: If the ship was placed
+
+        Description: The footprint is added to the masks of the board at once.
+                     The cells are empty, so only their move state and their
+                     visual cells have to be reset one by one
+        """
+        board = self._get_board( player_type )
+        mask = self._footprints.get_mask( bow, direction, size )
+
+        if mask == 0 or board.occupied_mask & mask:
+            return False
+
+        board.ship_masks[ size ] = board.ship_masks.get( size, 0 ) | mask
+        board.occupied_mask |= mask
+        board.hit_mask &= ~mask
+        board.miss_mask &= ~mask
+
+        new_val = { IH.GAME_COORD_TYPE_ID_INDEX : size, IH.GAME_COORD_TYPE_STATE_INDEX : IH.CoordStateType.COORD_STATE_BASE }
+
+        for coord in self._footprints.get_mask_coords( mask ):
+            board.visual_board.set_cell( coord, new_val )
+
+        return True
+
+    def ships_are_alive( self, player_type : IH.PlayerTypeEnum ) -> bool:
+        """
+        Function: Are there ships still alive?
+
+        Inputs: The player's' board
+        Outputs: If there are ships still alive
+
+        Description: A ship is alive as long as one of its cells has not been hit
+        """
+        board = self._get_board( player_type )
+        return board.occupied_mask & ~board.hit_mask != 0
+
+    def ship_is_alive( self, player_type : IH.PlayerTypeEnum, ship_id : int ) -> bool:
+        """
+        Function: Is the particular ship still alive
+
+        Inputs: The player's' board, the ship we are testing
+        Outputs: If a particular ship is still alive
+
+        Description: A particular ship is alive as long as one of its cells has
+                     not been hit
+        """
+        board = self._get_board( player_type )
+        return self._get_id_mask( board, ship_id ) & ~board.hit_mask != 0
+
+    def get_visual_board( self, player_type : IH.PlayerTypeEnum ) -> IH.VisualBoardType:
+        """
+        Function: Get the visual board
+
+        Inputs: The player's' board
+        Outputs: The visual board
+
+        Description: This function returns a transformed state of the board
+                     so that the entire board is represented as a 2D array
+                     of integers. The returned rows are read-only views that
+                     track the board as it changes
+        """
+        # The visual board is kept current by update_coord, so
+        # the views can be handed out directly
+        return self._get_board( player_type ).visual_board.get_view()
+
+    def get_board_masks( self, player_type : IH.PlayerTypeEnum ) -> IH.BoardMasksType:
+        """
+        Function: Get the board masks
+
+        Inputs: The player's' board
+        Outputs: The masks of the ships, the hit cells and the missed cells
+
+        Description: The masks are the storage of this model, so they are
+                     handed out as they are
+        """
+        board = self._get_board( player_type )
+        ship_masks = { ship_id : mask for ship_id, mask in board.ship_masks.items() if mask }
+
+        return ship_masks, board.hit_mask, board.miss_mask
+
+################################################################################
+# Procedures
+################################################################################
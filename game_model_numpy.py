@@ -0,0 +1,306 @@
+"""
+Module: game_model_numpy.py
+Creation Date: October 18, 2026
+Author: Manoj Turaga
+Contributors: Manoj Turaga
+Sources:
+
+Description:
+    This model is an implementation of the model interface that is meant for
+    the large grid variant of the game. Every board is stored as two int8
+    NumPy arrays, one for the ship ids and one for the cell states, so that
+    boards of up to MAX_NUMBER_OF_ROWS by MAX_NUMBER_OF_COLS can be handled
+    with vectorized array operations
+
+Inputs:
+    Actions done to affect the player state
+Outputs:
+    Current state of the player
+"""
+
+################################################################################
+# Imports
+################################################################################
+from interfaces import interface_headers as IH
+from interfaces import interface_game_model as IGM
+
+import ship_footprints as SF
+import visual_board as VB
+
+import numpy
+
+################################################################################
+# Global Variables
+################################################################################
+
+# Ship ids are stored in a signed byte, so this is the largest
+# id that can be placed on the board
+MAX_SHIP_ID = numpy.iinfo( numpy.int8 ).max
+
+# Lookup from the stored state value back to the state type
+STATE_VALUE_TO_STATE = { state.value : state for state in IH.CoordStateType }
+
+################################################################################
+# Types
+################################################################################
+class NumpyGameModel( IGM.GameModelInterface ):
+    def __init__( self ):
+        """
+        Function: Initialization
+
+        Inputs: None
+        Outputs: None
+
+        Description: This is the initialization function of the model. It will
+                     create the arrays for both the current player and the
+                     opponent using the board dimensions in the interface headers
+
+        Data members: Ship id and cell state arrays for the current player and the opponent
+        """
+        shape = ( IH.NUMBER_OF_ROWS, IH.NUMBER_OF_COLS )
+
+        # Initialize Data Members. Every cell starts as an
+        # empty cell that has not been attacked
+        self._host_ids = numpy.full( shape, IH.BASE_CELL, dtype=numpy.int8 )
+        self._join_ids = numpy.full( shape, IH.BASE_CELL, dtype=numpy.int8 )
+        self._host_states = numpy.full( shape, IH.CoordStateType.COORD_STATE_BASE.value, dtype=numpy.int8 )
+        self._join_states = numpy.full( shape, IH.CoordStateType.COORD_STATE_BASE.value, dtype=numpy.int8 )
+
+        # The visual boards are kept current as cells change, and
+        # consumers are only ever given read-only views of them
+        self._host_visual = numpy.full( shape, IH.BASE_CELL, dtype=numpy.int8 )
+        self._join_visual = numpy.full( shape, IH.BASE_CELL, dtype=numpy.int8 )
+        self._host_visual_view = self._host_visual.view()
+        self._join_visual_view = self._join_visual.view()
+        self._host_visual_view.flags.writeable = False
+        self._join_visual_view.flags.writeable = False
+
+    def _get_arrays( self, player_type : IH.PlayerTypeEnum ) -> tuple[ numpy.ndarray, numpy.ndarray ]:
+        """
+        Function: Get Arrays
+
+        Inputs: The player whose board we want
+        Outputs: The ship id array and the state array of the board
+
+        Description: This is a helper function to select the board of a player
+        """
+        if player_type == IH.PlayerTypeEnum.PLAYER_TYPE_HOST:
+            return self._host_ids, self._host_states
+
+        return self._join_ids, self._join_states
+
+    def get_coord( self, player_type : IH.PlayerTypeEnum, coord: IH.SystemCoordType ) -> IH.GameCoordType:
+        """
+        Function: Get coordinate from board
+
+        Inputs: The Player we want to get the data from, the location of the data
+        Outputs: The data in the cell of the board
+
+        Description: This function rebuilds the cell structure defined in the
+                     interface headers from the arrays of the board
+        """
+        # Negative indexes would wrap around the arrays
+        IH.check_on_board( coord )
+        ids, states = self._get_arrays( player_type )
+        row = coord[ IH.ROW_INDEX ]
+        col = coord[ IH.COLUMN_INDEX ]
+
+        return { IH.GAME_COORD_TYPE_ID_INDEX : int( ids[ row, col ] ),
+                 IH.GAME_COORD_TYPE_STATE_INDEX : STATE_VALUE_TO_STATE[ int( states[ row, col ] ) ] }
+
+    def update_coord( self, player_type : IH.PlayerTypeEnum, coord: IH.SystemCoordType, new_val: IH.GameCoordType ) -> None:
+        """
+        Function: Update cell in board
+
+        Inputs: The Player we want to get the data from, the location of the data, the new data
+        Outputs: None
+
+        Description: This function is the data setter of the cell
+        """
+        IH.check_on_board( coord )
+        ids, states = self._get_arrays( player_type )
+        row = coord[ IH.ROW_INDEX ]
+        col = coord[ IH.COLUMN_INDEX ]
+        ship_id = new_val[ IH.GAME_COORD_TYPE_ID_INDEX ]
+
+        # The id has to fit in the array that stores it
+        if not IH.BASE_CELL <= ship_id <= MAX_SHIP_ID:
+            raise ValueError( f"Ship id { ship_id } can not be stored in this model" )
+
+        ids[ row, col ] = ship_id
+        states[ row, col ] = new_val[ IH.GAME_COORD_TYPE_STATE_INDEX ].value
+
+        visual = self._host_visual if player_type == IH.PlayerTypeEnum.PLAYER_TYPE_HOST else self._join_visual
+        visual[ row, col ] = VB.get_visual_cell( new_val )
+
+    def is_valid_coord( self, player_type : IH.PlayerTypeEnum, coord: IH.SystemCoordType, event : IH.GameEventType ) -> bool:
+        """
+        Function: Can action be taken on coordinate
+
+        Inputs: The player's' board, the coordinate to check, under what circumstances we are checking
+        Outputs: Boolean value
+
+        Description: This function makes sure that an action can be taken
+                     on a particular coordinate. Depending on the context provided by event,
+                     this function can take different logic to know if a particular coordinate
+                     is valid
+        """
+        ids, states = self._get_arrays( player_type )
+        row = coord[ IH.ROW_INDEX ]
+        col = coord[ IH.COLUMN_INDEX ]
+
+        # Check the bounds before indexing because negative
+        # indices would wrap around the array
+        if not IH.is_on_board( coord ):
+            return False
+
+        if event == IH.GameEventType.GAME_EVENT_PLACE_SHIPS:
+            return bool( ids[ row, col ] == IH.BASE_CELL )
+
+        elif event == IH.GameEventType.GAME_EVENT_MAKE_ATTACK:
+            # It is invalid to attack a coordinate that already
+            # had a move made on it
+            return bool( states[ row, col ] == IH.CoordStateType.COORD_STATE_BASE.value )
+
+        else:
+            # We raise an error if we try to validate an action on
+            # a coordinate with an undefined event
+            raise AssertionError( f"There isn't a check for validity given the event { event.name }" )
+
+    def _get_footprint( self, bow : IH.SystemCoordType, direction : str, size : int ) -> tuple[ slice, slice ]:
+        """
+        Function: Get Footprint
+
+        Inputs: The system coordinate of the bow, the direction, the size of the ship
+        Outputs: The row and column slices of the cells the ship would take, None if it leaves the board
+
+        Description: A ship is a straight line of cells, so its footprint is
+                     a single slice of the arrays
+        """
+        stern = SF.get_stern( bow, direction, size, IH.NUMBER_OF_ROWS, IH.NUMBER_OF_COLS )
+
+        if stern is None:
+            return None
+
+        return ( slice( stern[ IH.ROW_INDEX ], bow[ IH.ROW_INDEX ] + 1 ),
+                 slice( stern[ IH.COLUMN_INDEX ], bow[ IH.COLUMN_INDEX ] + 1 ) )
+
+    def can_place_ship( self, player_type : IH.PlayerTypeEnum, bow : IH.SystemCoordType, direction : str, size : int ) -> bool:
+        """
+        Function: Can a ship be placed
+
+        Inputs: The player's' board, the system coordinate of the bow, the direction, the size of the ship
+        Outputs: Boolean value
+
+        Description: The ship can be placed if its footprint is on the board
+                     and holds no ship ids
+        """
+        footprint = self._get_footprint( bow, direction, size )
+
+        if footprint is None:
+            return False
+
+        ids, _ = self._get_arrays( player_type )
+        return not ids[ footprint ].any()
+
+    def place_ship( self, player_type : IH.PlayerTypeEnum, bow : IH.SystemCoordType, direction : str, size : int ) -> bool:
+        """
+        Function: Place a ship
+
+        Inputs: The player's' board, the system coordinate of the bow, the direction, the size of the ship
+        Outputs: If the ship was placed
+
+        Description: The footprint is checked and written with one slice of
+                     every array of the board
+        """
+        footprint = self._get_footprint( bow, direction, size )
+
+        if footprint is None:
+            return False
+
+        # The id has to fit in the array that stores it
+        if size > MAX_SHIP_ID:
+            raise ValueError( f"Ship id { size } can not be stored in this model" )
+
+        ids, states = self._get_arrays( player_type )
+
+        if ids[ footprint ].any():
+            return False
+
+        visual = self._host_visual if player_type == IH.PlayerTypeEnum.PLAYER_TYPE_HOST else self._join_visual
+
+        ids[ footprint ] = size
+        states[ footprint ] = IH.CoordStateType.COORD_STATE_BASE.value
+        visual[ footprint ] = size
+
+        return True
+
+    def ships_are_alive( self, player_type : IH.PlayerTypeEnum ) -> bool:
+        """
+        Function: Are there ships still alive?
+
+        Inputs: The player's' board
+        Outputs: If there are ships still alive
+
+        Description: Ships are alive as long as one ship cell has not been hit
+        """
+        ids, states = self._get_arrays( player_type )
+        return bool( numpy.any( ( ids != IH.BASE_CELL ) & ( states != IH.CoordStateType.COORD_STATE_HIT.value ) ) )
+
+    def ship_is_alive( self, player_type : IH.PlayerTypeEnum, ship_id : int ) -> bool:
+        """
+        Function: Is the particular ship still alive
+
+        Inputs: The player's' board, the ship we are testing
+        Outputs: If a particular ship is still alive
+
+        Description: A particular ship is alive as long as one of its cells
+                     has not been hit
+        """
+        ids, states = self._get_arrays( player_type )
+        return bool( numpy.any( ( ids == ship_id ) & ( states != IH.CoordStateType.COORD_STATE_HIT.value ) ) )
+
+    def get_visual_board( self, player_type : IH.PlayerTypeEnum ) -> IH.VisualBoardType:
+        """
+        Function: Get the visual board
+
+        Inputs: The player's' board
+        Outputs: The visual board
+
+        Description: This function returns a transformed state of the board
+                     so that the entire board is represented as a 2D array
+                     of integers. Attacked cells show the action done on them
+                     and all other cells show the id of the cell. The returned
+                     array is a read-only view that tracks the board as it changes
+        """
+        return self._host_visual_view if player_type == IH.PlayerTypeEnum.PLAYER_TYPE_HOST else self._join_visual_view
+
+    def get_board_masks( self, player_type : IH.PlayerTypeEnum ) -> IH.BoardMasksType:
+        """
+        Function: Get the board masks
+
+        Inputs: The player's' board
+        Outputs: The masks of the ships, the hit cells and the missed cells
+
+        Description: The arrays are packed into bits in row major order, which
+                     is the order of the bits of the masks
+        """
+        ids, _ = self._get_arrays( player_type )
+        visual = self._host_visual if player_type == IH.PlayerTypeEnum.PLAYER_TYPE_HOST else self._join_visual
+
+        # The ship ids are positive, so they read the same as bytes
+        ship_masks = { ship_id : _get_mask( ids == ship_id ) for ship_id in set( ids.tobytes() ) if ship_id != IH.BASE_CELL }
+
+        return ship_masks, _get_mask( visual == IH.HIT_CELL ), _get_mask( visual == IH.MISSED_CELL )
+
+################################################################################
+# Procedures
+################################################################################
+def _get_mask( cells : numpy.ndarray ) -> int:
+    """
+    Function: Get Mask
+
+    Inputs: A boolean array of the cells of a board
+    Outputs: The mask of the cells that are set
+    """
+    return int.from_bytes( numpy.packbits( cells, axis=None, bitorder="little" ).tobytes(), "little" )
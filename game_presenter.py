@@ -24,6 +24,8 @@ from interfaces import interface_headers as IH
 from interfaces import interface_game_presenter as IGP
 from interfaces import interface_game_view as IGV
 
+from collections.abc import Callable
+
 
 ################################################################################
 # Global Variables and Constants
@@ -33,8 +35,6 @@ from interfaces import interface_game_view as IGV
 ################################################################################
 # Types
 ################################################################################
-TRIGGER_TO_FUNCTION_FUNC_IDX = 0
-TRIGGER_TO_FUNCTION_PARAM_IDX = 1
 
 # Declare an implementation of the View Interface specified
 # in the interfaces directory. As long as all the functions
@@ -56,39 +56,46 @@ class GamePresenter( IGP.GamePresenterInterface ):
         # Declare and Initialize Presenter Members
         self._view_instance : IGV.GameViewInterface = view
         self._player_type : IH.PlayerTypeEnum = IH.PlayerTypeEnum.PLAYER_TYPE_HOST
-        pass
+
+        # This is a mapping between game events and the corresponding
+        # View functions. It is built once, since the view does not
+        # change for the lifetime of the presenter
+        self._event_handlers : dict[ IH.GameEventType, Callable[ [ dict ], dict ] ] = \
+            {
+            IH.GameEventType.GAME_EVENT_INITIALIZATION:     self._view_instance.draw_start_page,
+            IH.GameEventType.GAME_EVENT_PLACE_SHIPS:        self._view_instance.prompt_ship_init,
+            IH.GameEventType.GAME_EVENT_MAKE_ATTACK:        self._view_instance.prompt_user_attack,
+            IH.GameEventType.GAME_EVENT_WAIT_FOR_OPPONENT:  self._view_instance.prompt_wait_page,
+            IH.GameEventType.GAME_EVENT_GAME_END:           self._view_instance.draw_game_over_page,
+            }
+
+    def register_event_handler( self, event, handler : Callable[ [ dict ], dict ] ) -> None:
+        """
+        Function: Register Event Handler
+
+        Inputs: The event to handle, the function that handles the event
+        Outputs: None
+
+        Description: Adds a handler for a new event, or replaces the view
+                     function that handles an existing event
+        """
+        self._event_handlers[ event ] = handler
 
     def trigger_view_event( self, event, params : dict ) -> dict:
         """
         Function: Trigger view event
 
-        Inputs: Instance of View
-        Outputs: None
+        Inputs: The event to trigger, the parameters of the event
+        Outputs: The return values of the view function
 
-        Description: This is the initialization function for ths implementation
-                     of the presenter. The presenter will take in a view object
-                     and use this to control what is being displayed based on
-                     the data in the model and the data provided to it
+        Description: Calls the view function that handles the event. The view
+                     gets its own copy of the parameters, so it can not change
+                     the parameters of the calling function
         """
-        # This is a mapping between game events and the corresponding
-        # View functions
-        message_to_view_event_map = \
-            {
-            IH.GameEventType.GAME_EVENT_INITIALIZATION:     ( self._view_instance.draw_start_page,    dict( {}, **params ) ),
-            IH.GameEventType.GAME_EVENT_PLACE_SHIPS:        ( self._view_instance.prompt_ship_init,   dict( {}, **params ) ),
-            IH.GameEventType.GAME_EVENT_MAKE_ATTACK:        ( self._view_instance.prompt_user_attack, dict( {}, **params ) ),
-            IH.GameEventType.GAME_EVENT_WAIT_FOR_OPPONENT:  ( self._view_instance.prompt_wait_page,   dict( {}, **params ) ),
-            IH.GameEventType.GAME_EVENT_GAME_END:           ( self._view_instance.draw_game_over_page,dict( {}, **params ) ),
-            }
-        
-        # Obtain the function and the parameters for the function from the
-        # map
-        function_pointer_tup = message_to_view_event_map[ event ]
-        function_pointer = function_pointer_tup[ TRIGGER_TO_FUNCTION_FUNC_IDX ]
-        function_params = function_pointer_tup[ TRIGGER_TO_FUNCTION_PARAM_IDX ]
-        
-        # Call the view function
-        return_vals : dict = function_pointer( function_params )
+        # Obtain the function for the event from the map and
+        # call it with a copy of the parameters
+        function_pointer = self._event_handlers[ event ]
+        return_vals : dict = function_pointer( dict( params ) )
 
         # Return the view parameters back to the calling function
-        return return_vals
\ No newline at end of file
+        return return_vals
@@ -0,0 +1,300 @@
+'''
+Module: game_server.py
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Description: This module implements a server that hosts many games at once.
+             Every instance of the game connects to the server as a joining
+             player in lobby mode. The server pairs the players in the order
+             they connect, tells each player if they make the first move, and
+             relays the attacks and responses between them. Every match runs
+             as a coroutine on a single event loop and keeps a record of the
+             moves in a model, so one process can serve thousands of games
+
+Inputs: Connections from instances of the game
+Outputs: Relayed messages between paired instances
+
+Run it with $python executable$ game_server.py
+'''
+
+################################################################################
+# Imports
+################################################################################
+import message_codec as MC
+import message_framing as FR
+import model_factory as MF
+import network_config as NC
+import game_engine as GE
+import interfaces.interface_headers as IH
+
+import argparse
+import asyncio
+
+################################################################################
+# Global Variables
+################################################################################
+
+# The server listens on the same address as the host of a
+# single game, so clients do not need to be configured
+DEFAULT_SERVER_PORT = 5014
+
+# Backlog of connections that have not been accepted yet
+DEFAULT_SERVER_BACKLOG = 1024
+
+# The server only records the moves made on the boards, so use
+# the model that is cheapest to hold in memory
+DEFAULT_SERVER_MODEL_TYPE = "bitboard"
+
+################################################################################
+# Types
+################################################################################
+class MatchPlayer:
+    """
+    Description: This is one connection to the server along with the codec
+                 that was negotiated for it
+    """
+    __slots__ = ( "reader", "writer", "codec" )
+
+    def __init__( self, reader : asyncio.StreamReader, writer : asyncio.StreamWriter ) -> None:
+        """
+        Definition: Storing the streams of the connection. JSON is used until a codec has been negotiated.
+        """
+        self.reader = reader
+        self.writer = writer
+        self.codec = MC.JsonMessageCodec()
+
+    async def receive( self ) -> dict:
+        """
+        Definition: Waiting for a complete frame and decoding the message.
+        """
+        header = await self.reader.readexactly( FR.FRAME_HEADER.size )
+        ( length, ) = FR.FRAME_HEADER.unpack( header )
+
+        return self.codec.decode( await self.reader.readexactly( length ) )
+
+    async def send( self, msg : dict ) -> None:
+        """
+        Definition: Encoding the message and sending it as a single frame.
+        """
+        self.writer.write( FR.encode_frame( self.codec.encode( msg ) ) )
+        await self.writer.drain()
+
+    async def negotiate_codec( self ) -> None:
+        """
+        Definition: Selecting a codec from the codecs offered by the player if it plays on the same board, the same way a host does.
+        """
+        offer = await self.receive()
+        answer = MC.get_board_dimensions()
+
+        # A player on another board is answered without a codec, so
+        # it refuses the connection as well
+        try:
+            MC.check_board_dimensions( offer )
+
+        except MC.BoardMismatchError:
+            await self.send( answer )
+            raise
+
+        codec = MC.select_codec( offer[ IH.VIEW_PARAM_CODECS ], MC.DEFAULT_CODEC )
+        answer[ IH.VIEW_PARAM_CODEC ] = codec
+
+        await self.send( answer )
+        self.codec = MC.CODEC_NAME_TO_CLASS[ codec ]()
+
+    def is_connected( self ) -> bool:
+        """
+        Definition: Checking if the player is still connected.
+        """
+        return not self.reader.at_eof() and not self.writer.is_closing()
+
+    def close( self ) -> None:
+        """
+        Definition: Closing the connection.
+        """
+        self.writer.close()
+
+class GameServer:
+    def __init__( self, config : NC.NetworkConfig = None, model_type : str = DEFAULT_SERVER_MODEL_TYPE ) -> None:
+        """
+        Definition: Setting up the address and socket options of the server and the lobby.
+        """
+        self.network_config = NC.from_environment( get_default_config() ) if config is None else config
+        self.model_type = model_type
+
+        # The player that is waiting to be paired, and the matches
+        # that are being played
+        self._waiting_player : MatchPlayer = None
+        self._matches : set[ asyncio.Task ] = set()
+        self.matches_started = 0
+        self.matches_finished = 0
+        self._server : asyncio.Server = None
+
+    def get_active_matches( self ) -> int:
+        """
+        Definition: Getting the number of matches that are being played.
+        """
+        return len( self._matches )
+
+    async def start( self ) -> None:
+        """
+        Definition: Opening the listening socket of the server.
+        """
+        self._server = await asyncio.start_server( self._handle_connection, sock=NC.create_listening_socket( self.network_config ),
+                                                   backlog=self.network_config.backlog )
+
+    async def serve_forever( self ) -> None:
+        """
+        Definition: Accepting connections until the server is closed.
+        """
+        if self._server is None:
+            await self.start()
+
+        async with self._server:
+            await self._server.serve_forever()
+
+    def close( self ) -> None:
+        """
+        Definition: Closing the listening socket and every match.
+        """
+        if self._server is not None:
+            self._server.close()
+            NC.remove_socket_path( self.network_config )
+
+        for match in list( self._matches ):
+            match.cancel()
+
+    async def _handle_connection( self, reader : asyncio.StreamReader, writer : asyncio.StreamWriter ) -> None:
+        """
+        Definition: Negotiating a codec with a new player and placing them in the lobby.
+        """
+        NC.apply_socket_options( writer.get_extra_info( "socket" ), self.network_config )
+        player = MatchPlayer( reader, writer )
+
+        try:
+            await player.negotiate_codec()
+
+        except ( asyncio.IncompleteReadError, ConnectionError, ValueError, KeyError ):
+            player.close()
+            return
+
+        # Wait for an opponent if there is no one to pair with.
+        # A waiting player that already left is replaced
+        if self._waiting_player is None or not self._waiting_player.is_connected():
+            self._waiting_player = player
+            return
+
+        first_player = self._waiting_player
+        self._waiting_player = None
+
+        match = asyncio.create_task( self._run_match( first_player, player ) )
+        self._matches.add( match )
+        match.add_done_callback( self._matches.discard )
+
+    async def _run_match( self, first_player : MatchPlayer, second_player : MatchPlayer ) -> None:
+        """
+        Definition: Relaying the moves of a match until one of the players wins or leaves.
+        """
+        self.matches_started += 1
+
+        # The first player makes the first move, so their board is
+        # recorded as the host board the same as in a single game
+        players = { IH.PlayerTypeEnum.PLAYER_TYPE_HOST : first_player,
+                    IH.PlayerTypeEnum.PLAYER_TYPE_JOIN : second_player }
+        engine = GE.GameEngine( MF.create_model( self.model_type ) )
+        model = engine.get_model()
+        turn = IH.PlayerTypeEnum.PLAYER_TYPE_HOST
+
+        try:
+            await first_player.send( { IH.VIEW_PARAM_FIRST_MOVE : True } )
+            await second_player.send( { IH.VIEW_PARAM_FIRST_MOVE : False } )
+
+            while not engine.is_over():
+                attacker = players[ turn ]
+                defender_type = GE.get_opponent_type( turn )
+                defender = players[ defender_type ]
+
+                # Only relay attacks on cells of the board that have
+                # not been attacked yet. Anything else ends the match
+                attack = await attacker.receive()
+                coord = GE.get_attack_coord( attack )
+
+                if coord is None or not engine.is_valid_attack( defender_type, coord ):
+                    break
+
+                await defender.send( attack )
+                response = await defender.receive()
+
+                # Record the result of the move on the board of the
+                # defender before passing the response on
+                engine.record_attack_result( defender_type, coord, response )
+                await attacker.send( response )
+
+                turn = defender_type
+
+        except ( asyncio.IncompleteReadError, ConnectionError, ValueError, KeyError, TypeError, IndexError ):
+            pass
+
+        finally:
+            first_player.close()
+            second_player.close()
+            self.matches_finished += 1
+
+################################################################################
+# Procedures
+################################################################################
+def get_default_config() -> NC.NetworkConfig:
+    """
+    Function: Get Default Config
+
+    Inputs: None
+    Output: The network settings of a server that is not configured
+    """
+    return NC.NetworkConfig( port=DEFAULT_SERVER_PORT, backlog=DEFAULT_SERVER_BACKLOG )
+
+def parse_arguments( argv : list[ str ] = None ) -> argparse.Namespace:
+    """
+    Function: Parse Arguments
+
+    Inputs: Command line arguments, defaults to the arguments of the process
+    Output: Parsed server options
+    """
+    parser = argparse.ArgumentParser( description="Battleship multi-game server" )
+    NC.add_network_arguments( parser, get_default_config() )
+    parser.add_argument( "--model", choices=MF.MODEL_TYPES, default=DEFAULT_SERVER_MODEL_TYPE,
+                         help="Implementation of the game model used to record the matches" )
+    parser.add_argument( "--rows", type=int, default=IH.NUMBER_OF_ROWS, help="Number of rows on the board" )
+    parser.add_argument( "--cols", type=int, default=IH.NUMBER_OF_COLS, help="Number of columns on the board" )
+
+    options = parser.parse_args( argv )
+
+    # The server relays the messages between the players, so every
+    # message passes through it and there is no memory to share
+    if options.transport == NC.TRANSPORT_SHARED_MEMORY:
+        parser.error( f"The server can not use the { NC.TRANSPORT_SHARED_MEMORY } transport" )
+
+    return options
+
+def main( options : argparse.Namespace ) -> None:
+    """
+    Function: Main
+
+    Inputs: Server options
+    Output: None
+
+    Description: Runs the server until the process is interrupted
+    """
+    IH.set_board_dimensions( options.rows, options.cols )
+    server = GameServer( NC.from_arguments( options ), options.model )
+
+    try:
+        asyncio.run( server.serve_forever() )
+
+    except KeyboardInterrupt:
+        pass
+
+    finally:
+        NC.remove_socket_path( server.network_config )
+
+if __name__ == "__main__":
+    main( parse_arguments() )
@@ -0,0 +1,736 @@
+'''
+Module: game_snapshot.py
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Inputs: The state of a game after every turn
+Outputs: Snapshots of the game, games resumed from a snapshot
+
+Description: This module saves a game after every turn so it can survive a
+             dropped connection or a crashed instance. A snapshot holds the
+             ship layouts and the hit and miss masks of both boards, which is
+             a couple of hundred bytes on the default board. When the players
+             reconnect, they exchange how many turns they have saved and the
+             last attack they answered, so a player that missed the answer to
+             its last attack catches up without replaying the game
+
+             The snapshot file has two slots that are written in turn, and
+             every slot is checked with a CRC. A crash in the middle of a
+             write only damages the slot that was being written, so the
+             snapshot of the turn before is read instead
+'''
+################################################################################
+# Imports
+################################################################################
+import game_engine as GE
+
+from interfaces import interface_headers as IH
+from interfaces import interface_game_model as IGM
+from interfaces import interface_game_interaction as IGI
+
+import os
+import struct
+import time
+import zlib
+
+################################################################################
+# Global Variables
+################################################################################
+
+# Every snapshot starts with a header that identifies the file
+# and describes the game: the board size, the amount of turns
+# that were played, the player that saved it, the player that
+# moves next, and if the last attack answered is included
+SNAPSHOT_MAGIC = b"BSNP"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEADER = struct.Struct( "!4sBHHIBB?" )
+
+# The last attack that was answered, along with the response:
+# row, column, state, win, ship sunk and the size of the ship
+LAST_DEFENSE_STRUCT = struct.Struct( "!HHB??B" )
+
+# Every board is saved as the amount of ships, the id and mask
+# of every ship, and the hit and miss masks. The masks are
+# saved with as many bytes as the board needs
+SHIP_COUNT_STRUCT = struct.Struct( "!B" )
+SHIP_ID_STRUCT = struct.Struct( "!B" )
+MASK_BYTE_ORDER = "little"
+
+# Order the boards are saved in
+SNAPSHOT_BOARDS = ( IH.PlayerTypeEnum.PLAYER_TYPE_HOST, IH.PlayerTypeEnum.PLAYER_TYPE_JOIN )
+
+# Every slot of the snapshot file starts with the length and
+# the CRC of the snapshot in it. The slots are made larger than
+# the first snapshot, so the file only has to be created again
+# if the snapshots grow past that
+SLOT_HEADER = struct.Struct( "!II" )
+SLOT_COUNT = 2
+SLOT_GROWTH = 2
+MIN_SLOT_SIZE = 512
+
+# Suffix of the file that a new snapshot file is created in
+# before it replaces the old one
+TEMPORARY_SUFFIX = ".tmp"
+
+# Seconds to wait for the opponent to return, and between the
+# attempts to connect to a host that is not listening yet
+RECONNECT_TIMEOUT = 120.0
+RECONNECT_INTERVAL = 0.5
+
+################################################################################
+# Types
+################################################################################
+class SnapshotError( Exception ):
+    """
+    Description: This error is raised for a snapshot that can not be read,
+                 when the snapshots of the two players can not be reconciled,
+                 or when the opponent does not return to a lost game in time
+    """
+
+class GameSnapshot:
+    """
+    Description: This is the state of a game after a turn. The last defense is
+                 the last attack the player answered along with its response,
+                 None if the player's last turn was an attack
+    """
+    __slots__ = ( "rows", "cols", "sequence", "player_type", "turn", "last_defense", "boards" )
+
+    def __init__( self, rows : int, cols : int, sequence : int, player_type : IH.PlayerTypeEnum, turn : IH.PlayerTypeEnum,
+                  last_defense : dict, boards : dict[ IH.PlayerTypeEnum, IH.BoardMasksType ] ) -> None:
+        """
+        Function: Initialization
+
+        Inputs: The size of the board, the amount of turns played, the player,
+                the player that moves next, the last defense, the masks of both boards
+        Outputs: None
+        """
+        self.rows = rows
+        self.cols = cols
+        self.sequence = sequence
+        self.player_type = player_type
+        self.turn = turn
+        self.last_defense = last_defense
+        self.boards = boards
+
+class SnapshotFile:
+    """
+    Description: This is a snapshot file that stays open for the whole game,
+                 so writing a snapshot is a single positioned write
+    """
+    __slots__ = ( "_path", "_fd", "_slot_size", "_next_slot" )
+
+    def __init__( self, path : str ) -> None:
+        """
+        Function: Initialization
+
+        Inputs: The path of the snapshot file
+        Outputs: None
+
+        Description: The file is created by the first write
+        """
+        self._path = path
+        self._fd : int = None
+        self._slot_size = 0
+        self._next_slot = 0
+
+    def write( self, snapshot : GameSnapshot ) -> None:
+        """
+        Function: Write
+
+        Inputs: The snapshot of a game
+        Outputs: None
+        """
+        data = encode_snapshot( snapshot )
+        record = SLOT_HEADER.pack( len( data ), zlib.crc32( data ) ) + data
+
+        if self._fd is None or len( record ) > self._slot_size:
+            self._create( record )
+            return
+
+        offset = self._next_slot * self._slot_size
+
+        if hasattr( os, "pwrite" ):
+            os.pwrite( self._fd, record, offset )
+
+        else:
+            # Windows does not have positioned writes
+            os.lseek( self._fd, offset, os.SEEK_SET )
+            os.write( self._fd, record )
+
+        self._next_slot = ( self._next_slot + 1 ) % SLOT_COUNT
+
+    def _create( self, record : bytes ) -> None:
+        """
+        Function: Create
+
+        Inputs: The first record of the file
+        Outputs: None
+
+        Description: The new file is created next to the old one and replaces
+                     it once it is complete, so there is always a snapshot to
+                     read
+        """
+        self.close()
+
+        self._slot_size = max( MIN_SLOT_SIZE, len( record ) * SLOT_GROWTH )
+        temporary_path = self._path + TEMPORARY_SUFFIX
+
+        with open( temporary_path, "wb" ) as snapshot_file:
+            snapshot_file.write( record.ljust( self._slot_size * SLOT_COUNT, b"\0" ) )
+
+        os.replace( temporary_path, self._path )
+
+        self._fd = os.open( self._path, os.O_WRONLY | getattr( os, "O_BINARY", 0 ) )
+        self._next_slot = 1
+
+    def close( self ) -> None:
+        """
+        Function: Close
+
+        Inputs: None
+        Outputs: None
+        """
+        if self._fd is not None:
+            os.close( self._fd )
+            self._fd = None
+
+    def remove( self ) -> None:
+        """
+        Function: Remove
+
+        Inputs: None
+        Outputs: None
+        """
+        self.close()
+
+        if os.path.exists( self._path ):
+            os.remove( self._path )
+
+class SnapshotRecorder:
+    def __init__( self, engine : GE.GameEngine, player_type : IH.PlayerTypeEnum, path : str,
+                  sequence : int = 0, last_defense : dict = None ) -> None:
+        """
+        Function: Initialization
+
+        Inputs: The engine of the game, the player, the path of the snapshot,
+                the amount of turns played and the last defense of a resumed game
+        Outputs: None
+
+        Description: The recorder writes a snapshot after every turn that the
+                     game loops tell it about
+        """
+        self._engine = engine
+        self._player_type = player_type
+        self._file = SnapshotFile( path )
+        self.sequence = sequence
+        self.last_defense = last_defense
+
+    def write( self, turn : IH.PlayerTypeEnum ) -> None:
+        """
+        Function: Write
+
+        Inputs: The player that moves next
+        Outputs: None
+        """
+        self._file.write( capture_snapshot( self._engine.get_model(), self._player_type, turn, self.sequence, self.last_defense ) )
+
+    def record_attack( self, turn : IH.PlayerTypeEnum ) -> None:
+        """
+        Function: Record Attack
+
+        Inputs: The player that moves next
+        Outputs: None
+
+        Description: Called once the response to the player's attack was recorded
+        """
+        self.sequence += 1
+        self.last_defense = None
+        self.write( turn )
+
+    def record_defense( self, coord : IH.SystemCoordType, response : dict, turn : IH.PlayerTypeEnum ) -> None:
+        """
+        Function: Record Defense
+
+        Inputs: The coordinate the opponent attacked, the response, the player that moves next
+        Outputs: None
+
+        Description: Called before the response is sent, so the opponent can
+                     never be ahead of the snapshot on disk
+        """
+        self.sequence += 1
+        self.last_defense = { IH.VIEW_PARAM_ROW : coord[ IH.ROW_INDEX ], IH.VIEW_PARAM_COL : coord[ IH.COLUMN_INDEX ] }
+        self.last_defense.update( response )
+        self.write( turn )
+
+    def remove( self ) -> None:
+        """
+        Function: Remove
+
+        Inputs: None
+        Outputs: None
+
+        Description: A game that is over can not be resumed
+        """
+        self._file.remove()
+
+    def synchronize( self, connection : IGI.GameInteractionInterface ) -> dict:
+        """
+        Function: Synchronize
+
+        Inputs: A connection that was just opened
+        Outputs: The answer to the player's last attack if it never arrived, None otherwise
+
+        Description: Both players send the amount of turns they have saved and
+                     their last defense. The players agree if they saved the
+                     same turns. Otherwise one of them answered the last attack
+                     of the other, but the answer never arrived. The player that
+                     answered is done, and the other player takes the answer
+                     from the last defense of the opponent. Raises a
+                     SnapshotError if the players can not agree
+        """
+        try:
+            connection.send_message( { IH.VIEW_PARAM_SEQUENCE : self.sequence, IH.VIEW_PARAM_LAST_DEFENSE : self.last_defense } )
+            answer = connection.wait_for_message()
+
+            opponent_sequence = answer[ IH.VIEW_PARAM_SEQUENCE ]
+            opponent_defense = answer[ IH.VIEW_PARAM_LAST_DEFENSE ]
+
+        except ( OSError, ValueError, KeyError, TypeError ) as error:
+            raise SnapshotError( "The game can not be resumed, the opponent did not send the turns it saved" ) from error
+
+        if opponent_sequence == self.sequence:
+            return None
+
+        if opponent_sequence == self.sequence - 1 and self.last_defense is not None:
+            return None
+
+        if opponent_sequence == self.sequence + 1 and opponent_defense is not None:
+            return opponent_defense
+
+        raise SnapshotError( f"The game can not be resumed, { self.sequence } turns were saved but the opponent saved { opponent_sequence }" )
+
+    def resume( self, connection : IGI.GameInteractionInterface, turn : IH.PlayerTypeEnum ) -> IH.PlayerTypeEnum:
+        """
+        Function: Resume
+
+        Inputs: The connection of a game that was resumed from a snapshot, the player that moves next in the snapshot
+        Outputs: The player that moves next
+
+        Description: An answer to the last attack that never arrived is
+                     recorded the same way as an answer that did
+        """
+        answer = self.synchronize( connection )
+
+        if answer is None:
+            return turn
+
+        opponent_type = GE.get_opponent_type( self._player_type )
+        coord = ( answer[ IH.VIEW_PARAM_ROW ], answer[ IH.VIEW_PARAM_COL ] )
+
+        self._engine.record_attack_result( opponent_type, coord, answer )
+        self.record_attack( opponent_type )
+
+        return opponent_type
+
+    def reconnect( self, connection : IGI.GameInteractionInterface ) -> dict:
+        """
+        Function: Reconnect
+
+        Inputs: The connection that was lost
+        Outputs: The answer to the player's last attack if it never arrived, None otherwise
+
+        Description: Opens the connection again, waiting for the opponent to
+                     return, and synchronizes the game. Raises a SnapshotError
+                     if the opponent does not return within RECONNECT_TIMEOUT
+        """
+        connection.close_connection()
+        deadline = time.monotonic() + RECONNECT_TIMEOUT
+
+        while True:
+            # A host waits for the opponent to connect until the deadline
+            connection.open_timeout = max( deadline - time.monotonic(), RECONNECT_INTERVAL )
+
+            try:
+                connection.open_connection()
+                break
+
+            # A host that is being restarted does not listen yet
+            except ConnectionRefusedError as error:
+                if time.monotonic() > deadline:
+                    raise SnapshotError( f"The opponent did not return within { RECONNECT_TIMEOUT :.0f} seconds" ) from error
+
+                time.sleep( RECONNECT_INTERVAL )
+
+            except TimeoutError as error:
+                raise SnapshotError( f"The opponent did not return within { RECONNECT_TIMEOUT :.0f} seconds" ) from error
+
+            except OSError as error:
+                raise SnapshotError( f"The connection to the opponent could not be opened again: { error }" ) from error
+
+            finally:
+                connection.open_timeout = None
+
+        return self.synchronize( connection )
+
+class ResumableConnection( IGI.GameInteractionInterface ):
+    def __init__( self, connection, recorder : SnapshotRecorder ) -> None:
+        """
+        Function: Initialization
+
+        Inputs: The connection to the opponent, the recorder of the game
+        Outputs: None
+
+        Description: This connection hides a lost connection from the game
+                     loops. Whenever the connection is lost, it is opened again
+                     and the game is synchronized. An attack that was lost is
+                     sent again, and an answer to the last attack that was lost
+                     is handed out as if it had arrived
+        """
+        self._connection = connection
+        self._recorder = recorder
+        self._pending_request : dict = None
+        self._answer : dict = None
+
+    @property
+    def codec( self ):
+        """
+        Function: Codec
+
+        Inputs: None
+        Outputs: The codec of the connection
+        """
+        return self._connection.codec
+
+    @property
+    def connection_count( self ) -> int:
+        """
+        Function: Connection Count
+
+        Inputs: None
+        Outputs: The amount of times the connection was opened
+        """
+        return self._connection.connection_count
+
+    @property
+    def poll_interval( self ) -> float:
+        """
+        Function: Poll Interval
+
+        Inputs: None
+        Outputs: The seconds between the checks of an event loop, None if the socket tells when a message arrives
+        """
+        return self._connection.poll_interval
+
+    def open_connection( self ) -> None:
+        """
+        Function: Open Connection
+
+        Inputs: None
+        Outputs: None
+        """
+        self._connection.open_connection()
+
+    def close_connection( self ) -> None:
+        """
+        Function: Close Connection
+
+        Inputs: None
+        Outputs: None
+        """
+        self._connection.close_connection()
+
+    def get_round_trip_latency( self ):
+        """
+        Function: Get Round Trip Latency
+
+        Inputs: None
+        Outputs: The histogram of the round trips of the requests
+        """
+        return self._connection.get_round_trip_latency()
+
+    def fileno( self ) -> int:
+        """
+        Function: File Number
+
+        Inputs: None
+        Outputs: The file descriptor of the current connection
+        """
+        return self._connection.fileno()
+
+    def reconnect( self ) -> None:
+        """
+        Function: Reconnect
+
+        Inputs: None
+        Outputs: None
+        """
+        answer = self._recorder.reconnect( self._connection )
+
+        if self._pending_request is not None:
+            if answer is not None:
+                self._answer = answer
+
+            else:
+                self._connection.send_request( self._pending_request )
+
+    def send_message( self, msg : dict ) -> None:
+        """
+        Function: Send Message
+
+        Inputs: The message to send
+        Outputs: None
+
+        Description: Messages are answers that were saved before they are
+                     sent, so a message that is lost reaches the opponent
+                     through the synchronization
+        """
+        try:
+            self._connection.send_message( msg )
+
+        except OSError:
+            self.reconnect()
+
+    def send_request( self, msg : dict ) -> None:
+        """
+        Function: Send Request
+
+        Inputs: The attack to send
+        Outputs: None
+        """
+        self._pending_request = msg
+
+        try:
+            self._connection.send_request( msg )
+
+        except OSError:
+            self.reconnect()
+
+    def _take_message( self, message : dict ) -> dict:
+        """
+        Function: Take Message
+
+        Inputs: A message that arrived, None if there was not one
+        Outputs: The message
+        """
+        if message is not None:
+            self._pending_request = None
+
+        return message
+
+    def wait_for_message( self ) -> dict:
+        """
+        Function: Wait For Message
+
+        Inputs: None
+        Outputs: The next message from the opponent
+        """
+        while True:
+            if self._answer is not None:
+                answer, self._answer = self._answer, None
+                return self._take_message( answer )
+
+            try:
+                return self._take_message( self._connection.wait_for_message() )
+
+            except OSError:
+                self.reconnect()
+
+    def poll_message( self ) -> dict:
+        """
+        Function: Poll Message
+
+        Inputs: None
+        Outputs: The next message from the opponent, None if it has not fully arrived
+        """
+        while True:
+            if self._answer is not None:
+                answer, self._answer = self._answer, None
+                return self._take_message( answer )
+
+            try:
+                return self._take_message( self._connection.poll_message() )
+
+            except OSError:
+                self.reconnect()
+
+################################################################################
+# Procedures
+################################################################################
+def get_mask_size( rows : int, cols : int ) -> int:
+    """
+    Function: Get Mask Size
+
+    Inputs: The size of the board
+    Outputs: The amount of bytes a mask of the board is saved in
+    """
+    return ( rows * cols + 7 ) // 8
+
+def capture_snapshot( model : IGM.GameModelInterface, player_type : IH.PlayerTypeEnum, turn : IH.PlayerTypeEnum,
+                      sequence : int, last_defense : dict = None ) -> GameSnapshot:
+    """
+    Function: Capture Snapshot
+
+    Inputs: The model of the game, the player, the player that moves next, the amount of turns played, the last defense
+    Outputs: The snapshot of the game
+    """
+    boards = { board : model.get_board_masks( board ) for board in SNAPSHOT_BOARDS }
+
+    return GameSnapshot( IH.NUMBER_OF_ROWS, IH.NUMBER_OF_COLS, sequence, player_type, turn, last_defense, boards )
+
+def encode_snapshot( snapshot : GameSnapshot ) -> bytes:
+    """
+    Function: Encode Snapshot
+
+    Inputs: The snapshot of a game
+    Outputs: The bytes of the snapshot
+    """
+    mask_size = get_mask_size( snapshot.rows, snapshot.cols )
+    parts = [ SNAPSHOT_HEADER.pack( SNAPSHOT_MAGIC, SNAPSHOT_VERSION, snapshot.rows, snapshot.cols, snapshot.sequence,
+                                    snapshot.player_type.value, snapshot.turn.value, snapshot.last_defense is not None ) ]
+
+    if snapshot.last_defense is not None:
+        defense = snapshot.last_defense
+        parts.append( LAST_DEFENSE_STRUCT.pack( defense[ IH.VIEW_PARAM_ROW ], defense[ IH.VIEW_PARAM_COL ],
+                                                defense[ IH.GAME_COORD_TYPE_STATE_INDEX ], defense[ IH.VIEW_PARAM_WIN ],
+                                                defense[ IH.VIEW_PARAM_SHIP_SUNK ], defense[ IH.VIEW_PARAM_SIZE ] ) )
+
+    for board in SNAPSHOT_BOARDS:
+        ship_masks, hit_mask, miss_mask = snapshot.boards[ board ]
+        parts.append( SHIP_COUNT_STRUCT.pack( len( ship_masks ) ) )
+
+        for ship_id, mask in ship_masks.items():
+            parts.append( SHIP_ID_STRUCT.pack( ship_id ) )
+            parts.append( mask.to_bytes( mask_size, MASK_BYTE_ORDER ) )
+
+        parts.append( hit_mask.to_bytes( mask_size, MASK_BYTE_ORDER ) )
+        parts.append( miss_mask.to_bytes( mask_size, MASK_BYTE_ORDER ) )
+
+    return b"".join( parts )
+
+def decode_snapshot( data : bytes ) -> GameSnapshot:
+    """
+    Function: Decode Snapshot
+
+    Inputs: The bytes of a snapshot
+    Outputs: The snapshot of the game
+    """
+    try:
+        magic, version, rows, cols, sequence, player_value, turn_value, has_defense = SNAPSHOT_HEADER.unpack_from( data )
+
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise SnapshotError( "The file is not a snapshot of this version of the game" )
+
+        offset = SNAPSHOT_HEADER.size
+        last_defense = None
+
+        if has_defense:
+            row, col, state, win, ship_sunk, size = LAST_DEFENSE_STRUCT.unpack_from( data, offset )
+            offset += LAST_DEFENSE_STRUCT.size
+            last_defense = { IH.VIEW_PARAM_ROW : row, IH.VIEW_PARAM_COL : col, IH.GAME_COORD_TYPE_STATE_INDEX : state,
+                             IH.VIEW_PARAM_WIN : win, IH.VIEW_PARAM_SHIP_SUNK : ship_sunk, IH.VIEW_PARAM_SIZE : size }
+
+        mask_size = get_mask_size( rows, cols )
+        boards = dict()
+
+        def read_mask() -> int:
+            nonlocal offset
+            mask = int.from_bytes( data[ offset : offset + mask_size ], MASK_BYTE_ORDER )
+            offset += mask_size
+            return mask
+
+        for board in SNAPSHOT_BOARDS:
+            ( ship_count, ) = SHIP_COUNT_STRUCT.unpack_from( data, offset )
+            offset += SHIP_COUNT_STRUCT.size
+            ship_masks = dict()
+
+            for _ in range( ship_count ):
+                ( ship_id, ) = SHIP_ID_STRUCT.unpack_from( data, offset )
+                offset += SHIP_ID_STRUCT.size
+                ship_masks[ ship_id ] = read_mask()
+
+            hit_mask = read_mask()
+            boards[ board ] = ( ship_masks, hit_mask, read_mask() )
+
+        if offset != len( data ):
+            raise SnapshotError( "The snapshot is truncated or has trailing data" )
+
+        return GameSnapshot( rows, cols, sequence, IH.PlayerTypeEnum( player_value ), IH.PlayerTypeEnum( turn_value ), last_defense, boards )
+
+    except ( struct.error, ValueError ) as error:
+        raise SnapshotError( f"The snapshot can not be read: { error }" ) from error
+
+def read_snapshot( path : str ) -> GameSnapshot:
+    """
+    Function: Read Snapshot
+
+    Inputs: The path of a snapshot file
+    Outputs: The latest snapshot in the file
+
+    Description: Slots that were not written or were damaged by a crash fail
+                 their CRC and are skipped
+    """
+    with open( path, "rb" ) as snapshot_file:
+        data = snapshot_file.read()
+
+    slot_size = len( data ) // SLOT_COUNT
+    latest : GameSnapshot = None
+
+    for slot in range( SLOT_COUNT ):
+        offset = slot * slot_size
+        length, crc = SLOT_HEADER.unpack_from( data, offset )
+        payload = data[ offset + SLOT_HEADER.size : offset + SLOT_HEADER.size + length ]
+
+        if length == 0 or len( payload ) != length or zlib.crc32( payload ) != crc:
+            continue
+
+        snapshot = decode_snapshot( payload )
+
+        if latest is None or snapshot.sequence > latest.sequence:
+            latest = snapshot
+
+    if latest is None:
+        raise SnapshotError( f"{ path } does not hold a complete snapshot" )
+
+    return latest
+
+def get_mask_cells( mask : int ) -> list[ IH.SystemCoordType ]:
+    """
+    Function: Get Mask Cells
+
+    Inputs: A mask of cells
+    Outputs: The coordinates of the cells in the mask
+    """
+    cells = list()
+
+    while mask:
+        low_bit = mask & -mask
+        cells.append( divmod( low_bit.bit_length() - 1, IH.NUMBER_OF_COLS ) )
+        mask ^= low_bit
+
+    return cells
+
+def restore_model( snapshot : GameSnapshot, model : IGM.GameModelInterface ) -> None:
+    """
+    Function: Restore Model
+
+    Inputs: The snapshot of a game, a new model of the same board size
+    Outputs: None
+
+    Description: Only the cells that have a ship or were attacked are
+                 updated, the rest of a new model is already empty
+    """
+    for board in SNAPSHOT_BOARDS:
+        ship_masks, hit_mask, miss_mask = snapshot.boards[ board ]
+        cell_ids = dict()
+
+        for ship_id, mask in ship_masks.items():
+            for coord in get_mask_cells( mask ):
+                cell_ids[ coord ] = ship_id
+                model.update_coord( board, coord, { IH.GAME_COORD_TYPE_ID_INDEX : ship_id,
+                                                    IH.GAME_COORD_TYPE_STATE_INDEX : IH.CoordStateType.COORD_STATE_BASE } )
+
+        for mask, state in ( ( hit_mask, IH.CoordStateType.COORD_STATE_HIT ), ( miss_mask, IH.CoordStateType.COORD_STATE_MISS ) ):
+            for coord in get_mask_cells( mask ):
+                model.update_coord( board, coord, { IH.GAME_COORD_TYPE_ID_INDEX : cell_ids.get( coord, IH.BASE_CELL ),
+                                                    IH.GAME_COORD_TYPE_STATE_INDEX : state } )
@@ -33,9 +33,7 @@ from interfaces import interface_game_view as IGV
 # Source: https://www.geeksforgeeks.org/clear-screen-python/
 from os import system, name
 
-from pprint import pprint
-
-import pandas
+import terminal_renderer as TR
 
 ################################################################################
 # Global Variables and Constants
@@ -45,10 +43,72 @@ WINDOWS_OS_CLEAR_SCREEN_COMMAND : str = "cls"
 
 NON_WINDOWS_OS_CLEAR_SCREEN_COMMAND : str = "clear"
 
+# Symbols used to display the cells that are not ship cells
+CELL_TO_SYMBOL : dict[ int, str ] = { IH.BASE_CELL : '~',
+                                      IH.HIT_CELL : 'X',
+                                      IH.MISSED_CELL : 'O' }
+
+# Amount of spaces between the columns of a drawn board
+GRID_COLUMN_SPACING : int = 2
+
 ################################################################################
 # Types
 ################################################################################
 
+# The formatter lays out a board the same way the boards used to
+# be printed with pandas: the row labels are left aligned in the
+# first column, and every other column is right aligned under its
+# label. Everything that only depends on the size of the board is
+# computed once, so drawing a board only joins the symbols
+class GridFormatter:
+    def __init__( self, number_of_rows : int, number_of_cols : int ):
+        """
+        Function: Initialization
+
+        Inputs: The number of rows and columns of the board
+        Outputs: None
+
+        Description: Precomputes the header line, the row labels and the
+                     padding in front of every cell
+        """
+        row_labels = [ str( IH.SYS_ROW_TO_PLACMENT_ROW[ row ] ) for row in range( number_of_rows ) ]
+        col_labels = [ IH.SYS_COL_TO_PLACMENT_COL[ col ] for col in range( number_of_cols ) ]
+        label_width = max( len( label ) for label in row_labels )
+
+        self.number_of_rows = number_of_rows
+        self.number_of_cols = number_of_cols
+
+        # Every symbol is a single character, so the padding in
+        # front of a cell only depends on the width of its column
+        self._cell_padding = [ " " * ( GRID_COLUMN_SPACING + len( label ) - 1 ) for label in col_labels ]
+        self._row_labels = [ label.ljust( label_width ) for label in row_labels ]
+        self._header = " " * label_width + "".join( " " * GRID_COLUMN_SPACING + label for label in col_labels )
+
+    def format_lines( self, grid : list[ list[ str ] ] ) -> list[ str ]:
+        """
+        Function: Format Lines
+
+        Inputs: Grid of the symbols to display
+        Outputs: The lines of the board with its labels
+        """
+        lines = [ self._header ]
+        cell_padding = self._cell_padding
+
+        for row_label, row in zip( self._row_labels, grid ):
+            lines.append( row_label + "".join( map( str.__add__, cell_padding, row ) ) )
+
+        return lines
+
+    def format( self, grid : list[ list[ str ] ] ) -> str:
+        """
+        Function: Format
+
+        Inputs: Grid of the symbols to display
+        Outputs: The board with its labels as a single string
+        """
+        return "\n".join( self.format_lines( grid ) )
+
+
 # Declare an implementation of the View Interface specified
 # in the interfaces directory. As long as all the functions
 # specified there are implemented, this will be a valid model
@@ -67,7 +127,11 @@ class GameView( IGV.GameViewInterface ):
                      an implemenation chooses to do something, this function
                      will have a larger purpose 
         """
-        pass
+        self._grid_formatter : GridFormatter = None
+
+        # Pages are drawn by a renderer that only updates the parts
+        # of the screen that changed since the last page
+        self._renderer = TR.create_renderer( clear_screen=self.clear_screen )
     
     def draw_start_page( self, params : dict ) -> dict:
         """
@@ -88,8 +152,7 @@ class GameView( IGV.GameViewInterface ):
         number_of_ships = 0
 
         # Print the welcome dialog
-        self.clear_screen()
-        print( "Welcome to Battleship!" )
+        self._renderer.render( [ "Welcome to Battleship!" ] )
 
         # Obtain the type of player is running the game.
         # The types of players that are supported are
@@ -107,7 +170,7 @@ class GameView( IGV.GameViewInterface ):
                 config_dict[ IH.VIEW_PARAM_PLAYER_TYPE ] = IH.PlayerTypeEnum( int( player_type ) )
                 break
             else:
-                print( "Error! Invalid Input" )
+                self._show_input_error( "Error! Invalid Input" )
         
         # Obtain the number of ships that the player will be facing
         # Again ensure that the input is a valid input
@@ -118,7 +181,7 @@ class GameView( IGV.GameViewInterface ):
                 config_dict[ IH.VIEW_PARAM_NUM_OF_SHIPS ] = int( number_of_ships )
                 break
             else:
-                print( "Error! Invalid Input" )
+                self._show_input_error( "Error! Invalid Input" )
         
         # Return the configurations once all the required
         # configurations have been generated
@@ -144,6 +207,44 @@ class GameView( IGV.GameViewInterface ):
             # Execute the non windows version of the clear screen command
             system( NON_WINDOWS_OS_CLEAR_SCREEN_COMMAND )
 
+    def _show_input_error( self, message : str ) -> None:
+        """
+        Function: Show Input Error
+
+        Inputs: The error to show below the prompt
+        Outputs: None
+
+        Description: Every error adds lines below the page, so the prompts may
+                     no longer fit in the space the renderer keeps free for
+                     them. The next page is drawn in full in that case
+        """
+        print( message )
+        self._renderer.invalidate()
+
+    def _get_row_range( self ) -> str:
+        """
+        Function: Get Row Range
+
+        Inputs: None
+        Outputs: The range of the row labels
+
+        Description: This is a helper function to describe the rows that
+                     the user can enter for the current size of the board
+        """
+        return f"{ IH.SYS_ROW_TO_PLACMENT_ROW[ 0 ] } - { IH.SYS_ROW_TO_PLACMENT_ROW[ IH.NUMBER_OF_ROWS - 1 ] }"
+
+    def _get_col_range( self ) -> str:
+        """
+        Function: Get Column Range
+
+        Inputs: None
+        Outputs: The range of the column labels
+
+        Description: This is a helper function to describe the columns that
+                     the user can enter for the current size of the board
+        """
+        return f"{ IH.SYS_COL_TO_PLACMENT_COL[ 0 ] } - { IH.SYS_COL_TO_PLACMENT_COL[ IH.NUMBER_OF_COLS - 1 ] }"
+
     def prompt_ship_init( self, params: dict ) -> dict:
         """
         Function: Prompt Ship Initialization
@@ -162,43 +263,40 @@ class GameView( IGV.GameViewInterface ):
         size = params[ IH.VIEW_PARAM_SIZE ]
         is_error_state = params[ IH.VIEW_PARAM_IS_ERROR_STATE ]
     
-        # Clear the screen of any existing characters
-        self.clear_screen()
-
-        # Print the title of this page and the
+        # Build the title of this page and the
         # current state of the grids
-        print( "Initialization:\n" )
-        self.draw_grid( params )
+        frame = [ "Initialization:", "", *self._get_grid_lines( params ) ]
 
         # If we were in an error state, then place the
         # only possible error that could occur
         if is_error_state:
-            print( f"Error! Invalid Ship Placement!" )
+            frame.append( f"Error! Invalid Ship Placement!" )
 
         # Print the size of the sship that we are placing
-        print( f"Place ship of size { size }." )
+        frame.append( f"Place ship of size { size }." )
+        self._renderer.render( frame )
 
         # This loop is responsible for getting the placement of the ships
         # column. It will continue running until a valid column is selected 
         while True:
-            col = input( "Enter the column of the ship's bow (A - J): " ).upper()
+            col = input( f"Enter the column of the ship's bow ({ self._get_col_range() }): " ).upper()
             
             if col in IH.PLACEMENT_COL_TO_SYS_COL.keys():
                 return_dict[ IH.VIEW_PARAM_COL ] = col
                 break
             else:
-                print( "Invalid input!" )
+                self._show_input_error( "Invalid input!" )
 
         # This loop is responsible for getting the placment of a ship's row.
         # It will contiue running until a valid row is slected
         while True:
-            row = input( "Enter the row of the ship's bow (1 - 10): " )
+            row = input( f"Enter the row of the ship's bow ({ self._get_row_range() }): " )
 
             if row.isnumeric() and int( row ) in IH.PLACEMENT_ROW_TO_SYS_ROW.keys():
                 return_dict[ IH.VIEW_PARAM_ROW ] = int( row )
                 break
             else:
-                print( "Invalid input!" )
+                self._show_input_error( "Invalid input!" )
 
         # This loop is responsible for getting the type of placement.
         # It will keep running until a valid placement is entered
@@ -209,40 +307,40 @@ class GameView( IGV.GameViewInterface ):
                 return_dict[ IH.VIEW_PARAM_DIRECTION ] = direction
                 break
             else:
-                print( "Invalid input!" )
+                self._show_input_error( "Invalid input!" )
 
         # Return the configuration back to the calling function
         return return_dict
     
-    def _convert_to_view_grid( self, grid : list[ list ] ) -> None:
+    def _get_grid_formatter( self ) -> GridFormatter:
+        """
+        Function: Get Grid Formatter
+
+        Inputs: None
+        Outputs: The formatter for the current size of the board
+        """
+        formatter = self._grid_formatter
+
+        if formatter is None or formatter.number_of_rows != IH.NUMBER_OF_ROWS or formatter.number_of_cols != IH.NUMBER_OF_COLS:
+            formatter = self._grid_formatter = GridFormatter( IH.NUMBER_OF_ROWS, IH.NUMBER_OF_COLS )
+
+        return formatter
+
+    def _convert_to_view_grid( self, grid : IH.VisualBoardType ) -> list[ list[ str ] ]:
         """
         Function: Convert to view grid
 
         Inputs: Grid
-        Outputs: In place modification of grid
+        Outputs: Grid of the symbols to display
 
         Description: This page will take the grid given to it and
                      transform it into the grid that will be
-                     displayed
+                     displayed. The grid given to it is a view of
+                     the model, so it is never modified
         """
-        # Iterate over every cell in the grid
-        for i in range( len( grid ) ):
-            for j in range( len( grid [ i ] ) ):
-                # The following if blocks are responsible for
-                # replacing the numeric value in the grid with
-                # a corresponding string that represents the number
-                # state
-                if grid[ i ][ j ] > IH.BASE_CELL:
-                    grid[ i ][ j ] = 'S'
-
-                elif grid[ i ][ j ] == IH.BASE_CELL:
-                    grid[ i ][ j ] = '~'
-
-                elif grid[ i ][ j ] == IH.HIT_CELL:
-                    grid[ i ][ j ] = 'X'
-
-                elif grid[ i ][ j ] == IH.MISSED_CELL:
-                    grid[ i ][ j ] = 'O'
+        # Replace the numeric value of every cell with a
+        # corresponding string that represents the state
+        return [ [ 'S' if cell > IH.BASE_CELL else CELL_TO_SYMBOL[ cell ] for cell in row ] for row in grid ]
 
     def prompt_user_attack( self, params : dict ) -> dict:
         """
@@ -262,47 +360,46 @@ class GameView( IGV.GameViewInterface ):
         is_error_state = params[ IH.VIEW_PARAM_IS_ERROR_STATE ]
         state_message = params[ IH.VIEW_PARAM_STATE_MESSAGE ]
         
-        # Print the title of this page and draw the grids
-        # of the player and the opponent on the screen
-        self.clear_screen()
-        print( "Attack Plan:\n" )
-        self.draw_grid( params )
-
-        # If the system is in an Error state, print the only
-        # possible error message to the console
+        # Build the title of this page and the grids
+        # of the player and the opponent
+        frame = [ "Attack Plan:", "", *self._get_grid_lines( params ) ]
+
+        # If the system is in an Error state, add the only
+        # possible error message to the page
         if is_error_state:
-            print( f"Error! Already Attacked this Coordinate" )
+            frame.append( f"Error! Already Attacked this Coordinate" )
 
-        # If there is a state message, print it to the
-        # console
+        # If there is a state message, add it to the
+        # page
         if state_message is not None:
-            print( state_message )
+            frame.extend( state_message.splitlines() )
 
-        print( f"Make an attack!" )
+        frame.append( f"Make an attack!" )
+        self._renderer.render( frame )
 
         # The following loop is responsible for getting the column
         # location for the attack, which will keep running until
         # valid column is passed in
         while True:
-            col = input( "Enter the column of the attack (A - J): " ).upper()
+            col = input( f"Enter the column of the attack ({ self._get_col_range() }): " ).upper()
             
             if col in IH.PLACEMENT_COL_TO_SYS_COL.keys():
                 return_dict[ IH.VIEW_PARAM_COL ] = col
                 break
             else:
-                print( "Invalid input!" )
+                self._show_input_error( "Invalid input!" )
 
         # The following loop is responsible for getting the row
         # location for the attack, which will keep running until
         # valid column is passed in
         while True:
-            row = input( "Enter the row of the attack (1 - 10): " )
+            row = input( f"Enter the row of the attack ({ self._get_row_range() }): " )
 
             if row.isnumeric() and int( row ) in IH.PLACEMENT_ROW_TO_SYS_ROW.keys():
                 return_dict[ IH.VIEW_PARAM_ROW ] = int( row )
                 break
             else:
-                print( "Invalid input!" )
+                self._show_input_error( "Invalid input!" )
         
         # Return the dictionary back to the calling function
         return return_dict
@@ -323,17 +420,16 @@ class GameView( IGV.GameViewInterface ):
         # Get the state message from the configuration
         state_message = params[ IH.VIEW_PARAM_STATE_MESSAGE ]
         
-        # Print the template of the page to the console
-        self.clear_screen()
-        print( "Standby:\n" )
-        self.draw_grid( params )
+        # Build the template of the page
+        frame = [ "Standby:", "", *self._get_grid_lines( params ) ]
 
-        # If the there is a state message, print that state
-        # message ot the console
+        # If the there is a state message, add that state
+        # message to the page
         if state_message is not None:
-            print( state_message )
+            frame.extend( state_message.splitlines() )
 
-        print( "Waiting for opponent" )
+        frame.append( "Waiting for opponent" )
+        self._renderer.render( frame )
 
         # Return necessary even though nothing is being returned
         return return_dict
@@ -354,33 +450,28 @@ class GameView( IGV.GameViewInterface ):
         win = params[ IH.VIEW_PARAM_WIN ]
         state_message = params[ IH.VIEW_PARAM_STATE_MESSAGE ]
         
-        # Print Page template to the console
-        self.clear_screen()
-        print( "Game Over:\n" )
-        self.draw_grid( params )
-
-        # Print the final state message
-        print( state_message )
+        # Build the page template along with the final
+        # state message
+        frame = [ "Game Over:", "", *self._get_grid_lines( params ), *str( state_message ).splitlines() ]
 
-        # Print the Win/Loss message and return dictionary back
+        # Add the Win/Loss message and return dictionary back
         # to the calling function
         if win:
-            print( "You Won!" )
+            frame.append( "You Won!" )
         else:
-            print( "You Lost!" )
+            frame.append( "You Lost!" )
+
+        self._renderer.render( frame )
 
         return return_dict
 
 
-    def draw_grid( self, params : dict ) -> dict:
+    def _get_grid_lines( self, params : dict ) -> list[ str ]:
         """
-        Function: Draw Grid
+        Function: Get Grid Lines
 
         Inputs: Configuration Inputs
-        Outputs: Configuration Outputs
-
-        Description: This function will draw the player board and the opponent
-                     board to the console
+        Outputs: The lines that show the player board and the opponent board
         """
         # Fetch the player and opponent board from the configuration
         # parameters
@@ -389,17 +480,32 @@ class GameView( IGV.GameViewInterface ):
 
         # Convert the boards into something that the view
         # can use
-        self._convert_to_view_grid( board )
-        self._convert_to_view_grid( opponent_board )
-        
-        # Convert each of the boards into a pandas dataframe so that
-        # printing looks clean
-        df_player = pandas.DataFrame( board, list( IH.PLACEMENT_ROW_TO_SYS_ROW.keys() ), list( IH.PLACEMENT_COL_TO_SYS_COL.keys() ) )
-        df_opponent = pandas.DataFrame( opponent_board, list( IH.PLACEMENT_ROW_TO_SYS_ROW.keys() ), list( IH.PLACEMENT_COL_TO_SYS_COL.keys() ) )
+        board = self._convert_to_view_grid( board )
+        opponent_board = self._convert_to_view_grid( opponent_board )
         
+        # Lay out the boards with their labels. The layout is only
+        # computed again if the size of the board has changed
+        formatter = self._get_grid_formatter()
+
+        return [ "Opponent's Board", "",
+                 *formatter.format_lines( opponent_board ),
+                 "", "Your Board:", "",
+                 *formatter.format_lines( board ),
+                 "" ]
+
+    def draw_grid( self, params : dict ) -> dict:
+        """
+        Function: Draw Grid
+
+        Inputs: Configuration Inputs
+        Outputs: Configuration Outputs
+
+        Description: This function will draw the player board and the opponent
+                     board to the console
+        """
         # Print the boards to the console
-        print( "Opponent's Board\n" )
-        pprint( df_opponent )
-        print( "\nYour Board:\n" )
-        pprint( df_player )
-        print()
\ No newline at end of file
+        print( "\n".join( self._get_grid_lines( params ) ) )
+
+        # The boards were printed below the last page, so the
+        # next page can not be updated in place
+        self._renderer.invalidate()
@@ -0,0 +1,608 @@
+'''
+Module: game_view_curses.py
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Inputs: Data provided by Executive Process
+Outputs: Outputs Game State to a full screen terminal interface
+
+Description: This module is an implementation of the game view interface that
+             uses curses. Both boards stay on the screen for the whole game and
+             only the cells that changed since the last page are drawn again.
+             Ships are placed and attacks are made by moving a cursor over the
+             boards with the arrow keys, so every key press only redraws the
+             cells under the cursor. Boards that do not fit on the screen
+             scroll to follow the cursor
+
+Select it with $python executable$ main.py --view curses
+'''
+
+################################################################################
+# Imports
+################################################################################
+from interfaces import interface_headers as IH
+from interfaces import interface_game_view as IGV
+
+import game_engine as GE
+import game_view as GV
+
+import atexit
+import curses
+
+################################################################################
+# Global Variables and Constants
+################################################################################
+
+# Keys that move the cursor, mapped to the change in row and column
+KEY_TO_MOVE : dict[ int, tuple[ int, int ] ] = { curses.KEY_UP : ( -1, 0 ), ord( 'w' ) : ( -1, 0 ),
+                                                 curses.KEY_DOWN : ( 1, 0 ), ord( 's' ) : ( 1, 0 ),
+                                                 curses.KEY_LEFT : ( 0, -1 ), ord( 'a' ) : ( 0, -1 ),
+                                                 curses.KEY_RIGHT : ( 0, 1 ), ord( 'd' ) : ( 0, 1 ) }
+
+# Keys that confirm a selection
+ENTER_KEYS = { curses.KEY_ENTER, ord( '\n' ), ord( '\r' ), ord( ' ' ) }
+
+# Keys that change the direction of the ship that is being placed
+KEY_TO_DIRECTION : dict[ int, str ] = { ord( 'h' ) : GE.DIRECTION_HORIZONTAL, ord( 'H' ) : GE.DIRECTION_HORIZONTAL,
+                                        ord( 'v' ) : GE.DIRECTION_VERTICAL, ord( 'V' ) : GE.DIRECTION_VERTICAL }
+ROTATE_KEYS = { ord( 'r' ), ord( 'R' ) }
+
+# Amount of milliseconds to wait for a key before checking if the
+# screen was resized
+INPUT_TIMEOUT = 250
+
+# Space between the two boards when they are side by side
+BOARD_GAP = 4
+
+# Rows above the boards that hold the title of the page and the
+# titles of the boards, and rows below the boards for the messages
+HEADER_LINES = 3
+MESSAGE_LINES = 5
+
+# Color pairs of the symbols on the boards
+SYMBOL_TO_COLOR : dict[ str, int ] = { 'S' : curses.COLOR_WHITE,
+                                       GV.CELL_TO_SYMBOL[ IH.HIT_CELL ] : curses.COLOR_RED,
+                                       GV.CELL_TO_SYMBOL[ IH.MISSED_CELL ] : curses.COLOR_YELLOW,
+                                       GV.CELL_TO_SYMBOL[ IH.BASE_CELL ] : curses.COLOR_CYAN }
+
+################################################################################
+# Procedures
+################################################################################
+def get_label_widths() -> tuple[ int, int ]:
+    """
+    Function: Get Label Widths
+
+    Inputs: None
+    Outputs: The width of the row labels, the width of every column
+
+    Description: Every column is as wide as the longest column label plus
+                 a space in front of it
+    """
+    return len( str( IH.NUMBER_OF_ROWS ) ), max( len( label ) for label in IH.PLACEMENT_COL_TO_SYS_COL ) + 1
+
+def get_board_size() -> tuple[ int, int ]:
+    """
+    Function: Get Board Size
+
+    Inputs: None
+    Outputs: The height and width of a board with its labels
+
+    Description: One extra column is kept at the end, since curses can not
+                 write to the last cell of a pad
+    """
+    label_width, col_width = get_label_widths()
+
+    return IH.NUMBER_OF_ROWS + 1, label_width + col_width * IH.NUMBER_OF_COLS + 1
+
+################################################################################
+# Types
+################################################################################
+class _BoardWidget:
+    """
+    Description: This is a single board on the screen. The board is drawn on a
+                 pad along with its labels, and the part of the pad that fits
+                 on the screen is shown. The symbol of every cell that is on
+                 the pad is kept, so updating the board only draws the cells
+                 that changed
+    """
+    def __init__( self, title : str, top : int, left : int, height : int, width : int, symbol_to_attr : dict[ str, int ] ):
+        """
+        Function: Initialization
+
+        Inputs: The title of the board, the area of the screen that shows the board, the attributes of the symbols
+        Outputs: None
+        """
+        self.title = title
+        self.top = top
+        self.left = left
+        self.height = height
+        self.width = width
+        self._symbol_to_attr = symbol_to_attr
+
+        self._label_width, self._col_width = get_label_widths()
+        self.pad_height, self.pad_width = get_board_size()
+        self._pad = curses.newpad( self.pad_height, self.pad_width )
+        self._symbols : list[ list[ str ] ] = [ [ None ] * IH.NUMBER_OF_COLS for _ in range( IH.NUMBER_OF_ROWS ) ]
+        self._scroll = ( 0, 0 )
+
+        # The labels never change, so draw them once
+        for col, label in IH.SYS_COL_TO_PLACMENT_COL.items():
+            self._pad.addstr( 0, self._get_x( col ) - len( label ) + 1, label )
+
+        for row, label in IH.SYS_ROW_TO_PLACMENT_ROW.items():
+            self._pad.addstr( row + 1, 0, str( label ) )
+
+    def _get_x( self, col : int ) -> int:
+        """
+        Function: Get X
+
+        Inputs: The column of a cell
+        Outputs: The column of the pad that holds the symbol of the cell
+        """
+        return self._label_width + self._col_width * ( col + 1 ) - 1
+
+    def update( self, grid : IH.VisualBoardType ) -> None:
+        """
+        Function: Update
+
+        Inputs: The visual board
+        Outputs: None
+
+        Description: Draws the cells whose symbol changed since the last update
+        """
+        for row, cells in enumerate( grid ):
+            symbols = [ 'S' if cell > IH.BASE_CELL else GV.CELL_TO_SYMBOL[ cell ] for cell in cells ]
+            drawn_symbols = self._symbols[ row ]
+
+            if symbols == drawn_symbols:
+                continue
+
+            for col, symbol in enumerate( symbols ):
+                if symbol != drawn_symbols[ col ]:
+                    self._pad.addstr( row + 1, self._get_x( col ), symbol, self._symbol_to_attr[ symbol ] )
+
+            self._symbols[ row ] = symbols
+
+    def highlight( self, coords : list[ IH.SystemCoordType ], enabled : bool ) -> None:
+        """
+        Function: Highlight
+
+        Inputs: The cells to highlight, if the highlight is turned on or off
+        Outputs: None
+        """
+        for row, col in coords:
+            symbol = self._symbols[ row ][ col ]
+            attr = self._symbol_to_attr[ symbol ]
+
+            self._pad.addstr( row + 1, self._get_x( col ), symbol, attr | curses.A_REVERSE if enabled else attr )
+
+    def refresh( self, focus : IH.SystemCoordType = None ) -> None:
+        """
+        Function: Refresh
+
+        Inputs: The cell that has to be visible, None to keep the current scroll position
+        Outputs: None
+
+        Description: Copies the visible part of the pad to the virtual screen.
+                     The screen itself is only updated by curses.doupdate
+        """
+        scroll_y, scroll_x = self._scroll
+
+        if focus is not None:
+            y = focus[ IH.ROW_INDEX ] + 1
+            x = self._get_x( focus[ IH.COLUMN_INDEX ] )
+
+            # Scroll just enough for the cell and the labels in
+            # front of it to be visible
+            scroll_y = min( max( scroll_y, y - self.height + 1 ), y - 1 )
+            scroll_x = min( max( scroll_x, x - self.width + 2 ), max( x - self._col_width - self._label_width, 0 ) )
+            scroll_y = max( 0, min( scroll_y, self.pad_height - self.height ) )
+            scroll_x = max( 0, min( scroll_x, self.pad_width - self.width ) )
+            self._scroll = ( scroll_y, scroll_x )
+
+        self._pad.noutrefresh( scroll_y, scroll_x, self.top, self.left, self.top + self.height - 1, self.left + self.width - 1 )
+
+# Declare an implementation of the View Interface specified
+# in the interfaces directory. As long as all the functions
+# specified there are implemented, this will be a valid view
+# that we can use
+class CursesGameView( IGV.GameViewInterface ):
+    def __init__( self ):
+        """
+        Function: Initialization
+
+        Inputs: None
+        Outputs: None
+
+        Description: The terminal is only taken over once the first page is
+                     drawn, and it is given back when the game over page is
+                     closed or the program exits
+        """
+        self._screen : curses.window = None
+        self._symbol_to_attr : dict[ str, int ] = dict()
+        self._boards : dict[ str, _BoardWidget ] = dict()
+        self._layout_size : tuple[ int, int ] = None
+        self._message_top = 0
+
+        # The cursors are kept between pages, so the next attack
+        # starts where the last one was made
+        self._attack_cursor : IH.SystemCoordType = ( 0, 0 )
+        self._placement_cursor : IH.SystemCoordType = ( 0, 0 )
+        self._direction = GE.DIRECTION_HORIZONTAL
+
+    def _start( self ) -> None:
+        """
+        Function: Start
+
+        Inputs: None
+        Outputs: None
+
+        Description: Takes over the terminal if that has not happened yet
+        """
+        if self._screen is not None:
+            return
+
+        self._screen = curses.initscr()
+        curses.noecho()
+        curses.cbreak()
+        self._screen.keypad( True )
+        self._screen.timeout( INPUT_TIMEOUT )
+        atexit.register( self.close )
+
+        try:
+            curses.curs_set( 0 )
+
+        except curses.error:
+            pass
+
+        self._symbol_to_attr = { symbol : curses.A_NORMAL for symbol in SYMBOL_TO_COLOR }
+
+        if curses.has_colors():
+            curses.start_color()
+
+            for pair, ( symbol, color ) in enumerate( SYMBOL_TO_COLOR.items(), start=1 ):
+                curses.init_pair( pair, color, curses.COLOR_BLACK )
+                self._symbol_to_attr[ symbol ] = curses.color_pair( pair )
+
+            self._symbol_to_attr[ 'S' ] |= curses.A_BOLD
+
+    def close( self ) -> None:
+        """
+        Function: Close
+
+        Inputs: None
+        Outputs: None
+
+        Description: Gives the terminal back in the state it was found in
+        """
+        if self._screen is None:
+            return
+
+        self._screen.keypad( False )
+        curses.nocbreak()
+        curses.echo()
+        curses.endwin()
+        self._screen = None
+        self._layout_size = None
+
+    def _layout( self ) -> None:
+        """
+        Function: Layout
+
+        Inputs: None
+        Outputs: None
+
+        Description: Places the boards on the screen. The boards are side by
+                     side if they fit, otherwise the opponent's board is above
+                     the player's board. This is done again if the screen is
+                     resized, and every cell is drawn again afterwards
+        """
+        screen_height, screen_width = self._screen.getmaxyx()
+        self._layout_size = ( screen_height, screen_width )
+        self._screen.erase()
+
+        # Size of the boards with their labels
+        pad_height, pad_width = get_board_size()
+        available_height = max( screen_height - HEADER_LINES - MESSAGE_LINES, 2 )
+
+        if pad_width * 2 + BOARD_GAP <= screen_width:
+            height = min( pad_height, available_height )
+            width = pad_width
+            positions = [ ( HEADER_LINES, 0 ), ( HEADER_LINES, width + BOARD_GAP ) ]
+            self._message_top = HEADER_LINES + height + 1
+
+        else:
+            height = min( pad_height, max( ( available_height - 1 ) // 2, 2 ) )
+            width = min( pad_width, screen_width )
+            positions = [ ( HEADER_LINES, 0 ), ( HEADER_LINES + height + 2, 0 ) ]
+            self._message_top = HEADER_LINES + height * 2 + 3
+
+        # Boards that are taller than the screen are cut off at the
+        # bottom of the screen
+        height = max( 1, min( height, screen_height - HEADER_LINES ) )
+        self._boards = dict()
+
+        for key, title, ( top, left ) in zip( ( IH.VIEW_PARAM_OPPONENT_BOARD, IH.VIEW_PARAM_BOARD ),
+                                              ( "Opponent's Board", "Your Board" ), positions ):
+            top = min( top, screen_height - 1 )
+            self._boards[ key ] = _BoardWidget( title, top, left, max( 1, min( height, screen_height - top ) ), width, self._symbol_to_attr )
+            self._add_text( top - 1, left, title, curses.A_BOLD )
+
+        self._message_top = min( self._message_top, screen_height - 1 )
+
+    def _add_text( self, y : int, x : int, text : str, attr : int = curses.A_NORMAL ) -> None:
+        """
+        Function: Add Text
+
+        Inputs: The position of the text, the text, the attributes of the text
+        Outputs: None
+
+        Description: Text that does not fit on the screen is cut off
+        """
+        screen_height, screen_width = self._screen.getmaxyx()
+
+        if 0 <= y < screen_height and x < screen_width:
+            self._screen.addnstr( y, x, text, screen_width - x - 1, attr )
+
+    def _draw_page( self, title : str, params : dict, messages : list[ str ] ) -> None:
+        """
+        Function: Draw Page
+
+        Inputs: The title of the page, the configuration inputs, the messages below the boards
+        Outputs: None
+
+        Description: Updates the boards and the text around them. The screen
+                     is updated once the caller is done drawing
+        """
+        self._start()
+
+        if self._layout_size != self._screen.getmaxyx():
+            self._layout()
+
+        self._screen.move( 0, 0 )
+        self._screen.clrtoeol()
+        self._add_text( 0, 0, title, curses.A_BOLD )
+
+        for line in range( self._message_top, self._layout_size[ 0 ] ):
+            self._screen.move( line, 0 )
+            self._screen.clrtoeol()
+
+        for line, message in enumerate( messages ):
+            self._add_text( self._message_top + line, 0, message )
+
+        self._screen.noutrefresh()
+
+        for key, board in self._boards.items():
+            board.update( params[ key ] )
+            board.refresh()
+
+    def _get_messages( self, params : dict, error_message : str = None ) -> list[ str ]:
+        """
+        Function: Get Messages
+
+        Inputs: Configuration Inputs, the message to show in the error state
+        Outputs: The error and state messages to show below the boards
+        """
+        messages = list()
+
+        if error_message is not None and params.get( IH.VIEW_PARAM_IS_ERROR_STATE ):
+            messages.append( error_message )
+
+        if params.get( IH.VIEW_PARAM_STATE_MESSAGE ) is not None:
+            messages.extend( str( params[ IH.VIEW_PARAM_STATE_MESSAGE ] ).splitlines() )
+
+        return messages
+
+    def _wait_for_key( self ) -> int:
+        """
+        Function: Wait for Key
+
+        Inputs: None
+        Outputs: The key that was pressed, None if the screen was resized
+
+        Description: Waiting is done in short steps, so a resized screen is
+                     noticed even if curses does not report it as a key
+        """
+        while True:
+            key = self._screen.getch()
+
+            if key == curses.KEY_RESIZE or ( self._layout_size is not None and self._layout_size != self._screen.getmaxyx() ):
+                curses.update_lines_cols()
+                return None
+
+            if key != -1:
+                return key
+
+    def _select_cell( self, title : str, params : dict, messages : list[ str ], board_key : str, cursor : IH.SystemCoordType,
+                      get_footprint ) -> IH.SystemCoordType:
+        """
+        Function: Select Cell
+
+        Inputs: The page to draw, the board to select on, the starting cursor,
+                the function that gives the cells to highlight for a cursor
+        Outputs: The selected cell
+
+        Description: Moves the cursor over the board until a cell is selected.
+                     Only the highlighted cells are drawn again on every key
+        """
+        self._draw_page( title, params, messages )
+        footprint = get_footprint( cursor )
+
+        while True:
+            board = self._boards[ board_key ]
+            board.highlight( footprint, True )
+            board.refresh( cursor )
+            curses.doupdate()
+
+            key = self._wait_for_key()
+            board.highlight( footprint, False )
+
+            # Draw every cell again on the new layout of the screen
+            if key is None:
+                self._draw_page( title, params, messages )
+
+            elif key in ENTER_KEYS:
+                return cursor
+
+            elif key in KEY_TO_MOVE:
+                row_change, col_change = KEY_TO_MOVE[ key ]
+                cursor = ( min( max( cursor[ IH.ROW_INDEX ] + row_change, 0 ), IH.NUMBER_OF_ROWS - 1 ),
+                           min( max( cursor[ IH.COLUMN_INDEX ] + col_change, 0 ), IH.NUMBER_OF_COLS - 1 ) )
+
+            elif key in KEY_TO_DIRECTION:
+                self._direction = KEY_TO_DIRECTION[ key ]
+
+            elif key in ROTATE_KEYS:
+                self._direction = GE.DIRECTION_VERTICAL if self._direction == GE.DIRECTION_HORIZONTAL else GE.DIRECTION_HORIZONTAL
+
+            footprint = get_footprint( cursor )
+
+    def draw_start_page( self, params : dict ) -> dict:
+        """
+        Function: Draw Start Page
+
+        Inputs: User Input for configuration related stuff
+        Outputs: Dictionary with configuration state
+
+        Description: The player type is selected with the up and down keys and
+                     the number of ships with the left and right keys or the
+                     number keys
+        """
+        self._start()
+        player_types = [ IH.PlayerTypeEnum.PLAYER_TYPE_HOST, IH.PlayerTypeEnum.PLAYER_TYPE_JOIN ]
+        selected = 0
+        number_of_ships = IH.MAX_NUM_OF_SHIPS
+
+        while True:
+            self._screen.erase()
+            self._add_text( 0, 0, "Welcome to Battleship!", curses.A_BOLD )
+            self._add_text( 2, 0, "Are you hosting or joining a game?" )
+
+            for index, label in enumerate( [ "Host", "Join" ] ):
+                self._add_text( 3 + index, 2, f"{ '>' if index == selected else ' ' } { label }",
+                                curses.A_REVERSE if index == selected else curses.A_NORMAL )
+
+            self._add_text( 6, 0, f"Ships: < { number_of_ships } >  ({ IH.MIN_NUM_OF_SHIPS } - { IH.MAX_NUM_OF_SHIPS })" )
+            self._add_text( 8, 0, "Up/Down selects, Left/Right changes the ships, Enter starts" )
+            self._screen.noutrefresh()
+            curses.doupdate()
+
+            key = self._wait_for_key()
+
+            if key in ENTER_KEYS:
+                return { IH.VIEW_PARAM_PLAYER_TYPE : player_types[ selected ],
+                         IH.VIEW_PARAM_NUM_OF_SHIPS : number_of_ships }
+
+            if key in KEY_TO_MOVE:
+                row_change, col_change = KEY_TO_MOVE[ key ]
+                selected = min( max( selected + row_change, 0 ), len( player_types ) - 1 )
+                number_of_ships = min( max( number_of_ships + col_change, IH.MIN_NUM_OF_SHIPS ), IH.MAX_NUM_OF_SHIPS )
+
+            elif key is not None and ord( str( IH.MIN_NUM_OF_SHIPS ) ) <= key <= ord( str( IH.MAX_NUM_OF_SHIPS ) ):
+                number_of_ships = key - ord( '0' )
+
+    def prompt_ship_init( self, params : dict ) -> dict:
+        """
+        Function: Prompt Ship Initialization
+
+        Inputs: Configuration Inputs
+        Outputs: Configuration Outputs
+
+        Description: The bow of the ship follows the cursor on the player's
+                     board and the cells the ship would take are highlighted
+        """
+        size = params[ IH.VIEW_PARAM_SIZE ]
+        messages = [ *self._get_messages( params, "Error! Invalid Ship Placement!" ),
+                     f"Place ship of size { size }.",
+                     "Arrows move the bow, H/V or R change the direction, Enter places the ship" ]
+
+        def get_footprint( cursor ):
+            return [ ( row, col ) for row, col in GE.get_ship_coords( cursor, self._direction, size )
+                     if 0 <= row < IH.NUMBER_OF_ROWS and 0 <= col < IH.NUMBER_OF_COLS ]
+
+        cursor = self._select_cell( "Initialization:", params, messages, IH.VIEW_PARAM_BOARD, self._placement_cursor, get_footprint )
+        self._placement_cursor = cursor
+
+        return { IH.VIEW_PARAM_ROW : IH.SYS_ROW_TO_PLACMENT_ROW[ cursor[ IH.ROW_INDEX ] ],
+                 IH.VIEW_PARAM_COL : IH.SYS_COL_TO_PLACMENT_COL[ cursor[ IH.COLUMN_INDEX ] ],
+                 IH.VIEW_PARAM_DIRECTION : self._direction }
+
+    def prompt_user_attack( self, params : dict ) -> dict:
+        """
+        Function: Prompt User Attack
+
+        Inputs: Configuration Inputs
+        Outputs: Configuration Outputs
+
+        Description: The attack is made on the cell under the cursor on the
+                     opponent's board
+        """
+        messages = [ *self._get_messages( params, "Error! Already Attacked this Coordinate" ),
+                     "Make an attack!",
+                     "Arrows move the cursor, Enter attacks" ]
+
+        cursor = self._select_cell( "Attack Plan:", params, messages, IH.VIEW_PARAM_OPPONENT_BOARD, self._attack_cursor,
+                                    lambda cursor: [ cursor ] )
+        self._attack_cursor = cursor
+
+        return { IH.VIEW_PARAM_ROW : IH.SYS_ROW_TO_PLACMENT_ROW[ cursor[ IH.ROW_INDEX ] ],
+                 IH.VIEW_PARAM_COL : IH.SYS_COL_TO_PLACMENT_COL[ cursor[ IH.COLUMN_INDEX ] ] }
+
+    def prompt_wait_page( self, params : dict ) -> dict:
+        """
+        Function: Prompt Wait Page
+
+        Inputs: Configuration Inputs
+        Outputs: Configuration Outputs
+
+        Description: The page is drawn and control is given back right away
+        """
+        self._draw_page( "Standby:", params, [ *self._get_messages( params ), "Waiting for opponent" ] )
+        curses.doupdate()
+
+        return dict()
+
+    def draw_game_over_page( self, params : dict ) -> dict:
+        """
+        Function: Draw Game Over Page
+
+        Inputs: Configuration Inputs
+        Outputs: Configuration Outputs
+
+        Description: The terminal is given back once a key is pressed
+        """
+        result = "You Won!" if params[ IH.VIEW_PARAM_WIN ] else "You Lost!"
+        messages = [ *self._get_messages( params ), result, "Press any key to exit" ]
+        self._draw_page( "Game Over:", params, messages )
+        curses.doupdate()
+
+        while self._wait_for_key() is None:
+            self._draw_page( "Game Over:", params, messages )
+            curses.doupdate()
+
+        self.close()
+
+        return dict()
+
+    def draw_grid( self, params : dict ) -> dict:
+        """
+        Function: Draw Grid
+
+        Inputs: Configuration Inputs
+        Outputs: Configuration Outputs
+
+        Description: Updates the cells of both boards that changed
+        """
+        self._start()
+
+        if self._layout_size != self._screen.getmaxyx():
+            self._layout()
+
+        for key, board in self._boards.items():
+            board.update( params[ key ] )
+            board.refresh()
+
+        curses.doupdate()
+
+        return dict()
@@ -21,25 +21,25 @@ Sources: DigitalOcean
 ################################################################################
 # Imports
 ################################################################################
-import socket
+import message_codec as MC
+import network_config as NC
 import interfaces.interface_headers as IH
-from interfaces.interface_game_interaction import GameInteractionInterface
+from socket_connection import SocketConnection
     
 ################################################################################
 # Types
 ################################################################################
-class Host( GameInteractionInterface ):
-    def __init__( self ) -> None:
+class Host( SocketConnection ):
+    def __init__( self, codec : str = MC.DEFAULT_CODEC, config : NC.NetworkConfig = None ) -> None:
         """
-        Definition: Setting up the host address, host port and client socket.
+        Definition: Setting up the address and socket options to listen with, and the client socket.
         """
         
-        # Declare the members of this class. For now, we will be using
-        # networking protocols on the same host. Can easily be modified
-        # to do networking across multiple hosts
-        self.host = socket.gethostname()
-        self.host_port = 5014
-        self.client_socket = None 
+        # Declare the members of this class. Without a configuration
+        # the settings are taken from the environment, and the
+        # host listens on the name of this machine on the default port
+        super().__init__( codec )
+        self.network_config = NC.from_environment() if config is None else config
         
         
     def open_connection( self ) -> None:
@@ -47,41 +47,22 @@ class Host( GameInteractionInterface ):
         Definition: Opening the connection and listening for a client connection.
         """
         
-        # Create and bind a socket to the host ip and port
-        host_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        host_socket.bind((self.host, self.host_port))
+        # Create a socket that is bound to the configured address
+        # and listen for connections from a client
+        host_socket = NC.create_listening_socket( self.network_config )
 
-        # Listen for connections from a client
-        host_socket.listen(1)
-        
-        # Store the client socket once a connection is established
-        self.client_socket, _ = host_socket.accept()
+        # Only one client is played against, so the listening socket
+        # is closed as soon as it has connected. A host that waits
+        # too long raises a TimeoutError
+        try:
+            host_socket.settimeout( self.open_timeout )
+            client_socket, _ = host_socket.accept()
 
+        finally:
+            NC.close_listening_socket( host_socket, self.network_config )
 
-    def close_connection( self ) -> None:
-        """
-        Definition: Closing the port.
-        """
-        
-        # Close the connection to the client socket
-        self.client_socket.close()
-        self.client_socket = None 
-    
-    
-    def send_message( self, msg ) -> None:
-        """
-        Definition: Sending a message to the client.
-        """
-        
-        # Send an encoded string on the socket
-        self.client_socket.send(msg.encode())
-    
-    
-    def wait_for_message( self ) -> str:
-        """
-        Definition: Waiting for a message from the client.
-        """
-        
-        # Decode the encoded string and return to calling function
-        data = self.client_socket.recv(1024).decode()
-        return data
\ No newline at end of file
+        # Store the client socket once a connection is established
+        # and select the codec that will be used for the game
+        NC.apply_socket_options( client_socket, self.network_config )
+        self._start_connection( client_socket )
+        self._negotiate_codec_as_host()
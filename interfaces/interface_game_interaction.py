@@ -43,17 +43,42 @@ class GameInteractionInterface( ABC ):
         Function: Send Message
 
         Description: This is the interface function to be able to send
-                     a message to the other player
+                     a message to the other player. Messages are dictionaries
+                     and the implementation decides how they are encoded
         """
         raise AssertionError( "Send Message method not implemented" )
     
+    @abstractmethod
+    def send_request( self, msg ) -> None:
+        """
+        Function: Send Request
+
+        Description: This is the interface function to be able to send
+                     a message that the other player answers right away,
+                     such as an attack. The time until the next message
+                     arrives is recorded as the round trip of the request
+        """
+        raise AssertionError( "Send Request method not implemented" )
+
+    @abstractmethod
+    def get_round_trip_latency( self ):
+        """
+        Function: Get Round Trip Latency
+
+        Description: This is the interface function to be able to get the
+                     histogram of the round trips of the requests sent on
+                     the connection
+        """
+        raise AssertionError( "Get Round Trip Latency method not implemented" )
+
     @abstractmethod
     def wait_for_message( self ):
         """
         Function: Wait For Message
 
         Description: This is the interface function to be able to wait for
-                     a message from the player
+                     a message from the player. The message is returned as
+                     a dictionary
         """
         raise AssertionError( "Wait for message method not implemented" )
     
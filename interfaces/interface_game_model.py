@@ -69,7 +69,8 @@ class GameModelInterface( ABC ):
 
         Description: This function is the data getter of this interface. We only get
                      coordinate information only because the application that consumes
-                     this model does not need to know everything stored in the model
+                     this model does not need to know everything stored in the model.
+                     A coordinate that is not on the board raises an IndexError
         """
         raise AssertionError( "Get Board method not implemented" )
     
@@ -83,7 +84,8 @@ class GameModelInterface( ABC ):
 
         Description: This function is the data setter of this interface. We only get
                      coordinate information only because the application that consumes
-                     this model does not need to know everything stored in the model
+                     this model does not need to know everything stored in the model.
+                     A coordinate that is not on the board raises an IndexError
         """
         raise AssertionError( "Update Coordinate not implemented" )
     
@@ -98,10 +100,40 @@ class GameModelInterface( ABC ):
         Description: This function defines the abstract method to make sure that an action can be taken
                      on a particular coordinate. Depending on the context provided by event,
                      this function can take different logic to know if a particular coordinate
-                     is valid
+                     is valid. A coordinate that is not on the board is never valid
         """
         raise AssertionError( "Is Valid Coordinate is not implemented" )
-    
+
+    @abstractmethod
+    def can_place_ship( self, player_type : IH.PlayerTypeEnum, bow : IH.SystemCoordType, direction : str, size : int ) -> bool:
+        """
+        Function: Can a ship be placed
+
+        Inputs: The player's' board, the system coordinate of the bow, the direction, the size of the ship
+        Outputs: Boolean value
+
+        Description: This function defines the interface to check a whole ship
+                     placement at once. The ship extends from the bow towards the
+                     first row or column depending on the direction, and it can be
+                     placed if every cell it would take is on the board and empty
+        """
+        raise AssertionError( "Can Place Ship is not implemented" )
+
+    @abstractmethod
+    def place_ship( self, player_type : IH.PlayerTypeEnum, bow : IH.SystemCoordType, direction : str, size : int ) -> bool:
+        """
+        Function: Place a ship
+
+        Inputs: The player's' board, the system coordinate of the bow, the direction, the size of the ship
+        Outputs: If the ship was placed
+
+        Description: This function defines the interface to check and commit a
+                     whole ship placement in one step. The size of the ship is
+                     used as the id of its cells, and nothing is changed if the
+                     ship can not be placed
+        """
+        raise AssertionError( "Place Ship is not implemented" )
+
     @abstractmethod
     def ships_are_alive( self, player_type : IH.PlayerTypeEnum ) -> bool:
         """
@@ -138,6 +170,22 @@ class GameModelInterface( ABC ):
 
         Description: This function defines the interface to transform
                      a board into a visual representation that can be
-                     consumed by presenter
+                     consumed by presenter. The visual board is a read-only
+                     view that tracks the board, so consumers must not modify
+                     it and do not need to request it again after a change
+        """
+        raise AssertionError( "Get Visual Board is not implemented" )
+
+    @abstractmethod
+    def get_board_masks( self, player_type : IH.PlayerTypeEnum ) -> IH.BoardMasksType:
+        """
+        Function: Get the board masks
+
+        Inputs: The player's' board
+        Outputs: The masks of the ships, the hit cells and the missed cells
+
+        Description: This function defines the interface to get the compact
+                     state of a board, which is small enough to be saved after
+                     every turn. Ships without any cells are left out
         """
-        raise AssertionError( "Get Visual Board is not implemented" )
\ No newline at end of file
+        raise AssertionError( "Get Board Masks is not implemented" )
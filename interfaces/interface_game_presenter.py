@@ -72,3 +72,19 @@ class GamePresenterInterface( ABC ):
                      some issues with declaring __ functions as abstract methods
         """
         raise AssertionError( "Trigger View Event function not implemented" )
+    
+    @abstractmethod
+    def register_event_handler( self, event, handler ) -> None:
+        """
+        Function: Register Event Handler
+
+        Inputs: The event to handle, the function that handles the event
+        Outputs: None
+
+        Description: This function allows new events to be handled, or the
+                     handling of an existing event to be replaced, without
+                     changing the presenter. The handler is called with the
+                     parameters of the event and returns a dictionary the
+                     same way the functions of the view do
+        """
+        raise AssertionError( "Register Event Handler function not implemented" )
@@ -14,6 +14,120 @@ Description:
 # Imports
 ################################################################################
 from enum import Enum
+from collections.abc import Sequence
+from numbers import Integral
+
+################################################################################
+# Procedures
+################################################################################
+def generate_row_labels( number_of_rows : int ) -> dict[ int, int ]:
+    """
+    Function: Generate Row Labels
+
+    Inputs: The number of rows on the board
+    Outputs: Mapping of placement rows to system rows
+
+    Description: Rows are numbered starting at 1, so the placement row
+                 is always one more than the system row
+    """
+    return { sys_row + 1 : sys_row for sys_row in range( number_of_rows ) }
+
+def generate_col_labels( number_of_cols : int ) -> dict[ str, int ]:
+    """
+    Function: Generate Column Labels
+
+    Inputs: The number of columns on the board
+    Outputs: Mapping of placement columns to system columns
+
+    Description: Columns are labeled with letters. Once the letters
+                 run out, the labels continue with two letters in the
+                 same fashion as a spreadsheet (A - Z, AA, AB, ...)
+    """
+    labels = dict()
+
+    for sys_col in range( number_of_cols ):
+        # Convert the column into a base 26 number where
+        # the digits are the letters of the alphabet
+        label = ""
+        remainder = sys_col + 1
+
+        while remainder > 0:
+            remainder, digit = divmod( remainder - 1, 26 )
+            label = chr( ord( 'A' ) + digit ) + label
+
+        labels[ label ] = sys_col
+
+    return labels
+
+def set_board_dimensions( number_of_rows : int, number_of_cols : int ) -> None:
+    """
+    Function: Set Board Dimensions
+
+    Inputs: The number of rows and columns of the board
+    Outputs: None
+
+    Description: Changes the size of the board for the rest of the program.
+                 This must be called before any model is created. The label
+                 mappings are updated in place so that any module holding a
+                 reference to them sees the new labels
+    """
+    global NUMBER_OF_ROWS, NUMBER_OF_COLS
+
+    # Make sure that every ship can still fit on the board
+    if not MAX_NUM_OF_SHIPS <= number_of_rows <= MAX_NUMBER_OF_ROWS:
+        raise ValueError( f"The number of rows must be between { MAX_NUM_OF_SHIPS } and { MAX_NUMBER_OF_ROWS }" )
+
+    if not MAX_NUM_OF_SHIPS <= number_of_cols <= MAX_NUMBER_OF_COLS:
+        raise ValueError( f"The number of columns must be between { MAX_NUM_OF_SHIPS } and { MAX_NUMBER_OF_COLS }" )
+
+    NUMBER_OF_ROWS = number_of_rows
+    NUMBER_OF_COLS = number_of_cols
+
+    # Regenerate the label mappings and their inversions
+    PLACEMENT_ROW_TO_SYS_ROW.clear()
+    PLACEMENT_ROW_TO_SYS_ROW.update( generate_row_labels( number_of_rows ) )
+    PLACEMENT_COL_TO_SYS_COL.clear()
+    PLACEMENT_COL_TO_SYS_COL.update( generate_col_labels( number_of_cols ) )
+
+    SYS_ROW_TO_PLACMENT_ROW.clear()
+    SYS_ROW_TO_PLACMENT_ROW.update( { val: key for key, val in PLACEMENT_ROW_TO_SYS_ROW.items() } )
+    SYS_COL_TO_PLACMENT_COL.clear()
+    SYS_COL_TO_PLACMENT_COL.update( { val: key for key, val in PLACEMENT_COL_TO_SYS_COL.items() } )
+
+def is_on_board( coord : tuple[ int, int ] ) -> bool:
+    """
+    Function: Is On Board
+
+    Inputs: A coordinate in the system coordinates
+    Outputs: If the coordinate is a cell of the board
+
+    Description: Coordinates that come from the network are checked with
+                 this before they reach a model, since the models do not
+                 agree on what an index outside of the board means
+    """
+    row = coord[ ROW_INDEX ]
+    col = coord[ COLUMN_INDEX ]
+
+    # Checking against the abstract integer type is slow, so it is
+    # only done for indexes that are not plain integers, such as the
+    # integers of numpy
+    if ( type( row ) is not int or type( col ) is not int ) and not ( isinstance( row, Integral ) and isinstance( col, Integral ) ):
+        return False
+
+    return 0 <= row < NUMBER_OF_ROWS and 0 <= col < NUMBER_OF_COLS
+
+def check_on_board( coord : tuple[ int, int ] ) -> None:
+    """
+    Function: Check On Board
+
+    Inputs: A coordinate in the system coordinates
+    Outputs: None
+
+    Description: Raises an IndexError for a coordinate that is not a cell
+                 of the board, the same in every model
+    """
+    if not is_on_board( coord ):
+        raise IndexError( f"The coordinate { tuple( coord ) } is not on the board" )
 
 ################################################################################
 # Global Variables
@@ -35,45 +149,45 @@ VIEW_PARAM_SIZE = "SIZE"
 VIEW_PARAM_STATE_MESSAGE = "STATE_MESSAGE"
 VIEW_PARAM_WIN = "WIN"
 VIEW_PARAM_SHIP_SUNK = "SHIP_SUNK"
+VIEW_PARAM_CODECS = "CODECS"
+VIEW_PARAM_CODEC = "CODEC"
+VIEW_PARAM_ROWS = "ROWS"
+VIEW_PARAM_COLS = "COLS"
+VIEW_PARAM_FIRST_MOVE = "FIRST_MOVE"
+VIEW_PARAM_SEQUENCE = "SEQUENCE"
+VIEW_PARAM_LAST_DEFENSE = "LAST_DEFENSE"
+VIEW_PARAM_RESPONSE = "RESPONSE"
+VIEW_PARAM_SHARED_MEMORY = "SHARED_MEMORY"
 
 # Variables to map to row and column locations to minimize magic
 # numbers in the system
 ROW_INDEX = 0
 COLUMN_INDEX = 1
 
-# Size of the board
+# Size of the board. These are the default dimensions of the
+# board, and they can be changed at runtime before any model
+# is created by calling set_board_dimensions
 NUMBER_OF_ROWS = 10
 NUMBER_OF_COLS = 10
 
+# Largest board that can be requested at runtime
+MAX_NUMBER_OF_ROWS = 1000
+MAX_NUMBER_OF_COLS = 1000
+
 # Amount of ships that can be placed onto the board
 MIN_NUM_OF_SHIPS = 1
 MAX_NUM_OF_SHIPS = 5
 
+# Directions that a ship can be placed in from its bow
+DIRECTION_VERTICAL = "V"
+DIRECTION_HORIZONTAL = "H"
+
 # We need a way to make sure we standardize the game coordinates
 # to the system coordinates. The Game indicates that rows will
-# be numbered 1-10, and columns will be labeled A-J, so define
-# a set of mappings that can convert this
-PLACEMENT_ROW_TO_SYS_ROW = { 1 : 0, 
-                             2 : 1, 
-                             3 : 2, 
-                             4 : 3, 
-                             5 : 4, 
-                             6 : 5, 
-                             7 : 6, 
-                             8 : 7, 
-                             9 : 8, 
-                             10 : 9 }
-
-PLACEMENT_COL_TO_SYS_COL = { 'A' : 0, 
-                             'B' : 1, 
-                             'C' : 2, 
-                             'D' : 3, 
-                             'E' : 4, 
-                             'F' : 5, 
-                             'G' : 6, 
-                             'H' : 7, 
-                             'I' : 8, 
-                             'J' : 9 }
+# be numbered starting at 1, and columns will be labeled starting
+# at A, so define a set of mappings that can convert this
+PLACEMENT_ROW_TO_SYS_ROW = generate_row_labels( NUMBER_OF_ROWS )
+PLACEMENT_COL_TO_SYS_COL = generate_col_labels( NUMBER_OF_COLS )
 
 # Invert the previous mappings to allow for fast reversal
 SYS_ROW_TO_PLACMENT_ROW = { val: key for key, val in PLACEMENT_ROW_TO_SYS_ROW.items() }
@@ -131,8 +245,16 @@ GameCoordType = dict[ str ]
 GameBoardType = list[ list[ GameCoordType ] ]
 
 # Typedef how the boards will be passed between
-# the different levels
-VisualBoardType = list[ list[ int ] ]
+# the different levels. Visual boards are read-only
+# views, so they are only required to be indexable
+VisualBoardType = Sequence[ Sequence[ int ] ]
+
+# Typedef the compact state of a board. It holds the mask of
+# the cells of every ship by ship id, the mask of the cells that
+# were hit and the mask of the cells that were missed. Bit n of
+# a mask refers to the cell at row n // NUMBER_OF_COLS and
+# column n % NUMBER_OF_COLS
+BoardMasksType = tuple[ dict[ int, int ], int, int ]
 
 
 
@@ -0,0 +1,185 @@
+'''
+Module: latency_stats.py
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Inputs: Measured latencies
+Outputs: Percentiles of the latencies
+
+Description: This module implements a histogram of latencies. Every latency
+             is counted in a bucket that is a fixed percentage wider than the
+             one before it, so the memory that is used does not grow with the
+             amount of latencies that are recorded, while the percentiles that
+             are read back are within that percentage of the exact value. The
+             summaries of the histograms can be appended to a log file as JSON
+             lines
+'''
+################################################################################
+# Imports
+################################################################################
+import json
+import math
+import time
+
+################################################################################
+# Global Variables
+################################################################################
+
+# Every bucket is this much wider than the one before it, which
+# is the precision of the percentiles
+BUCKET_GROWTH = 1.01
+BUCKET_GROWTH_LOG = math.log( BUCKET_GROWTH )
+
+# Latencies are counted in microseconds, anything below one
+# microsecond is counted in the first bucket
+MICROSECONDS_PER_SECOND = 1000000
+MILLISECONDS_PER_SECOND = 1000
+
+# Percentiles that are part of a summary
+SUMMARY_PERCENTILES = ( 50, 95, 99 )
+
+# Environment variable with the path of the log that the
+# summaries are appended to
+ENV_LATENCY_LOG = "BATTLESHIP_LATENCY_LOG"
+
+################################################################################
+# Types
+################################################################################
+class LatencyHistogram:
+    """
+    Description: This is a histogram of latencies in seconds
+    """
+    __slots__ = ( "_counts", "count", "total", "minimum", "maximum" )
+
+    def __init__( self ) -> None:
+        """
+        Function: Initialization
+
+        Inputs: None
+        Outputs: None
+        """
+        self._counts : dict[ int, int ] = dict()
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = 0.0
+
+    def record( self, latency : float ) -> None:
+        """
+        Function: Record
+
+        Inputs: A latency in seconds
+        Outputs: None
+        """
+        bucket = get_bucket( latency )
+        self._counts[ bucket ] = self._counts.get( bucket, 0 ) + 1
+
+        self.count += 1
+        self.total += latency
+        self.minimum = min( self.minimum, latency )
+        self.maximum = max( self.maximum, latency )
+
+    def merge( self, other : "LatencyHistogram" ) -> None:
+        """
+        Function: Merge
+
+        Inputs: Another histogram whose latencies are added to this one
+        Outputs: None
+        """
+        for bucket, count in other._counts.items():
+            self._counts[ bucket ] = self._counts.get( bucket, 0 ) + count
+
+        self.count += other.count
+        self.total += other.total
+        self.minimum = min( self.minimum, other.minimum )
+        self.maximum = max( self.maximum, other.maximum )
+
+    def get_percentile( self, percent : float ) -> float:
+        """
+        Function: Get Percentile
+
+        Inputs: The percent of latencies that are at or below the result
+        Outputs: The latency in seconds, None if nothing was recorded
+
+        Description: The upper bound of the bucket the percentile falls in is
+                     returned, kept within the smallest and largest latency
+        """
+        if self.count == 0:
+            return None
+
+        rank = max( 1, math.ceil( self.count * percent / 100 ) )
+        seen = 0
+
+        for bucket in sorted( self._counts ):
+            seen += self._counts[ bucket ]
+
+            if seen >= rank:
+                return min( max( get_bucket_upper_bound( bucket ), self.minimum ), self.maximum )
+
+        return self.maximum
+
+    def get_summary( self ) -> dict:
+        """
+        Function: Get Summary
+
+        Inputs: None
+        Outputs: The amount of latencies and their mean, smallest, largest and percentiles in milliseconds
+        """
+        summary = { "count" : self.count }
+
+        if self.count == 0:
+            return summary
+
+        summary[ "mean_ms" ] = self.total / self.count * MILLISECONDS_PER_SECOND
+        summary[ "min_ms" ] = self.minimum * MILLISECONDS_PER_SECOND
+
+        for percent in SUMMARY_PERCENTILES:
+            summary[ f"p{ percent }_ms" ] = self.get_percentile( percent ) * MILLISECONDS_PER_SECOND
+
+        summary[ "max_ms" ] = self.maximum * MILLISECONDS_PER_SECOND
+
+        return summary
+
+################################################################################
+# Procedures
+################################################################################
+def get_bucket( latency : float ) -> int:
+    """
+    Function: Get Bucket
+
+    Inputs: A latency in seconds
+    Outputs: The index of the bucket the latency is counted in
+    """
+    microseconds = latency * MICROSECONDS_PER_SECOND
+
+    if microseconds <= 1:
+        return 0
+
+    return int( math.log( microseconds ) / BUCKET_GROWTH_LOG ) + 1
+
+def get_bucket_upper_bound( bucket : int ) -> float:
+    """
+    Function: Get Bucket Upper Bound
+
+    Inputs: The index of a bucket
+    Outputs: The largest latency in seconds that is counted in the bucket
+    """
+    return BUCKET_GROWTH ** bucket / MICROSECONDS_PER_SECOND
+
+def append_summary( path : str, histogram : LatencyHistogram, details : dict = None ) -> None:
+    """
+    Function: Append Summary
+
+    Inputs: The path of the log file, the histogram, details that describe where the latencies come from
+    Outputs: None
+
+    Description: The summary is appended as a single JSON line along with the
+                 time it was written, so every game adds one line to the log
+    """
+    record = { "time" : time.time() }
+    record.update( details or dict() )
+    record.update( histogram.get_summary() )
+
+    with open( path, "a" ) as log_file:
+        log_file.write( json.dumps( record ) + "\n" )
@@ -0,0 +1,652 @@
+'''
+Module: load_tester.py
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Inputs: Load settings and the address of a game server
+Outputs: Throughput, latency, errors and server usage over time
+
+Description: This module drives synthetic players against a game server to
+             find where a single server process saturates. Every synthetic
+             player is a lobby Client, the same connection an instance of the
+             game uses, and plays whole games with a fleet from the fleet
+             generator and a bot strategy of the simulator. The players are
+             split across worker processes so the load is not limited by a
+             single process of the tester. New games are started at a target
+             rate, or as fast as the players can play them. Every interval a
+             JSON line reports the games per second, the percentiles of the
+             turn latencies, the errors and the CPU and memory use of the
+             server process, followed by a summary of the whole run
+
+Run it with $python executable$ load_tester.py --clients 100 --rate 50 --spawn-server
+'''
+################################################################################
+# Imports
+################################################################################
+import client as GC
+import fleet_generator as FG
+import game_engine as GE
+import game_server as GS
+import latency_stats as LS
+import message_codec as MC
+import model_factory as MF
+import network_config as NC
+import simulator as SIM
+
+from interfaces import interface_headers as IH
+
+import argparse
+import json
+import multiprocessing
+import os
+import queue
+import random
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+################################################################################
+# Global Variables
+################################################################################
+
+# Seconds between two reports
+DEFAULT_INTERVAL = 1.0
+
+# Times per report that the workers send their statistics, so a
+# report is not thrown off by when the workers happen to send them
+WORKER_SENDS_PER_INTERVAL = 10
+
+# Seconds a synthetic player waits for a message before the game
+# is counted as an error
+DEFAULT_TIMEOUT = 10.0
+
+# Seconds the games that are still being played at the end of
+# the run get to finish. Games that do not finish are not counted
+DRAIN_TIMEOUT = 5.0
+
+# Seconds a spawned server gets to start listening
+SERVER_START_TIMEOUT = 10.0
+
+# The synthetic players only need to hold their own fleet and
+# the results of their attacks
+DEFAULT_PLAYER_MODEL_TYPE = "bitboard"
+
+# Keys of the statistics that the workers send to the tester
+STAT_SESSIONS = "sessions"
+STAT_GAMES = "games"
+STAT_ERRORS = "errors"
+STAT_TURN_LATENCY = "turn_latency"
+STAT_FINAL = "final"
+
+################################################################################
+# Types
+################################################################################
+class _Pacer:
+    """
+    Description: This hands out the times the players of a worker start
+                 their games. The times are evenly spaced at the rate of the
+                 worker, and a player that asks late starts right away, so
+                 the rate is held as long as the players keep up
+    """
+    __slots__ = ( "_period", "_next_start", "_lock" )
+
+    def __init__( self, rate : float ) -> None:
+        """
+        Function: Initialization
+
+        Inputs: The amount of games the players start per second, 0 for as fast as possible
+        Outputs: None
+        """
+        self._period = 1 / rate if rate > 0 else 0.0
+        self._next_start = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait( self, deadline : float ) -> bool:
+        """
+        Function: Wait
+
+        Inputs: The time the run ends
+        Outputs: If a game may be started before the end of the run
+        """
+        with self._lock:
+            start = self._next_start if self._period > 0 else time.monotonic()
+            self._next_start = start + self._period
+
+        if start >= deadline:
+            return False
+
+        delay = start - time.monotonic()
+
+        if delay > 0:
+            time.sleep( delay )
+
+        return True
+
+class _WorkerStats:
+    """
+    Description: These are the statistics of a worker since its last
+                 report. The players of the worker add to them from their
+                 threads
+    """
+    __slots__ = ( "_lock", "_sessions", "_games", "_errors", "_turn_latency" )
+
+    def __init__( self ) -> None:
+        """
+        Function: Initialization
+
+        Inputs: None
+        Outputs: None
+        """
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset( self ) -> None:
+        """
+        Function: Reset
+
+        Inputs: None
+        Outputs: None
+        """
+        self._sessions = 0
+        self._games = 0
+        self._errors : dict[ str, int ] = dict()
+        self._turn_latency = LS.LatencyHistogram()
+
+    def record_game( self, won : bool, turn_latency : LS.LatencyHistogram ) -> None:
+        """
+        Function: Record Game
+
+        Inputs: If the player won, the latencies of the turns of the player
+        Outputs: None
+
+        Description: Only the winner counts the game, so every game that two
+                     players of the tester finish is counted once
+        """
+        with self._lock:
+            self._sessions += 1
+            self._games += int( won )
+            self._turn_latency.merge( turn_latency )
+
+    def record_error( self, error : Exception ) -> None:
+        """
+        Function: Record Error
+
+        Inputs: The error that ended the game of a player
+        Outputs: None
+        """
+        name = type( error ).__name__
+
+        with self._lock:
+            self._sessions += 1
+            self._errors[ name ] = self._errors.get( name, 0 ) + 1
+
+    def take( self ) -> dict:
+        """
+        Function: Take
+
+        Inputs: None
+        Outputs: The statistics since the last report
+        """
+        with self._lock:
+            stats = { STAT_SESSIONS : self._sessions, STAT_GAMES : self._games,
+                      STAT_ERRORS : self._errors, STAT_TURN_LATENCY : self._turn_latency }
+            self._reset()
+
+        return stats
+
+class ProcessSampler:
+    """
+    Description: This samples the CPU and memory use of a process from the
+                 proc file system. On systems without it nothing is sampled
+    """
+    __slots__ = ( "_pid", "_last_cpu", "_last_time" )
+
+    def __init__( self, pid : int ) -> None:
+        """
+        Function: Initialization
+
+        Inputs: The id of the process
+        Outputs: None
+        """
+        self._pid = pid
+        self._last_cpu = None
+        self._last_time = None
+
+    def _read_usage( self ) -> tuple[ float, int ]:
+        """
+        Function: Read Usage
+
+        Inputs: None
+        Outputs: The CPU seconds the process used and its resident memory in bytes, None if they can not be read
+
+        Description: The name of the process in the stat file is in
+                     parentheses and may contain spaces, so the fields are
+                     counted from the closing parenthesis
+        """
+        try:
+            with open( f"/proc/{ self._pid }/stat" ) as stat_file:
+                fields = stat_file.read().rsplit( ")", 1 )[ 1 ].split()
+
+            with open( f"/proc/{ self._pid }/statm" ) as statm_file:
+                resident_pages = int( statm_file.read().split()[ 1 ] )
+
+        except ( OSError, IndexError, ValueError ):
+            return None
+
+        # The user and system times are the 14th and 15th fields
+        # of the file, the 12th and 13th after the name
+        cpu_seconds = ( int( fields[ 11 ] ) + int( fields[ 12 ] ) ) / os.sysconf( "SC_CLK_TCK" )
+
+        return cpu_seconds, resident_pages * os.sysconf( "SC_PAGE_SIZE" )
+
+    def sample( self ) -> dict:
+        """
+        Function: Sample
+
+        Inputs: None
+        Outputs: The CPU use in percent of one core since the last sample and the resident memory in megabytes, None if they can not be read
+        """
+        usage = self._read_usage()
+        now = time.monotonic()
+
+        if usage is None:
+            return None
+
+        cpu_seconds, resident_bytes = usage
+        sample = { "rss_mb" : resident_bytes / ( 1 << 20 ) }
+
+        if self._last_cpu is not None and now > self._last_time:
+            sample[ "cpu_percent" ] = ( cpu_seconds - self._last_cpu ) / ( now - self._last_time ) * 100
+
+        self._last_cpu = cpu_seconds
+        self._last_time = now
+
+        return sample
+
+################################################################################
+# Procedures
+################################################################################
+def play_session( config : NC.NetworkConfig, codec : str, number_of_ships : int, strategy_type : str, rng : random.Random ) -> tuple[ bool, LS.LatencyHistogram ]:
+    """
+    Function: Play Session
+
+    Inputs: The address of the server, the codec, the number of ships, the strategy name,
+            the random number generator of the player
+    Outputs: If the player won, the latencies of the turns of the player
+
+    Description: Connects to the server as a lobby player and plays one game
+                 with the same messages as an instance of the game. The own
+                 board of the player is kept as the host board. A turn is
+                 timed from sending an attack until its response arrives,
+                 which includes relaying it to the opponent and back
+    """
+    player_type = IH.PlayerTypeEnum.PLAYER_TYPE_HOST
+    opponent_type = GE.get_opponent_type( player_type )
+
+    engine = GE.GameEngine( MF.create_model( DEFAULT_PLAYER_MODEL_TYPE ) )
+    FG.FleetGenerator( rng, number_of_ships ).place_fleet( engine, player_type )
+    strategy = SIM.STRATEGY_TYPE_TO_CLASS[ strategy_type ]( rng, number_of_ships )
+
+    connection = GC.Client( codec, lobby=True, config=config )
+
+    try:
+        connection.open_connection()
+        my_turn = connection.first_move
+
+        while not engine.is_over():
+            if my_turn:
+                coord = strategy.choose_attack()
+                connection.send_request( { IH.VIEW_PARAM_ROW : coord[ IH.ROW_INDEX ], IH.VIEW_PARAM_COL : coord[ IH.COLUMN_INDEX ] } )
+                response = connection.wait_for_message()
+
+                engine.record_attack_result( opponent_type, coord, response )
+                strategy.record_result( coord, response )
+
+            else:
+                attack = connection.wait_for_message()
+                connection.send_message( engine.resolve_attack( player_type, ( attack[ IH.VIEW_PARAM_ROW ], attack[ IH.VIEW_PARAM_COL ] ) ) )
+
+            my_turn = not my_turn
+
+    finally:
+        connection.close_connection()
+
+    return engine.get_winner() == player_type, connection.get_round_trip_latency()
+
+def _run_player( session : tuple, rng : random.Random, pacer : _Pacer, stats : _WorkerStats, deadline : float ) -> None:
+    """
+    Function: Run Player
+
+    Inputs: The address, codec, number of ships and strategy name of the games, the random number generator
+            of the player, the pacer and statistics of the worker, the time the run ends
+    Outputs: None
+
+    Description: Plays games until the end of the run. A game that fails
+                 after the end of the run was cut off by it, so it is not
+                 counted as an error
+    """
+    while pacer.wait( deadline ):
+        try:
+            won, turn_latency = play_session( *session, rng )
+
+        except ( OSError, EOFError, ValueError, KeyError, TypeError ) as error:
+            if time.monotonic() < deadline:
+                stats.record_error( error )
+
+            continue
+
+        stats.record_game( won, turn_latency )
+
+def _run_worker( task : tuple, results : multiprocessing.Queue ) -> None:
+    """
+    Function: Run Worker
+
+    Inputs: The settings of the worker, the queue the statistics are sent on
+    Outputs: None
+
+    Description: This is the function that is run by every worker process.
+                 Every player plays on its own thread, because a Client
+                 blocks while it waits for its opponent. The statistics are
+                 sent several times every interval, and once more when the
+                 run is over. The board dimensions are set again because the
+                 worker may not share the memory of the tester
+    """
+    ( worker_index, config, codec, number_of_ships, strategy_type, clients, rate, duration, interval, timeout, seed, rows, cols ) = task
+    session = ( config, codec, number_of_ships, strategy_type )
+
+    IH.set_board_dimensions( rows, cols )
+    socket.setdefaulttimeout( timeout )
+
+    pacer = _Pacer( rate )
+    stats = _WorkerStats()
+    deadline = time.monotonic() + duration
+
+    # Every player is seeded from the base seed, its worker and its
+    # place in the worker, so no two players play the same fleets
+    players = [ threading.Thread( target=_run_player, daemon=True,
+                                  args=( session, random.Random( ( seed << 32 ) + ( worker_index << 16 ) + index ), pacer, stats, deadline ) )
+                for index in range( clients ) ]
+
+    for player in players:
+        player.start()
+
+    while time.monotonic() < deadline:
+        time.sleep( min( interval / WORKER_SENDS_PER_INTERVAL, max( deadline - time.monotonic(), 0 ) ) )
+        results.put( stats.take() )
+
+    # Games that are being played get a moment to finish, the
+    # threads of those that do not are left behind
+    drain_deadline = time.monotonic() + DRAIN_TIMEOUT
+
+    for player in players:
+        player.join( max( drain_deadline - time.monotonic(), 0 ) )
+
+    final = stats.take()
+    final[ STAT_FINAL ] = True
+    results.put( final )
+
+def split_load( total : float, workers : int ) -> list[ float ]:
+    """
+    Function: Split Load
+
+    Inputs: The amount of players or the rate to split, the number of workers
+    Outputs: The share of every worker, whole players are spread as evenly as possible
+    """
+    if isinstance( total, int ):
+        return [ total // workers + int( index < total % workers ) for index in range( workers ) ]
+
+    return [ total / workers ] * workers
+
+def get_empty_stats() -> dict:
+    """
+    Function: Get Empty Statistics
+
+    Inputs: None
+    Outputs: Statistics that nothing was added to yet
+    """
+    return { STAT_SESSIONS : 0, STAT_GAMES : 0, STAT_ERRORS : dict(), STAT_TURN_LATENCY : LS.LatencyHistogram() }
+
+def merge_worker_stats( total : dict, stats : dict ) -> None:
+    """
+    Function: Merge Worker Statistics
+
+    Inputs: The running statistics, the statistics of a worker that are added to them
+    Outputs: None
+    """
+    total[ STAT_SESSIONS ] += stats[ STAT_SESSIONS ]
+    total[ STAT_GAMES ] += stats[ STAT_GAMES ]
+    total[ STAT_TURN_LATENCY ].merge( stats[ STAT_TURN_LATENCY ] )
+
+    for name, count in stats[ STAT_ERRORS ].items():
+        total[ STAT_ERRORS ][ name ] = total[ STAT_ERRORS ].get( name, 0 ) + count
+
+def summarize_worker_stats( stats : dict, seconds : float ) -> dict:
+    """
+    Function: Summarize Worker Statistics
+
+    Inputs: The merged statistics, the seconds they were gathered over
+    Outputs: The games per second, the turn latencies, the errors and the rate of games that failed
+    """
+    errors = sum( stats[ STAT_ERRORS ].values() )
+
+    return { "games" : stats[ STAT_GAMES ],
+             "games_per_s" : stats[ STAT_GAMES ] / seconds if seconds > 0 else 0.0,
+             "sessions" : stats[ STAT_SESSIONS ],
+             "errors" : stats[ STAT_ERRORS ],
+             "error_rate" : errors / stats[ STAT_SESSIONS ] if stats[ STAT_SESSIONS ] else 0.0,
+             "turn_latency" : stats[ STAT_TURN_LATENCY ].get_summary() }
+
+def spawn_server( config : NC.NetworkConfig, model_type : str, rows : int, cols : int ) -> subprocess.Popen:
+    """
+    Function: Spawn Server
+
+    Inputs: The settings of the server, the model it records the matches with, the board dimensions
+    Outputs: The process of the server, once it accepts connections
+
+    Description: The server is started with the same network settings as the
+                 players. It is ready once a connection is accepted, and that
+                 connection is closed again before it is paired
+    """
+    arguments = [ sys.executable, os.path.join( os.path.dirname( os.path.abspath( __file__ ) ), "game_server.py" ),
+                  "--port", str( config.port ), "--backlog", str( config.backlog ), "--transport", config.transport,
+                  "--reuseaddr" if config.reuse_address else "--no-reuseaddr",
+                  "--nodelay" if config.no_delay else "--no-nodelay",
+                  "--keepalive" if config.keep_alive else "--no-keepalive",
+                  "--model", model_type, "--rows", str( rows ), "--cols", str( cols ) ]
+
+    if config.host is not None:
+        arguments += [ "--host", config.host ]
+
+    if config.socket_path is not None:
+        arguments += [ "--socket-path", config.socket_path ]
+
+    server = subprocess.Popen( arguments )
+    start_deadline = time.monotonic() + SERVER_START_TIMEOUT
+
+    while time.monotonic() < start_deadline and server.poll() is None:
+        try:
+            NC.create_connected_socket( config ).close()
+            return server
+
+        except ConnectionRefusedError:
+            time.sleep( 0.05 )
+
+    server.kill()
+    server.wait()
+    raise RuntimeError( "The game server did not start listening" )
+
+def run_load( config : NC.NetworkConfig, clients : int, rate : float = 0.0, duration : float = 10.0, processes : int = 1,
+              codec : str = MC.DEFAULT_CODEC, number_of_ships : int = IH.MAX_NUM_OF_SHIPS, strategy_type : str = SIM.DEFAULT_STRATEGY_TYPE,
+              interval : float = DEFAULT_INTERVAL, timeout : float = DEFAULT_TIMEOUT, seed : int = 0, server_pid : int = None ):
+    """
+    Function: Run Load
+
+    Inputs: The address of the server, the number of players, the games started per second or 0 for as many as possible,
+            the seconds to run, the number of worker processes, the codec, the number of ships, the strategy name,
+            the seconds between reports, the seconds to wait for a message, the base seed, the process of the server or None
+    Outputs: Yields a report every interval, and a summary of the whole run at the end
+
+    Description: This is the entry point of the tester. A game is played by
+                 two players, so the players start twice as many sessions as
+                 the rate of games. Reports are made from the statistics that
+                 arrived since the last report
+    """
+    processes = max( 1, min( processes, clients ) )
+    results = multiprocessing.Queue()
+    workers = [ multiprocessing.Process( target=_run_worker, daemon=True,
+                                         args=( ( index, config, codec, number_of_ships, strategy_type, worker_clients, worker_rate,
+                                                  duration, interval, timeout, seed, IH.NUMBER_OF_ROWS, IH.NUMBER_OF_COLS ), results ) )
+                for index, ( worker_clients, worker_rate ) in enumerate( zip( split_load( clients, processes ), split_load( 2 * rate, processes ) ) ) ]
+
+    sampler = ProcessSampler( server_pid ) if server_pid is not None else None
+    server_samples = []
+
+    if sampler is not None:
+        sampler.sample()
+
+    for worker in workers:
+        worker.start()
+
+    start = time.monotonic()
+    last_report = start
+    total = get_empty_stats()
+    interval_stats = get_empty_stats()
+    finished = 0
+
+    while finished < len( workers ):
+        try:
+            stats = results.get( timeout=max( last_report + interval - time.monotonic(), 0 ) )
+            finished += int( stats.pop( STAT_FINAL, False ) )
+            merge_worker_stats( interval_stats, stats )
+            merge_worker_stats( total, stats )
+
+        except queue.Empty:
+            # A worker that crashed never sends its last statistics
+            if not any( worker.is_alive() for worker in workers ):
+                break
+
+        now = time.monotonic()
+
+        if now < last_report + interval and finished < len( workers ):
+            continue
+
+        report = { "elapsed_s" : now - start }
+        report.update( summarize_worker_stats( interval_stats, now - last_report ) )
+
+        # The last report can cover a fraction of an interval, which
+        # holds too few games to be a rate of the load
+        if now - last_report < interval:
+            report[ "games_per_s" ] = None
+
+        # Reports of intervals that started after the end of the run
+        # only hold the games that were still being played, so they
+        # are not a rate of the load either
+        if last_report >= start + duration:
+            report[ "draining" ] = True
+
+        if sampler is not None:
+            report[ "server" ] = sampler.sample()
+
+            if report[ "server" ] is not None:
+                server_samples.append( report[ "server" ] )
+
+        yield report
+
+        interval_stats = get_empty_stats()
+        last_report = now
+
+    for worker in workers:
+        worker.join()
+
+    # The games per second of the whole run are taken over the time
+    # new games were started, not the time the last games took to finish
+    summary = { "summary" : True, "clients" : clients, "target_games_per_s" : rate, "elapsed_s" : time.monotonic() - start }
+    summary.update( summarize_worker_stats( total, duration ) )
+
+    if server_samples:
+        cpu_samples = [ sample[ "cpu_percent" ] for sample in server_samples if "cpu_percent" in sample ]
+        summary[ "server" ] = { "max_rss_mb" : max( sample[ "rss_mb" ] for sample in server_samples ) }
+
+        if cpu_samples:
+            summary[ "server" ][ "mean_cpu_percent" ] = sum( cpu_samples ) / len( cpu_samples )
+            summary[ "server" ][ "max_cpu_percent" ] = max( cpu_samples )
+
+    yield summary
+
+def parse_arguments( argv : list[ str ] = None ) -> argparse.Namespace:
+    """
+    Function: Parse Arguments
+
+    Inputs: Command line arguments, defaults to the arguments of the process
+    Output: Parsed load options
+    """
+    parser = argparse.ArgumentParser( description="Battleship load tester for the game server" )
+    parser.add_argument( "--clients", type=int, default=100, help="Number of synthetic players that play at the same time" )
+    parser.add_argument( "--rate", type=float, default=0.0, help="Games started per second, 0 to play as many as the players can" )
+    parser.add_argument( "--duration", type=float, default=10.0, help="Seconds to start new games for" )
+    parser.add_argument( "--interval", type=float, default=DEFAULT_INTERVAL, help="Seconds between reports" )
+    parser.add_argument( "--processes", type=int, default=max( 1, ( os.cpu_count() or 2 ) // 2 ),
+                         help="Number of worker processes of the players. Defaults to half the cores, leaving the rest to the server" )
+    parser.add_argument( "--timeout", type=float, default=DEFAULT_TIMEOUT, help="Seconds a player waits for a message before its game fails" )
+    parser.add_argument( "--codec", choices=MC.CODEC_NAME_TO_CLASS.keys(), default=MC.DEFAULT_CODEC, help="Codec the players offer" )
+    parser.add_argument( "--ships", type=int, default=IH.MAX_NUM_OF_SHIPS,
+                         choices=range( IH.MIN_NUM_OF_SHIPS, IH.MAX_NUM_OF_SHIPS + 1 ), help="Number of ships per player" )
+    parser.add_argument( "--strategy", choices=SIM.STRATEGY_TYPE_TO_CLASS.keys(), default=SIM.DEFAULT_STRATEGY_TYPE,
+                         help="Strategy of the players" )
+    parser.add_argument( "--seed", type=int, default=0, help="Base seed of the players" )
+    parser.add_argument( "--rows", type=int, default=IH.NUMBER_OF_ROWS, help="Number of rows on the board, which has to match the server" )
+    parser.add_argument( "--cols", type=int, default=IH.NUMBER_OF_COLS, help="Number of columns on the board, which has to match the server" )
+
+    server_group = parser.add_mutually_exclusive_group()
+    server_group.add_argument( "--spawn-server", action="store_true", help="Start a game server for the run and sample its CPU and memory use" )
+    server_group.add_argument( "--server-pid", type=int, default=None, help="Sample the CPU and memory use of a game server that is already running" )
+    parser.add_argument( "--server-model", choices=MF.MODEL_TYPES, default=GS.DEFAULT_SERVER_MODEL_TYPE,
+                         help="Implementation of the game model of a spawned server" )
+    NC.add_network_arguments( parser, GS.get_default_config() )
+
+    options = parser.parse_args( argv )
+
+    # The game server relays every message on its own socket
+    if options.transport == NC.TRANSPORT_SHARED_MEMORY:
+        parser.error( "The game server can not use the shared memory transport" )
+
+    if options.clients < 2:
+        parser.error( "At least two players are needed to play a game" )
+
+    return options
+
+def main( options : argparse.Namespace ) -> None:
+    """
+    Function: Main
+
+    Inputs: Load options
+    Output: Reports printed as one JSON object per line
+    """
+    IH.set_board_dimensions( options.rows, options.cols )
+    config = NC.from_arguments( options )
+    server = spawn_server( config, options.server_model, options.rows, options.cols ) if options.spawn_server else None
+    server_pid = server.pid if server is not None else options.server_pid
+
+    try:
+        for report in run_load( config, options.clients, options.rate, options.duration, options.processes, options.codec,
+                                options.ships, options.strategy, options.interval, options.timeout, options.seed, server_pid ):
+            print( json.dumps( report ), flush=True )
+
+    finally:
+        # The server cleans up its socket file when it is interrupted
+        if server is not None:
+            server.send_signal( signal.SIGINT )
+
+            try:
+                server.wait( SERVER_START_TIMEOUT )
+
+            except subprocess.TimeoutExpired:
+                server.kill()
+                server.wait()
+
+if __name__ == "__main__":
+    main( parse_arguments() )
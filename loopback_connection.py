@@ -0,0 +1,201 @@
+'''
+Module: loopback_connection.py
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Description: This module implements network interactions between two players
+             in the same process, without binding a port. Both ends of a
+             connection are created together, and the host and the joining
+             player can then be played from one thread or from two threads.
+             The queue connection hands the encoded messages over through
+             in-process queues. The socket pair connection frames them over a
+             connected pair of sockets like a network connection does, so it
+             can also be watched by the event loop
+
+Inputs: Messages to Send
+Outputs: Messages to Receive
+'''
+
+################################################################################
+# Imports
+################################################################################
+import queue
+import socket
+import time
+import message_codec as MC
+import latency_stats as LS
+from socket_connection import SocketConnection
+from interfaces.interface_game_interaction import GameInteractionInterface
+
+################################################################################
+# Global Variables
+################################################################################
+
+# Put on the queue of the other player when a connection is closed
+CLOSED_MESSAGE = None
+
+################################################################################
+# Types
+################################################################################
+class QueueConnection( GameInteractionInterface ):
+    def __init__( self, inbox : queue.SimpleQueue, outbox : queue.SimpleQueue, codec : str = MC.DEFAULT_CODEC ) -> None:
+        """
+        Definition: Setting up one end of a connection that receives on the inbox and sends on the outbox.
+        """
+
+        # The messages are encoded even though they never leave the
+        # process, so that only messages that could be sent over the
+        # network can be sent, and the receiver gets its own copy
+        self.codec = MC.CODEC_NAME_TO_CLASS[ codec ]()
+        self.connection_count = 0
+        self._inbox = inbox
+        self._outbox = outbox
+        self._closed = False
+
+        # The round trips of the requests are recorded from the time
+        # a request is sent until the next message arrives
+        self.round_trip_latency = LS.LatencyHistogram()
+        self._request_sent_at : float = None
+
+
+    def open_connection( self ) -> None:
+        """
+        Definition: Opening the connection. Both ends are connected when they are created, so a closed connection can not be opened again.
+        """
+
+        if self._closed:
+            raise ConnectionError( "A loopback connection can not be opened again" )
+
+        self.connection_count += 1
+
+
+    def close_connection( self ) -> None:
+        """
+        Definition: Closing the connection and letting the other player know.
+        """
+
+        # A connection that is already closed is left as it is
+        if not self._closed:
+            self._closed = True
+            self._outbox.put( CLOSED_MESSAGE )
+
+
+    def send_message( self, msg : dict ) -> None:
+        """
+        Definition: Sending a message to the other player.
+        """
+
+        if self._closed:
+            raise ConnectionError( "The connection is closed" )
+
+        self._outbox.put( self.codec.encode( msg ) )
+
+
+    def send_request( self, msg : dict ) -> None:
+        """
+        Definition: Sending a message that the other player answers right away, and starting the clock of its round trip.
+        """
+
+        self._request_sent_at = time.perf_counter()
+        self.send_message( msg )
+
+
+    def get_round_trip_latency( self ) -> LS.LatencyHistogram:
+        """
+        Definition: Getting the histogram of the round trips of the requests.
+        """
+
+        return self.round_trip_latency
+
+
+    def _receive_message( self, data : bytes ) -> dict:
+        """
+        Definition: Decoding a received message and stopping the clock of the request it answers.
+        """
+
+        if data is CLOSED_MESSAGE:
+            raise ConnectionError( "The connection was closed by the other player" )
+
+        if self._request_sent_at is not None:
+            self.round_trip_latency.record( time.perf_counter() - self._request_sent_at )
+            self._request_sent_at = None
+
+        return self.codec.decode( data )
+
+
+    def wait_for_message( self ) -> dict:
+        """
+        Definition: Waiting for a message from the other player.
+        """
+
+        return self._receive_message( self._inbox.get() )
+
+
+    def poll_message( self ) -> dict:
+        """
+        Definition: Getting the next message from the other player without blocking, None if it has not arrived.
+        """
+
+        try:
+            data = self._inbox.get_nowait()
+
+        except queue.Empty:
+            return None
+
+        return self._receive_message( data )
+
+
+class SocketPairConnection( SocketConnection ):
+    def __init__( self, connection_socket : socket.socket, codec : str = MC.DEFAULT_CODEC ) -> None:
+        """
+        Definition: Setting up one end of a connected pair of sockets.
+        """
+
+        super().__init__( codec )
+        self._start_connection( connection_socket )
+
+
+    def open_connection( self ) -> None:
+        """
+        Definition: Opening the connection. Both ends are connected when they are created, so a closed connection can not be opened again.
+        """
+
+        if self.client_socket is None:
+            raise ConnectionError( "A loopback connection can not be opened again" )
+
+################################################################################
+# Procedures
+################################################################################
+def create_queue_pair( codec : str = MC.DEFAULT_CODEC ) -> tuple[ QueueConnection, QueueConnection ]:
+    """
+    Function: Create Queue Pair
+
+    Inputs: The codec of the messages
+    Output: The connection of the host and the connection of the joining player
+    """
+    host_inbox = queue.SimpleQueue()
+    join_inbox = queue.SimpleQueue()
+
+    return QueueConnection( host_inbox, join_inbox, codec ), QueueConnection( join_inbox, host_inbox, codec )
+
+def create_socket_pair( codec : str = MC.DEFAULT_CODEC ) -> tuple[ SocketPairConnection, SocketPairConnection ]:
+    """
+    Function: Create Socket Pair
+
+    Inputs: The codec both players prefer
+    Output: The connection of the host and the connection of the joining player
+
+    Description: The codec is negotiated the same way as over the network.
+                 The offer fits in the buffer of the socket, so both sides of
+                 the negotiation can be done here in order without blocking
+    """
+    host_socket, join_socket = socket.socketpair()
+    host = SocketPairConnection( host_socket, codec )
+    join = SocketPairConnection( join_socket, codec )
+
+    join._send_codec_offer()
+    host._negotiate_codec_as_host()
+    join._receive_codec_answer()
+
+    return host, join
@@ -14,49 +14,110 @@ Description: This module is the launching point for the Battleship program. The
 ################################################################################
 # Imports
 ################################################################################
-import game_view as GV
 import game_presenter as GP
-import game_model as GM
+import game_engine as GE
+import model_factory as MF
 import client as GC
 import host as GH
+import message_codec as MC
+import view_factory as VF
+import game_loop as GL
+import network_config as NC
+import latency_stats as LS
+import game_snapshot as GS
+import move_log as ML
+import shared_memory_connection as SMC
 
 from interfaces import interface_headers as IH
+from interfaces import interface_game_interaction as IGI
 
-import json
+import argparse
+import errno
+import os
 
 ################################################################################
 # Global Variables
 ################################################################################
 
+# The placement rules now live in the engine. Keep the helper
+# available from here for the code that already uses it
+get_ending_coordinate = GE.get_ending_coordinate
+
 ################################################################################
 # Procedures
 ################################################################################
-def get_ending_coordinate( start_coordinate, dir, amount : IH.SystemCoordType ) -> IH.SystemCoordType:
+def parse_arguments( argv : list[ str ] = None ) -> argparse.Namespace:
     """
-    Function: Get Ending Coordinate
+    Function: Parse Arguments
 
-    Inputs: Starting coordinate, calulation direction, amount to move
-    Output: Ending Coordinate
+    Inputs: Command line arguments, defaults to the arguments of the process
+    Output: Parsed startup options
 
-    Description: This is a helper function that computes the predicted
-                 ending coordinate given a starting coordinate and
-                 the orientation of ship with the size of the ship
+    Description: This is a helper function that parses the options that
+                 are selected when the game is launched
+    """
+    parser = argparse.ArgumentParser( description="Battleship" )
+    parser.add_argument( "--model", choices=MF.MODEL_TYPES, default=MF.DEFAULT_MODEL_TYPE,
+                         help="Implementation of the game model to use" )
+    parser.add_argument( "--codec", choices=MC.CODEC_NAME_TO_CLASS.keys(), default=MC.DEFAULT_CODEC,
+                         help="Preferred encoding of the network messages. Use json to read the messages while debugging" )
+    parser.add_argument( "--view", choices=VF.VIEW_TYPES, default=VF.DEFAULT_VIEW_TYPE,
+                         help="Implementation of the game view to use" )
+    parser.add_argument( "--lobby", action="store_true",
+                         help="Join a game server and play against the next player in its lobby" )
+    parser.add_argument( "--rows", type=int, default=IH.NUMBER_OF_ROWS,
+                         help=f"Number of rows on the board (up to { IH.MAX_NUMBER_OF_ROWS })" )
+    parser.add_argument( "--cols", type=int, default=IH.NUMBER_OF_COLS,
+                         help=f"Number of columns on the board (up to { IH.MAX_NUMBER_OF_COLS })" )
+    parser.add_argument( "--event-loop", action="store_true",
+                         help="Wait for the opponent on an event loop, which notices an opponent that left and lets you leave by entering q" )
+    parser.add_argument( "--turn-timeout", type=float, default=None, metavar="SECONDS",
+                         help="Seconds a player has to make a move before losing the game. Implies --event-loop" )
+    parser.add_argument( "--latency-log", default=os.environ.get( LS.ENV_LATENCY_LOG ), metavar="PATH",
+                         help=f"Append the round trip latencies of your attacks to this file as a JSON line when the game ends [{ LS.ENV_LATENCY_LOG }]" )
+    parser.add_argument( "--move-log", default=os.environ.get( ML.ENV_MOVE_LOG ), metavar="PATH",
+                         help=f"Append every placement and attack of the game to this binary log, which replay.py reads [{ ML.ENV_MOVE_LOG }]" )
+    parser.add_argument( "--snapshot", default=None, metavar="PATH",
+                         help="Save the game to this file after every turn, and wait for the opponent to return when the connection is lost" )
+    parser.add_argument( "--resume", default=None, metavar="PATH",
+                         help="Resume the game that was saved to this file, and keep saving it there" )
+    NC.add_network_arguments( parser )
+
+    options = parser.parse_args( argv )
+
+    # The game server pairs players anew, so it has no
+    # opponent to return to
+    if options.lobby and ( options.snapshot or options.resume ):
+        parser.error( "--snapshot and --resume can not be used with --lobby" )
+
+    # The game server relays every message on its own socket
+    if options.lobby and options.transport == NC.TRANSPORT_SHARED_MEMORY:
+        parser.error( "The shared memory transport can not be used with --lobby" )
+
+    if options.resume:
+        options.snapshot = options.resume
+
+    return options
+
+def dump_latency( options : argparse.Namespace, connection, player_type : IH.PlayerTypeEnum ) -> None:
     """
+    Function: Dump Latency
 
-    # Depending on the direction passed, compute the ending
-    # coordinate by subtracting the amount from the a particular
-    # index in the starting coordinate
-    if dir == "V":
-        return ( start_coordinate[ 0 ] - amount + 1, start_coordinate[ 1 ] )
-    
-    if dir == "H":
-        return ( start_coordinate[ 0 ], start_coordinate[ 1 ] - amount + 1 )
+    Inputs: Startup options, the connection the game was played on, the type of the player
+    Output: None
+
+    Description: This is a helper function that appends the round trip
+                 latencies of the game to the latency log if one was selected
+    """
+    if options.latency_log:
+        LS.append_summary( options.latency_log, connection.get_round_trip_latency(),
+                           { "player" : player_type.name, "codec" : connection.codec.name, "lobby" : options.lobby } )
 
-def main():
+def main( options : argparse.Namespace = None, connection : IGI.GameInteractionInterface = None ):
     """
     Function: Main
 
-    Inputs: None
+    Inputs: Startup options, the connection to play on or None to connect over the network
     Output: Battleship Game
 
     Description: This is the main function, which serves as the launching
@@ -64,11 +125,30 @@ def main():
                  the executive process that will control the flow of the
                  battleship game
     """
+    # Use the default options if the caller did not provide any
+    if options is None:
+        options = parse_arguments( [] )
+
+    # A resumed game is played on the board it was saved with
+    snapshot = GS.read_snapshot( options.resume ) if options.resume else None
+
+    # The size of the board needs to be known before the
+    # model is created
+    if snapshot is not None:
+        IH.set_board_dimensions( snapshot.rows, snapshot.cols )
+
+    else:
+        IH.set_board_dimensions( options.rows, options.cols )
+
     # Initializes Instances of the Model, View, and presenter, as
     # well as the variable to hold the connection state
-    model = GM.GameModel()
-    presenter = GP.GamePresenter( GV.GameView() )
-    connection = None
+    model = MF.create_model( options.model )
+    network_config = NC.from_arguments( options )
+    # The moves are written once the game is over, so instances
+    # that share a log never mix the moves of their games
+    move_log = ML.MoveLogWriter( options.move_log, buffered=True ) if options.move_log else None
+    engine = GE.GameEngine( model, move_log )
+    presenter = GP.GamePresenter( VF.create_view( options.view ) )
 
     # The host player will always have the first move
     # Suggest improvement, make RNG?
@@ -87,20 +167,56 @@ def main():
 
     # Trigger the initialization event of the presenter to
     # obtain configuration related items, including the number
-    # of ships and whether the player is a host or joining player
-    function_returns = presenter.trigger_view_event( IH.GameEventType.GAME_EVENT_INITIALIZATION, {} )
-    player_type = function_returns[ IH.VIEW_PARAM_PLAYER_TYPE ]
-    number_of_ships = function_returns[ IH.VIEW_PARAM_NUM_OF_SHIPS ]
+    # of ships and whether the player is a host or joining player.
+    # A resumed game already has its ships, so none are placed
+    if snapshot is not None:
+        player_type = snapshot.player_type
+        number_of_ships = 0
+        turn = snapshot.turn
+        GS.restore_model( snapshot, model )
+
+        if move_log is not None:
+            move_log.start_restored_game( player_type, model )
+
+    else:
+        function_returns = presenter.trigger_view_event( IH.GameEventType.GAME_EVENT_INITIALIZATION, {} )
+        player_type = function_returns[ IH.VIEW_PARAM_PLAYER_TYPE ]
+        number_of_ships = function_returns[ IH.VIEW_PARAM_NUM_OF_SHIPS ]
+
+        if move_log is not None:
+            move_log.start_game( player_type, number_of_ships )
 
     # Make the opponent be the opposite type of the player
-    # create the correct networking state for the current
-    # player
     if player_type == IH.PlayerTypeEnum.PLAYER_TYPE_JOIN:
         oppenent_type = IH.PlayerTypeEnum.PLAYER_TYPE_HOST
-        connection = GC.Client()
     else:
         oppenent_type = IH.PlayerTypeEnum.PLAYER_TYPE_JOIN
-        connection = GH.Host()
+
+    # A connection from the caller, such as a loopback connection
+    # to an opponent in the same process, is played on as it is.
+    # Otherwise create the correct networking state for the
+    # current player
+    if connection is None:
+        # In lobby mode every player joins a game server, which
+        # pairs them with an opponent
+        if options.lobby:
+            connection = GC.Client( options.codec, lobby=True, config=network_config )
+
+        elif player_type == IH.PlayerTypeEnum.PLAYER_TYPE_JOIN:
+            connection = GC.Client( options.codec, config=network_config )
+
+        else:
+            connection = GH.Host( options.codec, network_config )
+
+        # Players on the same machine can hand their messages over in
+        # shared memory, after meeting on the socket of the other transports
+        if network_config.transport == NC.TRANSPORT_SHARED_MEMORY:
+            connection = SMC.SharedMemoryConnection( connection )
+
+    # The visual boards are views that track the model, so they
+    # only need to be obtained once for the rest of the game
+    function_parameters[ IH.VIEW_PARAM_BOARD ] = model.get_visual_board( player_type )
+    function_parameters[ IH.VIEW_PARAM_OPPONENT_BOARD ] = model.get_visual_board( oppenent_type )
 
     # Initially set the error state of the view to be false
     # as well as setting the initial size of the ship to be
@@ -111,11 +227,8 @@ def main():
     # This loop will continue executing until we have placed
     # all the ships onto the board
     while size <= number_of_ships:
-        # Set the size, and the visual boards of the current
-        # player and opponent as inputs into the presenter
+        # Set the size of the ship as an input into the presenter
         function_parameters[ IH.VIEW_PARAM_SIZE ] = size
-        function_parameters[ IH.VIEW_PARAM_BOARD ] = model.get_visual_board( player_type )
-        function_parameters[ IH.VIEW_PARAM_OPPONENT_BOARD ] = model.get_visual_board( oppenent_type )
 
         # Trigger the presenter to display the configuration page.
         # On page exit, ensure to reset the error state so that
@@ -129,193 +242,206 @@ def main():
         start_coordinate = ( return_val[ IH.VIEW_PARAM_ROW ], return_val[ IH.VIEW_PARAM_COL ] )
         
         # Convert the coordinate returned by the presenter
-        # into system coordinates and compute the ending coordinate
-        # based on the values returned by configuration
+        # into system coordinates and let the engine place the
+        # ship. If it could not be placed, we will trigger the
+        # error state in the presenter
         start_coordinate_sys = ( IH.PLACEMENT_ROW_TO_SYS_ROW[ start_coordinate[ IH.ROW_INDEX ] ], IH.PLACEMENT_COL_TO_SYS_COL[ start_coordinate[ IH.COLUMN_INDEX ] ] )
-        end_coordinate_sys = get_ending_coordinate( start_coordinate_sys, direction, size )
-
-        # Here we are creating a set of all the coordinates
-        # that the ship is predicted to take, We use a set
-        # to make sure that there are no repeat coordinates
-        boat_coords = { ( row, col ) 
-                        for row in range( start_coordinate_sys[ IH.ROW_INDEX ], end_coordinate_sys[ IH.ROW_INDEX ] - 1, -1 )
-                        for col in range( start_coordinate_sys[ IH.COLUMN_INDEX ], end_coordinate_sys[ IH.COLUMN_INDEX ] - 1, -1 ) }
-
-        # If we find that at least one of the coordinates
-        # is not a valid coordinate, we will trigger the error
-        # state in the presenter
-        for coord in boat_coords:
-            if not model.is_valid_coord( player_type, coord, IH.GameEventType.GAME_EVENT_PLACE_SHIPS ):
-                function_parameters[ IH.VIEW_PARAM_IS_ERROR_STATE ] = True
-        
-        # If the presenter is not supposed to be in an
-        # error state, we will update the model with the ship
-        # selections
-        if not function_parameters[ IH.VIEW_PARAM_IS_ERROR_STATE ]:
-            for coord in boat_coords:
-                new_state = { IH.GAME_COORD_TYPE_ID_INDEX : size, IH.GAME_COORD_TYPE_STATE_INDEX: IH.CoordStateType.COORD_STATE_BASE }
-                model.update_coord( player_type, coord, new_state )
 
+        if engine.place_ship( player_type, start_coordinate_sys, direction, size ):
             # Increment the size only if we are able to
             # successfully place a ship
             size += 1
 
-    # Re initialize function parameters to have the most
-    # up to date data remove any messages that could
-    # have been triggered due to previous steps
-    function_parameters[ IH.VIEW_PARAM_BOARD ] = model.get_visual_board( player_type )
-    function_parameters[ IH.VIEW_PARAM_OPPONENT_BOARD ] = model.get_visual_board( oppenent_type )
+        else:
+            function_parameters[ IH.VIEW_PARAM_IS_ERROR_STATE ] = True
+
+    # Re initialize function parameters to remove any messages
+    # that could have been triggered due to previous steps
     function_parameters[ IH.VIEW_PARAM_IS_ERROR_STATE ] = False
     function_parameters[ IH.VIEW_PARAM_STATE_MESSAGE ] = None
 
     # Trigger the presenter to display the wait page
     # as well as open the network connection
     presenter.trigger_view_event( IH.GameEventType.GAME_EVENT_WAIT_FOR_OPPONENT, function_parameters )
-    connection.open_connection()
 
-    # Initialize a variable to handle whether
-    # the game should end or not
-    game_over = False
-    win = False
+    # Moves only refer to the same cells if both players play on
+    # the same board, which is checked when the connection opens
+    try:
+        connection.open_connection()
 
-    # Execute the following loop while the game
-    # can still be played
-    while not game_over:
-        function_parameters[ IH.VIEW_PARAM_BOARD ] = model.get_visual_board( player_type )
-        function_parameters[ IH.VIEW_PARAM_OPPONENT_BOARD ] = model.get_visual_board( oppenent_type )
-
-        # The following code logic is executed if it is not
-        # the current players turn
-        if player_type != turn:
-            # Trigger the presenter's wait for event page and reset
-            # the error state and the status state after the call
-            presenter.trigger_view_event( IH.GameEventType.GAME_EVENT_WAIT_FOR_OPPONENT, function_parameters )
-            function_parameters[ IH.VIEW_PARAM_STATE_MESSAGE ] = None
-            function_parameters[ IH.VIEW_PARAM_IS_ERROR_STATE ] = False
-            
-            # Wait until we get a response from the opponent and
-            # load the data as a dictionary. Along with that,
-            # initialize a variable to store the response that
-            # will be sent back
-            data = connection.wait_for_message()
-            data = json.loads( data )
-            response = dict()
-            
-            # Unpack the data into coordinates and get the current
-            # state of the coordinate on the board
-            coord = ( data[ IH.VIEW_PARAM_ROW ], data[ IH.VIEW_PARAM_COL ] )
-            cell = model.get_coord( player_type, coord )
-
-            # If the coordinate is a ship coordinate, and it is not hit already,
-            # make sure that it is in the hit state. Otherwise, the the opponent
-            # missed 
-            if cell[ IH.GAME_COORD_TYPE_ID_INDEX ] > IH.BASE_CELL and cell[ IH.GAME_COORD_TYPE_STATE_INDEX ] != IH.CoordStateType.COORD_STATE_HIT:
-                response[ IH.GAME_COORD_TYPE_STATE_INDEX ] = IH.CoordStateType.COORD_STATE_HIT.value
-                cell[ IH.GAME_COORD_TYPE_STATE_INDEX ] = IH.CoordStateType.COORD_STATE_HIT
+    except MC.BoardMismatchError as error:
+        raise SystemExit( str( error ) ) from error
 
-            else:
-                response[ IH.GAME_COORD_TYPE_STATE_INDEX ] =  IH.CoordStateType.COORD_STATE_MISS.value
-                cell[ IH.GAME_COORD_TYPE_STATE_INDEX ] = IH.CoordStateType.COORD_STATE_MISS
-
-            # Update the player's model with the new data for the attack
-            model.update_coord( player_type, coord, cell )
-
-            # Determine if the result of this attack cause the opponent
-            # to win and send the message
-            response[ IH.VIEW_PARAM_WIN ] = not model.ships_are_alive( player_type )
-            response[ IH.VIEW_PARAM_SHIP_SUNK ] = not model.ship_is_alive( player_type, cell[ IH.GAME_COORD_TYPE_ID_INDEX ] )
-            response[ IH.VIEW_PARAM_SIZE ] = cell[ IH.GAME_COORD_TYPE_ID_INDEX ]
-            connection.send_message( json.dumps( response ) )
-            
-            # Update the state message to allow the presenter to display this
-            # message on the next page load
-            if cell[ IH.GAME_COORD_TYPE_STATE_INDEX ] == IH.CoordStateType.COORD_STATE_HIT:
-                function_parameters[ IH.VIEW_PARAM_STATE_MESSAGE ] = f"The opponent's move at row={ IH.SYS_ROW_TO_PLACMENT_ROW[ coord[ 0 ] ] }, col={ IH.SYS_COL_TO_PLACMENT_COL[ coord[ 1 ] ] } hit!"
-
-            else:
-                function_parameters[ IH.VIEW_PARAM_STATE_MESSAGE ] = f"The opponent's move at row={ IH.SYS_ROW_TO_PLACMENT_ROW[ coord[ 0 ] ] }, col={ IH.SYS_COL_TO_PLACMENT_COL[ coord[ 1 ] ] } missed!"
+    # Another host already listens on the address of this host
+    except OSError as error:
+        if error.errno != errno.EADDRINUSE:
+            raise
 
-            # If Ship was sunk, indictate as a status message that the ship was sunk
-            if response[ IH.VIEW_PARAM_SHIP_SUNK ]:
-                function_parameters[ IH.VIEW_PARAM_STATE_MESSAGE ] += f"\nShip of size { cell[ IH.GAME_COORD_TYPE_ID_INDEX ] } was sunk!"
+        raise SystemExit( f"Can not host the game: { error.strerror }. Stop the other host, or pick another --port or --socket-path" ) from error
 
-            # Make it so the user is now the active
-            # player
-            turn = player_type
+    # The recorder saves every turn. A resumed game first agrees
+    # with the opponent on the last turn that was played, and the
+    # connection opens itself again whenever it is lost
+    recorder = None
 
-            # If the result of the other player's attack
-            # caused your board to be destoryed, close
-            # the connection and indicate that you lost
-            if response[ IH.VIEW_PARAM_WIN ]:
-                connection.close_connection()
-                game_over = True
-                win = False
+    if options.snapshot:
+        if snapshot is not None:
+            recorder = GS.SnapshotRecorder( engine, player_type, options.snapshot, snapshot.sequence, snapshot.last_defense )
+            turn = recorder.resume( connection, turn )
+            function_parameters[ IH.VIEW_PARAM_STATE_MESSAGE ] = "The game was resumed"
 
         else:
-            # Trigger the presenter to display the attack page
-            attack = presenter.trigger_view_event( IH.GameEventType.GAME_EVENT_MAKE_ATTACK, function_parameters )
-
-            # Remove any messages or errors that are currently
-            # displayed on the page
-            function_parameters[ IH.VIEW_PARAM_STATE_MESSAGE ] = None
-            function_parameters[ IH.VIEW_PARAM_IS_ERROR_STATE ] = False
-
-            # Get the system coordinates from the attack
-            attack_sys = ( IH.PLACEMENT_ROW_TO_SYS_ROW[ attack[ IH.VIEW_PARAM_ROW ] ], IH.PLACEMENT_COL_TO_SYS_COL[ attack[ IH.VIEW_PARAM_COL ] ] )
-
-            # The following block of code is only executed if the attack is valid
-            if model.is_valid_coord( oppenent_type, attack_sys, IH.GameEventType.GAME_EVENT_MAKE_ATTACK ):
-                # Get a reference to the cell of the coordinate
-                # that you are attacking
-                cell = model.get_coord( oppenent_type, attack_sys )
-                
-                # Pack the attack's location into the a json
-                # structure and send it to the other player
-                data = dict()
-                data[ IH.VIEW_PARAM_ROW ] = attack_sys[ IH.ROW_INDEX ]
-                data[ IH.VIEW_PARAM_COL ] = attack_sys[ IH.COLUMN_INDEX ]
-                connection.send_message( json.dumps( data ) )
-
-                # Obtain the response from the other player
-                response = json.loads( connection.wait_for_message() )
-                
-                model.update_coord( oppenent_type, attack_sys, { IH.GAME_COORD_TYPE_ID_INDEX: cell[ IH.GAME_COORD_TYPE_ID_INDEX ], 
-                                                                 IH.GAME_COORD_TYPE_STATE_INDEX: IH.CoordStateType( response[ IH.GAME_COORD_TYPE_STATE_INDEX ] ) } )
-                
+            recorder = GS.SnapshotRecorder( engine, player_type, options.snapshot )
+            recorder.write( turn )
+
+        connection = GS.ResumableConnection( connection, recorder )
+
+    # In lobby mode the game server decides which player
+    # makes the first move
+    if options.lobby:
+        turn = player_type if connection.first_move else oppenent_type
+
+    # The event loop plays the rest of the game, including
+    # the game over page
+    if options.event_loop or options.turn_timeout is not None:
+        GL.EventDrivenGame( engine, presenter, connection, function_parameters, player_type, turn, options.turn_timeout, recorder ).run()
+        dump_latency( options, connection, player_type )
+
+        if move_log is not None:
+            move_log.close()
+
+        return
+
+    # Execute the following loop while the game
+    # can still be played. A connection that was lost and could
+    # not be resumed ends the game the same way as in the event loop
+    try:
+        while not engine.is_over():
+            # The following code logic is executed if it is not
+            # the current players turn
+            if player_type != turn:
+                # Trigger the presenter's wait for event page and reset
+                # the error state and the status state after the call
+                presenter.trigger_view_event( IH.GameEventType.GAME_EVENT_WAIT_FOR_OPPONENT, function_parameters )
+                function_parameters[ IH.VIEW_PARAM_STATE_MESSAGE ] = None
+                function_parameters[ IH.VIEW_PARAM_IS_ERROR_STATE ] = False
+            
+                # Wait until we get a message from the opponent, and
+                # unpack it into coordinates. A message that can not be
+                # decoded is an invalid move as well
+                try:
+                    coord = GE.get_attack_coord( connection.wait_for_message() )
+
+                except ValueError:
+                    coord = None
+
+                # An attack the rules do not allow ends the game the
+                # same way as in the event loop
+                if coord is None or not engine.is_valid_attack( player_type, coord ):
+                    engine.forfeit( oppenent_type )
+                    function_parameters[ IH.VIEW_PARAM_STATE_MESSAGE ] = GL.INVALID_MOVE_MESSAGE
+                    connection.close_connection()
+                    continue
+
+                # Let the engine apply the attack to the player's board.
+                # The engine gives back the response that is sent to the
+                # opponent
+                response = engine.resolve_attack( player_type, coord )
+
+                # The response is saved before it is sent, so the opponent
+                # is never ahead of the snapshot
+                if recorder is not None:
+                    recorder.record_defense( coord, response, player_type )
+
+                connection.send_message( response )
+            
                 # Update the state message to allow the presenter to display this
                 # message on the next page load
-                if IH.CoordStateType( response[ IH.GAME_COORD_TYPE_STATE_INDEX ] ) == IH.CoordStateType.COORD_STATE_HIT:
-                    function_parameters[ IH.VIEW_PARAM_STATE_MESSAGE ] = f"Your move at row={ attack[ IH.VIEW_PARAM_ROW ] }, col={ attack[ IH.VIEW_PARAM_COL ] } hit!"
+                function_parameters[ IH.VIEW_PARAM_STATE_MESSAGE ] = GL.describe_opponent_attack( coord, response )
 
-                else:
-                    function_parameters[ IH.VIEW_PARAM_STATE_MESSAGE ] = f"Your move at row={ attack[ IH.VIEW_PARAM_ROW ] }, col={ attack[ IH.VIEW_PARAM_COL ] } missed!"
-
-                if response[ IH.VIEW_PARAM_SHIP_SUNK ]:
-                    function_parameters[ IH.VIEW_PARAM_STATE_MESSAGE ] += f"\nShip of size { response[ IH.VIEW_PARAM_SIZE ] } was sunk!"
+                # Make it so the user is now the active
+                # player
+                turn = player_type
 
-                # If the result of the attack ended the opponenet
-                # Indicate that you won the game!
+                # If the result of the other player's attack
+                # caused your board to be destoryed, close
+                # the connection
                 if response[ IH.VIEW_PARAM_WIN ]:
                     connection.close_connection()
-                    game_over = True
-                    win = True
-
-                turn = oppenent_type
 
             else:
-                # We are only in an error state if the
-                # user attempted to attack a coordinate
-                # that has already been hit. Allow the user
-                # to keep inputting until they get it right
-                function_parameters[ IH.VIEW_PARAM_IS_ERROR_STATE ] = True
-    
-    else:
-        # Once the Game is over, display the game over page
-        function_parameters[ IH.VIEW_PARAM_BOARD ] = model.get_visual_board( player_type )
-        function_parameters[ IH.VIEW_PARAM_OPPONENT_BOARD ] = model.get_visual_board( oppenent_type )
-        function_parameters[ IH.VIEW_PARAM_WIN ] = win
-        presenter.trigger_view_event( IH.GameEventType.GAME_EVENT_GAME_END, function_parameters )
-        pass
+                # Trigger the presenter to display the attack page
+                attack = presenter.trigger_view_event( IH.GameEventType.GAME_EVENT_MAKE_ATTACK, function_parameters )
+
+                # Remove any messages or errors that are currently
+                # displayed on the page
+                function_parameters[ IH.VIEW_PARAM_STATE_MESSAGE ] = None
+                function_parameters[ IH.VIEW_PARAM_IS_ERROR_STATE ] = False
+
+                # Get the system coordinates from the attack
+                attack_sys = ( IH.PLACEMENT_ROW_TO_SYS_ROW[ attack[ IH.VIEW_PARAM_ROW ] ], IH.PLACEMENT_COL_TO_SYS_COL[ attack[ IH.VIEW_PARAM_COL ] ] )
+
+                # The following block of code is only executed if the attack is valid
+                if engine.is_valid_attack( oppenent_type, attack_sys ):
+                    # Pack the attack's location into a message
+                    # and send it to the other player
+                    data = dict()
+                    data[ IH.VIEW_PARAM_ROW ] = attack_sys[ IH.ROW_INDEX ]
+                    data[ IH.VIEW_PARAM_COL ] = attack_sys[ IH.COLUMN_INDEX ]
+                    connection.send_request( data )
+
+                    # Obtain the response from the other player and record
+                    # it on the opponent's board
+                    try:
+                        response = connection.wait_for_message()
+                        engine.record_attack_result( oppenent_type, attack_sys, response )
+
+                    except ( KeyError, TypeError, ValueError ):
+                        engine.forfeit( oppenent_type )
+                        function_parameters[ IH.VIEW_PARAM_STATE_MESSAGE ] = GL.INVALID_MOVE_MESSAGE
+                        connection.close_connection()
+                        continue
+                
+                    # Update the state message to allow the presenter to display this
+                    # message on the next page load. Views that play on their
+                    # own also get the response itself
+                    function_parameters[ IH.VIEW_PARAM_STATE_MESSAGE ] = GL.describe_player_attack( attack, response )
+                    function_parameters[ IH.VIEW_PARAM_RESPONSE ] = response
+
+                    # If the result of the attack ended the opponenet
+                    # close the connection
+                    if response[ IH.VIEW_PARAM_WIN ]:
+                        connection.close_connection()
+
+                    turn = oppenent_type
+
+                    if recorder is not None:
+                        recorder.record_attack( turn )
+
+                else:
+                    # We are only in an error state if the
+                    # user attempted to attack a coordinate
+                    # that has already been hit. Allow the user
+                    # to keep inputting until they get it right
+                    function_parameters[ IH.VIEW_PARAM_IS_ERROR_STATE ] = True
+
+    except GS.SnapshotError as error:
+        engine.forfeit( oppenent_type )
+        function_parameters[ IH.VIEW_PARAM_STATE_MESSAGE ] = str( error )
+        connection.close_connection()
+
+    # Once the Game is over, display the game over page
+    # and indicate if you won the game
+    function_parameters[ IH.VIEW_PARAM_WIN ] = engine.get_winner() == player_type
+    presenter.trigger_view_event( IH.GameEventType.GAME_EVENT_GAME_END, function_parameters )
+    dump_latency( options, connection, player_type )
+
+    if move_log is not None:
+        move_log.close()
+
+    # A game that is over can not be resumed
+    if recorder is not None:
+        recorder.remove()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main( parse_arguments() )
\ No newline at end of file
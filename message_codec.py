@@ -0,0 +1,227 @@
+'''
+Module: message_codec.py
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Description: This module implements the codecs that convert the messages sent
+             between two instances of the game to bytes and back. JSON can
+             encode any message and is easy to read while debugging. The
+             binary codec packs the attack and response messages that are sent
+             every turn into three bytes each, and falls back to JSON for any
+             other message
+
+Inputs: Messages to encode, bytes to decode
+Outputs: Encoded messages, decoded messages
+'''
+
+################################################################################
+# Imports
+################################################################################
+import interfaces.interface_headers as IH
+
+import json
+import struct
+
+################################################################################
+# Global Variables
+################################################################################
+CODEC_JSON = "json"
+CODEC_BINARY = "binary"
+
+# The first byte of every binary message says how the rest of
+# the message is packed
+BINARY_TAG_JSON = 0
+BINARY_TAG_ATTACK = 1
+BINARY_TAG_WIDE_ATTACK = 2
+BINARY_TAG_RESPONSE = 3
+
+# Attacks on boards with more than 256 rows or columns do not fit
+# in a byte per coordinate, so they use the wide format
+ATTACK_STRUCT = struct.Struct( "!BBB" )
+WIDE_ATTACK_STRUCT = struct.Struct( "!BHH" )
+RESPONSE_STRUCT = struct.Struct( "!BBB" )
+MAX_NARROW_COORD = 0xFF
+
+# Layout of the flags byte of a response. The lowest two bits
+# hold the state of the cell that was attacked
+RESPONSE_STATE_MASK = 0x03
+RESPONSE_WIN_FLAG = 0x04
+RESPONSE_SHIP_SUNK_FLAG = 0x08
+
+# Keys of the messages that have a binary format
+ATTACK_KEYS = { IH.VIEW_PARAM_ROW, IH.VIEW_PARAM_COL }
+RESPONSE_KEYS = { IH.GAME_COORD_TYPE_STATE_INDEX, IH.VIEW_PARAM_WIN, IH.VIEW_PARAM_SHIP_SUNK, IH.VIEW_PARAM_SIZE }
+
+################################################################################
+# Types
+################################################################################
+class BoardMismatchError( ConnectionError ):
+    """
+    Description: This error is raised when the other side of a connection
+                 plays on a board of different dimensions, so their moves
+                 would not refer to the same cells
+    """
+
+class JsonMessageCodec:
+    """
+    Description: This codec encodes every message as JSON
+    """
+    name = CODEC_JSON
+
+    def encode( self, message : dict ) -> bytes:
+        """
+        Function: Encode
+
+        Inputs: The message to send
+        Outputs: The encoded message
+        """
+        return json.dumps( message ).encode()
+
+    def decode( self, data : bytes ) -> dict:
+        """
+        Function: Decode
+
+        Inputs: The received bytes
+        Outputs: The decoded message
+        """
+        return json.loads( data )
+
+class BinaryMessageCodec:
+    """
+    Description: This codec packs the attack and response messages with struct
+                 and encodes any other message as JSON behind a tag byte
+    """
+    name = CODEC_BINARY
+
+    def encode( self, message : dict ) -> bytes:
+        """
+        Function: Encode
+
+        Inputs: The message to send
+        Outputs: The encoded message
+        """
+        keys = message.keys()
+
+        if keys == ATTACK_KEYS:
+            row = message[ IH.VIEW_PARAM_ROW ]
+            col = message[ IH.VIEW_PARAM_COL ]
+
+            if row <= MAX_NARROW_COORD and col <= MAX_NARROW_COORD:
+                return ATTACK_STRUCT.pack( BINARY_TAG_ATTACK, row, col )
+
+            return WIDE_ATTACK_STRUCT.pack( BINARY_TAG_WIDE_ATTACK, row, col )
+
+        if keys == RESPONSE_KEYS:
+            flags = message[ IH.GAME_COORD_TYPE_STATE_INDEX ] & RESPONSE_STATE_MASK
+
+            if message[ IH.VIEW_PARAM_WIN ]:
+                flags |= RESPONSE_WIN_FLAG
+
+            if message[ IH.VIEW_PARAM_SHIP_SUNK ]:
+                flags |= RESPONSE_SHIP_SUNK_FLAG
+
+            return RESPONSE_STRUCT.pack( BINARY_TAG_RESPONSE, flags, message[ IH.VIEW_PARAM_SIZE ] )
+
+        return bytes( ( BINARY_TAG_JSON, ) ) + json.dumps( message ).encode()
+
+    def decode( self, data : bytes ) -> dict:
+        """
+        Function: Decode
+
+        Inputs: The received bytes
+        Outputs: The decoded message
+
+        Description: Raises a ValueError for bytes that are not a message, the
+                     same as the JSON codec does
+        """
+        try:
+            tag = data[ 0 ]
+
+            if tag == BINARY_TAG_ATTACK:
+                _, row, col = ATTACK_STRUCT.unpack( data )
+                return { IH.VIEW_PARAM_ROW : row, IH.VIEW_PARAM_COL : col }
+
+            if tag == BINARY_TAG_WIDE_ATTACK:
+                _, row, col = WIDE_ATTACK_STRUCT.unpack( data )
+                return { IH.VIEW_PARAM_ROW : row, IH.VIEW_PARAM_COL : col }
+
+            if tag == BINARY_TAG_RESPONSE:
+                _, flags, size = RESPONSE_STRUCT.unpack( data )
+                return { IH.GAME_COORD_TYPE_STATE_INDEX : flags & RESPONSE_STATE_MASK,
+                         IH.VIEW_PARAM_WIN : bool( flags & RESPONSE_WIN_FLAG ),
+                         IH.VIEW_PARAM_SHIP_SUNK : bool( flags & RESPONSE_SHIP_SUNK_FLAG ),
+                         IH.VIEW_PARAM_SIZE : size }
+
+        except ( IndexError, struct.error ) as error:
+            raise ValueError( f"A binary message of { len( data ) } bytes can not be decoded" ) from error
+
+        if tag == BINARY_TAG_JSON:
+            return json.loads( data[ 1 : ] )
+
+        raise ValueError( f"Unknown binary message tag { tag }" )
+
+# Mapping between the codec names that can be negotiated and
+# the implementations of the codecs
+CODEC_NAME_TO_CLASS = { CODEC_JSON : JsonMessageCodec,
+                        CODEC_BINARY : BinaryMessageCodec }
+DEFAULT_CODEC = CODEC_BINARY
+
+################################################################################
+# Procedures
+################################################################################
+def get_offered_codecs( preferred_codec : str ) -> list[ str ]:
+    """
+    Function: Get Offered Codecs
+
+    Inputs: The codec that is preferred
+    Outputs: The codecs to offer during negotiation, in order of preference
+
+    Description: JSON is always offered last so that two instances can
+                 always agree on a codec
+    """
+    return [ preferred_codec ] if preferred_codec == CODEC_JSON else [ preferred_codec, CODEC_JSON ]
+
+def select_codec( offered_codecs : list[ str ], preferred_codec : str ) -> str:
+    """
+    Function: Select Codec
+
+    Inputs: The codecs offered by the other instance, the codec that is preferred
+    Outputs: The codec both instances will use
+
+    Description: The first offered codec that this instance is also willing
+                 to use is selected
+    """
+    accepted_codecs = get_offered_codecs( preferred_codec )
+
+    for codec in offered_codecs:
+        if codec in accepted_codecs:
+            return codec
+
+    return CODEC_JSON
+
+def get_board_dimensions() -> dict:
+    """
+    Function: Get Board Dimensions
+
+    Inputs: None
+    Outputs: The board dimensions of this instance, to send along with the codec negotiation
+    """
+    return { IH.VIEW_PARAM_ROWS : IH.NUMBER_OF_ROWS, IH.VIEW_PARAM_COLS : IH.NUMBER_OF_COLS }
+
+def check_board_dimensions( message : dict ) -> None:
+    """
+    Function: Check Board Dimensions
+
+    Inputs: A negotiation message from the other side of a connection
+    Outputs: None
+
+    Description: Raises a BoardMismatchError if the other side plays on a
+                 board of different dimensions, or did not send them
+    """
+    rows = message.get( IH.VIEW_PARAM_ROWS )
+    cols = message.get( IH.VIEW_PARAM_COLS )
+
+    if rows != IH.NUMBER_OF_ROWS or cols != IH.NUMBER_OF_COLS:
+        raise BoardMismatchError( f"The other side plays on a { rows }x{ cols } board, but this game is { IH.NUMBER_OF_ROWS }x{ IH.NUMBER_OF_COLS }. "
+                                  f"Start both with the same --rows and --cols" )
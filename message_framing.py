@@ -0,0 +1,212 @@
+'''
+Module: message_framing.py
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Description: This module implements the framing of the messages that are sent
+             between two instances of the game. A stream socket does not keep
+             the boundaries of the messages that are sent on it, so every
+             message is prefixed with its length. The receiving side collects
+             the bytes it receives in a buffer and only hands out complete
+             messages
+
+Inputs: Messages to frame, bytes received from a socket
+Outputs: Framed messages, complete messages
+'''
+
+################################################################################
+# Imports
+################################################################################
+import socket
+import struct
+
+################################################################################
+# Global Variables
+################################################################################
+
+# Every frame starts with the length of the message as an
+# unsigned 32 bit integer in network byte order
+FRAME_HEADER = struct.Struct( "!I" )
+
+# Maximum amount of bytes that are read from a socket at once
+RECEIVE_SIZE = 65536
+
+# Flag that makes a single receive return right away if there is
+# nothing to read. It is not available on every platform
+NON_BLOCKING_RECEIVE_FLAG = getattr( socket, "MSG_DONTWAIT", 0 )
+
+################################################################################
+# Types
+################################################################################
+class FrameBuffer:
+    """
+    Description: This is the reassembly buffer for the frames of a single
+                 connection. Bytes can be added as they are received, and
+                 complete frames are taken out in the order they were sent
+    """
+    def __init__( self ) -> None:
+        """
+        Function: Initialization
+
+        Inputs: None
+        Outputs: None
+        """
+        self._buffer = bytearray()
+        self._offset = 0
+
+    def feed( self, data : bytes ) -> None:
+        """
+        Function: Feed
+
+        Inputs: Bytes received from the connection
+        Outputs: None
+        """
+        self._buffer += data
+
+    def next_frame( self ) -> bytes:
+        """
+        Function: Next Frame
+
+        Inputs: None
+        Outputs: The next complete message, None if there is not one yet
+        """
+        available = len( self._buffer ) - self._offset
+        if available < FRAME_HEADER.size:
+            return None
+
+        ( length, ) = FRAME_HEADER.unpack_from( self._buffer, self._offset )
+        if available < FRAME_HEADER.size + length:
+            return None
+
+        start = self._offset + FRAME_HEADER.size
+        frame = bytes( self._buffer[ start : start + length ] )
+        self._offset = start + length
+
+        # Drop the bytes that were already handed out once they
+        # make up most of the buffer, so the buffer does not grow
+        # without bound and we do not copy on every frame
+        if self._offset * 2 >= len( self._buffer ):
+            del self._buffer[ : self._offset ]
+            self._offset = 0
+
+        return frame
+
+    def take_remaining( self ) -> bytes:
+        """
+        Function: Take Remaining
+
+        Inputs: None
+        Outputs: The bytes that were received after the last complete frame
+
+        Description: This is used when a connection stops sending frames,
+                     and the buffer is empty afterwards
+        """
+        remaining = bytes( self._buffer[ self._offset : ] )
+        self._buffer = bytearray()
+        self._offset = 0
+
+        return remaining
+
+################################################################################
+# Procedures
+################################################################################
+def encode_frame( payload : bytes ) -> bytes:
+    """
+    Function: Encode Frame
+
+    Inputs: The message to send
+    Outputs: The message prefixed with its length
+    """
+    return FRAME_HEADER.pack( len( payload ) ) + payload
+
+def send_frame( connection_socket : socket.socket, payload : bytes ) -> None:
+    """
+    Function: Send Frame
+
+    Inputs: The socket to send on, the message to send
+    Outputs: None
+
+    Description: Sends the complete frame. sendall keeps sending until every
+                 byte was accepted by the socket
+    """
+    connection_socket.sendall( encode_frame( payload ) )
+
+def receive_frame( connection_socket : socket.socket, frame_buffer : FrameBuffer ) -> bytes:
+    """
+    Function: Receive Frame
+
+    Inputs: The socket to receive on, the reassembly buffer of the connection
+    Outputs: The next complete message
+
+    Description: Blocks until a complete message is in the buffer. Any bytes
+                 of the following messages stay in the buffer for the next call
+    """
+    while True:
+        frame = frame_buffer.next_frame()
+        if frame is not None:
+            return frame
+
+        data = connection_socket.recv( RECEIVE_SIZE )
+
+        # A socket that returns no data was closed by the other side
+        if not data:
+            raise ConnectionError( "The connection was closed by the other player" )
+
+        frame_buffer.feed( data )
+
+def receive_available_frame( connection_socket : socket.socket, frame_buffer : FrameBuffer ) -> bytes:
+    """
+    Function: Receive Available Frame
+
+    Inputs: The socket to receive on, the reassembly buffer of the connection
+    Outputs: The next complete message, None if it has not fully arrived
+
+    Description: Never blocks. Bytes that are already waiting on the socket
+                 are added to the buffer before looking for a message
+    """
+    frame = frame_buffer.next_frame()
+    if frame is not None:
+        return frame
+
+    data = receive_available( connection_socket )
+    if data is None:
+        return None
+
+    frame_buffer.feed( data )
+
+    return frame_buffer.next_frame()
+
+def receive_available( connection_socket : socket.socket ) -> bytes:
+    """
+    Function: Receive Available
+
+    Inputs: The socket to receive on
+    Outputs: The bytes that are waiting on the socket, None if there are none
+
+    Description: Never blocks
+    """
+    try:
+        if NON_BLOCKING_RECEIVE_FLAG:
+            data = connection_socket.recv( RECEIVE_SIZE, NON_BLOCKING_RECEIVE_FLAG )
+
+        else:
+            # Platforms without the flag make the socket non blocking
+            # for the duration of the call instead
+            timeout = connection_socket.gettimeout()
+            connection_socket.settimeout( 0.0 )
+
+            try:
+                data = connection_socket.recv( RECEIVE_SIZE )
+
+            finally:
+                connection_socket.settimeout( timeout )
+
+    except BlockingIOError:
+        return None
+
+    # A socket that returns no data was closed by the other side
+    if not data:
+        raise ConnectionError( "The connection was closed by the other player" )
+
+    return data
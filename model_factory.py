@@ -0,0 +1,56 @@
+'''
+Module: model_factory.py
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Inputs: Name of a model implementation
+Outputs: Instance of the model
+
+Description: This module maps the names of the model implementations that can
+             be selected at startup to the implementations of the model
+             interface, so that every entry point selects models the same way
+'''
+################################################################################
+# Imports
+################################################################################
+import game_model as GM
+import game_model_bitboard as GMB
+
+from interfaces import interface_game_model as IGM
+
+################################################################################
+# Global Variables
+################################################################################
+
+# Mapping between the model names that can be selected at startup
+# and the implementations of the model interface
+MODEL_TYPE_TO_CLASS = { "list" : GM.GameModel,
+                        "bitboard" : GMB.BitboardGameModel }
+DEFAULT_MODEL_TYPE = "list"
+
+# The numpy model is only imported when it is selected so that
+# numpy stays an optional dependency for the large grid variant
+NUMPY_MODEL_TYPE = "numpy"
+
+# Every model name that can be selected
+MODEL_TYPES = [ *MODEL_TYPE_TO_CLASS.keys(), NUMPY_MODEL_TYPE ]
+
+################################################################################
+# Procedures
+################################################################################
+def create_model( model_type : str ) -> IGM.GameModelInterface:
+    """
+    Function: Create Model
+
+    Inputs: The name of the model implementation
+    Output: Instance of the model
+
+    Description: This is a helper function that creates the model that
+                 was selected at startup
+    """
+    if model_type == NUMPY_MODEL_TYPE:
+        import game_model_numpy as GMN
+        return GMN.NumpyGameModel()
+
+    return MODEL_TYPE_TO_CLASS[ model_type ]()
@@ -0,0 +1,445 @@
+'''
+Module: move_log.py
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Inputs: Placements and attacks of played games
+Outputs: An append-only log of the moves, the state of a game at any turn
+
+Description: This module writes every placement and attack of a game to an
+             append-only binary log. Every record has the same size, so a log
+             is read by mapping it into memory and slicing it, without parsing
+             anything. A single field of every record can be read as one
+             strided slice of the log, which lets the analytics scan millions
+             of games in seconds. A game starts with a record that holds the
+             size of its board, and any game can be replayed onto a model up
+             to any turn
+
+             A buffered writer collects the records of a game and writes them
+             with a single write to a file that is opened for appending, so
+             several processes can write whole games to the same log without
+             mixing their records. The game and the simulator both buffer
+'''
+################################################################################
+# Imports
+################################################################################
+import game_engine as GE
+import game_snapshot as GS
+import model_factory as MF
+
+from interfaces import interface_headers as IH
+
+import mmap
+import os
+import struct
+import time
+
+################################################################################
+# Global Variables
+################################################################################
+
+# Every record is the kind of the record, the player, the row and
+# the column, the size of a ship, the flags of the record and the
+# time it was written in nanoseconds since the epoch
+RECORD_STRUCT = struct.Struct( "<BBHHBBQ" )
+RECORD_SIZE = RECORD_STRUCT.size
+
+# Offsets of the fields of a record that are a single byte, which
+# can be read for every record as a strided slice
+KIND_OFFSET = 0
+PLAYER_OFFSET = 1
+SIZE_OFFSET = 6
+FLAGS_OFFSET = 7
+
+# Indexes of the fields of an unpacked record
+RECORD_KIND_INDEX = 0
+RECORD_PLAYER_INDEX = 1
+RECORD_ROW_INDEX = 2
+RECORD_COL_INDEX = 3
+RECORD_SIZE_INDEX = 4
+RECORD_FLAGS_INDEX = 5
+RECORD_TIME_INDEX = 6
+
+# Kinds of the records. A game record starts a game, with the
+# rows and columns of its board in place of the coordinate, the
+# player that wrote the log and the number of ships. A placement
+# record is the bow of a ship that was placed on the board of the
+# player. An attack record is an attack on the board of the player
+# along with its result
+RECORD_GAME = 1
+RECORD_PLACEMENT = 2
+RECORD_ATTACK = 3
+
+# Flags of a game record. A log that holds the placements of both
+# players sets the flag, otherwise only the ships of the player
+# that wrote the log are known
+GAME_FLAG_ALL_BOARDS = 0x01
+
+# Flags of a placement record
+PLACEMENT_FLAG_VERTICAL = 0x01
+
+# Flags of an attack record
+ATTACK_FLAG_HIT = 0x01
+ATTACK_FLAG_SUNK = 0x02
+ATTACK_FLAG_WIN = 0x04
+ATTACK_FLAG_LIMIT = ATTACK_FLAG_WIN << 1
+
+# Turns the column of the kinds into a mask of the attack records
+ATTACK_MASK_TABLE = bytes( 0xFF if kind == RECORD_ATTACK else 0 for kind in range( 256 ) )
+
+# Environment variable with the path of the log of the game
+ENV_MOVE_LOG = "BATTLESHIP_MOVE_LOG"
+
+# Values that are written for the players and the hit state. The
+# values are looked up once, since reading the value of an enum
+# costs more than writing the whole record
+HOST_VALUE = IH.PlayerTypeEnum.PLAYER_TYPE_HOST.value
+JOIN_VALUE = IH.PlayerTypeEnum.PLAYER_TYPE_JOIN.value
+HIT_STATE_VALUE = IH.CoordStateType.COORD_STATE_HIT.value
+
+# Amount of bytes a buffered writer collects before it writes them
+FLUSH_SIZE = 1 << 20
+
+################################################################################
+# Types
+################################################################################
+class MoveLogWriter:
+    def __init__( self, path : str, buffered : bool = False ) -> None:
+        """
+        Function: Initialization
+
+        Inputs: The path of the log, if the records are collected until the end of a game
+        Outputs: None
+
+        Description: An unbuffered writer writes every record as it happens, so
+                     it needs a log of its own. A buffered writer writes whole
+                     games at once, between games and when it is closed, so
+                     a game that is never finished is not written
+        """
+        self._fd = os.open( path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr( os, "O_BINARY", 0 ), 0o644 )
+        self._buffered = buffered
+        self._buffer = bytearray()
+
+    def _append( self, kind : int, player : int, row : int, col : int, size : int, flags : int ) -> None:
+        """
+        Function: Append
+
+        Inputs: The fields of a record
+        Outputs: None
+        """
+        self._buffer += RECORD_STRUCT.pack( kind, player, row, col, size, flags, time.time_ns() )
+
+        if not self._buffered:
+            self.flush()
+
+    def start_game( self, player_type : IH.PlayerTypeEnum, number_of_ships : int, all_boards : bool = False ) -> None:
+        """
+        Function: Start Game
+
+        Inputs: The player that writes the log, the number of ships, if the placements of both players are logged
+        Outputs: None
+
+        Description: The board of the game is the board that is currently set
+                     in the interface headers
+        """
+        # Whole games are written at once, so the records of games
+        # that are written by other processes can not end up in
+        # the middle of a game
+        if len( self._buffer ) >= FLUSH_SIZE:
+            self.flush()
+
+        self._append( RECORD_GAME, get_player_value( player_type ), IH.NUMBER_OF_ROWS, IH.NUMBER_OF_COLS, number_of_ships,
+                      GAME_FLAG_ALL_BOARDS if all_boards else 0 )
+
+    def start_restored_game( self, player_type : IH.PlayerTypeEnum, model ) -> None:
+        """
+        Function: Start Restored Game
+
+        Inputs: The player that writes the log, a model that was restored from a snapshot
+        Outputs: None
+
+        Description: The moves before a snapshot are lost along with the game
+                     that saved it, so a resumed game starts a new game in the
+                     log. It holds the ships of the player and every cell that
+                     was attacked on either board. The order of those attacks
+                     is not known, so they are written in the order of the cells
+        """
+        ship_masks, _, _ = model.get_board_masks( player_type )
+        self.start_game( player_type, len( ship_masks ) )
+
+        # The cells of a ship are in order, and a ship extends from
+        # its bow towards the first row or column
+        for size, mask in sorted( ship_masks.items() ):
+            cells = GS.get_mask_cells( mask )
+            vertical = len( cells ) > 1 and cells[ 0 ][ IH.COLUMN_INDEX ] == cells[ -1 ][ IH.COLUMN_INDEX ]
+            self.log_placement( player_type, cells[ -1 ], GE.DIRECTION_VERTICAL if vertical else GE.DIRECTION_HORIZONTAL, size )
+
+        for board in GS.SNAPSHOT_BOARDS:
+            _, hit_mask, miss_mask = model.get_board_masks( board )
+
+            for mask, state in ( ( hit_mask, IH.CoordStateType.COORD_STATE_HIT ), ( miss_mask, IH.CoordStateType.COORD_STATE_MISS ) ):
+                for coord in GS.get_mask_cells( mask ):
+                    self.log_attack( board, coord, { IH.GAME_COORD_TYPE_STATE_INDEX : state.value, IH.VIEW_PARAM_WIN : False,
+                                                     IH.VIEW_PARAM_SHIP_SUNK : False, IH.VIEW_PARAM_SIZE : 0 } )
+
+    def log_placement( self, player_type : IH.PlayerTypeEnum, bow : IH.SystemCoordType, direction : str, size : int ) -> None:
+        """
+        Function: Log Placement
+
+        Inputs: The player's board, the system coordinate of the bow, the direction, the size of the ship
+        Outputs: None
+        """
+        self._append( RECORD_PLACEMENT, get_player_value( player_type ), bow[ IH.ROW_INDEX ], bow[ IH.COLUMN_INDEX ], size,
+                      PLACEMENT_FLAG_VERTICAL if direction == GE.DIRECTION_VERTICAL else 0 )
+
+    def log_attack( self, player_type : IH.PlayerTypeEnum, coord : IH.SystemCoordType, response : dict ) -> None:
+        """
+        Function: Log Attack
+
+        Inputs: The board that was attacked, the coordinate of the attack, the response to the attack
+        Outputs: None
+        """
+        flags = 0
+        state = response[ IH.GAME_COORD_TYPE_STATE_INDEX ]
+
+        if state == HIT_STATE_VALUE or state is IH.CoordStateType.COORD_STATE_HIT:
+            flags |= ATTACK_FLAG_HIT
+
+        if response.get( IH.VIEW_PARAM_SHIP_SUNK ):
+            flags |= ATTACK_FLAG_SUNK
+
+        if response[ IH.VIEW_PARAM_WIN ]:
+            flags |= ATTACK_FLAG_WIN
+
+        self._append( RECORD_ATTACK, get_player_value( player_type ), coord[ IH.ROW_INDEX ], coord[ IH.COLUMN_INDEX ],
+                      response[ IH.VIEW_PARAM_SIZE ], flags )
+
+    def flush( self ) -> None:
+        """
+        Function: Flush
+
+        Inputs: None
+        Outputs: None
+        """
+        written = 0
+
+        with memoryview( self._buffer ) as data:
+            while written < len( data ):
+                written += os.write( self._fd, data[ written: ] )
+
+        self._buffer.clear()
+
+    def close( self ) -> None:
+        """
+        Function: Close
+
+        Inputs: None
+        Outputs: None
+        """
+        if self._fd is not None:
+            self.flush()
+            os.close( self._fd )
+            self._fd = None
+
+class MoveLogReader:
+    def __init__( self, path : str ) -> None:
+        """
+        Function: Initialization
+
+        Inputs: The path of the log
+        Outputs: None
+
+        Description: The log is mapped into memory. A record that was only
+                     partly written when a game crashed is not read
+        """
+        self._mapping : mmap.mmap = None
+        self._games : list[ int ] = None
+        self.number_of_records = 0
+
+        with open( path, "rb" ) as log_file:
+            size = os.fstat( log_file.fileno() ).st_size
+
+            # An empty file can not be mapped
+            if size >= RECORD_SIZE:
+                self._mapping = mmap.mmap( log_file.fileno(), 0, access=mmap.ACCESS_READ )
+                self.number_of_records = size // RECORD_SIZE
+
+    def close( self ) -> None:
+        """
+        Function: Close
+
+        Inputs: None
+        Outputs: None
+        """
+        if self._mapping is not None:
+            self._mapping.close()
+            self._mapping = None
+
+    def get_record( self, index : int ) -> tuple:
+        """
+        Function: Get Record
+
+        Inputs: The index of a record
+        Outputs: The fields of the record
+        """
+        return RECORD_STRUCT.unpack_from( self._mapping, index * RECORD_SIZE )
+
+    def iter_records( self, start : int = 0, stop : int = None ):
+        """
+        Function: Iterate Records
+
+        Inputs: The index of the first record, the index after the last record, defaults to the end of the log
+        Outputs: Yields the fields of every record
+        """
+        stop = self.number_of_records if stop is None else min( stop, self.number_of_records )
+
+        if start >= stop:
+            return
+
+        with memoryview( self._mapping ) as view:
+            yield from RECORD_STRUCT.iter_unpack( view[ start * RECORD_SIZE : stop * RECORD_SIZE ] )
+
+    def get_column( self, offset : int ) -> bytes:
+        """
+        Function: Get Column
+
+        Inputs: The offset of a field of a single byte
+        Outputs: The field of every record, one byte per record
+        """
+        if self._mapping is None:
+            return b""
+
+        return self._mapping[ offset : self.number_of_records * RECORD_SIZE : RECORD_SIZE ]
+
+    def get_games( self ) -> list[ int ]:
+        """
+        Function: Get Games
+
+        Inputs: None
+        Outputs: The index of the game record of every game
+
+        Description: The game records are found in the column of the kinds,
+                     and are only looked up once
+        """
+        if self._games is None:
+            kinds = self.get_column( KIND_OFFSET )
+            marker = bytes( [ RECORD_GAME ] )
+            self._games = list()
+
+            index = kinds.find( marker )
+            while index >= 0:
+                self._games.append( index )
+                index = kinds.find( marker, index + 1 )
+
+        return self._games
+
+    def get_game_records( self, game_index : int ) -> tuple[ int, int ]:
+        """
+        Function: Get Game Records
+
+        Inputs: The index of a game
+        Outputs: The index of the game record and the index after the last record of the game
+        """
+        games = self.get_games()
+        start = games[ game_index ]
+        stop = games[ game_index + 1 ] if game_index + 1 < len( games ) else self.number_of_records
+
+        return start, stop
+
+################################################################################
+# Procedures
+################################################################################
+def get_player_value( player_type : IH.PlayerTypeEnum ) -> int:
+    """
+    Function: Get Player Value
+
+    Inputs: Type of a player
+    Outputs: The value that is written for the player
+    """
+    return JOIN_VALUE if player_type is IH.PlayerTypeEnum.PLAYER_TYPE_JOIN else HOST_VALUE
+
+def get_response( record : tuple ) -> dict:
+    """
+    Function: Get Response
+
+    Inputs: The fields of an attack record
+    Outputs: The response to the attack
+    """
+    flags = record[ RECORD_FLAGS_INDEX ]
+    state = IH.CoordStateType.COORD_STATE_HIT if flags & ATTACK_FLAG_HIT else IH.CoordStateType.COORD_STATE_MISS
+
+    return { IH.GAME_COORD_TYPE_STATE_INDEX : state.value,
+             IH.VIEW_PARAM_WIN : bool( flags & ATTACK_FLAG_WIN ),
+             IH.VIEW_PARAM_SHIP_SUNK : bool( flags & ATTACK_FLAG_SUNK ),
+             IH.VIEW_PARAM_SIZE : record[ RECORD_SIZE_INDEX ] }
+
+def replay_game( reader : MoveLogReader, game_index : int, turn : int = None,
+                 model_type : str = MF.DEFAULT_MODEL_TYPE ) -> tuple[ GE.GameEngine, tuple ]:
+    """
+    Function: Replay Game
+
+    Inputs: The log, the index of the game, the number of attacks to replay, defaults to every attack, the model name
+    Outputs: The engine with the game replayed onto a new model, the game record
+
+    Description: The board of the game becomes the board that is set in the
+                 interface headers. Attacks are recorded with the result that
+                 was logged, so a board whose ships are not in the log still
+                 shows its hits and misses
+    """
+    start, stop = reader.get_game_records( game_index )
+    game = reader.get_record( start )
+
+    IH.set_board_dimensions( game[ RECORD_ROW_INDEX ], game[ RECORD_COL_INDEX ] )
+    engine = GE.GameEngine( MF.create_model( model_type ) )
+    attacks = 0
+
+    for record in reader.iter_records( start + 1, stop ):
+        kind = record[ RECORD_KIND_INDEX ]
+        player_type = IH.PlayerTypeEnum( record[ RECORD_PLAYER_INDEX ] )
+        coord = ( record[ RECORD_ROW_INDEX ], record[ RECORD_COL_INDEX ] )
+
+        if kind == RECORD_PLACEMENT:
+            direction = GE.DIRECTION_VERTICAL if record[ RECORD_FLAGS_INDEX ] & PLACEMENT_FLAG_VERTICAL else GE.DIRECTION_HORIZONTAL
+            engine.place_ship( player_type, coord, direction, record[ RECORD_SIZE_INDEX ] )
+
+        elif kind == RECORD_ATTACK:
+            if turn is not None and attacks >= turn:
+                break
+
+            engine.record_attack_result( player_type, coord, get_response( record ) )
+            attacks += 1
+
+    return engine, game
+
+def get_log_stats( reader : MoveLogReader ) -> dict:
+    """
+    Function: Get Log Statistics
+
+    Inputs: The log
+    Outputs: Aggregates of every game in the log
+
+    Description: The statistics are counted on the columns of the log, so
+                 no record is unpacked
+    """
+    kinds = reader.get_column( KIND_OFFSET )
+    flags = reader.get_column( FLAGS_OFFSET )
+
+    # Keep the flags of the attacks only, every other record becomes
+    # a zero byte. The columns are combined as two large integers
+    attack_mask = kinds.translate( ATTACK_MASK_TABLE )
+    attack_flags = ( int.from_bytes( attack_mask, "little" ) & int.from_bytes( flags, "little" ) ).to_bytes( len( flags ), "little" )
+    flag_counts = { value : attack_flags.count( value ) for value in range( ATTACK_FLAG_LIMIT ) }
+
+    games = kinds.count( RECORD_GAME )
+    attacks = kinds.count( RECORD_ATTACK )
+    hits = sum( count for value, count in flag_counts.items() if value & ATTACK_FLAG_HIT )
+
+    return { "records" : reader.number_of_records,
+             "games" : games,
+             "placements" : kinds.count( RECORD_PLACEMENT ),
+             "attacks" : attacks,
+             "hits" : hits,
+             "wins" : sum( count for value, count in flag_counts.items() if value & ATTACK_FLAG_WIN ),
+             "hit_rate" : hits / attacks if attacks else 0.0,
+             "mean_attacks_per_game" : attacks / games if games else 0.0 }
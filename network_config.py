@@ -0,0 +1,451 @@
+'''
+Module: network_config.py
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Inputs: Command line options and environment variables
+Outputs: The address and socket options of a network interaction
+
+Description: This module holds the settings of the sockets that are used by
+             the host, the joining player and the game server. Every setting
+             can be given on the command line, or in an environment variable
+             so that deployments do not need to change how the game is
+             started. The listening socket reuses its address, so a host can
+             be restarted right after a game, and any number of hosts can run
+             on one machine as long as they listen on different ports.
+             Players on the same machine can meet on a Unix domain socket
+             instead of TCP, which skips the loopback network stack
+'''
+################################################################################
+# Imports
+################################################################################
+import argparse
+import errno
+import os
+import socket
+import stat
+import tempfile
+
+# File locks tell if a host still listens on a Unix domain socket.
+# Without them a socket path that was left behind is never removed
+try:
+    import fcntl
+
+except ImportError:
+    fcntl = None
+
+################################################################################
+# Global Variables
+################################################################################
+
+# The host and the joining player meet on this port unless
+# another one is configured
+DEFAULT_PORT = 5014
+
+# A host only plays against a single opponent
+DEFAULT_BACKLOG = 1
+
+# Transports the players can meet on. The Unix domain socket and the
+# shared memory transports only reach players on the same machine,
+# and the shared memory transport meets on a Unix domain socket
+TRANSPORT_TCP = "tcp"
+TRANSPORT_UNIX = "unix"
+TRANSPORT_SHARED_MEMORY = "shm"
+TRANSPORTS = ( TRANSPORT_TCP, TRANSPORT_UNIX, TRANSPORT_SHARED_MEMORY )
+DEFAULT_TRANSPORT = TRANSPORT_TCP
+
+# Families of the sockets that the TCP options apply to
+TCP_FAMILIES = ( socket.AF_INET, socket.AF_INET6 )
+
+# Names of the environment variables of every setting
+ENV_HOST = "BATTLESHIP_HOST"
+ENV_PORT = "BATTLESHIP_PORT"
+ENV_BACKLOG = "BATTLESHIP_BACKLOG"
+ENV_REUSE_ADDRESS = "BATTLESHIP_REUSEADDR"
+ENV_NO_DELAY = "BATTLESHIP_NODELAY"
+ENV_KEEP_ALIVE = "BATTLESHIP_KEEPALIVE"
+ENV_TRANSPORT = "BATTLESHIP_TRANSPORT"
+ENV_SOCKET_PATH = "BATTLESHIP_SOCKET_PATH"
+
+# Values of the environment variables that turn an option on or off
+TRUE_VALUES = { "1", "true", "yes", "on" }
+FALSE_VALUES = { "0", "false", "no", "off" }
+
+# A host locks the file with this suffix next to its Unix domain
+# socket for as long as it listens on the socket
+LOCK_FILE_SUFFIX = ".lock"
+
+# Paths of the Unix domain sockets that this process listens on, and
+# the lock files it holds for them, None where there are no file locks
+_listening_paths : dict[ str, int ] = dict()
+
+################################################################################
+# Types
+################################################################################
+class NetworkConfig:
+    """
+    Description: These are the address of a connection and the options of its
+                 sockets. The host is the address that a host or server listens
+                 on, or the address that a joining player connects to. None
+                 stands for the name of this machine. The socket path is the
+                 address of the transports that meet on a Unix domain socket,
+                 and None stands for a path in the temporary directory that
+                 is named after the port
+    """
+    __slots__ = ( "host", "port", "backlog", "reuse_address", "no_delay", "keep_alive", "transport", "socket_path" )
+
+    def __init__( self, host : str = None, port : int = DEFAULT_PORT, backlog : int = DEFAULT_BACKLOG,
+                  reuse_address : bool = True, no_delay : bool = True, keep_alive : bool = False,
+                  transport : str = DEFAULT_TRANSPORT, socket_path : str = None ) -> None:
+        """
+        Function: Initialization
+
+        Inputs: The address, the port, the backlog of the listening socket,
+                if the address is reused, if TCP_NODELAY and SO_KEEPALIVE are set,
+                the transport, the path of the Unix domain socket
+        Outputs: None
+        """
+        if transport not in TRANSPORTS:
+            raise ValueError( f"Expected one of { list( TRANSPORTS ) }, got { transport !r}" )
+
+        self.host = host
+        self.port = port
+        self.backlog = backlog
+        self.reuse_address = reuse_address
+        self.no_delay = no_delay
+        self.keep_alive = keep_alive
+        self.transport = transport
+        self.socket_path = socket_path
+
+    def get_host( self ) -> str:
+        """
+        Function: Get Host
+
+        Inputs: None
+        Outputs: The address to listen on or connect to
+        """
+        return socket.gethostname() if self.host is None else self.host
+
+    def uses_unix_socket( self ) -> bool:
+        """
+        Function: Uses Unix Socket
+
+        Inputs: None
+        Outputs: If the players meet on a Unix domain socket
+        """
+        return self.transport != TRANSPORT_TCP
+
+    def get_socket_path( self ) -> str:
+        """
+        Function: Get Socket Path
+
+        Inputs: None
+        Outputs: The path of the Unix domain socket to listen on or connect to
+        """
+        if self.socket_path is None:
+            return os.path.join( tempfile.gettempdir(), f"battleship-{ self.port }.sock" )
+
+        return self.socket_path
+
+################################################################################
+# Procedures
+################################################################################
+def parse_bool( value : str ) -> bool:
+    """
+    Function: Parse Bool
+
+    Inputs: The value of an environment variable
+    Outputs: If the value turns the option on
+    """
+    value = value.strip().lower()
+
+    if value in TRUE_VALUES:
+        return True
+
+    if value in FALSE_VALUES:
+        return False
+
+    raise ValueError( f"Expected one of { sorted( TRUE_VALUES | FALSE_VALUES ) }, got { value !r}" )
+
+def from_environment( defaults : NetworkConfig = None, environ : dict = None ) -> NetworkConfig:
+    """
+    Function: From Environment
+
+    Inputs: The settings to use for the variables that are not set, the environment, defaults to the environment of the process
+    Outputs: The settings with the environment applied
+    """
+    defaults = NetworkConfig() if defaults is None else defaults
+    environ = os.environ if environ is None else environ
+
+    return NetworkConfig( environ.get( ENV_HOST, defaults.host ),
+                          int( environ[ ENV_PORT ] ) if ENV_PORT in environ else defaults.port,
+                          int( environ[ ENV_BACKLOG ] ) if ENV_BACKLOG in environ else defaults.backlog,
+                          parse_bool( environ[ ENV_REUSE_ADDRESS ] ) if ENV_REUSE_ADDRESS in environ else defaults.reuse_address,
+                          parse_bool( environ[ ENV_NO_DELAY ] ) if ENV_NO_DELAY in environ else defaults.no_delay,
+                          parse_bool( environ[ ENV_KEEP_ALIVE ] ) if ENV_KEEP_ALIVE in environ else defaults.keep_alive,
+                          environ.get( ENV_TRANSPORT, defaults.transport ),
+                          environ.get( ENV_SOCKET_PATH, defaults.socket_path ) )
+
+def add_network_arguments( parser : argparse.ArgumentParser, defaults : NetworkConfig = None ) -> None:
+    """
+    Function: Add Network Arguments
+
+    Inputs: The parser of a program, the settings to use when neither an option nor an environment variable is given
+    Outputs: None
+
+    Description: The environment variables become the defaults of the
+                 options, so an option on the command line always wins
+    """
+    config = from_environment( defaults )
+
+    group = parser.add_argument_group( "network", "Every option can also be set with the environment variable in brackets" )
+    group.add_argument( "--host", default=config.host,
+                        help=f"Address to listen on, or of the host to connect to. Defaults to the name of this machine [{ ENV_HOST }]" )
+    group.add_argument( "--port", type=int, default=config.port,
+                        help=f"Port to listen on or connect to (default { config.port }) [{ ENV_PORT }]" )
+    group.add_argument( "--backlog", type=int, default=config.backlog,
+                        help=f"Backlog of the listening socket (default { config.backlog }) [{ ENV_BACKLOG }]" )
+    group.add_argument( "--reuseaddr", action=argparse.BooleanOptionalAction, default=config.reuse_address,
+                        help=f"Set SO_REUSEADDR on the listening socket, so it can be restarted right away [{ ENV_REUSE_ADDRESS }]" )
+    group.add_argument( "--nodelay", action=argparse.BooleanOptionalAction, default=config.no_delay,
+                        help=f"Set TCP_NODELAY, so small messages are sent without waiting for earlier ones to be acknowledged (default on) [{ ENV_NO_DELAY }]" )
+    group.add_argument( "--keepalive", action=argparse.BooleanOptionalAction, default=config.keep_alive,
+                        help=f"Set SO_KEEPALIVE, so an opponent that disappeared is noticed [{ ENV_KEEP_ALIVE }]" )
+    group.add_argument( "--transport", choices=TRANSPORTS, default=config.transport,
+                        help=f"Meet over TCP, over a Unix domain socket, or over a Unix domain socket that hands the messages over in shared memory. "
+                             f"The last two only reach players on the same machine (default { config.transport }) [{ ENV_TRANSPORT }]" )
+    group.add_argument( "--socket-path", default=config.socket_path,
+                        help=f"Path of the Unix domain socket. Defaults to a path in the temporary directory named after the port [{ ENV_SOCKET_PATH }]" )
+
+def from_arguments( options : argparse.Namespace ) -> NetworkConfig:
+    """
+    Function: From Arguments
+
+    Inputs: Options parsed by a parser that the network arguments were added to
+    Outputs: The settings that were selected
+    """
+    return NetworkConfig( options.host, options.port, options.backlog, options.reuseaddr, options.nodelay, options.keepalive,
+                          options.transport, options.socket_path )
+
+def apply_socket_options( sock : socket.socket, config : NetworkConfig ) -> None:
+    """
+    Function: Apply Socket Options
+
+    Inputs: A connected socket, the settings of the connection
+    Outputs: None
+
+    Description: The options are TCP options, so Unix domain sockets are left as they are
+    """
+    if sock.family not in TCP_FAMILIES:
+        return
+
+    if config.no_delay:
+        sock.setsockopt( socket.IPPROTO_TCP, socket.TCP_NODELAY, 1 )
+
+    if config.keep_alive:
+        sock.setsockopt( socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1 )
+
+def create_listening_socket( config : NetworkConfig ) -> socket.socket:
+    """
+    Function: Create Listening Socket
+
+    Inputs: The settings of the connection
+    Outputs: A socket that is bound to the address and listening
+    """
+    if config.uses_unix_socket():
+        return _create_listening_unix_socket( config )
+
+    listening_socket = socket.socket( socket.AF_INET, socket.SOCK_STREAM )
+
+    try:
+        # The address has to be reused before binding, otherwise the
+        # connections of the last game keep the port taken
+        if config.reuse_address:
+            listening_socket.setsockopt( socket.SOL_SOCKET, socket.SO_REUSEADDR, 1 )
+
+        listening_socket.bind( ( config.get_host(), config.port ) )
+        listening_socket.listen( config.backlog )
+
+    except OSError:
+        listening_socket.close()
+        raise
+
+    return listening_socket
+
+def create_connected_socket( config : NetworkConfig ) -> socket.socket:
+    """
+    Function: Create Connected Socket
+
+    Inputs: The settings of the connection
+    Outputs: A socket that is connected to the address
+
+    Description: A Unix domain socket that does not exist yet is refused
+                 like a port nobody listens on, so callers can wait for the
+                 host in the same way on every transport
+    """
+    if config.uses_unix_socket():
+        connected_socket = socket.socket( socket.AF_UNIX, socket.SOCK_STREAM )
+
+        try:
+            connected_socket.connect( config.get_socket_path() )
+
+        except FileNotFoundError as error:
+            connected_socket.close()
+            raise ConnectionRefusedError( errno.ECONNREFUSED, f"Nothing listens on { config.get_socket_path() }" ) from error
+
+        except OSError:
+            connected_socket.close()
+            raise
+
+        return connected_socket
+
+    connected_socket = socket.create_connection( ( config.get_host(), config.port ) )
+    apply_socket_options( connected_socket, config )
+
+    return connected_socket
+
+def close_listening_socket( listening_socket : socket.socket, config : NetworkConfig ) -> None:
+    """
+    Function: Close Listening Socket
+
+    Inputs: A socket made by create_listening_socket, the settings of the connection
+    Outputs: None
+    """
+    listening_socket.close()
+    remove_socket_path( config )
+
+def remove_socket_path( config : NetworkConfig ) -> None:
+    """
+    Function: Remove Socket Path
+
+    Inputs: The settings of the connection
+    Outputs: None
+
+    Description: A Unix domain socket leaves its path behind when it is
+                 closed. Only a path that this process listens on is removed,
+                 together with its lock file
+    """
+    if not config.uses_unix_socket():
+        return
+
+    path = config.get_socket_path()
+
+    if path not in _listening_paths:
+        return
+
+    _remove_socket_file( path )
+    _release_socket_path( path, _listening_paths.pop( path ) )
+
+def _remove_socket_file( path : str ) -> None:
+    """
+    Function: Remove Socket File
+
+    Inputs: The path of a Unix domain socket
+    Outputs: None
+
+    Description: Only a path that is a socket is removed
+    """
+    try:
+        if stat.S_ISSOCK( os.stat( path ).st_mode ):
+            os.unlink( path )
+
+    except FileNotFoundError:
+        pass
+
+def _lock_socket_path( path : str ) -> int:
+    """
+    Function: Lock Socket Path
+
+    Inputs: The path of a Unix domain socket
+    Outputs: The open lock file of the path, which this process holds the lock of
+
+    Description: Raises an OSError with EADDRINUSE if another host holds the
+                 lock. A host that stops removes its lock file, so a lock
+                 that was taken on a file that is no longer at its path is
+                 given up and taken again on the new file
+    """
+    lock_path = path + LOCK_FILE_SUFFIX
+
+    while True:
+        lock_fd = os.open( lock_path, os.O_RDWR | os.O_CREAT, 0o600 )
+
+        try:
+            fcntl.flock( lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB )
+
+        except BlockingIOError:
+            os.close( lock_fd )
+            raise OSError( errno.EADDRINUSE, f"A host already listens on { path }" ) from None
+
+        try:
+            locked_file = os.fstat( lock_fd )
+            current_file = os.stat( lock_path )
+
+            if ( locked_file.st_dev, locked_file.st_ino ) == ( current_file.st_dev, current_file.st_ino ):
+                return lock_fd
+
+        except FileNotFoundError:
+            pass
+
+        os.close( lock_fd )
+
+def _release_socket_path( path : str, lock_fd : int ) -> None:
+    """
+    Function: Release Socket Path
+
+    Inputs: The path of a Unix domain socket, its lock file, None where there are no file locks
+    Outputs: None
+
+    Description: The lock file is removed while it is still locked, so the
+                 next host never locks a file that is about to be removed
+    """
+    if lock_fd is None:
+        return
+
+    try:
+        os.unlink( path + LOCK_FILE_SUFFIX )
+
+    except FileNotFoundError:
+        pass
+
+    os.close( lock_fd )
+
+def _create_listening_unix_socket( config : NetworkConfig ) -> socket.socket:
+    """
+    Function: Create Listening Unix Socket
+
+    Inputs: The settings of the connection
+    Outputs: A Unix domain socket that is bound to the path and listening
+
+    Description: The host locks the lock file of the path first, and raises
+                 an OSError with EADDRINUSE if another host holds it, so a
+                 path that a host still listens on is never taken over and
+                 the host never sees a connection. Once the lock is held, a
+                 socket at the path was left behind by a host that is gone,
+                 and reusing the address removes it, the same as SO_REUSEADDR
+                 lets a port be bound again
+    """
+    path = config.get_socket_path()
+    lock_fd = _lock_socket_path( path ) if fcntl is not None else None
+
+    try:
+        if lock_fd is not None and config.reuse_address:
+            _remove_socket_file( path )
+
+        listening_socket = socket.socket( socket.AF_UNIX, socket.SOCK_STREAM )
+
+        try:
+            listening_socket.bind( path )
+            listening_socket.listen( config.backlog )
+
+        except OSError:
+            listening_socket.close()
+            raise
+
+    except OSError:
+        _release_socket_path( path, lock_fd )
+        raise
+
+    _listening_paths[ path ] = lock_fd
+
+    return listening_socket
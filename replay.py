@@ -0,0 +1,117 @@
+'''
+Module: replay.py
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Inputs: A move log written by the game or the simulator
+Outputs: Statistics of the log, the boards of a game at any turn
+
+Description: This module reads the binary move logs. Without a game it
+             prints the statistics of every game in the log as JSON. With a
+             game it replays the game onto a model and prints both boards as
+             they were after the selected turn
+
+Run it with $python executable$ replay.py moves.log --game 0 --turn 10
+'''
+################################################################################
+# Imports
+################################################################################
+import game_view as GV
+import model_factory as MF
+import move_log as ML
+
+from interfaces import interface_headers as IH
+
+import argparse
+import json
+import sys
+
+################################################################################
+# Global Variables
+################################################################################
+
+# Titles of the boards of the players
+BOARD_TITLES = { IH.PlayerTypeEnum.PLAYER_TYPE_HOST : "Host's Board",
+                 IH.PlayerTypeEnum.PLAYER_TYPE_JOIN : "Joining Player's Board" }
+
+# Names of the players in the status of a game
+PLAYER_NAMES = { IH.PlayerTypeEnum.PLAYER_TYPE_HOST : "the host",
+                 IH.PlayerTypeEnum.PLAYER_TYPE_JOIN : "the joining player" }
+
+################################################################################
+# Procedures
+################################################################################
+def parse_arguments( argv : list[ str ] = None ) -> argparse.Namespace:
+    """
+    Function: Parse Arguments
+
+    Inputs: Command line arguments, defaults to the arguments of the process
+    Output: Parsed replay options
+    """
+    parser = argparse.ArgumentParser( description="Battleship move log replay" )
+    parser.add_argument( "log", help="Path of the move log" )
+    parser.add_argument( "--game", type=int, default=None, help="Index of the game to replay, negative indexes count from the last game" )
+    parser.add_argument( "--turn", type=int, default=None, help="Number of attacks to replay, defaults to the whole game" )
+    parser.add_argument( "--model", choices=MF.MODEL_TYPES, default=MF.DEFAULT_MODEL_TYPE,
+                         help="Implementation of the game model to replay onto" )
+
+    return parser.parse_args( argv )
+
+def get_board_lines( board : IH.VisualBoardType ) -> list[ str ]:
+    """
+    Function: Get Board Lines
+
+    Inputs: A visual board
+    Output: The lines that show the board
+    """
+    grid = [ [ 'S' if cell > IH.BASE_CELL else GV.CELL_TO_SYMBOL[ cell ] for cell in row ] for row in board ]
+
+    return GV.GridFormatter( IH.NUMBER_OF_ROWS, IH.NUMBER_OF_COLS ).format_lines( grid )
+
+def print_game( reader : ML.MoveLogReader, game_index : int, turn : int, model_type : str ) -> None:
+    """
+    Function: Print Game
+
+    Inputs: The log, the index of the game, the number of attacks to replay, the model name
+    Output: None
+    """
+    engine, game = ML.replay_game( reader, game_index, turn, model_type )
+    model = engine.get_model()
+
+    winner = engine.get_winner()
+    status = "in progress" if winner is None else f"won by { PLAYER_NAMES[ winner ] }"
+
+    print( f"Game { game_index } on a { game[ ML.RECORD_ROW_INDEX ] } x { game[ ML.RECORD_COL_INDEX ] } board, { status }" )
+
+    for player_type in IH.PlayerTypeEnum:
+        print( "", BOARD_TITLES[ player_type ], "", *get_board_lines( model.get_visual_board( player_type ) ), sep="\n" )
+
+def main( options : argparse.Namespace ) -> int:
+    """
+    Function: Main
+
+    Inputs: Replay options
+    Output: The exit status
+    """
+    reader = ML.MoveLogReader( options.log )
+
+    try:
+        if options.game is None:
+            print( json.dumps( ML.get_log_stats( reader ) ) )
+            return 0
+
+        games = reader.get_games()
+
+        if not -len( games ) <= options.game < len( games ):
+            print( f"The log has { len( games ) } games", file=sys.stderr )
+            return 1
+
+        print_game( reader, options.game % len( games ), options.turn, options.model )
+        return 0
+
+    finally:
+        reader.close()
+
+if __name__ == "__main__":
+    sys.exit( main( parse_arguments() ) )
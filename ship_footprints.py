@@ -0,0 +1,196 @@
+'''
+Module: ship_footprints.py
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Inputs: The bow, direction and size of a ship
+Outputs: The mask of the cells that the ship would take
+
+Description: This module holds the footprints of every legal ship placement.
+             A footprint is a mask where bit n refers to the cell at row
+             n // NUMBER_OF_COLS and column n % NUMBER_OF_COLS, the same
+             layout as the bitboard model. The masks of the fleet sizes are
+             precomputed for every bow on boards up to MAX_TABLE_CELLS cells,
+             so checking a placement is a lookup and a single AND against the
+             occupied cells. Larger boards shift a precomputed pattern instead
+             of holding a mask for every cell. A placement that would leave
+             the board has an empty footprint
+'''
+################################################################################
+# Imports
+################################################################################
+from interfaces import interface_headers as IH
+
+################################################################################
+# Global Variables
+################################################################################
+
+# Largest board that every footprint is precomputed for. The table holds
+# a mask per bow, direction and fleet size, and every mask is as wide as
+# the board, so larger boards would spend megabytes on it
+MAX_TABLE_CELLS = 1024
+
+# Tables that were already built, by the dimensions of the board
+_TABLES : dict[ tuple[ int, int ], "FootprintTable" ] = dict()
+
+################################################################################
+# Types
+################################################################################
+class FootprintTable:
+    """
+    Description: This is the table of the footprints of a single board size.
+                 Footprints of sizes outside of the fleet are computed when
+                 they are asked for
+    """
+    __slots__ = ( "rows", "cols", "_patterns", "_masks" )
+
+    def __init__( self, rows : int, cols : int ):
+        """
+        Function: Initialization
+
+        Inputs: The number of rows and columns of the board
+        Outputs: None
+
+        Description: Builds the masks of every fleet size in both directions
+                     for every bow. Bows where the ship would leave the board
+                     have an empty mask
+
+        Data members: The dimensions of the board, the footprint patterns that
+                      are shifted to the stern of a ship, the precomputed masks
+        """
+        self.rows = rows
+        self.cols = cols
+        self._patterns : dict[ tuple[ int, str ], int ] = dict()
+        self._masks : dict[ tuple[ int, str ], list[ int ] ] = dict()
+
+        if rows * cols > MAX_TABLE_CELLS:
+            return
+
+        for size in range( IH.MIN_NUM_OF_SHIPS, IH.MAX_NUM_OF_SHIPS + 1 ):
+            for direction in ( IH.DIRECTION_HORIZONTAL, IH.DIRECTION_VERTICAL ):
+                self._masks[ ( size, direction ) ] = [ self._get_shifted_mask( ( row, col ), direction, size )
+                                                       for row in range( rows ) for col in range( cols ) ]
+
+    def _get_pattern( self, direction : str, size : int ) -> int:
+        """
+        Function: Get Pattern
+
+        Inputs: The direction and size of a ship
+        Outputs: The footprint of the ship with its stern on the first cell
+        """
+        pattern = self._patterns.get( ( size, direction ) )
+
+        if pattern is None:
+            step = 1 if direction == IH.DIRECTION_HORIZONTAL else self.cols
+            pattern = sum( 1 << ( cell * step ) for cell in range( size ) )
+            self._patterns[ ( size, direction ) ] = pattern
+
+        return pattern
+
+    def _get_shifted_mask( self, bow : IH.SystemCoordType, direction : str, size : int ) -> int:
+        """
+        Function: Get Shifted Mask
+
+        Inputs: The bow, the direction and the size of a ship
+        Outputs: The footprint of the ship, zero if it does not fit on the board
+        """
+        stern = get_stern( bow, direction, size, self.rows, self.cols )
+
+        if stern is None:
+            return 0
+
+        return self._get_pattern( direction, size ) << ( stern[ IH.ROW_INDEX ] * self.cols + stern[ IH.COLUMN_INDEX ] )
+
+    def get_mask( self, bow : IH.SystemCoordType, direction : str, size : int ) -> int:
+        """
+        Function: Get Mask
+
+        Inputs: The bow, the direction and the size of a ship
+        Outputs: The footprint of the ship, zero if it does not fit on the board
+
+        Description: The bow is checked against the board before it is used
+                     as an index, because negative indices would wrap around
+                     the table
+        """
+        row = bow[ IH.ROW_INDEX ]
+        col = bow[ IH.COLUMN_INDEX ]
+
+        if row < 0 or row >= self.rows or col < 0 or col >= self.cols:
+            return 0
+
+        masks = self._masks.get( ( size, direction ) )
+
+        if masks is None:
+            return self._get_shifted_mask( bow, direction, size )
+
+        return masks[ row * self.cols + col ]
+
+    def get_mask_coords( self, mask : int ) -> list[ IH.SystemCoordType ]:
+        """
+        Function: Get Mask Coordinates
+
+        Inputs: A footprint
+        Outputs: The coordinates of the cells in the footprint
+        """
+        coords = []
+
+        while mask:
+            bit = mask & -mask
+            coords.append( divmod( bit.bit_length() - 1, self.cols ) )
+            mask ^= bit
+
+        return coords
+
+################################################################################
+# Procedures
+################################################################################
+def get_stern( bow : IH.SystemCoordType, direction : str, size : int, rows : int, cols : int ) -> IH.SystemCoordType:
+    """
+    Function: Get Stern
+
+    Inputs: The bow, the direction and the size of a ship, the dimensions of the board
+    Outputs: The last coordinate of the ship, None if the ship does not fit on the board
+
+    Description: The ship extends from the bow towards the first row or
+                 column depending on the direction, so the stern is the
+                 cell with the lowest index of the footprint
+    """
+    row = bow[ IH.ROW_INDEX ]
+    col = bow[ IH.COLUMN_INDEX ]
+
+    if size < 1 or row < 0 or row >= rows or col < 0 or col >= cols:
+        return None
+
+    if direction == IH.DIRECTION_HORIZONTAL:
+        col -= size - 1
+
+    elif direction == IH.DIRECTION_VERTICAL:
+        row -= size - 1
+
+    else:
+        return None
+
+    if row < 0 or col < 0:
+        return None
+
+    return ( row, col )
+
+def get_footprint_table() -> FootprintTable:
+    """
+    Function: Get Footprint Table
+
+    Inputs: None
+    Outputs: The footprint table of the current board dimensions
+
+    Description: Tables are built once per board size and shared by every
+                 model, so creating a model does not rebuild them
+    """
+    dimensions = ( IH.NUMBER_OF_ROWS, IH.NUMBER_OF_COLS )
+    table = _TABLES.get( dimensions )
+
+    if table is None:
+        table = FootprintTable( *dimensions )
+        _TABLES[ dimensions ] = table
+
+    return table
@@ -0,0 +1,294 @@
+'''
+Module: simulator.py
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Inputs: Number of games and simulation settings
+Outputs: Aggregate statistics of bot versus bot games
+
+Description: This module plays games between two bots on top of the game
+             engine, without a view or a network connection. The games are
+             split into chunks that are played across a pool of processes,
+             and the statistics of every finished chunk are merged and
+             streamed back to the caller. Every chunk is seeded from the base
+             seed and its index, so the results do not depend on how the
+             chunks are scheduled across the processes
+
+Run it with $python executable$ simulator.py --games 10000
+'''
+################################################################################
+# Imports
+################################################################################
+import ai_player as AI
+import fleet_generator as FG
+import game_engine as GE
+import model_factory as MF
+import move_log as ML
+
+from interfaces import interface_headers as IH
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+
+################################################################################
+# Global Variables
+################################################################################
+
+# Default amount of games that are played by a single task in the pool
+DEFAULT_CHUNK_SIZE = 250
+
+# The bitboard model is the cheapest to create and query, so use
+# it unless another model is requested
+DEFAULT_SIMULATION_MODEL_TYPE = "bitboard"
+
+# Keys of the statistics that are gathered for every chunk of games
+STAT_GAMES = "games"
+STAT_FIRST_MOVER_WINS = "first_mover_wins"
+STAT_WINNER_TURNS = "winner_turns"
+STAT_MIN_WINNER_TURNS = "min_winner_turns"
+STAT_MAX_WINNER_TURNS = "max_winner_turns"
+STAT_SHOTS = "shots"
+STAT_HITS = "hits"
+
+################################################################################
+# Types
+################################################################################
+class RandomStrategy:
+    """
+    Description: This is the simplest bot strategy. It attacks every cell of
+                 the opponent's board once in a random order
+    """
+    def __init__( self, rng : random.Random, number_of_ships : int = IH.MAX_NUM_OF_SHIPS ):
+        """
+        Function: Initialization
+
+        Inputs: Random number generator of the game, the number of ships of the opponent
+        Outputs: None
+        """
+        self._targets = [ ( row, col ) for row in range( IH.NUMBER_OF_ROWS ) for col in range( IH.NUMBER_OF_COLS ) ]
+        rng.shuffle( self._targets )
+
+    def choose_attack( self ) -> IH.SystemCoordType:
+        """
+        Function: Choose Attack
+
+        Inputs: None
+        Outputs: The coordinate to attack
+        """
+        return self._targets.pop()
+
+    def record_result( self, coord : IH.SystemCoordType, response : dict ) -> None:
+        """
+        Function: Record Result
+
+        Inputs: The coordinate that was attacked, the response to the attack
+        Outputs: None
+
+        Description: The random strategy does not learn from the responses
+        """
+        pass
+
+# Mapping between the strategy names that can be selected and
+# the implementations of the strategies
+STRATEGY_TYPE_TO_CLASS = { "random" : RandomStrategy, "density" : AI.DensityStrategy }
+DEFAULT_STRATEGY_TYPE = "random"
+
+################################################################################
+# Procedures
+################################################################################
+def play_game( rng : random.Random, number_of_ships : int, model_type : str, strategy_type : str,
+               move_log : ML.MoveLogWriter = None ) -> dict:
+    """
+    Function: Play Game
+
+    Inputs: The random number generator, the number of ships, the model and strategy names,
+            the move log the game is written to or None
+    Outputs: Statistics of the game
+
+    Description: Plays a single game between two bots. The host always
+                 makes the first move, the same as in the interactive game
+    """
+    engine = GE.GameEngine( MF.create_model( model_type ), move_log )
+
+    # The simulator knows the ships of both players
+    if move_log is not None:
+        move_log.start_game( IH.PlayerTypeEnum.PLAYER_TYPE_HOST, number_of_ships, all_boards=True )
+
+    strategy_class = STRATEGY_TYPE_TO_CLASS[ strategy_type ]
+    fleet_generator = FG.FleetGenerator( rng, number_of_ships )
+    strategies = dict()
+    shots = dict()
+    hits = dict()
+
+    for player_type in IH.PlayerTypeEnum:
+        fleet_generator.place_fleet( engine, player_type )
+        strategies[ player_type ] = strategy_class( rng, number_of_ships )
+        shots[ player_type ] = 0
+        hits[ player_type ] = 0
+
+    turn = IH.PlayerTypeEnum.PLAYER_TYPE_HOST
+
+    while not engine.is_over():
+        # Let the active bot attack the board of its opponent
+        # and learn from the response
+        opponent_type = GE.get_opponent_type( turn )
+        coord = strategies[ turn ].choose_attack()
+        response = engine.resolve_attack( opponent_type, coord )
+        strategies[ turn ].record_result( coord, response )
+
+        shots[ turn ] += 1
+        if IH.CoordStateType( response[ IH.GAME_COORD_TYPE_STATE_INDEX ] ) == IH.CoordStateType.COORD_STATE_HIT:
+            hits[ turn ] += 1
+
+        turn = opponent_type
+
+    winner = engine.get_winner()
+
+    return { STAT_GAMES : 1,
+             STAT_FIRST_MOVER_WINS : int( winner == IH.PlayerTypeEnum.PLAYER_TYPE_HOST ),
+             STAT_WINNER_TURNS : shots[ winner ],
+             STAT_MIN_WINNER_TURNS : shots[ winner ],
+             STAT_MAX_WINNER_TURNS : shots[ winner ],
+             STAT_SHOTS : sum( shots.values() ),
+             STAT_HITS : sum( hits.values() ) }
+
+def merge_stats( total : dict, stats : dict ) -> dict:
+    """
+    Function: Merge Statistics
+
+    Inputs: The running statistics, the statistics to add
+    Outputs: The merged statistics
+    """
+    if not total:
+        return dict( stats )
+
+    merged = { key : total[ key ] + stats[ key ] for key in total }
+    merged[ STAT_MIN_WINNER_TURNS ] = min( total[ STAT_MIN_WINNER_TURNS ], stats[ STAT_MIN_WINNER_TURNS ] )
+    merged[ STAT_MAX_WINNER_TURNS ] = max( total[ STAT_MAX_WINNER_TURNS ], stats[ STAT_MAX_WINNER_TURNS ] )
+
+    return merged
+
+def summarize_stats( stats : dict ) -> dict:
+    """
+    Function: Summarize Statistics
+
+    Inputs: The running statistics
+    Outputs: Aggregates of the statistics
+
+    Description: Converts the running sums into the aggregates that are
+                 reported. A first mover advantage above 0.5 means that
+                 the player who moves first wins more often
+    """
+    games = stats[ STAT_GAMES ]
+
+    return { "games" : games,
+             "mean_turns_to_win" : stats[ STAT_WINNER_TURNS ] / games,
+             "min_turns_to_win" : stats[ STAT_MIN_WINNER_TURNS ],
+             "max_turns_to_win" : stats[ STAT_MAX_WINNER_TURNS ],
+             "hit_rate" : stats[ STAT_HITS ] / stats[ STAT_SHOTS ],
+             "first_mover_win_rate" : stats[ STAT_FIRST_MOVER_WINS ] / games }
+
+def _play_chunk( task : tuple ) -> dict:
+    """
+    Function: Play Chunk
+
+    Inputs: The settings of a chunk of games
+    Outputs: The merged statistics of the chunk
+
+    Description: This is the function that is run by the processes in the
+                 pool. The board dimensions are set again because the worker
+                 may not share the memory of the parent process. Every worker
+                 appends whole games to the move log on its own
+    """
+    chunk_index, number_of_games, seed, number_of_ships, model_type, strategy_type, rows, cols, move_log_path = task
+
+    IH.set_board_dimensions( rows, cols )
+    rng = random.Random( ( seed << 32 ) + chunk_index )
+    move_log = ML.MoveLogWriter( move_log_path, buffered=True ) if move_log_path else None
+    total = dict()
+
+    for _ in range( number_of_games ):
+        total = merge_stats( total, play_game( rng, number_of_ships, model_type, strategy_type, move_log ) )
+
+    if move_log is not None:
+        move_log.close()
+
+    return total
+
+def simulate( number_of_games : int, number_of_ships : int = IH.MAX_NUM_OF_SHIPS, processes : int = None, seed : int = 0,
+              model_type : str = DEFAULT_SIMULATION_MODEL_TYPE, strategy_type : str = DEFAULT_STRATEGY_TYPE,
+              chunk_size : int = DEFAULT_CHUNK_SIZE, move_log_path : str = None ):
+    """
+    Function: Simulate
+
+    Inputs: The number of games, the number of ships, the number of processes, the base seed,
+            the model and strategy names, the amount of games per task, the move log the games are appended to or None
+    Outputs: Yields the aggregates after every finished chunk of games
+
+    Description: This is the entry point of the simulator. The games are
+                 split into chunks and played across a pool of processes.
+                 Chunks are merged as they finish, so the caller can report
+                 progress while the simulation runs
+    """
+    tasks = [ ( index, min( chunk_size, number_of_games - start ), seed, number_of_ships, model_type, strategy_type,
+                IH.NUMBER_OF_ROWS, IH.NUMBER_OF_COLS, move_log_path )
+              for index, start in enumerate( range( 0, number_of_games, chunk_size ) ) ]
+    total = dict()
+
+    # There is no reason to pay for a pool if there is only
+    # a single process
+    if processes == 1:
+        for task in tasks:
+            total = merge_stats( total, _play_chunk( task ) )
+            yield summarize_stats( total )
+
+        return
+
+    with multiprocessing.Pool( processes ) as pool:
+        for stats in pool.imap_unordered( _play_chunk, tasks ):
+            total = merge_stats( total, stats )
+            yield summarize_stats( total )
+
+def parse_arguments( argv : list[ str ] = None ) -> argparse.Namespace:
+    """
+    Function: Parse Arguments
+
+    Inputs: Command line arguments, defaults to the arguments of the process
+    Output: Parsed simulation options
+    """
+    parser = argparse.ArgumentParser( description="Battleship self-play simulator" )
+    parser.add_argument( "--games", type=int, default=1000, help="Number of games to play" )
+    parser.add_argument( "--ships", type=int, default=IH.MAX_NUM_OF_SHIPS,
+                         choices=range( IH.MIN_NUM_OF_SHIPS, IH.MAX_NUM_OF_SHIPS + 1 ), help="Number of ships per player" )
+    parser.add_argument( "--processes", type=int, default=os.cpu_count(), help="Number of worker processes" )
+    parser.add_argument( "--seed", type=int, default=0, help="Base seed of the simulation" )
+    parser.add_argument( "--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Number of games per task" )
+    parser.add_argument( "--model", choices=MF.MODEL_TYPES, default=DEFAULT_SIMULATION_MODEL_TYPE,
+                         help="Implementation of the game model to use" )
+    parser.add_argument( "--strategy", choices=STRATEGY_TYPE_TO_CLASS.keys(), default=DEFAULT_STRATEGY_TYPE,
+                         help="Strategy used by both bots" )
+    parser.add_argument( "--rows", type=int, default=IH.NUMBER_OF_ROWS, help="Number of rows on the board" )
+    parser.add_argument( "--cols", type=int, default=IH.NUMBER_OF_COLS, help="Number of columns on the board" )
+    parser.add_argument( "--move-log", default=None, metavar="PATH", help="Append every placement and attack to this binary log" )
+
+    return parser.parse_args( argv )
+
+def main( options : argparse.Namespace ):
+    """
+    Function: Main
+
+    Inputs: Simulation options
+    Output: Aggregates printed as one JSON object per line
+    """
+    IH.set_board_dimensions( options.rows, options.cols )
+
+    for summary in simulate( options.games, options.ships, options.processes, options.seed,
+                             options.model, options.strategy, options.chunk_size, options.move_log ):
+        print( json.dumps( summary ), flush=True )
+
+if __name__ == "__main__":
+    main( parse_arguments() )
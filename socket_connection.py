@@ -0,0 +1,212 @@
+'''
+Module: socket_connection.py
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Description: This module implements the parts of a network interaction that
+             are shared between the host and the joining player. Once a socket
+             is connected, both sides frame their messages the same way and
+             encode them with the codec that was negotiated when the
+             connection was opened
+
+Inputs: Messages to Send
+Outputs: Messages to Receive
+'''
+
+################################################################################
+# Imports
+################################################################################
+import socket
+import time
+import message_codec as MC
+import message_framing as FR
+import latency_stats as LS
+import interfaces.interface_headers as IH
+from interfaces.interface_game_interaction import GameInteractionInterface
+
+################################################################################
+# Types
+################################################################################
+class SocketConnection( GameInteractionInterface ):
+    def __init__( self, codec : str = MC.DEFAULT_CODEC ) -> None:
+        """
+        Definition: Setting up the state of a connection that is not open yet.
+        """
+
+        # The client socket is the socket that messages are exchanged
+        # on. JSON is used until a codec has been negotiated
+        self.client_socket : socket.socket = None
+        self.connection_count = 0
+        self.frame_buffer = FR.FrameBuffer()
+        self.preferred_codec = codec
+        self.codec = MC.JsonMessageCodec()
+
+        # Seconds a host waits for the other player to connect when
+        # the connection is opened, None waits for as long as it takes
+        self.open_timeout : float = None
+
+        # Seconds between the checks of an event loop that can not rely
+        # on the socket alone to tell when a message arrives, None if it can
+        self.poll_interval : float = None
+
+        # The round trips of the requests are recorded from the time
+        # a request is sent until the next message arrives
+        self.round_trip_latency = LS.LatencyHistogram()
+        self._request_sent_at : float = None
+
+
+    def _start_connection( self, client_socket : socket.socket ) -> None:
+        """
+        Definition: Storing a newly connected socket with an empty reassembly buffer.
+        """
+
+        self.client_socket = client_socket
+        self.connection_count += 1
+        self.frame_buffer = FR.FrameBuffer()
+        self.codec = MC.JsonMessageCodec()
+
+
+    def _negotiate_codec_as_host( self ) -> None:
+        """
+        Definition: Selecting a codec from the codecs offered by the joining player, if it plays on the same board.
+        """
+
+        # The negotiation messages are always encoded as JSON. Both
+        # sides send their board dimensions, and a joining player on
+        # another board is answered without a codec and refused
+        offer = MC.JsonMessageCodec().decode( FR.receive_frame( self.client_socket, self.frame_buffer ) )
+        answer = MC.get_board_dimensions()
+
+        try:
+            MC.check_board_dimensions( offer )
+
+        except MC.BoardMismatchError:
+            FR.send_frame( self.client_socket, MC.JsonMessageCodec().encode( answer ) )
+            self.close_connection()
+            raise
+
+        codec = MC.select_codec( offer[ IH.VIEW_PARAM_CODECS ], self.preferred_codec )
+        answer[ IH.VIEW_PARAM_CODEC ] = codec
+
+        FR.send_frame( self.client_socket, MC.JsonMessageCodec().encode( answer ) )
+        self.codec = MC.CODEC_NAME_TO_CLASS[ codec ]()
+
+
+    def _negotiate_codec_as_client( self ) -> None:
+        """
+        Definition: Offering codecs to the host and using the one it selected.
+        """
+
+        self._send_codec_offer()
+        self._receive_codec_answer()
+
+
+    def _send_codec_offer( self ) -> None:
+        """
+        Definition: Offering the codecs and the board dimensions of this player to the host.
+        """
+
+        # The negotiation messages are always encoded as JSON
+        offer = { IH.VIEW_PARAM_CODECS : MC.get_offered_codecs( self.preferred_codec ) }
+        offer.update( MC.get_board_dimensions() )
+        FR.send_frame( self.client_socket, MC.JsonMessageCodec().encode( offer ) )
+
+
+    def _receive_codec_answer( self ) -> None:
+        """
+        Definition: Using the codec that the host selected, if it plays on the same board.
+        """
+
+        answer = MC.JsonMessageCodec().decode( FR.receive_frame( self.client_socket, self.frame_buffer ) )
+
+        try:
+            MC.check_board_dimensions( answer )
+
+        except MC.BoardMismatchError:
+            self.close_connection()
+            raise
+
+        self.codec = MC.CODEC_NAME_TO_CLASS[ answer[ IH.VIEW_PARAM_CODEC ] ]()
+
+
+    def close_connection( self ) -> None:
+        """
+        Definition: Closing the port.
+        """
+
+        # Close the connection to the other player. A connection
+        # that is already closed is left as it is
+        if self.client_socket is not None:
+            self.client_socket.close()
+            self.client_socket = None
+
+
+    def send_message( self, msg : dict ) -> None:
+        """
+        Definition: Sending a message to the other player.
+        """
+
+        # Encode the message with the negotiated codec and send
+        # it on the socket as a single frame
+        FR.send_frame( self.client_socket, self.codec.encode( msg ) )
+
+
+    def send_request( self, msg : dict ) -> None:
+        """
+        Definition: Sending a message that the other player answers right away, and starting the clock of its round trip.
+        """
+
+        self._request_sent_at = time.perf_counter()
+        self.send_message( msg )
+
+
+    def get_round_trip_latency( self ) -> LS.LatencyHistogram:
+        """
+        Definition: Getting the histogram of the round trips of the requests.
+        """
+
+        return self.round_trip_latency
+
+
+    def _receive_message( self, frame : bytes ) -> dict:
+        """
+        Definition: Decoding a received frame and stopping the clock of the request it answers.
+        """
+
+        if self._request_sent_at is not None:
+            self.round_trip_latency.record( time.perf_counter() - self._request_sent_at )
+            self._request_sent_at = None
+
+        return self.codec.decode( frame )
+
+
+    def wait_for_message( self ) -> dict:
+        """
+        Definition: Waiting for a message from the other player.
+        """
+
+        # Wait for a complete frame, then decode the message and
+        # return to calling function
+        return self._receive_message( FR.receive_frame( self.client_socket, self.frame_buffer ) )
+
+
+    def fileno( self ) -> int:
+        """
+        Definition: Getting the file descriptor of the socket, so the connection can be watched by a selector.
+        """
+
+        return self.client_socket.fileno()
+
+
+    def poll_message( self ) -> dict:
+        """
+        Definition: Getting the next message from the other player without blocking, None if it has not fully arrived.
+        """
+
+        # Messages that arrived along with an earlier message are
+        # already in the buffer. Otherwise take whatever the socket
+        # has without waiting for more
+        frame = FR.receive_available_frame( self.client_socket, self.frame_buffer )
+
+        return None if frame is None else self._receive_message( frame )
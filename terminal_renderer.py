@@ -0,0 +1,242 @@
+'''
+Module: terminal_renderer.py
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Inputs: Frames of text to display
+Outputs: Text and ANSI escape sequences written to a terminal
+
+Description: This module draws the pages of the console view. A page is a
+             frame made of lines of text. The terminal renderer remembers the
+             last frame it drew, and only moves the cursor to the characters
+             that changed since then and rewrites them, so a turn that hits or
+             misses a single cell only sends a few bytes to the terminal. The
+             area below the frame, where the user answers the prompts, is
+             erased on every frame. Frames are drawn in full when they do not
+             fit on the screen, and the plain renderer is used when the output
+             is not a terminal that understands ANSI escape sequences
+'''
+################################################################################
+# Imports
+################################################################################
+import os
+import shutil
+import sys
+
+from collections.abc import Callable
+from typing import TextIO
+
+################################################################################
+# Global Variables
+################################################################################
+
+# ANSI escape sequences used by the terminal renderer
+ESCAPE_CLEAR_SCREEN = "\x1b[H\x1b[2J\x1b[3J"
+ESCAPE_CLEAR_TO_END_OF_LINE = "\x1b[K"
+ESCAPE_CLEAR_TO_END_OF_SCREEN = "\x1b[J"
+
+# Unchanged characters between two changed characters of a line
+# are rewritten instead of moving the cursor over them, as long
+# as that is shorter than the escape sequence of a cursor move
+MAX_REWRITTEN_GAP = 6
+
+# Lines below the frame that are kept free for the prompts. A
+# frame is only updated in place if the prompts will not scroll
+# it off the top of the screen
+PROMPT_LINES = 8
+
+WINDOWS_OS_NAME = "nt"
+
+################################################################################
+# Types
+################################################################################
+class PlainRenderer:
+    """
+    Description: This renderer writes every frame in full. It is used when the
+                 output is redirected or the terminal does not understand ANSI
+                 escape sequences. A function to clear the screen can be given
+                 to run before every frame
+    """
+    def __init__( self, stream : TextIO, clear_screen : Callable[ [], None ] = None ) -> None:
+        """
+        Function: Initialization
+
+        Inputs: The stream to write to, the function that clears the screen
+        Outputs: None
+        """
+        self._stream = stream
+        self._clear_screen = clear_screen
+
+    def render( self, lines : list[ str ] ) -> None:
+        """
+        Function: Render
+
+        Inputs: The lines of the frame
+        Outputs: None
+        """
+        if self._clear_screen is not None:
+            self._clear_screen()
+
+        self._stream.write( "".join( line + "\n" for line in lines ) )
+        self._stream.flush()
+
+    def invalidate( self ) -> None:
+        """
+        Function: Invalidate
+
+        Inputs: None
+        Outputs: None
+
+        Description: Every frame is drawn in full, so there is nothing to forget
+        """
+        pass
+
+class TerminalRenderer:
+    """
+    Description: This renderer only rewrites the parts of the frame that
+                 changed since the last frame. The frame is always drawn from
+                 the top left corner of the screen
+    """
+    def __init__( self, stream : TextIO ) -> None:
+        """
+        Function: Initialization
+
+        Inputs: The stream of the terminal
+        Outputs: None
+        """
+        self._stream = stream
+
+        # The frame on the screen, None if the screen does not
+        # hold a frame that can be updated in place
+        self._last_frame : list[ str ] = None
+        self._last_size : os.terminal_size = None
+
+    def invalidate( self ) -> None:
+        """
+        Function: Invalidate
+
+        Inputs: None
+        Outputs: None
+
+        Description: Draws the next frame in full. Call this if something other
+                     than the renderer may have moved the frame on the screen
+        """
+        self._last_frame = None
+
+    def render( self, lines : list[ str ] ) -> None:
+        """
+        Function: Render
+
+        Inputs: The lines of the frame
+        Outputs: None
+        """
+        size = shutil.get_terminal_size()
+        fits_on_screen = len( lines ) + PROMPT_LINES <= size.lines and max( map( len, lines ), default=0 ) <= size.columns
+
+        if self._last_frame is None or size != self._last_size or not fits_on_screen:
+            output = [ ESCAPE_CLEAR_SCREEN, "\n".join( lines ), "\n" ]
+
+        else:
+            output = get_frame_changes( self._last_frame, lines )
+
+            # Place the cursor below the frame and erase whatever
+            # the prompts of the last frame left there
+            output.append( f"\x1b[{ len( lines ) + 1 };1H{ ESCAPE_CLEAR_TO_END_OF_SCREEN }" )
+
+        self._stream.write( "".join( output ) )
+        self._stream.flush()
+
+        # A frame that did not fit may have scrolled, so it can not
+        # be updated in place
+        self._last_frame = list( lines ) if fits_on_screen else None
+        self._last_size = size
+
+################################################################################
+# Procedures
+################################################################################
+def get_line_changes( row : int, old_line : str, new_line : str ) -> list[ str ]:
+    """
+    Function: Get Line Changes
+
+    Inputs: The index of the line on the screen, the line on the screen, the new line
+    Outputs: The escape sequences and text that turn the old line into the new line
+
+    Description: Runs of changed characters are found from left to right.
+                 A run ends once more than MAX_REWRITTEN_GAP characters in a
+                 row are unchanged
+    """
+    output = list()
+    old_length = len( old_line )
+    new_length = len( new_line )
+    index = 0
+
+    while index < new_length:
+        if index < old_length and old_line[ index ] == new_line[ index ]:
+            index += 1
+            continue
+
+        start = index
+        end = index + 1
+        index += 1
+
+        while index < new_length and index - end <= MAX_REWRITTEN_GAP:
+            if index >= old_length or old_line[ index ] != new_line[ index ]:
+                end = index + 1
+
+            index += 1
+
+        output.append( f"\x1b[{ row + 1 };{ start + 1 }H{ new_line[ start : end ] }" )
+        index = end
+
+    # Erase the characters of the old line that are past the
+    # end of the new line
+    if old_length > new_length:
+        output.append( f"\x1b[{ row + 1 };{ new_length + 1 }H{ ESCAPE_CLEAR_TO_END_OF_LINE }" )
+
+    return output
+
+def get_frame_changes( old_frame : list[ str ], new_frame : list[ str ] ) -> list[ str ]:
+    """
+    Function: Get Frame Changes
+
+    Inputs: The frame on the screen, the new frame
+    Outputs: The escape sequences and text that turn the old frame into the new frame
+
+    Description: Lines of the old frame past the end of the new frame are
+                 left to the caller, which erases everything below the frame.
+                 Lines past the end of the old frame may hold the prompts of
+                 the old frame, so they are written in full
+    """
+    output = list()
+    old_length = len( old_frame )
+
+    for row, new_line in enumerate( new_frame ):
+        if row >= old_length:
+            output.append( f"\x1b[{ row + 1 };1H{ new_line }{ ESCAPE_CLEAR_TO_END_OF_LINE }" )
+
+        elif old_frame[ row ] != new_line:
+            output.extend( get_line_changes( row, old_frame[ row ], new_line ) )
+
+    return output
+
+def create_renderer( stream : TextIO = None, clear_screen : Callable[ [], None ] = None ):
+    """
+    Function: Create Renderer
+
+    Inputs: The stream to draw on, defaults to standard output, the function that clears the screen
+    Outputs: The renderer for the stream
+
+    Description: Terminals other than the Windows console get the terminal
+                 renderer. The Windows console keeps clearing the screen with
+                 the given function, and redirected output is never cleared
+    """
+    stream = sys.stdout if stream is None else stream
+
+    if not stream.isatty():
+        return PlainRenderer( stream )
+
+    if os.name == WINDOWS_OS_NAME:
+        return PlainRenderer( stream, clear_screen )
+
+    return TerminalRenderer( stream )
@@ -0,0 +1,237 @@
+'''
+Module: test_game_models.py
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Inputs: Every model in the model factory
+Outputs: Test results
+
+Description: This module runs the same behavioral tests against every model,
+             so that a model can be swapped for another without changing how
+             the game plays. Every test is run once for every model type, and
+             the last test plays the same moves on all models at once and
+             compares their boards cell by cell
+
+Run it with $python executable$ -m pytest tests from the root of the repository
+'''
+################################################################################
+# Imports
+################################################################################
+import fleet_generator as FG
+import game_engine as GE
+import model_factory as MF
+import visual_board as VB
+
+from interfaces import interface_headers as IH
+
+import random
+
+import pytest
+
+################################################################################
+# Global Variables
+################################################################################
+HOST = IH.PlayerTypeEnum.PLAYER_TYPE_HOST
+JOIN = IH.PlayerTypeEnum.PLAYER_TYPE_JOIN
+
+# Coordinates that are not on a board of the default dimensions.
+# Some of them are the index of another cell in a flat board, and
+# negative ones would wrap around a list or an array
+OFF_BOARD_COORDS = [ ( 0, 10 ), ( 10, 0 ), ( -1, 0 ), ( 0, -1 ), ( -1, -1 ), ( 99, 99 ), ( 10, 10 ) ]
+
+################################################################################
+# Procedures
+################################################################################
+@pytest.fixture( autouse=True )
+def default_dimensions():
+    """
+    Function: Default Dimensions
+
+    Inputs: None
+    Outputs: None
+
+    Description: Every test starts and ends on a board of the default size
+    """
+    IH.set_board_dimensions( 10, 10 )
+    yield
+    IH.set_board_dimensions( 10, 10 )
+
+@pytest.fixture( params=MF.MODEL_TYPES )
+def model( request ):
+    """
+    Function: Model
+
+    Inputs: The model type of the test
+    Outputs: An empty model of the type
+    """
+    return MF.create_model( request.param )
+
+def get_cells( bow : IH.SystemCoordType, direction : str, size : int ) -> list[ IH.SystemCoordType ]:
+    """
+    Function: Get Cells
+
+    Inputs: The bow, direction and size of a ship
+    Outputs: The cells of the ship, which extends from the bow towards the first row or column
+    """
+    row, col = bow
+
+    if direction == IH.DIRECTION_HORIZONTAL:
+        return [ ( row, col - offset ) for offset in range( size ) ]
+
+    return [ ( row - offset, col ) for offset in range( size ) ]
+
+def test_new_board_is_empty( model ):
+    for row in range( IH.NUMBER_OF_ROWS ):
+        for col in range( IH.NUMBER_OF_COLS ):
+            assert model.get_coord( HOST, ( row, col ) ) == { IH.GAME_COORD_TYPE_ID_INDEX : IH.BASE_CELL,
+                                                              IH.GAME_COORD_TYPE_STATE_INDEX : IH.CoordStateType.COORD_STATE_BASE }
+            assert model.is_valid_coord( HOST, ( row, col ), IH.GameEventType.GAME_EVENT_PLACE_SHIPS )
+            assert model.is_valid_coord( HOST, ( row, col ), IH.GameEventType.GAME_EVENT_MAKE_ATTACK )
+
+    assert not model.ships_are_alive( HOST )
+
+def test_queries_return_plain_booleans( model ):
+    model.place_ship( HOST, ( 0, 4 ), IH.DIRECTION_HORIZONTAL, 5 )
+
+    # The interface promises booleans, and the booleans of a
+    # library such as numpy can not be encoded as JSON
+    answers = [ model.is_valid_coord( HOST, ( 0, 0 ), IH.GameEventType.GAME_EVENT_PLACE_SHIPS ),
+                model.is_valid_coord( HOST, ( 5, 5 ), IH.GameEventType.GAME_EVENT_PLACE_SHIPS ),
+                model.is_valid_coord( HOST, ( 0, 0 ), IH.GameEventType.GAME_EVENT_MAKE_ATTACK ),
+                model.can_place_ship( HOST, ( 5, 5 ), IH.DIRECTION_VERTICAL, 2 ),
+                model.ships_are_alive( HOST ),
+                model.ship_is_alive( HOST, 5 ) ]
+
+    assert all( type( answer ) is bool for answer in answers )
+
+@pytest.mark.parametrize( "bow, direction, size", [ ( ( 0, 4 ), IH.DIRECTION_HORIZONTAL, 5 ), ( ( 9, 9 ), IH.DIRECTION_VERTICAL, 3 ),
+                                                    ( ( 4, 0 ), IH.DIRECTION_VERTICAL, 1 ) ] )
+def test_place_ship_occupies_its_cells( model, bow, direction, size ):
+    assert model.can_place_ship( HOST, bow, direction, size )
+    assert model.place_ship( HOST, bow, direction, size )
+
+    cells = set( get_cells( bow, direction, size ) )
+
+    for row in range( IH.NUMBER_OF_ROWS ):
+        for col in range( IH.NUMBER_OF_COLS ):
+            expected_id = size if ( row, col ) in cells else IH.BASE_CELL
+
+            assert model.get_coord( HOST, ( row, col ) )[ IH.GAME_COORD_TYPE_ID_INDEX ] == expected_id
+            assert model.is_valid_coord( HOST, ( row, col ), IH.GameEventType.GAME_EVENT_PLACE_SHIPS ) == ( expected_id == IH.BASE_CELL )
+
+    # The ship is only placed on the board of the player
+    assert model.ships_are_alive( HOST )
+    assert model.ship_is_alive( HOST, size )
+    assert not model.ships_are_alive( JOIN )
+
+@pytest.mark.parametrize( "bow, direction, size", [ ( ( 0, 3 ), IH.DIRECTION_HORIZONTAL, 5 ), ( ( 3, 0 ), IH.DIRECTION_VERTICAL, 5 ),
+                                                    ( ( 10, 4 ), IH.DIRECTION_HORIZONTAL, 2 ), ( ( 4, 10 ), IH.DIRECTION_VERTICAL, 2 ),
+                                                    ( ( -1, 4 ), IH.DIRECTION_HORIZONTAL, 2 ), ( ( 4, 4 ), "X", 2 ) ] )
+def test_ship_that_does_not_fit_is_not_placed( model, bow, direction, size ):
+    assert not model.can_place_ship( HOST, bow, direction, size )
+    assert not model.place_ship( HOST, bow, direction, size )
+    assert not model.ships_are_alive( HOST )
+
+def test_overlapping_ship_is_not_placed( model ):
+    assert model.place_ship( HOST, ( 2, 4 ), IH.DIRECTION_HORIZONTAL, 5 )
+
+    assert not model.can_place_ship( HOST, ( 4, 2 ), IH.DIRECTION_VERTICAL, 3 )
+    assert not model.place_ship( HOST, ( 4, 2 ), IH.DIRECTION_VERTICAL, 3 )
+    assert model.get_coord( HOST, ( 4, 2 ) )[ IH.GAME_COORD_TYPE_ID_INDEX ] == IH.BASE_CELL
+
+    # The same cells are free on the board of the opponent
+    assert model.place_ship( JOIN, ( 4, 2 ), IH.DIRECTION_VERTICAL, 3 )
+
+def test_attacks_sink_ships_and_win( model ):
+    engine = GE.GameEngine( model )
+    assert engine.place_ship( HOST, ( 0, 1 ), IH.DIRECTION_HORIZONTAL, 2 )
+    assert engine.place_ship( HOST, ( 5, 5 ), IH.DIRECTION_VERTICAL, 1 )
+
+    response = engine.resolve_attack( HOST, ( 9, 9 ) )
+    assert response[ IH.GAME_COORD_TYPE_STATE_INDEX ] == IH.CoordStateType.COORD_STATE_MISS.value
+    assert not response[ IH.VIEW_PARAM_WIN ]
+    assert not model.is_valid_coord( HOST, ( 9, 9 ), IH.GameEventType.GAME_EVENT_MAKE_ATTACK )
+
+    response = engine.resolve_attack( HOST, ( 0, 0 ) )
+    assert response[ IH.GAME_COORD_TYPE_STATE_INDEX ] == IH.CoordStateType.COORD_STATE_HIT.value
+    assert not response[ IH.VIEW_PARAM_SHIP_SUNK ]
+    assert model.ship_is_alive( HOST, 2 )
+
+    response = engine.resolve_attack( HOST, ( 0, 1 ) )
+    assert response[ IH.VIEW_PARAM_SHIP_SUNK ]
+    assert response[ IH.VIEW_PARAM_SIZE ] == 2
+    assert not response[ IH.VIEW_PARAM_WIN ]
+    assert not model.ship_is_alive( HOST, 2 )
+    assert model.ships_are_alive( HOST )
+
+    response = engine.resolve_attack( HOST, ( 5, 5 ) )
+    assert response[ IH.VIEW_PARAM_SHIP_SUNK ]
+    assert response[ IH.VIEW_PARAM_WIN ]
+    assert not model.ships_are_alive( HOST )
+    assert engine.get_winner() == JOIN
+
+def test_visual_board_tracks_the_board( model ):
+    visual_board = model.get_visual_board( HOST )
+    engine = GE.GameEngine( model )
+    engine.place_ship( HOST, ( 3, 3 ), IH.DIRECTION_HORIZONTAL, 3 )
+    engine.resolve_attack( HOST, ( 3, 2 ) )
+    engine.resolve_attack( HOST, ( 7, 7 ) )
+
+    # The views handed out before the moves show the moves
+    assert len( visual_board ) == IH.NUMBER_OF_ROWS
+
+    for row in range( IH.NUMBER_OF_ROWS ):
+        assert len( visual_board[ row ] ) == IH.NUMBER_OF_COLS
+
+        for col in range( IH.NUMBER_OF_COLS ):
+            assert visual_board[ row ][ col ] == VB.get_visual_cell( model.get_coord( HOST, ( row, col ) ) )
+
+    assert visual_board[ 3 ][ 2 ] == IH.HIT_CELL
+    assert visual_board[ 7 ][ 7 ] == IH.MISSED_CELL
+    assert visual_board[ 3 ][ 1 ] == 3
+
+@pytest.mark.parametrize( "coord", OFF_BOARD_COORDS )
+def test_off_board_coordinates_are_rejected( model, coord ):
+    model.place_ship( HOST, ( 0, 4 ), IH.DIRECTION_HORIZONTAL, 5 )
+    cell = { IH.GAME_COORD_TYPE_ID_INDEX : IH.BASE_CELL, IH.GAME_COORD_TYPE_STATE_INDEX : IH.CoordStateType.COORD_STATE_HIT }
+
+    assert not model.is_valid_coord( HOST, coord, IH.GameEventType.GAME_EVENT_PLACE_SHIPS )
+    assert not model.is_valid_coord( HOST, coord, IH.GameEventType.GAME_EVENT_MAKE_ATTACK )
+    assert not model.can_place_ship( HOST, coord, IH.DIRECTION_VERTICAL, 1 )
+
+    with pytest.raises( IndexError ):
+        model.get_coord( HOST, coord )
+
+    with pytest.raises( IndexError ):
+        model.update_coord( HOST, coord, cell )
+
+    # Nothing on the board was changed by the rejected coordinate
+    assert model.ships_are_alive( HOST )
+    assert all( model.is_valid_coord( HOST, ( row, col ), IH.GameEventType.GAME_EVENT_MAKE_ATTACK )
+                for row in range( IH.NUMBER_OF_ROWS ) for col in range( IH.NUMBER_OF_COLS ) )
+
+def test_models_agree_on_a_random_game():
+    rng = random.Random( 7 )
+    layout = FG.FleetGenerator( rng ).generate()
+    engines = [ GE.GameEngine( MF.create_model( model_type ) ) for model_type in MF.MODEL_TYPES ]
+    targets = [ ( row, col ) for row in range( IH.NUMBER_OF_ROWS ) for col in range( IH.NUMBER_OF_COLS ) ]
+    rng.shuffle( targets )
+
+    for engine in engines:
+        for bow, direction, size in layout:
+            assert engine.place_ship( HOST, bow, direction, size )
+
+    for coord in targets:
+        responses = [ engine.resolve_attack( HOST, coord ) for engine in engines ]
+        assert all( response == responses[ 0 ] for response in responses )
+
+        if responses[ 0 ][ IH.VIEW_PARAM_WIN ]:
+            break
+
+    for row in range( IH.NUMBER_OF_ROWS ):
+        for col in range( IH.NUMBER_OF_COLS ):
+            cells = [ engine.get_model().get_coord( HOST, ( row, col ) ) for engine in engines ]
+            assert all( cell == cells[ 0 ] for cell in cells )
+
+    assert all( engine.get_winner() == JOIN for engine in engines )
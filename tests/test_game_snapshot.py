@@ -0,0 +1,244 @@
+'''
+Module: test_game_snapshot.py
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Inputs: Games played on every model, snapshot files, loopback connections
+Outputs: Test results
+
+Description: This module tests that a snapshot restores the game it was taken
+             of, that a snapshot file still holds the previous snapshot when
+             the latest one was damaged, and that two players that resume a
+             game agree on the turns that were played
+
+Run it with $python executable$ -m pytest tests from the root of the repository
+'''
+################################################################################
+# Imports
+################################################################################
+import fleet_generator as FG
+import game_engine as GE
+import game_snapshot as GS
+import loopback_connection as LC
+import model_factory as MF
+
+from interfaces import interface_headers as IH
+
+import random
+import threading
+
+import pytest
+
+################################################################################
+# Global Variables
+################################################################################
+HOST = IH.PlayerTypeEnum.PLAYER_TYPE_HOST
+JOIN = IH.PlayerTypeEnum.PLAYER_TYPE_JOIN
+
+# Amount of attacks played on each board before a snapshot is taken
+ATTACK_COUNT = 30
+
+################################################################################
+# Procedures
+################################################################################
+@pytest.fixture( autouse=True )
+def default_dimensions():
+    """
+    Function: Default Dimensions
+
+    Inputs: None
+    Outputs: None
+
+    Description: Every test starts and ends on a board of the default size
+    """
+    IH.set_board_dimensions( 10, 10 )
+    yield
+    IH.set_board_dimensions( 10, 10 )
+
+def play_game( model_type : str, seed : int ) -> GE.GameEngine:
+    """
+    Function: Play Game
+
+    Inputs: The model type, the seed of the fleets and attacks
+    Outputs: An engine with both fleets placed and some attacks made on both boards
+    """
+    rng = random.Random( seed )
+    engine = GE.GameEngine( MF.create_model( model_type ) )
+    cells = [ ( row, col ) for row in range( IH.NUMBER_OF_ROWS ) for col in range( IH.NUMBER_OF_COLS ) ]
+
+    for player_type in ( HOST, JOIN ):
+        FG.FleetGenerator( rng ).place_fleet( engine, player_type )
+
+        for coord in rng.sample( cells, ATTACK_COUNT ):
+            engine.resolve_attack( player_type, coord )
+
+    return engine
+
+def get_response( state : IH.CoordStateType, win : bool = False ) -> dict:
+    """
+    Function: Get Response
+
+    Inputs: The state of the attacked cell, if the attack won the game
+    Outputs: The response to an attack that did not sink a ship
+    """
+    return { IH.GAME_COORD_TYPE_STATE_INDEX : state.value, IH.VIEW_PARAM_WIN : win,
+             IH.VIEW_PARAM_SHIP_SUNK : False, IH.VIEW_PARAM_SIZE : 0 }
+
+def synchronize_with( recorder : GS.SnapshotRecorder, opponent_answer : dict ):
+    """
+    Function: Synchronize With
+
+    Inputs: The recorder of a player, the synchronization message of the opponent
+    Outputs: The result of the synchronization of the player, the message the player sent
+    """
+    player, opponent = LC.create_queue_pair()
+    opponent.send_message( opponent_answer )
+
+    try:
+        return recorder.synchronize( player ), opponent.wait_for_message()
+
+    finally:
+        player.close_connection()
+        opponent.close_connection()
+
+@pytest.mark.parametrize( "model_type", MF.MODEL_TYPES )
+@pytest.mark.parametrize( "last_defense", [ None, { IH.VIEW_PARAM_ROW : 4, IH.VIEW_PARAM_COL : 7,
+                                                    **get_response( IH.CoordStateType.COORD_STATE_HIT ) } ] )
+def test_snapshot_round_trips( model_type, last_defense ):
+    engine = play_game( model_type, 7 )
+    snapshot = GS.capture_snapshot( engine.get_model(), JOIN, HOST, 61, last_defense )
+    decoded = GS.decode_snapshot( GS.encode_snapshot( snapshot ) )
+
+    for field in GS.GameSnapshot.__slots__:
+        assert getattr( decoded, field ) == getattr( snapshot, field )
+
+@pytest.mark.parametrize( "model_type", MF.MODEL_TYPES )
+def test_restored_model_matches_the_game( model_type ):
+    model = play_game( model_type, 11 ).get_model()
+    restored = MF.create_model( model_type )
+    GS.restore_model( GS.capture_snapshot( model, HOST, JOIN, 60 ), restored )
+
+    for board in GS.SNAPSHOT_BOARDS:
+        assert restored.get_board_masks( board ) == model.get_board_masks( board )
+        assert restored.ships_are_alive( board ) == model.ships_are_alive( board )
+
+        for row in range( IH.NUMBER_OF_ROWS ):
+            for col in range( IH.NUMBER_OF_COLS ):
+                assert restored.get_coord( board, ( row, col ) ) == model.get_coord( board, ( row, col ) )
+
+def test_damaged_snapshot_is_rejected():
+    data = GS.encode_snapshot( GS.capture_snapshot( play_game( MF.DEFAULT_MODEL_TYPE, 3 ).get_model(), HOST, HOST, 1 ) )
+
+    for damaged in ( b"XXXX" + data[ 4 : ], data[ : -1 ], data + b"\0", data[ : GS.SNAPSHOT_HEADER.size - 1 ] ):
+        with pytest.raises( GS.SnapshotError ):
+            GS.decode_snapshot( damaged )
+
+def test_file_keeps_the_latest_snapshot( tmp_path ):
+    path = str( tmp_path / "game.bsnp" )
+    engine = play_game( MF.DEFAULT_MODEL_TYPE, 5 )
+    recorder = GS.SnapshotRecorder( engine, HOST, path )
+
+    for turn in range( 5 ):
+        recorder.record_attack( JOIN if turn % 2 else HOST )
+        assert GS.read_snapshot( path ).sequence == turn + 1
+
+    recorder.remove()
+
+@pytest.mark.parametrize( "damaged_slot", range( GS.SLOT_COUNT ) )
+def test_file_falls_back_to_the_other_slot( tmp_path, damaged_slot ):
+    path = str( tmp_path / "game.bsnp" )
+    snapshot_file = GS.SnapshotFile( path )
+    model = play_game( MF.DEFAULT_MODEL_TYPE, 9 ).get_model()
+
+    # The first two snapshots fill both slots, the first slot
+    # with sequence 1 and the second with sequence 2
+    for sequence in ( 1, 2 ):
+        snapshot_file.write( GS.capture_snapshot( model, HOST, JOIN, sequence ) )
+
+    snapshot_file.close()
+
+    with open( path, "r+b" ) as damaged_file:
+        slot_size = len( damaged_file.read() ) // GS.SLOT_COUNT
+        damaged_file.seek( damaged_slot * slot_size + GS.SLOT_HEADER.size + 10 )
+        damaged_file.write( b"\xFF\x00\xFF" )
+
+    # The snapshot in the slot that was not damaged is read
+    assert GS.read_snapshot( path ).sequence == GS.SLOT_COUNT - damaged_slot
+
+def test_file_without_a_complete_snapshot_is_rejected( tmp_path ):
+    path = str( tmp_path / "game.bsnp" )
+    snapshot_file = GS.SnapshotFile( path )
+    snapshot_file.write( GS.capture_snapshot( play_game( MF.DEFAULT_MODEL_TYPE, 1 ).get_model(), HOST, JOIN, 1 ) )
+    snapshot_file.close()
+
+    with open( path, "r+b" ) as damaged_file:
+        damaged_file.seek( GS.SLOT_HEADER.size )
+        damaged_file.write( b"\0\0\0\0" )
+
+    with pytest.raises( GS.SnapshotError ):
+        GS.read_snapshot( path )
+
+def test_players_with_the_same_turns_agree( tmp_path ):
+    recorder = GS.SnapshotRecorder( play_game( MF.DEFAULT_MODEL_TYPE, 2 ), HOST, str( tmp_path / "host.bsnp" ), sequence=8 )
+    answer, sent = synchronize_with( recorder, { IH.VIEW_PARAM_SEQUENCE : 8, IH.VIEW_PARAM_LAST_DEFENSE : None } )
+
+    assert answer is None
+    assert sent == { IH.VIEW_PARAM_SEQUENCE : 8, IH.VIEW_PARAM_LAST_DEFENSE : None }
+
+def test_lost_answer_is_taken_from_the_opponent( tmp_path ):
+    engine = play_game( MF.DEFAULT_MODEL_TYPE, 4 )
+    recorder = GS.SnapshotRecorder( engine, HOST, str( tmp_path / "host.bsnp" ), sequence=8 )
+
+    # The opponent answered the attack of the player, but the
+    # answer was lost along with the connection
+    coord = next( ( row, col ) for row in range( IH.NUMBER_OF_ROWS ) for col in range( IH.NUMBER_OF_COLS )
+                  if engine.is_valid_attack( JOIN, ( row, col ) ) )
+    defense = { IH.VIEW_PARAM_ROW : coord[ IH.ROW_INDEX ], IH.VIEW_PARAM_COL : coord[ IH.COLUMN_INDEX ],
+                **get_response( IH.CoordStateType.COORD_STATE_MISS ) }
+
+    player, opponent = LC.create_queue_pair()
+    opponent.send_message( { IH.VIEW_PARAM_SEQUENCE : 9, IH.VIEW_PARAM_LAST_DEFENSE : defense } )
+
+    assert recorder.resume( player, HOST ) == JOIN
+    assert recorder.sequence == 9
+    assert not engine.is_valid_attack( JOIN, coord )
+    assert GS.read_snapshot( str( tmp_path / "host.bsnp" ) ).sequence == 9
+
+@pytest.mark.parametrize( "opponent_answer", [ { IH.VIEW_PARAM_SEQUENCE : 20, IH.VIEW_PARAM_LAST_DEFENSE : None },
+                                               { IH.VIEW_PARAM_SEQUENCE : 9, IH.VIEW_PARAM_LAST_DEFENSE : None },
+                                               { IH.VIEW_PARAM_ROW : 1, IH.VIEW_PARAM_COL : 1 },
+                                               { IH.VIEW_PARAM_SEQUENCE : 8 } ] )
+def test_players_that_can_not_agree_raise_snapshot_error( tmp_path, opponent_answer ):
+    recorder = GS.SnapshotRecorder( play_game( MF.DEFAULT_MODEL_TYPE, 6 ), HOST, str( tmp_path / "host.bsnp" ), sequence=8 )
+
+    with pytest.raises( GS.SnapshotError ):
+        synchronize_with( recorder, opponent_answer )
+
+def test_opponent_that_left_raises_snapshot_error( tmp_path ):
+    recorder = GS.SnapshotRecorder( play_game( MF.DEFAULT_MODEL_TYPE, 8 ), HOST, str( tmp_path / "host.bsnp" ), sequence=8 )
+    player, opponent = LC.create_socket_pair()
+    opponent.close_connection()
+
+    with pytest.raises( GS.SnapshotError ):
+        recorder.synchronize( player )
+
+    player.close_connection()
+
+def test_both_players_synchronize_over_a_socket_pair( tmp_path ):
+    host_recorder = GS.SnapshotRecorder( play_game( MF.DEFAULT_MODEL_TYPE, 10 ), HOST, str( tmp_path / "host.bsnp" ), sequence=12 )
+    join_recorder = GS.SnapshotRecorder( play_game( MF.DEFAULT_MODEL_TYPE, 10 ), JOIN, str( tmp_path / "join.bsnp" ), sequence=12 )
+    host, join = LC.create_socket_pair()
+    answers = dict()
+
+    # Both players send before they wait, so each one is played
+    # from a thread of its own
+    thread = threading.Thread( target=lambda: answers.update( join=join_recorder.synchronize( join ) ) )
+    thread.start()
+    answers[ "host" ] = host_recorder.synchronize( host )
+    thread.join( 10 )
+
+    assert answers == { "host" : None, "join" : None }
+
+    host.close_connection()
+    join.close_connection()
@@ -0,0 +1,164 @@
+'''
+Module: test_loopback_connection.py
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Inputs: Both kinds of loopback connection pairs with every codec
+Outputs: Test results
+
+Description: This module tests that both ends of a loopback connection pair
+             hand the messages to each other in order, that a message can be
+             waited for or polled, that a closed end is noticed by the other
+             one, and that a whole game can be played over a pair from two
+             threads
+
+Run it with $python executable$ -m pytest tests from the root of the repository
+'''
+################################################################################
+# Imports
+################################################################################
+import fleet_generator as FG
+import game_engine as GE
+import loopback_connection as LC
+import message_codec as MC
+import model_factory as MF
+
+from interfaces import interface_headers as IH
+
+import random
+import threading
+
+import pytest
+
+################################################################################
+# Global Variables
+################################################################################
+HOST = IH.PlayerTypeEnum.PLAYER_TYPE_HOST
+JOIN = IH.PlayerTypeEnum.PLAYER_TYPE_JOIN
+
+PAIR_FACTORIES = [ LC.create_queue_pair, LC.create_socket_pair ]
+
+# Seconds a test waits for the thread of the other player
+THREAD_TIMEOUT = 30
+
+################################################################################
+# Procedures
+################################################################################
+@pytest.fixture( params=[ ( factory, codec ) for factory in PAIR_FACTORIES for codec in MC.CODEC_NAME_TO_CLASS ],
+                 ids=lambda param: f"{ param[ 0 ].__name__ }-{ param[ 1 ] }" )
+def connection_pair( request ):
+    """
+    Function: Connection Pair
+
+    Inputs: The pair factory and codec of the test
+    Outputs: The connection of the host and the connection of the joining player, which are closed after the test
+    """
+    factory, codec = request.param
+    host, join = factory( codec )
+    yield host, join
+    host.close_connection()
+    join.close_connection()
+
+def play_defense( connection, engine : GE.GameEngine, player_type : IH.PlayerTypeEnum ) -> None:
+    """
+    Function: Play Defense
+
+    Inputs: The connection of a player, the engine of the player, the player
+    Outputs: None
+
+    Description: Answers the attacks of the opponent until the game is over
+    """
+    while not engine.is_over():
+        coord = GE.get_attack_coord( connection.wait_for_message() )
+        connection.send_message( engine.resolve_attack( player_type, coord ) )
+
+def test_messages_arrive_in_order( connection_pair ):
+    host, join = connection_pair
+    messages = [ { IH.VIEW_PARAM_ROW : row, IH.VIEW_PARAM_COL : row + 1 } for row in range( 5 ) ]
+
+    for message in messages:
+        host.send_message( message )
+
+    assert [ join.wait_for_message() for _ in messages ] == messages
+
+    join.send_message( messages[ 0 ] )
+    assert host.wait_for_message() == messages[ 0 ]
+
+def test_poll_does_not_block( connection_pair ):
+    host, join = connection_pair
+    attack = { IH.VIEW_PARAM_ROW : 1, IH.VIEW_PARAM_COL : 2 }
+
+    assert join.poll_message() is None
+
+    host.send_message( attack )
+    assert join.poll_message() == attack
+    assert join.poll_message() is None
+
+def test_request_round_trip_is_recorded( connection_pair ):
+    host, join = connection_pair
+
+    host.send_request( { IH.VIEW_PARAM_ROW : 1, IH.VIEW_PARAM_COL : 2 } )
+    join.wait_for_message()
+    join.send_message( { "answer" : True } )
+    host.wait_for_message()
+
+    assert host.get_round_trip_latency().count == 1
+    assert join.get_round_trip_latency().count == 0
+
+def test_closed_end_is_noticed( connection_pair ):
+    host, join = connection_pair
+    host.close_connection()
+
+    with pytest.raises( ConnectionError ):
+        join.wait_for_message()
+
+@pytest.mark.parametrize( "factory", PAIR_FACTORIES )
+def test_closed_connection_can_not_be_opened_again( factory ):
+    host, join = factory()
+    host.open_connection()
+    host.close_connection()
+    join.close_connection()
+
+    with pytest.raises( ConnectionError ):
+        host.open_connection()
+
+@pytest.mark.parametrize( "factory", PAIR_FACTORIES )
+def test_unencodable_message_is_not_sent( factory ):
+    host, join = factory( MC.CODEC_JSON )
+
+    with pytest.raises( TypeError ):
+        host.send_message( { "not json" : object() } )
+
+    assert join.poll_message() is None
+
+    host.close_connection()
+    join.close_connection()
+
+def test_game_is_played_from_two_threads( connection_pair ):
+    host, join = connection_pair
+    rng = random.Random( 3 )
+    engines = { player_type : GE.GameEngine( MF.create_model( MF.DEFAULT_MODEL_TYPE ) ) for player_type in ( HOST, JOIN ) }
+
+    for player_type, engine in engines.items():
+        FG.FleetGenerator( rng ).place_fleet( engine, player_type )
+
+    # The joining player only defends, and the host attacks every
+    # cell in order until the fleet of the joining player is sunk
+    thread = threading.Thread( target=play_defense, args=( join, engines[ JOIN ], JOIN ) )
+    thread.start()
+
+    host_engine = engines[ HOST ]
+    cells = iter( [ ( row, col ) for row in range( IH.NUMBER_OF_ROWS ) for col in range( IH.NUMBER_OF_COLS ) ] )
+
+    while not host_engine.is_over():
+        coord = next( cells )
+        host.send_request( { IH.VIEW_PARAM_ROW : coord[ IH.ROW_INDEX ], IH.VIEW_PARAM_COL : coord[ IH.COLUMN_INDEX ] } )
+        host_engine.record_attack_result( JOIN, coord, host.wait_for_message() )
+
+    thread.join( THREAD_TIMEOUT )
+
+    assert not thread.is_alive()
+    assert host_engine.get_winner() == HOST
+    assert engines[ JOIN ].get_winner() == HOST
+    assert host_engine.get_model().get_board_masks( JOIN )[ 1 : ] == engines[ JOIN ].get_model().get_board_masks( JOIN )[ 1 : ]
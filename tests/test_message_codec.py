@@ -0,0 +1,145 @@
+'''
+Module: test_message_codec.py
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Inputs: Every codec in the codec table
+Outputs: Test results
+
+Description: This module tests that every codec decodes the messages it
+             encodes to the same messages, that the binary codec packs the
+             attacks and responses of a turn into a few bytes and rejects bytes
+             that are not a message, and that two instances agree on a codec
+
+Run it with $python executable$ -m pytest tests from the root of the repository
+'''
+################################################################################
+# Imports
+################################################################################
+import loopback_connection as LC
+import message_codec as MC
+
+from interfaces import interface_headers as IH
+
+import pytest
+
+################################################################################
+# Global Variables
+################################################################################
+ATTACK = { IH.VIEW_PARAM_ROW : 3, IH.VIEW_PARAM_COL : 9 }
+
+# An attack on a board with more columns than fit in a byte
+WIDE_ATTACK = { IH.VIEW_PARAM_ROW : 2, IH.VIEW_PARAM_COL : 300 }
+
+RESPONSE = { IH.GAME_COORD_TYPE_STATE_INDEX : IH.CoordStateType.COORD_STATE_HIT.value,
+             IH.VIEW_PARAM_WIN : False, IH.VIEW_PARAM_SHIP_SUNK : True, IH.VIEW_PARAM_SIZE : 4 }
+
+# A message that has no binary format of its own
+OTHER_MESSAGE = { "codecs" : [ MC.CODEC_BINARY, MC.CODEC_JSON ], IH.VIEW_PARAM_ROWS : 10 }
+
+MESSAGES = [ ATTACK, WIDE_ATTACK, RESPONSE, OTHER_MESSAGE ]
+
+################################################################################
+# Procedures
+################################################################################
+@pytest.fixture( params=list( MC.CODEC_NAME_TO_CLASS ) )
+def codec( request ):
+    """
+    Function: Codec
+
+    Inputs: The codec name of the test
+    Outputs: An instance of the codec
+    """
+    return MC.CODEC_NAME_TO_CLASS[ request.param ]()
+
+@pytest.mark.parametrize( "message", MESSAGES )
+def test_messages_round_trip( codec, message ):
+    assert codec.decode( codec.encode( message ) ) == message
+
+def test_binary_attack_fits_in_three_bytes():
+    codec = MC.BinaryMessageCodec()
+    data = codec.encode( ATTACK )
+
+    assert data == bytes( ( MC.BINARY_TAG_ATTACK, 3, 9 ) )
+
+@pytest.mark.parametrize( "row, col", [ ( 2, 300 ), ( 256, 0 ), ( 1000, 1000 ) ] )
+def test_binary_wide_attack_round_trips( row, col ):
+    codec = MC.BinaryMessageCodec()
+    attack = { IH.VIEW_PARAM_ROW : row, IH.VIEW_PARAM_COL : col }
+    data = codec.encode( attack )
+
+    assert data[ 0 ] == MC.BINARY_TAG_WIDE_ATTACK
+    assert len( data ) == MC.WIDE_ATTACK_STRUCT.size
+    assert codec.decode( data ) == attack
+
+@pytest.mark.parametrize( "state", [ IH.CoordStateType.COORD_STATE_HIT, IH.CoordStateType.COORD_STATE_MISS ] )
+@pytest.mark.parametrize( "win, ship_sunk", [ ( False, False ), ( False, True ), ( True, True ) ] )
+@pytest.mark.parametrize( "size", [ 0, 1, 5, 255 ] )
+def test_binary_response_keeps_every_field( state, win, ship_sunk, size ):
+    codec = MC.BinaryMessageCodec()
+    response = { IH.GAME_COORD_TYPE_STATE_INDEX : state.value, IH.VIEW_PARAM_WIN : win,
+                 IH.VIEW_PARAM_SHIP_SUNK : ship_sunk, IH.VIEW_PARAM_SIZE : size }
+    data = codec.encode( response )
+
+    # The size of the sunk ship is the last byte
+    assert len( data ) == MC.RESPONSE_STRUCT.size
+    assert data[ -1 ] == size
+    assert codec.decode( data ) == response
+
+def test_binary_other_messages_are_json_behind_a_tag():
+    codec = MC.BinaryMessageCodec()
+    data = codec.encode( OTHER_MESSAGE )
+
+    assert data[ 0 ] == MC.BINARY_TAG_JSON
+    assert MC.JsonMessageCodec().decode( data[ 1 : ] ) == OTHER_MESSAGE
+
+@pytest.mark.parametrize( "data", [ bytes( ( 9, 1, 2 ) ), bytes( ( 0xFF, ) ) ] )
+def test_binary_unknown_tag_is_rejected( data ):
+    with pytest.raises( ValueError ):
+        MC.BinaryMessageCodec().decode( data )
+
+@pytest.mark.parametrize( "data", [ b"", bytes( ( MC.BINARY_TAG_ATTACK, 1 ) ), bytes( ( MC.BINARY_TAG_WIDE_ATTACK, 0, 1, 0 ) ),
+                                    bytes( ( MC.BINARY_TAG_RESPONSE, 1, 2, 3 ) ), bytes( ( MC.BINARY_TAG_JSON, ) ) + b"{" ] )
+def test_binary_truncated_message_is_rejected( data ):
+    with pytest.raises( ValueError ):
+        MC.BinaryMessageCodec().decode( data )
+
+def test_json_is_always_offered_last():
+    assert MC.get_offered_codecs( MC.CODEC_BINARY ) == [ MC.CODEC_BINARY, MC.CODEC_JSON ]
+    assert MC.get_offered_codecs( MC.CODEC_JSON ) == [ MC.CODEC_JSON ]
+
+@pytest.mark.parametrize( "offered_codecs, preferred_codec, expected_codec",
+                          [ ( [ MC.CODEC_BINARY, MC.CODEC_JSON ], MC.CODEC_BINARY, MC.CODEC_BINARY ),
+                            ( [ MC.CODEC_BINARY, MC.CODEC_JSON ], MC.CODEC_JSON, MC.CODEC_JSON ),
+                            ( [ MC.CODEC_JSON ], MC.CODEC_BINARY, MC.CODEC_JSON ),
+                            ( [ "unknown", MC.CODEC_BINARY ], MC.CODEC_BINARY, MC.CODEC_BINARY ),
+                            ( [ "unknown" ], MC.CODEC_BINARY, MC.CODEC_JSON ),
+                            ( [], MC.CODEC_BINARY, MC.CODEC_JSON ) ] )
+def test_codec_selection( offered_codecs, preferred_codec, expected_codec ):
+    assert MC.select_codec( offered_codecs, preferred_codec ) == expected_codec
+
+@pytest.mark.parametrize( "codec_name", list( MC.CODEC_NAME_TO_CLASS ) )
+def test_negotiated_codec_is_used_by_both_players( codec_name ):
+    host, join = LC.create_socket_pair( codec_name )
+
+    try:
+        assert host.codec.name == codec_name
+        assert join.codec.name == codec_name
+
+        join.send_message( ATTACK )
+        assert host.wait_for_message() == ATTACK
+
+    finally:
+        host.close_connection()
+        join.close_connection()
+
+def test_board_dimensions_must_match():
+    MC.check_board_dimensions( MC.get_board_dimensions() )
+
+    with pytest.raises( MC.BoardMismatchError ):
+        MC.check_board_dimensions( { IH.VIEW_PARAM_ROWS : IH.NUMBER_OF_ROWS + 1, IH.VIEW_PARAM_COLS : IH.NUMBER_OF_COLS } )
+
+    # An instance that did not send its board is not trusted either
+    with pytest.raises( MC.BoardMismatchError ):
+        MC.check_board_dimensions( {} )
@@ -0,0 +1,148 @@
+'''
+Module: test_message_framing.py
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Inputs: Frames split and joined the ways a socket can deliver them
+Outputs: Test results
+
+Description: This module tests that the reassembly buffer hands out every
+             message whole and in order, no matter how the bytes of the frames
+             arrive, and that the receive procedures do the same on a
+             connected pair of sockets
+
+Run it with $python executable$ -m pytest tests from the root of the repository
+'''
+################################################################################
+# Imports
+################################################################################
+import message_framing as FR
+
+import socket
+
+import pytest
+
+################################################################################
+# Global Variables
+################################################################################
+
+# Messages of different lengths, including an empty one and one
+# that is longer than a single read from a socket
+PAYLOADS = [ b"a", b"", b"hello world", bytes( range( 256 ) ) * 4, b"x" * ( FR.RECEIVE_SIZE + 17 ) ]
+
+################################################################################
+# Procedures
+################################################################################
+@pytest.fixture
+def socket_pair():
+    """
+    Function: Socket Pair
+
+    Inputs: None
+    Outputs: A connected pair of sockets, which are closed after the test
+    """
+    sender, receiver = socket.socketpair()
+    yield sender, receiver
+    sender.close()
+    receiver.close()
+
+def get_frames( frame_buffer : FR.FrameBuffer ) -> list[ bytes ]:
+    """
+    Function: Get Frames
+
+    Inputs: A reassembly buffer
+    Outputs: Every complete message in the buffer
+    """
+    frames = list()
+    frame = frame_buffer.next_frame()
+
+    while frame is not None:
+        frames.append( frame )
+        frame = frame_buffer.next_frame()
+
+    return frames
+
+def test_frame_is_prefixed_with_its_length():
+    frame = FR.encode_frame( b"abc" )
+
+    assert frame == FR.FRAME_HEADER.pack( 3 ) + b"abc"
+
+@pytest.mark.parametrize( "chunk_size", [ 1, 2, 3, 7, 1000 ] )
+def test_partial_frames_are_reassembled( chunk_size ):
+    frame_buffer = FR.FrameBuffer()
+    data = b"".join( FR.encode_frame( payload ) for payload in PAYLOADS )
+    frames = list()
+
+    for start in range( 0, len( data ), chunk_size ):
+        frame_buffer.feed( data[ start : start + chunk_size ] )
+        frames += get_frames( frame_buffer )
+
+    assert frames == PAYLOADS
+
+def test_incomplete_frame_is_not_handed_out():
+    frame_buffer = FR.FrameBuffer()
+    frame = FR.encode_frame( b"hello" )
+
+    # Neither a partial header nor a partial message is a frame
+    frame_buffer.feed( frame[ : 2 ] )
+    assert frame_buffer.next_frame() is None
+
+    frame_buffer.feed( frame[ 2 : -1 ] )
+    assert frame_buffer.next_frame() is None
+
+    frame_buffer.feed( frame[ -1 : ] )
+    assert frame_buffer.next_frame() == b"hello"
+    assert frame_buffer.next_frame() is None
+
+def test_coalesced_frames_are_split():
+    frame_buffer = FR.FrameBuffer()
+    frame_buffer.feed( b"".join( FR.encode_frame( payload ) for payload in PAYLOADS ) )
+
+    assert get_frames( frame_buffer ) == PAYLOADS
+
+def test_remaining_bytes_are_taken_after_the_last_frame():
+    frame_buffer = FR.FrameBuffer()
+    frame_buffer.feed( FR.encode_frame( b"first" ) + b"\x01\x02" )
+
+    assert frame_buffer.next_frame() == b"first"
+    assert frame_buffer.take_remaining() == b"\x01\x02"
+
+    # The buffer is empty afterwards and can be used again
+    assert frame_buffer.take_remaining() == b""
+    frame_buffer.feed( FR.encode_frame( b"second" ) )
+    assert frame_buffer.next_frame() == b"second"
+
+def test_receive_frame_reads_split_and_coalesced_frames( socket_pair ):
+    sender, receiver = socket_pair
+    frame_buffer = FR.FrameBuffer()
+    data = b"".join( FR.encode_frame( payload ) for payload in PAYLOADS[ : 4 ] )
+
+    # The first frame arrives in two parts, and the rest arrive
+    # along with the end of it
+    sender.sendall( data[ : 3 ] )
+    sender.sendall( data[ 3 : ] )
+
+    assert [ FR.receive_frame( receiver, frame_buffer ) for _ in PAYLOADS[ : 4 ] ] == PAYLOADS[ : 4 ]
+
+def test_receive_available_frame_does_not_block( socket_pair ):
+    sender, receiver = socket_pair
+    frame_buffer = FR.FrameBuffer()
+    frame = FR.encode_frame( b"hello" )
+
+    assert FR.receive_available_frame( receiver, frame_buffer ) is None
+
+    sender.sendall( frame[ : 5 ] )
+    assert FR.receive_available_frame( receiver, frame_buffer ) is None
+
+    sender.sendall( frame[ 5 : ] )
+    assert FR.receive_available_frame( receiver, frame_buffer ) == b"hello"
+    assert FR.receive_available_frame( receiver, frame_buffer ) is None
+
+def test_closed_socket_raises_connection_error( socket_pair ):
+    sender, receiver = socket_pair
+    sender.sendall( FR.encode_frame( b"hello" )[ : 6 ] )
+    sender.close()
+
+    with pytest.raises( ConnectionError ):
+        FR.receive_frame( receiver, FR.FrameBuffer() )
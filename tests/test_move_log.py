@@ -0,0 +1,202 @@
+'''
+Module: test_move_log.py
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Inputs: Games played on every model and written to move logs
+Outputs: Test results
+
+Description: This module tests that a game that is written to a move log is
+             replayed onto the same boards with the same winner, that buffered
+             writers that share a log never mix the records of their games,
+             and that a record that was only partly written is not read
+
+Run it with $python executable$ -m pytest tests from the root of the repository
+'''
+################################################################################
+# Imports
+################################################################################
+import fleet_generator as FG
+import game_engine as GE
+import game_snapshot as GS
+import model_factory as MF
+import move_log as ML
+
+from interfaces import interface_headers as IH
+
+import random
+
+import pytest
+
+################################################################################
+# Global Variables
+################################################################################
+HOST = IH.PlayerTypeEnum.PLAYER_TYPE_HOST
+JOIN = IH.PlayerTypeEnum.PLAYER_TYPE_JOIN
+
+################################################################################
+# Procedures
+################################################################################
+@pytest.fixture( autouse=True )
+def default_dimensions():
+    """
+    Function: Default Dimensions
+
+    Inputs: None
+    Outputs: None
+
+    Description: Every test starts and ends on a board of the default size,
+                 since a replay sets the board of the game it replays
+    """
+    IH.set_board_dimensions( 10, 10 )
+    yield
+    IH.set_board_dimensions( 10, 10 )
+
+def play_game( writer : ML.MoveLogWriter, model_type : str, seed : int, attack_count : int = None ) -> GE.GameEngine:
+    """
+    Function: Play Game
+
+    Inputs: The writer of the log, the model type, the seed of the fleets and attacks,
+            the amount of attacks to make, defaults to playing until the game is over
+    Outputs: The engine of the game
+    """
+    rng = random.Random( seed )
+    engine = GE.GameEngine( MF.create_model( model_type ), writer )
+    writer.start_game( HOST, IH.MAX_NUM_OF_SHIPS, all_boards=True )
+
+    for player_type in ( HOST, JOIN ):
+        FG.FleetGenerator( rng ).place_fleet( engine, player_type )
+
+    cells = { player_type : [ ( row, col ) for row in range( IH.NUMBER_OF_ROWS ) for col in range( IH.NUMBER_OF_COLS ) ]
+              for player_type in ( HOST, JOIN ) }
+
+    for cell_list in cells.values():
+        rng.shuffle( cell_list )
+
+    # The players take turns attacking the board of the other
+    board = JOIN
+    attacks = 0
+
+    while not engine.is_over() and attacks != attack_count:
+        engine.resolve_attack( board, cells[ board ].pop() )
+        board = GE.get_opponent_type( board )
+        attacks += 1
+
+    return engine
+
+def assert_same_boards( model, other_model ) -> None:
+    """
+    Function: Assert Same Boards
+
+    Inputs: Two models
+    Outputs: None
+    """
+    for board in ( HOST, JOIN ):
+        assert model.get_board_masks( board ) == other_model.get_board_masks( board )
+
+@pytest.mark.parametrize( "model_type", MF.MODEL_TYPES )
+@pytest.mark.parametrize( "buffered", [ False, True ] )
+def test_game_is_replayed( tmp_path, model_type, buffered ):
+    path = str( tmp_path / "moves.mlog" )
+    writer = ML.MoveLogWriter( path, buffered )
+    engine = play_game( writer, model_type, 1 )
+    writer.close()
+
+    reader = ML.MoveLogReader( path )
+    replayed, game = ML.replay_game( reader, 0, model_type=model_type )
+
+    assert reader.get_games() == [ 0 ]
+    assert game[ ML.RECORD_SIZE_INDEX ] == IH.MAX_NUM_OF_SHIPS
+    assert replayed.get_winner() == engine.get_winner()
+    assert_same_boards( replayed.get_model(), engine.get_model() )
+
+    reader.close()
+
+def test_game_is_replayed_up_to_a_turn( tmp_path ):
+    path = str( tmp_path / "moves.mlog" )
+    writer = ML.MoveLogWriter( path )
+    engine = play_game( writer, MF.DEFAULT_MODEL_TYPE, 2, attack_count=20 )
+    play_game( writer, MF.DEFAULT_MODEL_TYPE, 3 )
+    writer.close()
+
+    reader = ML.MoveLogReader( path )
+    replayed, _ = ML.replay_game( reader, 1, turn=20 )
+
+    assert len( reader.get_games() ) == 2
+    assert_same_boards( ML.replay_game( reader, 0 )[ 0 ].get_model(), engine.get_model() )
+    assert not replayed.is_over()
+
+    reader.close()
+
+def test_buffered_writer_writes_whole_games( tmp_path ):
+    path = str( tmp_path / "moves.mlog" )
+    writers = [ ML.MoveLogWriter( path, buffered=True ) for _ in range( 2 ) ]
+
+    # The games of the two writers are played at the same time,
+    # but each one is written at once when it is finished
+    engines = [ play_game( writer, MF.DEFAULT_MODEL_TYPE, seed ) for seed, writer in enumerate( writers ) ]
+
+    with open( path, "rb" ) as log_file:
+        assert log_file.read() == b""
+
+    for writer in reversed( writers ):
+        writer.close()
+
+    reader = ML.MoveLogReader( path )
+    assert len( reader.get_games() ) == 2
+
+    for game_index, engine in enumerate( reversed( engines ) ):
+        start, stop = reader.get_game_records( game_index )
+        kinds = [ record[ ML.RECORD_KIND_INDEX ] for record in reader.iter_records( start + 1, stop ) ]
+
+        # The placements come before every attack of the game
+        assert kinds == sorted( kinds )
+        assert kinds.count( ML.RECORD_PLACEMENT ) == 2 * IH.MAX_NUM_OF_SHIPS
+        assert ML.replay_game( reader, game_index )[ 0 ].get_winner() == engine.get_winner()
+
+    reader.close()
+
+def test_partial_record_is_not_read( tmp_path ):
+    path = str( tmp_path / "moves.mlog" )
+    writer = ML.MoveLogWriter( path )
+    play_game( writer, MF.DEFAULT_MODEL_TYPE, 4, attack_count=10 )
+    writer.close()
+
+    reader = ML.MoveLogReader( path )
+    number_of_records = reader.number_of_records
+    reader.close()
+
+    # A game that crashed in the middle of a write
+    with open( path, "ab" ) as log_file:
+        log_file.write( bytes( ML.RECORD_SIZE - 1 ) )
+
+    reader = ML.MoveLogReader( path )
+    assert reader.number_of_records == number_of_records
+    assert not ML.replay_game( reader, 0 )[ 0 ].is_over()
+
+    reader.close()
+
+@pytest.mark.parametrize( "model_type", MF.MODEL_TYPES )
+def test_restored_game_starts_from_its_snapshot( tmp_path, model_type ):
+    writer = ML.MoveLogWriter( str( tmp_path / "played.mlog" ) )
+    model = play_game( writer, model_type, 5, attack_count=40 ).get_model()
+    writer.close()
+
+    restored = MF.create_model( model_type )
+    GS.restore_model( GS.capture_snapshot( model, HOST, HOST, 40 ), restored )
+
+    path = str( tmp_path / "restored.mlog" )
+    writer = ML.MoveLogWriter( path, buffered=True )
+    writer.start_restored_game( HOST, restored )
+    writer.close()
+
+    # Only the ships of the player that resumed are known, the
+    # attacks on the board of the opponent are replayed as logged
+    reader = ML.MoveLogReader( path )
+    replayed = ML.replay_game( reader, 0, model_type=model_type )[ 0 ].get_model()
+
+    assert replayed.get_board_masks( HOST ) == model.get_board_masks( HOST )
+    assert replayed.get_board_masks( JOIN )[ 1 : ] == model.get_board_masks( JOIN )[ 1 : ]
+
+    reader.close()
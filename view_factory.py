@@ -0,0 +1,55 @@
+'''
+Module: view_factory.py
+Date Created: October 18, 2026
+Author: Manoj Turaga
+Contributer(s): Manoj Turaga
+
+Inputs: Name of a view implementation
+Outputs: Instance of the view
+
+Description: This module maps the names of the view implementations that can
+             be selected at startup to the implementations of the view
+             interface, so that every entry point selects views the same way
+'''
+################################################################################
+# Imports
+################################################################################
+import game_view as GV
+import ai_player as AI
+
+from interfaces import interface_game_view as IGV
+
+################################################################################
+# Global Variables
+################################################################################
+
+# Mapping between the view names that can be selected at startup
+# and the implementations of the view interface
+VIEW_TYPE_TO_CLASS = { "console" : GV.GameView, "ai" : AI.AIGameView }
+DEFAULT_VIEW_TYPE = "console"
+
+# The curses view is only imported when it is selected, since
+# curses is not available on every platform
+CURSES_VIEW_TYPE = "curses"
+
+# Every view name that can be selected
+VIEW_TYPES = [ *VIEW_TYPE_TO_CLASS.keys(), CURSES_VIEW_TYPE ]
+
+################################################################################
+# Procedures
+################################################################################
+def create_view( view_type : str ) -> IGV.GameViewInterface:
+    """
+    Function: Create View
+
+    Inputs: The name of the view implementation
+    Output: Instance of the view
+
+    Description: This is a helper function that creates the view that
+                 was selected at startup
+    """
+    if view_type == CURSES_VIEW_TYPE:
+        import game_view_curses as GVC
+        return GVC.CursesGameView()
+
+    return VIEW_TYPE_TO_CLASS[ view_type ]()
@@ -0,0 +1,136 @@
+"""
+Module: visual_board.py
+Creation Date: October 18, 2026
+Author: Manoj Turaga
+Contributors: Manoj Turaga
+Sources:
+
+Description:
+    This module holds the visual representation of a board that models hand
+    out to the rest of the program. The visual board is kept in a single
+    buffer that the model updates one cell at a time, and consumers are given
+    read-only views of the rows of that buffer. The views always reflect the
+    current state of the board, so they never need to be rebuilt
+
+Inputs:
+    Cell updates from a model
+Outputs:
+    Read-only views of the visual board
+"""
+
+################################################################################
+# Imports
+################################################################################
+from interfaces import interface_headers as IH
+
+################################################################################
+# Global Variables
+################################################################################
+
+# Format of the buffer used to store the visual board. The
+# hit and missed cells are negative, so the cells are signed
+VISUAL_BOARD_CELL_FORMAT = "b"
+
+# Tables that translate every byte of a buffer of cells into the
+# digit of a binary number, by the value of the cell they find
+_MASK_TABLES : dict[ int, bytes ] = dict()
+
+################################################################################
+# Types
+################################################################################
+class VisualBoard:
+    """
+    Description: This is a buffer of the visual state of every cell on the board
+    """
+    __slots__ = ( "_cells", "_view" )
+
+    def __init__( self ):
+        """
+        Function: Initialization
+
+        Inputs: None
+        Outputs: None
+
+        Description: Creates a visual board where every cell is an empty cell
+                     that has not been attacked. The read-only row views are
+                     created once here and handed out for the life of the board
+        """
+        self._cells = memoryview( bytearray( IH.NUMBER_OF_ROWS * IH.NUMBER_OF_COLS ) ).cast( VISUAL_BOARD_CELL_FORMAT )
+        self._view = tuple( self._cells[ row * IH.NUMBER_OF_COLS : ( row + 1 ) * IH.NUMBER_OF_COLS ].toreadonly()
+                            for row in range( IH.NUMBER_OF_ROWS ) )
+
+    def set_cell( self, coord : IH.SystemCoordType, cell : IH.GameCoordType ) -> None:
+        """
+        Function: Set Cell
+
+        Inputs: The location of the cell, the value of the cell
+        Outputs: None
+
+        Description: Updates the visual state of a single cell
+        """
+        self._cells[ coord[ IH.ROW_INDEX ] * IH.NUMBER_OF_COLS + coord[ IH.COLUMN_INDEX ] ] = get_visual_cell( cell )
+
+    def get_view( self ) -> IH.VisualBoardType:
+        """
+        Function: Get View
+
+        Inputs: None
+        Outputs: Read-only views of the rows of the board
+
+        Description: Returns the views of the board. Nothing is allocated
+                     when this is called
+        """
+        return self._view
+
+    def get_state_masks( self ) -> tuple[ int, int ]:
+        """
+        Function: Get State Masks
+
+        Inputs: None
+        Outputs: The mask of the cells that were hit and the mask of the cells that were missed
+        """
+        cells = self._cells.tobytes()
+
+        return get_cell_mask( cells, IH.HIT_CELL ), get_cell_mask( cells, IH.MISSED_CELL )
+
+################################################################################
+# Procedures
+################################################################################
+def get_visual_cell( cell : IH.GameCoordType ) -> int:
+    """
+    Function: Get Visual Cell
+
+    Inputs: The value of a cell
+    Outputs: The visual value of the cell
+
+    Description: We only want to show the ID of the cell if it has not been
+                 attacked. Otherwise, display the type of action done on the cell
+    """
+    state = cell[ IH.GAME_COORD_TYPE_STATE_INDEX ]
+
+    if state == IH.CoordStateType.COORD_STATE_HIT:
+        return IH.HIT_CELL
+
+    if state == IH.CoordStateType.COORD_STATE_MISS:
+        return IH.MISSED_CELL
+
+    return cell[ IH.GAME_COORD_TYPE_ID_INDEX ]
+
+def get_cell_mask( cells : bytes, value : int ) -> int:
+    """
+    Function: Get Cell Mask
+
+    Inputs: A buffer with a signed byte for every cell of a board, the value to look for
+    Outputs: The mask of the cells that hold the value
+
+    Description: The buffer is translated into a string of binary digits in a
+                 single pass, with the first cell as the last digit so that
+                 bit n of the mask refers to cell n
+    """
+    table = _MASK_TABLES.get( value )
+
+    if table is None:
+        table = bytes( ord( "1" ) if byte == value & 0xFF else ord( "0" ) for byte in range( 256 ) )
+        _MASK_TABLES[ value ] = table
+
+    return int( cells.translate( table )[ ::-1 ], 2 )